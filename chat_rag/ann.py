@@ -0,0 +1,95 @@
+import math
+import time
+from typing import Any, Dict
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from chat_rag.config import (
+    HNSW_EF_CONSTRUCTION,
+    HNSW_M,
+    IVFFLAT_LISTS,
+    VECTOR_INDEX_TYPE,
+)
+from chat_rag.storage import EMBEDDINGS_TABLE
+
+def ann_index_name(table: str) -> str:
+    return f"{table}_embedding_ann_idx"
+
+ANN_INDEX_NAME = ann_index_name(EMBEDDINGS_TABLE)
+INDEX_TYPES = ("hnsw", "ivfflat", "none")
+
+def _table_exists(conn, table: str = EMBEDDINGS_TABLE) -> bool:
+    return conn.execute(text("SELECT to_regclass(:t)"), {"t": table}).scalar() is not None
+
+def embeddings_table_exists(engine: Engine, table: str = EMBEDDINGS_TABLE) -> bool:
+    with engine.connect() as conn:
+        return _table_exists(conn, table)
+
+def ann_index_exists(engine: Engine) -> bool:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT to_regclass(:i)"), {"i": ANN_INDEX_NAME}).scalar() is not None
+
+def _index_ddl(conn, index_type: str, table: str = EMBEDDINGS_TABLE) -> str:
+    if index_type == "hnsw":
+        method = f"hnsw (embedding vector_cosine_ops) WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})"
+    elif index_type == "ivfflat":
+        lists = IVFFLAT_LISTS
+        if lists <= 0:
+            # pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) above
+            rows = conn.execute(text(f"SELECT count(*) FROM {table}")).scalar() or 0
+            lists = max(10, rows // 1000 if rows <= 1_000_000 else int(math.sqrt(rows)))
+        method = f"ivfflat (embedding vector_cosine_ops) WITH (lists = {lists})"
+    else:
+        raise ValueError(f"Unknown vector index type: {index_type!r} (expected one of {INDEX_TYPES})")
+    return f"CREATE INDEX IF NOT EXISTS {ann_index_name(table)} ON {table} USING {method}"
+
+def drop_ann_index(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX IF EXISTS {ANN_INDEX_NAME}"))
+
+def build_ann_index(
+    engine: Engine,
+    index_type: str = VECTOR_INDEX_TYPE,
+    rebuild: bool = False,
+    table: str = EMBEDDINGS_TABLE,
+) -> float:
+    """
+    Create the ANN index on the embeddings table (no-op if it already exists
+    unless `rebuild`). Returns the build time in seconds.
+    """
+    if index_type == "none":
+        return 0.0
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        if not _table_exists(conn, table):
+            return 0.0
+        if rebuild:
+            conn.execute(text(f"DROP INDEX IF EXISTS {ann_index_name(table)}"))
+        conn.execute(text(_index_ddl(conn, index_type, table)))
+    return time.perf_counter() - start
+
+def ann_index_status(engine: Engine) -> Dict[str, Any]:
+    with engine.connect() as conn:
+        if not _table_exists(conn):
+            return {"table": EMBEDDINGS_TABLE, "table_exists": False}
+        rows = conn.execute(text(f"SELECT count(*) FROM {EMBEDDINGS_TABLE}")).scalar()
+        index = conn.execute(
+            text(
+                "SELECT i.indexdef, pg_size_pretty(pg_relation_size(c.oid)), x.indisvalid "
+                "FROM pg_indexes i "
+                "JOIN pg_class c ON c.relname = i.indexname "
+                "JOIN pg_index x ON x.indexrelid = c.oid "
+                "WHERE i.indexname = :i"
+            ),
+            {"i": ANN_INDEX_NAME},
+        ).first()
+    status: Dict[str, Any] = {
+        "table": EMBEDDINGS_TABLE,
+        "table_exists": True,
+        "rows": rows,
+        "configured_type": VECTOR_INDEX_TYPE,
+        "index": ANN_INDEX_NAME,
+        "index_exists": index is not None,
+    }
+    if index is not None:
+        status.update(definition=index[0], size=index[1], valid=index[2])
+    return status
@@ -0,0 +1,350 @@
+"""
+End-to-end benchmark harness (`python main.py bench`).
+
+Generates a synthetic export, then times each stage of the pipeline on it:
+streaming parse, text and Markdown rendering, chunking, embedding, writing
+to a vector store, and retrieval latency with recall measured against an
+exact brute-force search over the same vectors.
+
+By default embeddings come from `HashEmbedding`, a deterministic
+feature-hashing stand-in that needs no model download, and vectors go to a
+scratch pgvector table when Postgres is reachable or an in-memory store
+otherwise. Nothing touches the real embeddings table.
+"""
+import hashlib
+import json
+import math
+import random
+import re
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+import numpy as np
+from llama_index.core import Document
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.bridge.pydantic import Field
+from llama_index.core.schema import BaseNode
+from chat_rag.pipeline import StageTiming, chunk_documents, embed_nodes
+from chat_rag.streaming import iter_json_file
+from chat_rag.synthetic import SyntheticExport, SyntheticSpec
+
+BENCH_TABLE_NAME = "bench_embeddings"
+_TOKEN = re.compile(r"\w+")
+
+
+class HashEmbedding(BaseEmbedding):
+    """
+    Deterministic bag-of-words embedding: each token is hashed into one of
+    `dim` signed buckets and the result is L2-normalised. Lexically similar
+    texts get similar vectors, which is all the retrieval benchmark needs.
+    """
+
+    dim: int = Field(default=256, description="Embedding dimension")
+
+    def __init__(self, dim: int = 256, **kwargs: Any):
+        super().__init__(dim=dim, model_name=f"hash-{dim}", **kwargs)
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HashEmbedding"
+
+    def _embed(self, text: str) -> List[float]:
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in _TOKEN.findall(text.lower()):
+            h = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+            vec[h % self.dim] += 1.0 if (h >> 32) & 1 else -1.0
+        norm = float(np.linalg.norm(vec))
+        return (vec / norm if norm else vec).tolist()
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._embed(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(t) for t in texts]
+
+
+class MemoryStore:
+    """
+    In-memory fallback vector store: exact cosine search with numpy.
+    """
+
+    name = "memory"
+
+    def __init__(self, dim: int):
+        self._ids: List[str] = []
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+
+    def write(self, nodes: Sequence[BaseNode]) -> StageTiming:
+        start = time.perf_counter()
+        self._ids.extend(n.node_id for n in nodes)
+        self._vectors = np.vstack([self._vectors, _matrix([n.get_embedding() for n in nodes])])
+        return StageTiming(len(nodes), time.perf_counter() - start)
+
+    def finish(self) -> float:
+        return 0.0
+
+    def query(self, embedding: List[float], top_k: int) -> List[str]:
+        return _exact_top_k(self._vectors, self._ids, embedding, top_k)
+
+    def close(self) -> None:
+        pass
+
+
+class PgStore:
+    """
+    Scratch pgvector table written with the ingestion COPY path and searched
+    through PGVectorStore, with the configured ANN index built after loading.
+    """
+
+    name = "pgvector"
+
+    def __init__(self, dim: int, index_type: str):
+        from chat_rag.pipeline import ensure_table
+        from chat_rag.storage import get_engine, get_vector_store
+        self.engine = get_engine()
+        self.index_type = index_type
+        self.vector_store = get_vector_store(BENCH_TABLE_NAME, embed_dim=dim)
+        self.table = f"data_{BENCH_TABLE_NAME}"
+        self._drop()
+        ensure_table(self.vector_store)
+
+    def _drop(self) -> None:
+        from sqlalchemy import text
+        with self.engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {self.table}"))
+
+    def write(self, nodes: Sequence[BaseNode]) -> StageTiming:
+        from chat_rag.pipeline import write_nodes
+        return write_nodes(self.engine, nodes, table=self.table)
+
+    def finish(self) -> float:
+        from sqlalchemy import text
+        from chat_rag.ann import build_ann_index
+        seconds = build_ann_index(self.engine, index_type=self.index_type, table=self.table)
+        with self.engine.begin() as conn:
+            conn.execute(text(f"ANALYZE {self.table}"))
+        return seconds
+
+    def query(self, embedding: List[float], top_k: int) -> List[str]:
+        from llama_index.core.vector_stores.types import VectorStoreQuery
+        result = self.vector_store.query(
+            VectorStoreQuery(query_embedding=embedding, similarity_top_k=top_k)
+        )
+        return list(result.ids or [])
+
+    def close(self) -> None:
+        self._drop()
+
+
+def _matrix(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    m = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return m / norms
+
+
+def _exact_top_k(matrix: np.ndarray, ids: List[str], embedding: List[float], top_k: int) -> List[str]:
+    scores = matrix @ _matrix([embedding])[0]
+    k = min(top_k, len(ids))
+    if k == 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    return [ids[i] for i in top[np.argsort(-scores[top])]]
+
+
+def percentiles(samples: Sequence[float]) -> Dict[str, float]:
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+    q = statistics.quantiles(samples, n=100, method='inclusive')
+    return {"p50": q[49], "p95": q[94], "p99": q[98]}
+
+
+def open_store(kind: str, dim: int, index_type: str):
+    """
+    `kind` is "pg", "memory" or "auto" (pgvector if Postgres is reachable).
+    """
+    if kind == "memory":
+        return MemoryStore(dim)
+    try:
+        return PgStore(dim, index_type)
+    except Exception as e:
+        if kind == "pg":
+            raise
+        print(f"Postgres unavailable ({type(e).__name__}); using the in-memory store.")
+        return MemoryStore(dim)
+
+
+class BenchConfig(NamedTuple):
+    spec: SyntheticSpec = SyntheticSpec()
+    queries: int = 200
+    top_k: int = 10
+    batch_size: int = 100
+    store: str = "auto"
+    index_type: str = "hnsw"
+    embed_dim: int = 256
+    real_embeddings: bool = False
+    output_dir: Optional[Path] = None
+
+
+def _rate(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else math.inf
+
+
+def run_benchmark(config: BenchConfig) -> Dict[str, Any]:
+    """
+    Run every stage and return the measurements as a nested dict.
+    """
+    # Imported here: they pull in the ingestion and export-rendering code
+    from chat_rag.ingest import _iter_batches, _render_blocks
+    from parse_export import render_conversation
+
+    spec = config.spec
+    export = SyntheticExport(spec)
+    results: Dict[str, Any] = {"config": {**spec._asdict(), **{
+        k: v for k, v in config._asdict().items() if k not in ("spec", "output_dir")
+    }}}
+
+    tmp = None
+    output_dir = config.output_dir
+    if output_dir is None:
+        tmp = tempfile.TemporaryDirectory(prefix="chat-rag-bench-")
+        output_dir = Path(tmp.name)
+
+    if config.real_embeddings:
+        from chat_rag.context import get_embed_model
+        embed_model = get_embed_model()
+        dim = len(embed_model.get_query_embedding("dimension probe"))
+    else:
+        embed_model = HashEmbedding(config.embed_dim)
+        dim = config.embed_dim
+    store = open_store(config.store, dim, config.index_type)
+    results["config"]["store"] = store.name
+
+    try:
+        start = time.perf_counter()
+        path = export.write(output_dir)
+        seconds = time.perf_counter() - start
+        size_mb = path.stat().st_size / 1e6
+        results["generate"] = {"conversations": spec.conversations, "seconds": seconds, "size_mb": size_mb}
+
+        start = time.perf_counter()
+        parsed = sum(1 for _ in iter_json_file(path))
+        seconds = time.perf_counter() - start
+        results["parse"] = {
+            "conversations": parsed,
+            "seconds": seconds,
+            "conversations_per_sec": _rate(parsed, seconds),
+            "mb_per_sec": _rate(size_mb, seconds),
+        }
+
+        text_seconds = markdown_seconds = chunk_seconds = 0.0
+        embed_seconds = write_seconds = 0.0
+        chunks = 0
+        all_ids: List[str] = []
+        all_vectors: List[np.ndarray] = []
+        conversations = iter_json_file(path)
+        for batch in _iter_batches(conversations, config.batch_size):
+            start = time.perf_counter()
+            for i, conv in enumerate(batch):
+                render_conversation(conv, i, 'json', None, {}, False)
+            markdown_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            documents = []
+            messages = []
+            for conv in batch:
+                blocks = _render_blocks(conv)
+                metadata = {"title": conv.get('title'), "id": conv['id'], "create_time": conv.get('create_time')}
+                text = "\n\n".join(block.text for block in blocks)
+                documents.append(Document(text=text, metadata=metadata, id_=conv['id']))
+                messages.append(blocks)
+            text_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            nodes = chunk_documents(documents, messages)
+            chunk_seconds += time.perf_counter() - start
+            chunks += len(nodes)
+
+            embed_seconds += embed_nodes(nodes, embed_model).seconds
+            write_seconds += store.write(nodes).seconds
+            all_ids.extend(n.node_id for n in nodes)
+            all_vectors.append(_matrix([n.get_embedding() for n in nodes]))
+
+        index_seconds = store.finish()
+        results["render_text"] = {"seconds": text_seconds, "conversations_per_sec": _rate(parsed, text_seconds)}
+        results["render_markdown"] = {"seconds": markdown_seconds, "conversations_per_sec": _rate(parsed, markdown_seconds)}
+        results["chunk"] = {"nodes": chunks, "seconds": chunk_seconds, "nodes_per_sec": _rate(chunks, chunk_seconds)}
+        results["embed"] = {
+            "model": embed_model.model_name,
+            "nodes": chunks,
+            "seconds": embed_seconds,
+            "nodes_per_sec": _rate(chunks, embed_seconds),
+        }
+        results["write"] = {
+            "store": store.name,
+            "nodes": chunks,
+            "seconds": write_seconds,
+            "nodes_per_sec": _rate(chunks, write_seconds),
+            "index_build_seconds": index_seconds,
+        }
+
+        matrix = np.vstack(all_vectors) if all_vectors else np.zeros((0, dim), dtype=np.float32)
+        rng = random.Random(spec.seed)
+        latencies: List[float] = []
+        recalls: List[float] = []
+        for _ in range(config.queries):
+            embedding = embed_model.get_query_embedding(export.query(rng).text)
+            start = time.perf_counter()
+            found = store.query(embedding, config.top_k)
+            latencies.append((time.perf_counter() - start) * 1000)
+            exact = _exact_top_k(matrix, all_ids, embedding, config.top_k)
+            if exact:
+                recalls.append(len(set(found) & set(exact)) / len(exact))
+        results["retrieval"] = {
+            "queries": config.queries,
+            "top_k": config.top_k,
+            "latency_ms": percentiles(latencies),
+            "recall": statistics.fmean(recalls) if recalls else 0.0,
+        }
+    finally:
+        store.close()
+        if tmp is not None:
+            tmp.cleanup()
+    return results
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    cfg = results["config"]
+    lines = [
+        f"Benchmark: {cfg['conversations']} conversations x {cfg['messages']} messages "
+        f"(branch rate {cfg['branch_rate']}), store={cfg['store']}",
+        f"  generate         {results['generate']['seconds']:8.2f}s  {results['generate']['size_mb']:.1f} MB",
+        f"  parse            {results['parse']['conversations_per_sec']:10.1f} conv/s  "
+        f"{results['parse']['mb_per_sec']:.1f} MB/s",
+        f"  render (text)    {results['render_text']['conversations_per_sec']:10.1f} conv/s",
+        f"  render (md)      {results['render_markdown']['conversations_per_sec']:10.1f} conv/s",
+        f"  chunk            {results['chunk']['nodes_per_sec']:10.1f} nodes/s  ({results['chunk']['nodes']} nodes)",
+        f"  embed            {results['embed']['nodes_per_sec']:10.1f} nodes/s  ({results['embed']['model']})",
+        f"  write            {results['write']['nodes_per_sec']:10.1f} nodes/s  "
+        f"(index build {results['write']['index_build_seconds']:.2f}s)",
+    ]
+    retrieval = results["retrieval"]
+    latency = retrieval["latency_ms"]
+    lines.append(
+        f"  retrieval        p50 {latency['p50']:.2f} ms  p95 {latency['p95']:.2f} ms  "
+        f"p99 {latency['p99']:.2f} ms  recall@{retrieval['top_k']} {retrieval['recall']:.3f}"
+    )
+    return "\n".join(lines)
+
+
+def write_results(results: Dict[str, Any], path: Path) -> None:
+    path.write_text(json.dumps(results, indent=2, default=str), encoding='utf-8')
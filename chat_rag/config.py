@@ -22,3 +22,51 @@ ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
 # Embeddings
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "BAAI/bge-m3")
+
+# Embedding cache (set EMBED_CACHE_MAX_ENTRIES=0 to disable)
+EMBED_CACHE_PATH = Path(os.getenv("EMBED_CACHE_PATH", str(BASE_DIR / ".cache" / "embeddings.sqlite")))
+EMBED_CACHE_MAX_ENTRIES = int(os.getenv("EMBED_CACHE_MAX_ENTRIES", "250000"))
+
+# Database connection pool (shared by retrieval tools, REPL and web requests)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+# Approximate nearest neighbour index on the embeddings table
+VECTOR_INDEX_TYPE = os.getenv("VECTOR_INDEX_TYPE", "hnsw")  # "hnsw", "ivfflat" or "none"
+HNSW_M = int(os.getenv("HNSW_M", "16"))
+HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "64"))
+HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "40"))
+IVFFLAT_LISTS = int(os.getenv("IVFFLAT_LISTS", "0"))  # 0 = derive from row count
+IVFFLAT_PROBES = int(os.getenv("IVFFLAT_PROBES", "10"))
+
+# Postgres full-text search configuration used by keyword/hybrid search
+TEXT_SEARCH_CONFIG = os.getenv("TEXT_SEARCH_CONFIG", "english")
+
+# In-process retrieval caches
+QUERY_EMBED_CACHE_SIZE = int(os.getenv("QUERY_EMBED_CACHE_SIZE", "1024"))
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "600"))  # seconds
+
+# Optional second retrieval stage for search_conversations: fetch
+# RERANK_CANDIDATES conversations from pgvector, rescore them with a local
+# cross-encoder and return at most RERANK_TOP_K within RERANK_TOKEN_BUDGET
+# tokens of tool output (0 = no budget). For multilingual histories use
+# BAAI/bge-reranker-v2-m3 (slower on CPU).
+RERANK_ENABLED = os.getenv("RERANK_ENABLED", "false").lower() in ("1", "true", "yes")
+RERANK_MODEL = os.getenv("RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+RERANK_CANDIDATES = int(os.getenv("RERANK_CANDIDATES", "20"))
+RERANK_TOP_K = int(os.getenv("RERANK_TOP_K", "5"))
+RERANK_TOKEN_BUDGET = int(os.getenv("RERANK_TOKEN_BUDGET", "800"))
+RERANK_BATCH_SIZE = int(os.getenv("RERANK_BATCH_SIZE", "16"))
+
+# Web chat sessions (one agent + memory per browser session)
+CHAT_MAX_SESSIONS = int(os.getenv("CHAT_MAX_SESSIONS", "64"))
+CHAT_SESSION_IDLE_TIMEOUT = float(os.getenv("CHAT_SESSION_IDLE_TIMEOUT", "1800"))  # seconds
+
+# Load the models, DB pool and vector index when the web server starts
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+# Timing instrumentation exposed on /api/metrics; TIMING_HEADERS adds a
+# Server-Timing header with each request's span breakdown
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+TIMING_HEADERS = os.getenv("TIMING_HEADERS", "false").lower() in ("1", "true", "yes")
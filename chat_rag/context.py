@@ -0,0 +1,76 @@
+import threading
+from typing import Dict, Optional
+from llama_index.core import VectorStoreIndex
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.retrievers import BaseRetriever
+from llama_index.vector_stores.postgres import PGVectorStore
+from chat_rag.config import EMBEDDING_MODEL
+from chat_rag.storage import get_vector_store
+
+_embed_model: Optional[BaseEmbedding] = None
+_embed_model_lock = threading.Lock()
+
+def get_embed_model() -> BaseEmbedding:
+    """
+    Process-wide query embedding model, loaded on first use. Callers racing
+    the warm-up wait for its load instead of loading a second copy.
+    """
+    global _embed_model
+    if _embed_model is None:
+        with _embed_model_lock:
+            if _embed_model is None:
+                from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+                _embed_model = HuggingFaceEmbedding(model_name=EMBEDDING_MODEL)
+    return _embed_model
+
+class RetrievalContext:
+    """
+    Lazily initialized vector store, index and retrievers shared by every
+    tool call, REPL turn and web request in the process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._vector_store: Optional[PGVectorStore] = None
+        self._index: Optional[VectorStoreIndex] = None
+        self._retrievers: Dict[int, BaseRetriever] = {}
+
+    @property
+    def vector_store(self) -> PGVectorStore:
+        if self._vector_store is None:
+            with self._lock:
+                if self._vector_store is None:
+                    self._vector_store = get_vector_store()
+        return self._vector_store
+
+    @property
+    def index(self) -> VectorStoreIndex:
+        if self._index is None:
+            vector_store = self.vector_store
+            with self._lock:
+                if self._index is None:
+                    self._index = VectorStoreIndex.from_vector_store(
+                        vector_store=vector_store, embed_model=get_embed_model()
+                    )
+        return self._index
+
+    def retriever(self, similarity_top_k: int = 5) -> BaseRetriever:
+        """
+        Return a cached unfiltered retriever for the given top-k.
+        """
+        retriever = self._retrievers.get(similarity_top_k)
+        if retriever is None:
+            retriever = self.index.as_retriever(similarity_top_k=similarity_top_k)
+            self._retrievers[similarity_top_k] = retriever
+        return retriever
+
+_context: Optional[RetrievalContext] = None
+_context_lock = threading.Lock()
+
+def get_retrieval_context() -> RetrievalContext:
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                _context = RetrievalContext()
+    return _context
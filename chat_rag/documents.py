@@ -0,0 +1,80 @@
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from chat_rag.storage import EMBEDDINGS_TABLE, get_async_engine, get_engine
+
+# Expression index on the conversation id stored in each chunk's metadata
+CONVERSATION_ID_INDEX = f"{EMBEDDINGS_TABLE}_conversation_id_idx"
+# Set (to the leaf node id) on chunks of abandoned branches; absent on the canonical path
+BRANCH_KEY = "branch"
+# Export the conversation came from (e.g. "chatgpt"); kept out of embeddings
+SOURCE_KEY = "source"
+
+# Indexed expressions used by filtered search; queries must use them verbatim
+CREATE_TIME_EXPR = "((metadata_->>'create_time')::double precision)"
+TITLE_EXPR = "(metadata_->>'title')"
+SOURCE_EXPR = f"(metadata_->>'{SOURCE_KEY}')"
+
+def ensure_document_index(engine: Engine) -> None:
+    """
+    Index the `id` metadata key so whole conversations are looked up without a scan.
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {CONVERSATION_ID_INDEX} "
+            f"ON {EMBEDDINGS_TABLE} ((metadata_->>'id'))"
+        ))
+
+def ensure_metadata_indexes(engine: Engine) -> None:
+    """
+    Expression indexes for filtered search: B-trees on create_time and source,
+    and a trigram index on the title for case-insensitive substring matches.
+    The trigram index is skipped if the pg_trgm extension can't be created.
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {EMBEDDINGS_TABLE}_create_time_idx "
+            f"ON {EMBEDDINGS_TABLE} ({CREATE_TIME_EXPR})"
+        ))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {EMBEDDINGS_TABLE}_source_idx "
+            f"ON {EMBEDDINGS_TABLE} ({SOURCE_EXPR})"
+        ))
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {EMBEDDINGS_TABLE}_title_trgm_idx "
+                f"ON {EMBEDDINGS_TABLE} USING gin ({TITLE_EXPR} gin_trgm_ops)"
+            ))
+    except DBAPIError as e:
+        print(f"Title index not created (title filters will scan): {e.orig}")
+
+# Every chunk of one conversation's canonical path, in document order
+_DOCUMENT_CHUNKS_SQL = text(
+    f"SELECT text FROM {EMBEDDINGS_TABLE} "
+    f"WHERE metadata_->>'id' = :doc_id AND metadata_->>'{BRANCH_KEY}' IS NULL "
+    f"ORDER BY (metadata_->>'chunk_index')::int NULLS LAST, id"
+)
+
+def fetch_document_chunks(doc_id: str, engine: Optional[Engine] = None) -> List[str]:
+    """
+    Return every chunk of a conversation's canonical path in document order
+    with one SQL query. Chunks written before `chunk_index` was recorded fall
+    back to insertion order.
+    """
+    engine = engine or get_engine()
+    with engine.connect() as conn:
+        rows = conn.execute(_DOCUMENT_CHUNKS_SQL, {"doc_id": doc_id})
+        return [row[0] for row in rows]
+
+async def afetch_document_chunks(doc_id: str, engine: Optional[AsyncEngine] = None) -> List[str]:
+    """
+    `fetch_document_chunks` on the asyncpg pool.
+    """
+    engine = engine or get_async_engine()
+    async with engine.connect() as conn:
+        rows = await conn.execute(_DOCUMENT_CHUNKS_SQL, {"doc_id": doc_id})
+        return [row[0] for row in rows]
@@ -0,0 +1,93 @@
+import hashlib
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+# Chunks looked up per SQL statement; stays under SQLite's variable limit
+_LOOKUP_CHUNK = 500
+
+class EmbeddingCache:
+    """
+    Persistent SQLite cache of chunk embeddings keyed by
+    sha256(model name + chunk text), with least-recently-used eviction once
+    it holds more than `max_entries` vectors.
+
+    Safe to open from several processes at once (WAL mode).
+    """
+
+    def __init__(self, path: Path, model_name: str, max_entries: int):
+        self.path = Path(path)
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._last_used = 0.0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key BLOB PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+
+    def _now(self) -> float:
+        # Strictly increasing within a process so recency is never a tie
+        self._last_used = max(time.time(), self._last_used + 1e-6)
+        return self._last_used
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode('utf-8')).digest()
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Return the cached embedding for each text, or None where it is missing.
+        """
+        keys = [self._key(t) for t in texts]
+        found = {}
+        for i in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[i : i + _LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+            )
+            for key, blob in rows:
+                found[key] = array('f', blob).tolist()
+        if found:
+            now = self._now()
+            self._conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, k) for k in found]
+            )
+            self._conn.commit()
+        results = [found.get(k) for k in keys]
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return results
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        now = self._now()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+            [(self._key(t), array('f', v).tobytes(), now) for t, v in zip(texts, vectors)],
+        )
+        self._conn.commit()
+        self._evict()
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT count(*) FROM embeddings").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,109 +1,341 @@
-import json
-import hashlib
-import datetime as dt
-import html as html_mod
-import re
+import time
+from collections import deque
+from concurrent.futures import Future
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from llama_index.core import Document, VectorStoreIndex, Settings
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-from chat_rag.storage import get_storage_context
-from chat_rag.config import EMBEDDING_MODEL
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from llama_index.core import Document, Settings
+from chat_rag.storage import get_storage_context, get_engine
+from chat_rag.cache import invalidate_search_cache
+from chat_rag.ann import ann_index_exists, build_ann_index, drop_ann_index
+from chat_rag.documents import BRANCH_KEY, SOURCE_KEY, ensure_document_index, ensure_metadata_indexes
+from chat_rag.metrics import timed
+from chat_rag.manifest import IngestManifest, ManifestEntry, content_hash, pipeline_fingerprint
+from chat_rag.search import ensure_text_search_index
+from chat_rag.pipeline import (
+    MessageBlock,
+    chunk_and_embed,
+    chunk_documents,
+    create_embed_pool,
+    embed_nodes,
+    ensure_table,
+    open_embed_cache,
+    write_nodes,
+)
+from chat_rag.config import EMBEDDING_MODEL, VECTOR_INDEX_TYPE
+from chat_rag.normalize import Conversation, Message, normalize
+from chat_rag.streaming import ReadProgress, open_export
 
-def _read_json(path: Path) -> Any:
-    with path.open('r', encoding='utf-8') as f:
-        return json.load(f)
+# Value of the `source` metadata key on everything this module ingests
+EXPORT_SOURCE = "chatgpt"
+# Bump whenever conversation rendering changes so the manifest re-processes
+# conversations whose export entry is unchanged
+RENDER_VERSION = 3
 
-def _extract_json_from_html(path: Path) -> List[Dict[str, Any]]:
-    text = path.read_text(encoding='utf-8', errors='replace')
-    m = re.search(r"var\s+jsonData\s*=\s*(\[.*?\])\s*;", text, flags=re.DOTALL)
-    if not m:
-        raise ValueError("jsonData array not found in chat.html")
-    json_blob = m.group(1)
-    json_blob = html_mod.unescape(json_blob)
-    return json.loads(json_blob)
+def _message_blocks(messages: List[Message]) -> List[MessageBlock]:
+    blocks = []
+    for msg in Conversation.visible(messages):
+        text = '\n'.join(str(p) for p in msg.parts if p)
+        if text.strip():
+            blocks.append(MessageBlock(str(msg.role), f"[{msg.role}]: {text}"))
+    return blocks
 
-def _collect_messages(conversation: Dict[str, Any]) -> List[Dict[str, Any]]:
-    mapping = conversation.get('mapping', {}) or {}
-    messages: List[Dict[str, Any]] = []
-    for node in mapping.values():
-        msg = (node or {}).get('message')
-        if msg:
-            messages.append(msg)
-    
-    def key_fn(m: Dict[str, Any]):
-        ct = m.get('create_time')
-        return float(ct) if isinstance(ct, (int, float)) else float('inf')
-    
-    messages.sort(key=key_fn)
-    return messages
+@timed("ingest.render")
+def _render_blocks(conversation: Any) -> List[MessageBlock]:
+    """
+    Message blocks on the branch the user last saw (root to `current_node`,
+    or every message in time order without one). Hidden messages are skipped.
+    """
+    return _message_blocks(normalize(conversation).canonical)
 
-def _render_conversation(conversation: Dict[str, Any]) -> str:
-    messages = _collect_messages(conversation)
-    lines = []
-    for msg in messages:
-        role = (msg.get('author') or {}).get('role')
-        content = msg.get('content') or {}
-        parts = content.get('parts') or []
-        text = '\n'.join(str(p) for p in parts if p)
-        if text.strip():
-            lines.append(f"[{role}]: {text}")
-    return "\n\n".join(lines)
+def _render_conversation(conversation: Any) -> str:
+    return "\n\n".join(block.text for block in _render_blocks(conversation))
 
-def load_conversations(input_dir: Path) -> List[Dict[str, Any]]:
-    json_path = input_dir / 'conversations.json'
-    html_path = input_dir / 'chat.html'
-    
-    if json_path.exists():
-        return _read_json(json_path)
-    if html_path.exists():
-        return _extract_json_from_html(html_path)
-    raise FileNotFoundError("No conversations found in input directory")
+def load_conversations(input_dir: Path, progress: Optional[ReadProgress] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream conversations from the export one at a time.
+    `input_dir` may also be the export .zip, which is read without extracting it.
+    """
+    conversations, _ = open_export(input_dir, progress=progress)
+    return conversations
+
+def _iter_batches(items: Iterator[Any], batch_size: int) -> Iterator[List[Any]]:
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def ingest_data(
+    input_dir: Path,
+    limit: Optional[int] = None,
+    batch_size: int = 10,
+    force: bool = False,
+    embed_batch_size: int = 64,
+    workers: int = 1,
+    use_embed_cache: bool = True,
+    defer_index: bool = False,
+    include_branches: bool = False,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    conversation_hook: Optional[Callable[[Conversation], None]] = None,
+):
+    """
+    Embed conversations into the vector store.
 
-def ingest_data(input_dir: Path, limit: Optional[int] = None, batch_size: int = 10):
-    conversations = load_conversations(input_dir)
+    An ingestion manifest records a content hash per conversation id, so
+    unchanged conversations are skipped, changed ones have their old chunks
+    replaced and new ones are added. Entries also record a fingerprint of the
+    pipeline settings (embedding model, chunking, render version, branches);
+    conversations ingested under a different fingerprint are re-processed.
+    `force` re-embeds everything.
+
+    Each batch of conversations is chunked together, embedded in batches of
+    `embed_batch_size` nodes and written to the embeddings table with one COPY.
+    With `workers > 1` batches are chunked and embedded in a process pool, each
+    worker holding its own model, while this process remains the only writer.
+    Chunk embeddings are looked up in the on-disk embedding cache first unless
+    `use_embed_cache` is False.
+
+    Only the branch ending at each conversation's `current_node` is embedded,
+    chunked on message boundaries. `include_branches` also indexes every
+    abandoned branch (regenerated or edited turns) as a separate document
+    tagged with a `branch` metadata key.
+
+    The ANN index is (re)built once at the end if it is missing, even when
+    ingestion fails. With `defer_index` it is dropped first so bulk writes
+    skip index maintenance.
+
+    `progress_callback`, if given, receives a dict after every batch with the
+    stage, conversations parsed, chunks embedded, nodes written, throughput
+    and an ETA estimated from how much of the export has been read.
+
+    `conversation_hook`, if given, is called with every normalized
+    conversation in export order, unchanged ones included, so another output
+    (e.g. the Markdown export) can be produced from the same pass.
+    """
+    read_progress = ReadProgress()
+    conversations = load_conversations(input_dir, read_progress)
     
     if limit:
-        conversations = conversations[:limit]
+        conversations = islice(conversations, limit)
         print(f"Limiting to {limit} conversations.")
     
-    print(f"Found {len(conversations)} conversations to process.")
-    
     # Configure Settings
-    Settings.embed_model = HuggingFaceEmbedding(model_name=EMBEDDING_MODEL)
     Settings.llm = None
+    pool = None
+    cache = None
+    if workers > 1:
+        pool = create_embed_pool(workers, EMBEDDING_MODEL, embed_batch_size, use_cache=use_embed_cache)
+        print(f"Embedding with {workers} worker processes.")
+    else:
+        from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+        Settings.embed_model = HuggingFaceEmbedding(model_name=EMBEDDING_MODEL, embed_batch_size=embed_batch_size)
+        cache = open_embed_cache(EMBEDDING_MODEL) if use_embed_cache else None
     
     storage_context = get_storage_context()
     vector_store = storage_context.vector_store
+    ensure_table(vector_store)
+    engine = get_engine()
+    ensure_document_index(engine)
+    ensure_metadata_indexes(engine)
+    ensure_text_search_index(engine)
+    if defer_index:
+        drop_ann_index(engine)
+        print("ANN index dropped; it will be rebuilt after ingestion.")
+    manifest = IngestManifest(engine)
+    orphaned = manifest.delete_orphaned_nodes()
+    if orphaned:
+        print(f"Removed {orphaned} chunks stored without conversation metadata; their conversations will be re-ingested.")
+    splitter = Settings.node_parser
+    fingerprint = pipeline_fingerprint(
+        chunk_size=getattr(splitter, "chunk_size", None),
+        chunk_overlap=getattr(splitter, "chunk_overlap", None),
+        render_version=RENDER_VERSION,
+        include_branches=include_branches,
+    )
     
-    # Get existing index or create new one from vector store
-    index = VectorStoreIndex.from_vector_store(vector_store=vector_store)
+    total = 0
+    total_nodes = 0
+    total_embedded = 0
+    cache_hits = 0
+    counts = {"new": 0, "changed": 0, "unchanged": 0, "empty": 0}
+    started = time.perf_counter()
+    completed = False
     
-    total_batches = (len(conversations) + batch_size - 1) // batch_size
+    def report(stage: str, message: str) -> None:
+        if progress_callback is None:
+            return
+        elapsed = time.perf_counter() - started
+        fraction = min(1.0, total / limit) if limit else read_progress.fraction
+        if stage == "complete":
+            fraction = 1.0
+        eta = elapsed * (1 - fraction) / fraction if 0 < fraction < 1 else None
+        progress_callback({
+            "status": "running",
+            "stage": stage,
+            "message": message,
+            "progress": fraction,
+            "conversations_parsed": total,
+            "chunks_embedded": total_embedded,
+            "nodes_written": total_nodes,
+            "throughput": total_nodes / elapsed if elapsed > 0 else 0.0,
+            "elapsed_seconds": elapsed,
+            "eta_seconds": eta,
+            **counts,
+        })
     
-    for i in range(0, len(conversations), batch_size):
-        batch = conversations[i : i + batch_size]
-        print(f"Processing batch {i // batch_size + 1}/{total_batches} ({len(batch)} conversations)...")
-        
-        documents = []
-        for conv in batch:
-            text = _render_conversation(conv)
-            if not text.strip():
-                continue
+    def persist(documents: List[Document], entries: List[ManifestEntry], emptied: List[str], nodes, embedded) -> None:
+        nonlocal total_nodes, total_embedded, cache_hits
+        # Conversations that no longer render anything only lose their chunks
+        manifest.delete_nodes(emptied)
+        if documents:
+            cache_hits += embedded.cached
+            total_embedded += embedded.count
+            # Drop stale chunks of changed conversations (and any legacy rows) first
+            manifest.delete_nodes({d.metadata["id"] for d in documents if d.metadata["id"]})
+            written = write_nodes(engine, nodes)
+            invalidate_search_cache()
+            total_nodes += len(nodes)
+            print(
+                f"  {len(documents)} docs -> {len(nodes)} nodes: "
+                f"embedded at {embedded.rate:.1f} nodes/sec, written at {written.rate:.1f} nodes/sec"
+            )
+        # Record only after the chunks are persisted so an interrupted run is retried
+        manifest.record(entries)
+        report("writing", f"{total_nodes} nodes written")
+    
+    # Batches submitted to the pool, oldest first; bounded to keep memory flat
+    pending: Deque[Tuple[List[Document], List[ManifestEntry], List[str], Future]] = deque()
+    try:
+        for batch_num, batch in enumerate(_iter_batches(conversations, batch_size), 1):
+            total += len(batch)
+            print(f"Processing batch {batch_num} ({len(batch)} conversations, {total} so far)...")
+            report("parsing", f"Parsed {total} conversations")
+            
+            known = {} if force else manifest.lookup(c.get('id') for c in batch if c.get('id'))
+            documents = []
+            messages: List[List[MessageBlock]] = []
+            entries: List[ManifestEntry] = []
+            emptied: List[str] = []
+            for conv in batch:
+                if conversation_hook is not None:
+                    conv = normalize(conv)
+                    conversation_hook(conv)
+                conv_id = conv.get('id')
+                update_time = conv.get('update_time')
+                previous = known.get(conv_id)
+                # Entries from a different pipeline (model, chunking, rendering)
+                # describe stale chunks, whatever the conversation's state
+                current = previous is not None and previous.fingerprint == fingerprint
+                if current and update_time is not None and previous.update_time == update_time:
+                    counts["unchanged"] += 1
+                    continue
+                
+                conv = normalize(conv)
+                title = conv.get('title', 'Untitled')
+                blocks = _render_blocks(conv)
+                text = "\n\n".join(block.text for block in blocks)
+                if not text.strip():
+                    counts["empty"] += 1
+                    if conv_id:
+                        # Drop any chunks from when it still had content and
+                        # record it so the next run can skip it
+                        emptied.append(conv_id)
+                        entries.append(ManifestEntry(conv_id, content_hash("", str(title)), update_time, fingerprint))
+                    continue
                 
-            metadata = {
-                "title": conv.get('title', 'Untitled'),
-                "id": conv.get('id'),
-                "create_time": conv.get('create_time'),
-            }
+                branches = [
+                    (leaf, _message_blocks(msgs)) for leaf, msgs in conv.branches
+                ] if include_branches else []
+                branches = [(leaf, b) for leaf, b in branches if b]
+                
+                hashed = text + "".join(
+                    f"\n\n[branch {leaf}]\n\n" + "\n\n".join(x.text for x in b) for leaf, b in branches
+                )
+                digest = content_hash(hashed, str(title))
+                if conv_id:
+                    entries.append(ManifestEntry(conv_id, digest, update_time, fingerprint))
+                if current and previous.content_hash == digest:
+                    counts["unchanged"] += 1
+                    continue
+                counts["changed" if previous else "new"] += 1
+                    
+                metadata = {
+                    "title": title,
+                    "id": conv_id,
+                    "create_time": conv.get('create_time'),
+                    SOURCE_KEY: EXPORT_SOURCE,
+                }
+                
+                # Use the conversation id as the ref doc id so chunks can be replaced later.
+                # The source tag is only for filtering; it stays out of embeddings and prompts.
+                doc = Document(
+                    text=text,
+                    metadata=metadata,
+                    excluded_embed_metadata_keys=[SOURCE_KEY],
+                    excluded_llm_metadata_keys=[SOURCE_KEY],
+                    **({"id_": conv_id} if conv_id else {}),
+                )
+                documents.append(doc)
+                messages.append(blocks)
+                
+                for leaf, branch_blocks in branches:
+                    # Same conversation id (so it is replaced with the rest),
+                    # but its own ref doc and excluded from get_doc_content
+                    branch_doc = Document(
+                        text="\n\n".join(b.text for b in branch_blocks),
+                        metadata={**metadata, BRANCH_KEY: leaf},
+                        id_=f"{conv_id or doc.doc_id}#{leaf}",
+                        excluded_embed_metadata_keys=[BRANCH_KEY, SOURCE_KEY],
+                        excluded_llm_metadata_keys=[SOURCE_KEY],
+                    )
+                    documents.append(branch_doc)
+                    messages.append(branch_blocks)
             
-            doc = Document(text=text, metadata=metadata)
-            documents.append(doc)
+            if pool is None:
+                nodes = chunk_documents(documents, messages) if documents else []
+                embedded = embed_nodes(nodes, Settings.embed_model, cache)
+                persist(documents, entries, emptied, nodes, embedded)
+                continue
             
-        if documents:
-            # Insert documents into the index (this generates embeddings and persists)
-            # We use insert_nodes or refresh_ref_docs, but for simple ingestion:
-            for doc in documents:
-                index.insert(doc)
+            future = pool.submit(chunk_and_embed, documents, messages) if documents else None
+            pending.append((documents, entries, emptied, future))
+            while len(pending) > 2 * workers:
+                docs, ents, gone, fut = pending.popleft()
+                persist(docs, ents, gone, *(fut.result() if fut else ([], None)))
+        
+        while pending:
+            docs, ents, gone, fut = pending.popleft()
+            persist(docs, ents, gone, *(fut.result() if fut else ([], None)))
+        completed = True
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if cache is not None:
+            cache.close()
+        # Also after a failed or interrupted run, so `defer_index` never
+        # leaves the table without its ANN index
+        try:
+            if VECTOR_INDEX_TYPE != "none" and not ann_index_exists(engine):
+                print("Building ANN index...")
+                report("indexing", "Building ANN index")
+                elapsed = build_ann_index(engine)
+                print(f"ANN index built in {elapsed:.1f}s.")
+        except Exception as e:
+            if completed:
+                raise
+            # Don't mask the error that stopped ingestion (often the same
+            # unreachable database); the next run builds the index
+            print(f"Could not rebuild the ANN index after the failed ingestion: {e}")
                 
-    print("Ingestion complete.")
+    print(
+        f"Ingestion complete. Processed {total} conversations: "
+        f"{counts['new']} new, {counts['changed']} changed, "
+        f"{counts['unchanged']} unchanged, {counts['empty']} empty; {total_nodes} nodes written."
+    )
+    if use_embed_cache and total_nodes:
+        print(
+            f"Embedding cache: {cache_hits} hits, {total_nodes - cache_hits} misses "
+            f"({100.0 * cache_hits / total_nodes:.1f}% hit rate)."
+        )
+    report("complete", f"Ingested {total} conversations ({total_nodes} nodes written)")
@@ -1,6 +1,8 @@
+import threading
 from rich.console import Console
 from rich.markdown import Markdown
-from chat_rag.query import query_async, setup_agent
+from chat_rag.query import create_memory, query_async, setup_agent
+from chat_rag.warmup import warm_up
 
 console = Console()
 
@@ -11,6 +13,11 @@ async def start_repl_async():
     # Initialize agent once to maintain conversation history
     with console.status("[bold yellow]Initializing Agent...[/bold yellow]"):
         agent = setup_agent()
+        memory = create_memory()
+    
+    # Load the embedding model and DB pool while the user types; a query sent
+    # before it finishes waits for the model instead of loading another copy
+    threading.Thread(target=warm_up, daemon=True).start()
         
     # Set custom exception handler to suppress CancelledError noise from LlamaIndex instrumentation
     import asyncio
@@ -28,8 +35,8 @@ async def start_repl_async():
                 break
             
             with console.status("[bold yellow]Thinking...[/bold yellow]"):
-                # Pass the existing agent to preserve state
-                response = await query_async(user_input, agent=agent)
+                # Pass the existing agent and memory to preserve state
+                response = await query_async(user_input, agent=agent, memory=memory)
             
             console.print("[bold green]Assistant:[/bold green]")
             console.print(Markdown(str(response)))
@@ -0,0 +1,131 @@
+import hashlib
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from chat_rag.config import EMBEDDING_MODEL
+from chat_rag.storage import EMBEDDINGS_TABLE
+
+MANIFEST_TABLE = "ingest_manifest"
+
+class ManifestEntry(NamedTuple):
+    conversation_id: str
+    content_hash: str
+    update_time: Optional[float]
+    fingerprint: Optional[str] = None
+
+def content_hash(text_: str, title: str) -> str:
+    """
+    Hash of everything that ends up in the vector store for a conversation.
+    The embedding model is included so switching models re-embeds everything.
+    """
+    h = hashlib.sha1()
+    for part in (EMBEDDING_MODEL, title, text_):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+def pipeline_fingerprint(**settings) -> str:
+    """
+    Hash of the pipeline settings that shape the stored chunks (embedding
+    model, chunking, rendering). An entry written under a different
+    fingerprint is re-processed even if the conversation is unchanged.
+    """
+    h = hashlib.sha1(EMBEDDING_MODEL.encode('utf-8'))
+    for key in sorted(settings):
+        h.update(f"\0{key}={settings[key]!r}".encode('utf-8'))
+    return h.hexdigest()
+
+class IngestManifest:
+    """
+    Postgres table recording which version of each conversation is embedded.
+    Lets repeat ingests skip unchanged conversations and replace changed ones.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+                    conversation_id TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    update_time DOUBLE PRECISION,
+                    ingested_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+                """
+            ))
+            # Manifests created before fingerprints were recorded
+            conn.execute(text(f"ALTER TABLE {MANIFEST_TABLE} ADD COLUMN IF NOT EXISTS fingerprint TEXT"))
+
+    def lookup(self, conversation_ids: Iterable[str]) -> Dict[str, ManifestEntry]:
+        ids = list(conversation_ids)
+        if not ids:
+            return {}
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    f"SELECT conversation_id, content_hash, update_time, fingerprint "
+                    f"FROM {MANIFEST_TABLE} WHERE conversation_id = ANY(:ids)"
+                ),
+                {"ids": ids},
+            )
+            return {row[0]: ManifestEntry(*row) for row in rows}
+
+    def delete_nodes(self, conversation_ids: Iterable[str]) -> int:
+        """
+        Remove previously embedded chunks for these conversations.
+        Matches on the `id` metadata key so rows written before the manifest
+        existed are replaced as well.
+        """
+        ids = list(conversation_ids)
+        if not ids:
+            return 0
+        with self.engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT to_regclass(:table)"), {"table": EMBEDDINGS_TABLE}
+            ).scalar()
+            if exists is None:
+                return 0
+            result = conn.execute(
+                text(f"DELETE FROM {EMBEDDINGS_TABLE} WHERE metadata_->>'id' = ANY(:ids)"),
+                {"ids": ids},
+            )
+            return result.rowcount
+
+    def delete_orphaned_nodes(self) -> int:
+        """
+        Remove chunks the message-boundary chunker wrote without their
+        conversation's metadata (a `roles` key but no `id`). delete_nodes
+        cannot find them; their conversations are re-ingested because the
+        render version changed.
+        """
+        with self.engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT to_regclass(:table)"), {"table": EMBEDDINGS_TABLE}
+            ).scalar()
+            if exists is None:
+                return 0
+            result = conn.execute(text(
+                f"DELETE FROM {EMBEDDINGS_TABLE} "
+                f"WHERE metadata_->>'id' IS NULL AND metadata_->>'roles' IS NOT NULL"
+            ))
+            return result.rowcount
+
+    def record(self, entries: List[ManifestEntry]) -> None:
+        if not entries:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    f"""
+                    INSERT INTO {MANIFEST_TABLE} (conversation_id, content_hash, update_time, fingerprint, ingested_at)
+                    VALUES (:conversation_id, :content_hash, :update_time, :fingerprint, now())
+                    ON CONFLICT (conversation_id) DO UPDATE SET
+                        content_hash = EXCLUDED.content_hash,
+                        update_time = EXCLUDED.update_time,
+                        fingerprint = EXCLUDED.fingerprint,
+                        ingested_at = EXCLUDED.ingested_at
+                    """
+                ),
+                [entry._asdict() for entry in entries],
+            )
@@ -0,0 +1,197 @@
+"""
+Lightweight timing instrumentation for the hot paths.
+
+`span(name)` and `@timed(name)` record wall-clock durations into per-name
+histograms that `render_prometheus()` exposes in the Prometheus text format.
+While a request is being handled, `collect_request_timings()` also sums
+spans per name for that request, which the web app returns as a
+`Server-Timing` header.
+
+With METRICS_ENABLED=false, `timed` returns the function unchanged and
+`span` returns a shared no-op context manager, so the cost is one attribute
+check per call site.
+
+Only the standard library is used.
+"""
+import bisect
+import inspect
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from chat_rag.config import METRICS_ENABLED
+
+# Upper bounds in seconds; covers cache hits through slow LLM turns
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_NAME = "chat_rag_span_seconds"
+
+_NOOP = nullcontext()
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+F = TypeVar("F", bound=Callable)
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class Registry:
+    """
+    Thread-safe set of span histograms keyed by span name.
+    """
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + seconds
+
+    def snapshot(self) -> Dict[str, Tuple[List[int], float, int]]:
+        with self._lock:
+            return {
+                name: (list(h.counts), h.total, h.count)
+                for name, h in self._histograms.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+registry = Registry()
+
+
+def observe(name: str, seconds: float) -> None:
+    """
+    Record a duration measured elsewhere (e.g. between two streamed events).
+    """
+    if METRICS_ENABLED:
+        registry.observe(name, seconds)
+
+
+@contextmanager
+def _timed_span(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.observe(name, time.perf_counter() - start)
+
+
+def span(name: str):
+    """
+    Context manager timing the enclosed block under `name`.
+    """
+    if not METRICS_ENABLED:
+        return _NOOP
+    return _timed_span(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator timing every call of the function under `name`. Coroutine
+    functions are timed until the awaited result is ready.
+    """
+    def decorator(fn: F) -> F:
+        if not METRICS_ENABLED:
+            return fn
+
+        if inspect.iscoroutinefunction(fn):
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    registry.observe(name, time.perf_counter() - start)
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                registry.observe(name, time.perf_counter() - start)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+@contextmanager
+def collect_request_timings() -> Iterator[Dict[str, float]]:
+    """
+    Sum the spans recorded in this context (and threads started from it)
+    into the yielded dict.
+    """
+    timings: Dict[str, float] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def server_timing_header(timings: Dict[str, float]) -> str:
+    """
+    Format per-request timings as a `Server-Timing` header (durations in ms).
+    """
+    return ", ".join(
+        f"{name.replace('.', '-')};dur={seconds * 1000:.1f}" for name, seconds in timings.items()
+    )
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def render_prometheus(
+    gauges: Iterable[Tuple[str, str, Dict[str, str], float]] = (),
+    counters: Iterable[Tuple[str, str, Dict[str, str], float]] = (),
+) -> str:
+    """
+    All span histograms in the Prometheus text exposition format, followed by
+    any extra `(name, help, labels, value)` gauges and counters. Counter
+    names should end in `_total`.
+    """
+    lines = [
+        f"# HELP {METRIC_NAME} Wall-clock time spent in instrumented spans.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    for name, (counts, total, count) in sorted(registry.snapshot().items()):
+        label = f'span="{_label(name)}"'
+        cumulative = 0
+        for bound, n in zip(BUCKETS, counts):
+            cumulative += n
+            lines.append(f'{METRIC_NAME}_bucket{{{label},le="{bound}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_bucket{{{label},le="+Inf"}} {count}')
+        lines.append(f"{METRIC_NAME}_sum{{{label}}} {total}")
+        lines.append(f"{METRIC_NAME}_count{{{label}}} {count}")
+
+    # Samples of one metric must be contiguous, after its HELP and TYPE lines
+    families: Dict[str, List[str]] = {}
+    for kind, samples in (("gauge", gauges), ("counter", counters)):
+        for name, help_text, labels, value in samples:
+            family = families.setdefault(name, [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"])
+            label_str = ",".join(f'{k}="{_label(str(v))}"' for k, v in labels.items())
+            family.append(f"{name}{{{label_str}}} {value}" if label_str else f"{name} {value}")
+    for family in families.values():
+        lines.extend(family)
+    return "\n".join(lines) + "\n"
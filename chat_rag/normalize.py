@@ -0,0 +1,140 @@
+"""
+Normalized conversation records shared by the Markdown exporter
+(`parse_export.py`) and the RAG ingester (`chat_rag.ingest`).
+
+`normalize()` turns one raw export conversation into a `Conversation` whose
+messages are compact `Message` objects with parsed timestamps and a
+precomputed `hidden` flag, already ordered three ways:
+
+- `messages`: every message by (create_time, update_time, id)
+- `canonical`: the branch ending at `current_node`, root first
+- `branches`: each abandoned branch (regenerated or edited turns) from its
+  fork point to its leaf
+
+Rendering is left to the consumers. Only the standard library is used.
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """Epoch seconds from a number or numeric string; None otherwise."""
+    if isinstance(value, (int, float, str)) and str(value).replace('.', '', 1).isdigit():
+        return float(value)
+    return None
+
+
+def _is_hidden(role: Optional[str], content: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
+    if metadata.get('is_visually_hidden_from_conversation') is True:
+        return True
+    # Hide empty system placeholders
+    parts = content.get('parts') or []
+    return (
+        role == 'system'
+        and content.get('content_type') == 'text'
+        and all((p or '').strip() == '' for p in parts)
+    )
+
+
+class Message:
+    __slots__ = (
+        'node_id', 'id', 'role', 'create_time', 'update_time',
+        'content_type', 'content', 'metadata', 'hidden',
+    )
+
+    def __init__(self, node_id: str, raw: Dict[str, Any]):
+        self.node_id = node_id
+        self.id = raw.get('id') or ''
+        self.role: Optional[str] = (raw.get('author') or {}).get('role')
+        # Raw values are kept (not parsed) so renderers format them as before
+        self.create_time = raw.get('create_time')
+        self.update_time = raw.get('update_time')
+        self.content: Dict[str, Any] = raw.get('content') or {}
+        self.content_type: str = self.content.get('content_type') or 'text'
+        self.metadata: Dict[str, Any] = raw.get('metadata') or {}
+        self.hidden = _is_hidden(self.role, self.content, self.metadata)
+
+    @property
+    def parts(self) -> List[Any]:
+        return self.content.get('parts') or []
+
+    def sort_key(self) -> Tuple[float, float, str]:
+        ct = parse_timestamp(self.create_time)
+        ut = parse_timestamp(self.update_time)
+        return (
+            ct if ct is not None else float('inf'),
+            ut if ut is not None else float('inf'),
+            self.id,
+        )
+
+
+class Conversation:
+    __slots__ = (
+        'raw', 'id', 'title', 'create_time', 'update_time',
+        'current_node', 'messages', 'canonical', 'branches',
+    )
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.id: Optional[str] = raw.get('id')
+        self.title = raw.get('title')
+        self.create_time = raw.get('create_time')
+        self.update_time = raw.get('update_time')
+        self.current_node: Optional[str] = raw.get('current_node')
+
+        mapping: Dict[str, Any] = raw.get('mapping', {}) or {}
+        by_node: Dict[str, Message] = {}
+        for node_id, node in mapping.items():
+            msg = (node or {}).get('message')
+            if msg:
+                by_node[node_id] = Message(node_id, msg)
+        self.messages: List[Message] = sorted(by_node.values(), key=Message.sort_key)
+
+        path = _path_to_root(mapping, self.current_node)
+        if path:
+            on_path = set(path)
+            self.canonical: List[Message] = [by_node[n] for n in path if n in by_node]
+            self.branches: List[Tuple[str, List[Message]]] = []
+            for node_id, node in mapping.items():
+                if node_id in on_path or (node or {}).get('children'):
+                    continue
+                branch = [by_node[n] for n in _path_to_root(mapping, node_id, stop=on_path) if n in by_node]
+                if branch:
+                    self.branches.append((node_id, branch))
+        else:
+            # No usable current_node: treat every message as one thread
+            self.canonical = self.messages
+            self.branches = []
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Raw conversation field (project ids, conversation_id, ...)."""
+        return self.raw.get(key, default)
+
+    @staticmethod
+    def visible(messages: List[Message], include_tools: bool = True) -> List[Message]:
+        """Drop hidden messages, and tool messages unless `include_tools`."""
+        return [
+            m for m in messages
+            if not m.hidden and (include_tools or m.role != 'tool')
+        ]
+
+
+def _path_to_root(mapping: Dict[str, Any], node_id: Optional[str], stop: Optional[Set[str]] = None) -> List[str]:
+    """Node ids from `node_id` up to the root (or the first id in `stop`,
+    exclusive), returned root first. Guards against cycles."""
+    path: List[str] = []
+    seen: Set[str] = set()
+    while node_id and node_id in mapping and node_id not in seen:
+        if stop is not None and node_id in stop:
+            break
+        seen.add(node_id)
+        path.append(node_id)
+        node_id = (mapping[node_id] or {}).get('parent')
+    path.reverse()
+    return path
+
+
+def normalize(conversation: Any) -> Conversation:
+    """Normalize a raw export conversation; already-normalized ones pass through."""
+    if isinstance(conversation, Conversation):
+        return conversation
+    return Conversation(conversation)
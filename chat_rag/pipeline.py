@@ -0,0 +1,239 @@
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from llama_index.core import Document, Settings
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.node_parser.node_utils import build_nodes_from_splits
+from llama_index.core.schema import BaseNode, MetadataMode
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
+from llama_index.vector_stores.postgres import PGVectorStore
+from sqlalchemy.engine import Engine
+from chat_rag.config import EMBED_CACHE_MAX_ENTRIES, EMBED_CACHE_PATH
+from chat_rag.embed_cache import EmbeddingCache
+from chat_rag.metrics import timed
+from chat_rag.storage import EMBEDDINGS_TABLE
+
+class StageTiming(NamedTuple):
+    count: int
+    seconds: float
+    cached: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.seconds if self.seconds > 0 else float('inf')
+
+# Per-chunk bookkeeping that must not leak into embeddings or LLM prompts
+CHUNK_INDEX_KEY = "chunk_index"
+# Comma-separated authors of the messages in a chunk, e.g. "user,assistant"
+ROLES_KEY = "roles"
+
+class MessageBlock(NamedTuple):
+    """One rendered message of a conversation document."""
+    role: str
+    text: str
+
+def _group_messages(
+    document: Document, blocks: Sequence[MessageBlock], splitter: SentenceSplitter
+) -> List[Tuple[str, List[str]]]:
+    """
+    Pack whole messages into chunks of up to the splitter's chunk size.
+    Only a message that is too long on its own is split (by sentence).
+    """
+    metadata_str = document.get_metadata_str(mode=MetadataMode.EMBED)
+    budget = splitter.chunk_size - len(splitter._tokenizer(metadata_str))
+    separator = "\n\n"
+    separator_len = len(splitter._tokenizer(separator))
+
+    pieces: List[Tuple[str, str, int]] = []
+    for block in blocks:
+        size = len(splitter._tokenizer(block.text))
+        if size <= budget:
+            pieces.append((block.role, block.text, size))
+        else:
+            for part in splitter.split_text_metadata_aware(block.text, metadata_str):
+                pieces.append((block.role, part, len(splitter._tokenizer(part))))
+
+    groups: List[Tuple[str, List[str]]] = []
+    texts: List[str] = []
+    roles: List[str] = []
+    used = 0
+    for role, piece, size in pieces:
+        if texts and used + separator_len + size > budget:
+            groups.append((separator.join(texts), roles))
+            texts, roles, used = [], [], 0
+        used += size + (separator_len if texts else 0)
+        texts.append(piece)
+        if role not in roles:
+            roles.append(role)
+    if texts:
+        groups.append((separator.join(texts), roles))
+    return groups
+
+def chunk_documents(
+    documents: Sequence[Document],
+    messages: Optional[Sequence[Optional[Sequence[MessageBlock]]]] = None,
+) -> List[BaseNode]:
+    """
+    Split a whole batch of documents into nodes with the configured node parser.
+    Each node records its ordinal within its document so the document can be
+    reassembled in order without a vector search.
+
+    `messages`, if given, holds the rendered message blocks of each document
+    (in the same order). Those documents are chunked on message boundaries
+    and each node records the roles it contains; others use the parser as is.
+    """
+    splitter = Settings.node_parser
+    if messages is None or not isinstance(splitter, SentenceSplitter):
+        nodes = splitter.get_nodes_from_documents(documents)
+    else:
+        nodes = []
+        for document, blocks in zip(documents, messages):
+            if not blocks:
+                nodes.extend(splitter.get_nodes_from_documents([document]))
+                continue
+            groups = _group_messages(document, blocks, splitter)
+            doc_nodes = build_nodes_from_splits([text for text, _ in groups], document)
+            for node, (_, roles) in zip(doc_nodes, groups):
+                # build_nodes_from_splits leaves metadata to the parser's own
+                # postprocessing, which this path skips; copy it like the parser
+                if splitter.include_metadata:
+                    node.metadata = {**document.metadata, **node.metadata}
+                node.metadata[ROLES_KEY] = ",".join(roles)
+                node.excluded_embed_metadata_keys.append(ROLES_KEY)
+            nodes.extend(doc_nodes)
+    ordinals: Dict[str, int] = {}
+    for node in nodes:
+        ordinal = ordinals.get(node.ref_doc_id, 0)
+        ordinals[node.ref_doc_id] = ordinal + 1
+        node.metadata[CHUNK_INDEX_KEY] = ordinal
+        node.excluded_embed_metadata_keys.append(CHUNK_INDEX_KEY)
+        node.excluded_llm_metadata_keys.append(CHUNK_INDEX_KEY)
+    return nodes
+
+@timed("embed.nodes")
+def embed_nodes(
+    nodes: Sequence[BaseNode],
+    embed_model: BaseEmbedding,
+    cache: Optional[EmbeddingCache] = None,
+) -> StageTiming:
+    """
+    Embed nodes in place. The model batches internally by its `embed_batch_size`,
+    so all nodes of an ingestion batch are passed in a single call.
+    Chunks found in `cache` are not sent to the model.
+    """
+    start = time.perf_counter()
+    texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+    embeddings = cache.get_many(texts) if cache else [None] * len(texts)
+    missing = [i for i, e in enumerate(embeddings) if e is None]
+    if missing:
+        computed = embed_model.get_text_embedding_batch([texts[i] for i in missing])
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+        if cache:
+            cache.put_many([texts[i] for i in missing], computed)
+    for node, embedding in zip(nodes, embeddings):
+        node.embedding = embedding
+    return StageTiming(len(nodes), time.perf_counter() - start, len(nodes) - len(missing))
+
+def open_embed_cache(model_name: str) -> Optional[EmbeddingCache]:
+    """
+    Open the configured on-disk embedding cache, or None if it is disabled.
+    """
+    if EMBED_CACHE_MAX_ENTRIES <= 0:
+        return None
+    return EmbeddingCache(EMBED_CACHE_PATH, model_name, EMBED_CACHE_MAX_ENTRIES)
+
+# Per-process model and cache used by embedding workers
+_worker_embed_model: Optional[BaseEmbedding] = None
+_worker_cache: Optional[EmbeddingCache] = None
+
+def _init_embed_worker(model_name: str, embed_batch_size: int, num_threads: int, use_cache: bool) -> None:
+    global _worker_embed_model, _worker_cache
+    import torch
+    from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+
+    # Split the cores between workers instead of each one grabbing all of them
+    torch.set_num_threads(num_threads)
+    _worker_embed_model = HuggingFaceEmbedding(model_name=model_name, embed_batch_size=embed_batch_size)
+    _worker_cache = open_embed_cache(model_name) if use_cache else None
+
+def chunk_and_embed(
+    documents: Sequence[Document],
+    messages: Optional[Sequence[Optional[Sequence[MessageBlock]]]] = None,
+) -> Tuple[List[BaseNode], StageTiming]:
+    """
+    Worker entry point: chunk and embed one batch with the process-local model.
+    """
+    nodes = chunk_documents(documents, messages)
+    return nodes, embed_nodes(nodes, _worker_embed_model, _worker_cache)
+
+def create_embed_pool(
+    workers: int, model_name: str, embed_batch_size: int, use_cache: bool = True
+) -> ProcessPoolExecutor:
+    """
+    Start a pool of embedding workers, each loading its own copy of the model.
+    """
+    num_threads = max(1, (os.cpu_count() or 1) // workers)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        # torch is not fork-safe once initialised, so always start fresh interpreters
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_embed_worker,
+        initargs=(model_name, embed_batch_size, num_threads, use_cache),
+    )
+
+def ensure_table(vector_store: PGVectorStore) -> None:
+    """
+    Make sure the embeddings table exists before writing to it directly.
+    """
+    # add() runs the store's schema/table setup; an empty batch writes nothing
+    vector_store.add([])
+
+def _copy_field(value: Optional[str]) -> str:
+    # Escape for COPY text format; Postgres text cannot hold NUL bytes
+    if value is None:
+        return '\\N'
+    return (
+        value.replace('\x00', '')
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+@timed("store.write")
+def write_nodes(engine: Engine, nodes: Sequence[BaseNode], table: str = EMBEDDINGS_TABLE) -> StageTiming:
+    """
+    Bulk-write embedded nodes to the embeddings table with a single COPY.
+    Rows match what PGVectorStore.add would insert.
+    """
+    start = time.perf_counter()
+    buf = io.StringIO()
+    for node in nodes:
+        metadata = node_to_metadata_dict(node, remove_text=True, flat_metadata=False)
+        embedding = '[' + ','.join(repr(float(x)) for x in node.get_embedding()) + ']'
+        buf.write('\t'.join((
+            _copy_field(node.get_content(metadata_mode=MetadataMode.NONE)),
+            _copy_field(json.dumps(metadata)),
+            _copy_field(node.node_id),
+            embedding,
+        )))
+        buf.write('\n')
+    buf.seek(0)
+
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cur:
+            cur.copy_expert(
+                f"COPY {table} (text, metadata_, node_id, embedding) FROM STDIN",
+                buf,
+            )
+        raw.commit()
+    finally:
+        raw.close()
+    return StageTiming(len(nodes), time.perf_counter() - start)
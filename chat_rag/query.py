@@ -1,15 +1,16 @@
 import asyncio
+from functools import lru_cache
+from typing import Optional, Tuple
 # import nest_asyncio
 # nest_asyncio.apply()
 
-from llama_index.core import VectorStoreIndex
-from llama_index.llms.ollama import Ollama
-from llama_index.llms.anthropic import Anthropic
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 from llama_index.core import Settings
+from llama_index.core.llms import LLM
+from llama_index.core.memory import BaseMemory, ChatMemoryBuffer
+from llama_index.core.memory.chat_memory_buffer import DEFAULT_TOKEN_LIMIT_RATIO
+from llama_index.core.tools import FunctionTool
 from llama_index.core.agent.workflow import FunctionAgent, ReActAgent
-from chat_rag.storage import get_vector_store
-from chat_rag.config import EMBEDDING_MODEL, LLM_MODEL, LLM_PROVIDER, ANTHROPIC_API_KEY
+from chat_rag.config import LLM_MODEL, LLM_PROVIDER, ANTHROPIC_API_KEY
 from chat_rag.tools import get_rag_tools
 
 SYSTEM_PROMPT = """
@@ -17,10 +18,12 @@ You are a helpful AI assistant for exploring a user's ChatGPT conversation histo
 You have access to tools to search conversations and retrieve full document contents.
 
 GUIDELINES:
-1. **Search First**: When asked about a topic, use `search_conversations` to find relevant items.
-2. **Full Content**: If the user asks to see a "whole conversation", "full text", or "source", use `get_doc_content` with the specific ID found from search.
-3. **Citations**: Always cite the Title and ID of conversations you reference.
-4. **Follow-up Questions**: At the very end of your response, ALWAYS provide 1-3 relevant follow-up questions to help the user explore further. Format them as a numbered list.
+1. **Search First**: When asked about a topic, use `search_conversations` to find relevant items. If the question names a time period ("in March 2024") or a title, pass `date_from`/`date_to` or `title_contains` rather than filtering the results yourself.
+2. **Several Angles**: To look for a topic under different wordings or related subtopics, call `multi_search_conversations` once with all the queries instead of searching repeatedly.
+3. **Exact Terms**: For exact identifiers (error codes, function names, file names), use `hybrid_search_conversations`; set `keyword_only` to true for a purely literal match.
+4. **Full Content**: If the user asks to see a "whole conversation", "full text", or "source", use `get_doc_content` with the specific ID found from search.
+5. **Citations**: Always cite the Title and ID of conversations you reference.
+6. **Follow-up Questions**: At the very end of your response, ALWAYS provide 1-3 relevant follow-up questions to help the user explore further. Format them as a numbered list.
 
 Example Follow-ups:
 1. Would you like to see the full content of the "Resume Review" conversation?
@@ -28,20 +31,32 @@ Example Follow-ups:
 3. Do you want to summarize the key points from this thread?
 """
 
+@lru_cache(maxsize=None)
+def get_llm() -> LLM:
+    """
+    Process-wide LLM client shared by every agent and chat session.
+    """
+    # Only the configured provider's client library is imported
+    if LLM_PROVIDER == "anthropic":
+        from llama_index.llms.anthropic import Anthropic
+        return Anthropic(model=LLM_MODEL, api_key=ANTHROPIC_API_KEY)
+    from llama_index.llms.ollama import Ollama
+    return Ollama(model=LLM_MODEL, request_timeout=600.0)
+
+@lru_cache(maxsize=None)
+def get_tools() -> Tuple[FunctionTool, ...]:
+    return tuple(get_rag_tools())
+
 def setup_agent():
-    # Setup Embedding Model
-    Settings.embed_model = HuggingFaceEmbedding(model_name=EMBEDDING_MODEL)
+    # The embedding model is a process-wide singleton loaded by the first
+    # vector search, so keyword-only sessions never load it
     
-    # Setup LLM based on provider
-    if LLM_PROVIDER == "anthropic":
-        Settings.llm = Anthropic(model=LLM_MODEL, api_key=ANTHROPIC_API_KEY)
-        AgentClass = FunctionAgent
-    else:  # ollama
-        Settings.llm = Ollama(model=LLM_MODEL, request_timeout=600.0)
-        AgentClass = ReActAgent
+    # Setup LLM based on provider; the client is shared by all agents
+    Settings.llm = get_llm()
+    AgentClass = FunctionAgent if LLM_PROVIDER == "anthropic" else ReActAgent
     
     # Get Tools
-    tools = get_rag_tools()
+    tools = list(get_tools())
     
     # Create Agent (Workflow)
     agent = AgentClass(
@@ -52,10 +67,28 @@ def setup_agent():
     
     return agent
 
-async def query_async(question: str, agent=None):
+@lru_cache(maxsize=None)
+def _memory_token_limit() -> int:
+    # Ollama looks the context window up on the server, so only ask once
+    return int(get_llm().metadata.context_window * DEFAULT_TOKEN_LIMIT_RATIO)
+
+def create_memory() -> BaseMemory:
+    """
+    Fresh chat history for one conversation with the agent.
+    """
+    return ChatMemoryBuffer.from_defaults(token_limit=_memory_token_limit())
+
+async def query_async(question: str, agent=None, memory: Optional[BaseMemory] = None):
     if agent is None:
         agent = setup_agent()
-    return await agent.run(user_msg=question)
+    return await agent.run(user_msg=question, memory=memory)
 
 def query(question: str):
-    return asyncio.run(query_async(question))
+    async def run():
+        try:
+            return await query_async(question)
+        finally:
+            # asyncpg connections belong to this loop; the next asyncio.run opens new ones
+            from chat_rag.storage import get_async_engine
+            await get_async_engine().dispose()
+    return asyncio.run(run())
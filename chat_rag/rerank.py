@@ -0,0 +1,74 @@
+"""
+Optional second retrieval stage for `search_conversations`.
+
+pgvector returns a wide, cheap candidate set (RERANK_CANDIDATES distinct
+conversations, grouped in SQL); a local cross-encoder then scores every
+(query, snippet) pair in batches and the best RERANK_TOP_K conversations are
+kept. The tool trims that list further to RERANK_TOKEN_BUDGET tokens of
+output, so the LLM reads fewer, more precise results.
+"""
+import asyncio
+import threading
+from typing import Any, List, Optional, Sequence
+from chat_rag.cache import search_result_cache
+from chat_rag.config import RERANK_BATCH_SIZE, RERANK_CANDIDATES, RERANK_MODEL
+from chat_rag.metrics import timed
+from chat_rag.search import (
+    ConversationHits,
+    SearchFilters,
+    agrouped_vector_search,
+    grouped_vector_search,
+)
+
+_reranker: Optional[Any] = None
+_reranker_lock = threading.Lock()
+
+def get_reranker():
+    """
+    Process-wide cross-encoder, loaded once on first use.
+    """
+    global _reranker
+    if _reranker is None:
+        with _reranker_lock:
+            if _reranker is None:
+                from sentence_transformers import CrossEncoder
+                _reranker = CrossEncoder(RERANK_MODEL)
+    return _reranker
+
+@timed("search.rerank")
+def rerank(query: str, conversations: Sequence[ConversationHits], top_k: int) -> List[ConversationHits]:
+    """
+    Rescore conversations by their best snippet according to the
+    cross-encoder; snippets are reordered by the new scores as well.
+    All pairs are scored in one batched `predict` call.
+    """
+    pairs = [(query, hit.text) for conv in conversations for hit in conv.hits]
+    if not pairs:
+        return []
+    scores = iter(get_reranker().predict(pairs, batch_size=RERANK_BATCH_SIZE, show_progress_bar=False))
+    rescored = []
+    for conv in conversations:
+        hits = sorted(
+            (hit._replace(score=float(next(scores))) for hit in conv.hits),
+            key=lambda h: h.score,
+            reverse=True,
+        )
+        rescored.append(conv._replace(score=hits[0].score, hits=hits))
+    rescored.sort(key=lambda c: c.score, reverse=True)
+    return rescored[:top_k]
+
+def rerank_search(query: str, top_k: int, filters: Optional[SearchFilters] = None) -> List[ConversationHits]:
+    return search_result_cache.get_or_compute(
+        ("rerank", query, top_k, filters),
+        lambda: rerank(query, grouped_vector_search(query, RERANK_CANDIDATES, filters), top_k),
+    )
+
+async def arerank_search(query: str, top_k: int, filters: Optional[SearchFilters] = None) -> List[ConversationHits]:
+    """
+    Async `rerank_search`: candidates come from the asyncpg pool and the
+    cross-encoder runs in a worker thread.
+    """
+    async def run() -> List[ConversationHits]:
+        candidates = await agrouped_vector_search(query, RERANK_CANDIDATES, filters)
+        return await asyncio.to_thread(rerank, query, candidates, top_k)
+    return await search_result_cache.aget_or_compute(("rerank", query, top_k, filters), run)
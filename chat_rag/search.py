@@ -0,0 +1,362 @@
+import asyncio
+import datetime as dt
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from llama_index.core.schema import NodeWithScore, QueryBundle
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from chat_rag.config import HNSW_EF_SEARCH, TEXT_SEARCH_CONFIG
+from chat_rag.cache import query_embedding_cache, search_result_cache
+from chat_rag.context import get_embed_model, get_retrieval_context
+from chat_rag.documents import CREATE_TIME_EXPR, SOURCE_EXPR, TITLE_EXPR
+from chat_rag.metrics import span, timed
+from chat_rag.storage import EMBEDDINGS_TABLE, get_async_engine, get_engine
+
+TEXT_SEARCH_COLUMN = "text_search_tsv"
+TEXT_SEARCH_INDEX = f"{EMBEDDINGS_TABLE}_{TEXT_SEARCH_COLUMN}_idx"
+# Standard reciprocal rank fusion constant
+RRF_K = 60
+# Chunks fetched per requested conversation before grouping; the best
+# chunks of a conversation are usually neighbours in the ranking
+GROUP_OVERFETCH = 10
+SNIPPETS_PER_CONVERSATION = 2
+
+# Over-fetch the nearest chunks with the ANN index (after any metadata
+# filters), then rank conversations by their best chunk and keep the top
+# `top_k` with up to `snippets` chunks each. Chunks without a conversation id
+# (legacy rows) stand alone.
+_GROUPED_SEARCH_SQL = """
+WITH candidates AS (
+    SELECT node_id, text, metadata_,
+           COALESCE(metadata_->>'id', node_id) AS conv_key,
+           embedding <=> CAST(CAST(:embedding AS text) AS vector) AS distance
+    FROM {table}
+    {where}
+    ORDER BY embedding <=> CAST(CAST(:embedding AS text) AS vector)
+    LIMIT :candidates
+), ranked AS (
+    SELECT *,
+           row_number() OVER (PARTITION BY conv_key ORDER BY distance, node_id) AS chunk_rank,
+           min(distance) OVER (PARTITION BY conv_key) AS best_distance
+    FROM candidates
+), conversations AS (
+    SELECT *, dense_rank() OVER (ORDER BY best_distance, conv_key) AS conv_rank
+    FROM ranked
+    WHERE chunk_rank <= :snippets
+)
+SELECT conv_key, node_id, metadata_->>'id', metadata_->>'title', metadata_->'create_time', text,
+       1 - distance AS score
+FROM conversations
+WHERE conv_rank <= :top_k
+ORDER BY conv_rank, chunk_rank
+"""
+# HNSW scans return at most ef_search rows, so widen it for large over-fetches
+_SET_EF_SEARCH_SQL = text("SELECT set_config('hnsw.ef_search', :ef_search, true)")
+# With a filter, ANN scans keep going until enough rows pass it (pgvector 0.8+;
+# a no-op on older versions, which filter the first ef_search rows only)
+_ITERATIVE_SCAN_SQL = text(
+    "SELECT set_config('hnsw.iterative_scan', 'relaxed_order', true), "
+    "set_config('ivfflat.iterative_scan', 'relaxed_order', true) "
+    "WHERE EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector' "
+    "AND string_to_array(extversion, '.')::int[] >= '{0,8}')"
+)
+
+class SearchHit(NamedTuple):
+    node_id: str
+    doc_id: Optional[str]
+    title: Optional[str]
+    create_time: Any
+    text: str
+    score: float
+
+class SearchFilters(NamedTuple):
+    # Epoch seconds on the conversation's create_time; date_to is exclusive
+    date_from: Optional[float] = None
+    date_to: Optional[float] = None
+    # Case-insensitive substring of the title
+    title_contains: Optional[str] = None
+    source: Optional[str] = None
+
+def parse_date_bound(value: str, end: bool = False) -> float:
+    """
+    Epoch seconds for `YYYY`, `YYYY-MM`, `YYYY-MM-DD` or an ISO datetime
+    (UTC unless it has an offset). With `end`, a date-only value covers the
+    whole year, month or day, so the bound is the start of the next one.
+    """
+    value = value.strip()
+    if re.fullmatch(r"\d{4}", value):
+        start = dt.datetime(int(value), 1, 1)
+        following = dt.datetime(start.year + 1, 1, 1)
+    elif re.fullmatch(r"\d{4}-\d{2}", value):
+        start = dt.datetime.strptime(value, "%Y-%m")
+        following = dt.datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+    else:
+        start = dt.datetime.fromisoformat(value)
+        date_only = re.fullmatch(r"\d{4}-\d{2}-\d{2}", value) is not None
+        following = start + dt.timedelta(days=1) if date_only else start
+    bound = following if end else start
+    if bound.tzinfo is None:
+        bound = bound.replace(tzinfo=dt.timezone.utc)
+    return bound.timestamp()
+
+def _filter_clause(filters: Optional[SearchFilters]) -> Tuple[str, Dict[str, Any]]:
+    """
+    WHERE clause over the indexed metadata expressions, and its parameters.
+    """
+    if filters is None:
+        return "", {}
+    conditions, params = [], {}
+    if filters.date_from is not None:
+        conditions.append(f"{CREATE_TIME_EXPR} >= :date_from")
+        params["date_from"] = filters.date_from
+    if filters.date_to is not None:
+        conditions.append(f"{CREATE_TIME_EXPR} < :date_to")
+        params["date_to"] = filters.date_to
+    if filters.title_contains:
+        escaped = re.sub(r"([\\%_])", r"\\\1", filters.title_contains)
+        conditions.append(f"{TITLE_EXPR} ILIKE :title_pattern")
+        params["title_pattern"] = f"%{escaped}%"
+    if filters.source:
+        conditions.append(f"{SOURCE_EXPR} = :source")
+        params["source"] = filters.source
+    if not conditions:
+        return "", {}
+    return "WHERE " + " AND ".join(conditions), params
+
+class ConversationHits(NamedTuple):
+    doc_id: Optional[str]
+    title: Optional[str]
+    create_time: Any
+    # Best chunk score for the conversation
+    score: float
+    # Queries that matched it, in the order given
+    queries: List[str]
+    # Distinct matching chunks, best first
+    hits: List[SearchHit]
+
+def ensure_text_search_index(engine: Engine) -> None:
+    """
+    Add a generated tsvector column over chunk text and a GIN index on it.
+    Adding the column rewrites the table once; later calls are no-ops.
+    """
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"ALTER TABLE {EMBEDDINGS_TABLE} ADD COLUMN IF NOT EXISTS {TEXT_SEARCH_COLUMN} tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('{TEXT_SEARCH_CONFIG}', text)) STORED"
+        ))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {TEXT_SEARCH_INDEX} "
+            f"ON {EMBEDDINGS_TABLE} USING gin ({TEXT_SEARCH_COLUMN})"
+        ))
+
+def hits_from_nodes(nodes: Sequence[NodeWithScore]) -> List[SearchHit]:
+    return [
+        SearchHit(
+            node_id=n.node.node_id,
+            doc_id=n.metadata.get('id'),
+            title=n.metadata.get('title'),
+            create_time=n.metadata.get('create_time'),
+            text=n.text,
+            score=n.score or 0.0,
+        )
+        for n in nodes
+    ]
+
+def embed_query(query: str) -> List[float]:
+    """
+    Embed a query, reusing the in-process LRU cache of query embeddings.
+    """
+    return query_embedding_cache.get_or_compute(query, lambda: _embed_query(query))
+
+@timed("embed.query")
+def _embed_query(query: str) -> List[float]:
+    return get_embed_model().get_query_embedding(query)
+
+async def aembed_query(query: str) -> List[float]:
+    """
+    Async `embed_query`. Cache misses run the model in a worker thread so the
+    event loop keeps serving other requests.
+    """
+    return await query_embedding_cache.aget_or_compute(
+        query, lambda: asyncio.to_thread(_embed_query, query)
+    )
+
+def keyword_search(query: str, top_k: int = 5, engine: Optional[Engine] = None) -> List[SearchHit]:
+    """
+    Full-text search over chunk text ranked by ts_rank_cd. Needs no embedding model.
+    """
+    return search_result_cache.get_or_compute(
+        ("keyword", query, top_k), lambda: _keyword_search(query, top_k, engine or get_engine())
+    )
+
+@timed("search.keyword")
+def _keyword_search(query: str, top_k: int, engine: Engine) -> List[SearchHit]:
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(
+                f"SELECT node_id, metadata_->>'id', metadata_->>'title', metadata_->'create_time', text, "
+                f"ts_rank_cd({TEXT_SEARCH_COLUMN}, q) AS rank "
+                f"FROM {EMBEDDINGS_TABLE}, websearch_to_tsquery('{TEXT_SEARCH_CONFIG}', :query) q "
+                f"WHERE {TEXT_SEARCH_COLUMN} @@ q "
+                f"ORDER BY rank DESC LIMIT :top_k"
+            ),
+            {"query": query, "top_k": top_k},
+        )
+        return [SearchHit(*row) for row in rows]
+
+def vector_search(query: str, top_k: int = 5) -> List[SearchHit]:
+    def run() -> List[SearchHit]:
+        retriever = get_retrieval_context().retriever(similarity_top_k=top_k)
+        bundle = QueryBundle(query_str=query, embedding=embed_query(query))
+        with span("search.vector"):
+            return hits_from_nodes(retriever.retrieve(bundle))
+    return search_result_cache.get_or_compute(("vector", query, top_k), run)
+
+async def avector_search(query: str, top_k: int = 5) -> List[SearchHit]:
+    """
+    Async `vector_search` sharing its result cache. The ANN query goes through
+    PGVectorStore's async API on the asyncpg pool, so concurrent chats don't
+    hold a worker thread and a psycopg2 connection while Postgres works.
+    """
+    async def run() -> List[SearchHit]:
+        return await _aretrieve(query, await aembed_query(query), top_k)
+    return await search_result_cache.aget_or_compute(("vector", query, top_k), run)
+
+async def _aretrieve(query: str, embedding: List[float], top_k: int) -> List[SearchHit]:
+    retriever = get_retrieval_context().retriever(similarity_top_k=top_k)
+    with span("search.vector"):
+        return hits_from_nodes(await retriever.aretrieve(QueryBundle(query_str=query, embedding=embedding)))
+
+def _grouped_statements(embedding: List[float], top_k: int, filters: Optional[SearchFilters]) -> List[Tuple[Any, Dict[str, Any]]]:
+    """
+    Statements to run in one transaction; the last returns the grouped rows.
+    """
+    where, params = _filter_clause(filters)
+    candidates = top_k * GROUP_OVERFETCH
+    statements = []
+    if candidates > HNSW_EF_SEARCH:
+        statements.append((_SET_EF_SEARCH_SQL, {"ef_search": str(candidates)}))
+    if where:
+        statements.append((_ITERATIVE_SCAN_SQL, {}))
+    params.update(
+        embedding="[" + ",".join(str(float(x)) for x in embedding) + "]",
+        candidates=candidates,
+        snippets=SNIPPETS_PER_CONVERSATION,
+        top_k=top_k,
+    )
+    statements.append((text(_GROUPED_SEARCH_SQL.format(table=EMBEDDINGS_TABLE, where=where)), params))
+    return statements
+
+def _group_rows(query: str, rows: Sequence[Sequence[Any]]) -> List[ConversationHits]:
+    conversations: List[ConversationHits] = []
+    last_key = None
+    for conv_key, *fields in rows:
+        hit = SearchHit(*fields)
+        if conv_key != last_key:
+            conversations.append(ConversationHits(hit.doc_id, hit.title, hit.create_time, hit.score, [query], []))
+            last_key = conv_key
+        conversations[-1].hits.append(hit)
+    return conversations
+
+def grouped_vector_search(
+    query: str, top_k: int = 5, filters: Optional[SearchFilters] = None, engine: Optional[Engine] = None
+) -> List[ConversationHits]:
+    """
+    The `top_k` distinct conversations closest to the query, each with its
+    best chunks. Metadata filters, over-fetching, grouping and ranking all
+    happen in one SQL query.
+    """
+    return search_result_cache.get_or_compute(
+        ("grouped", query, top_k, filters),
+        lambda: _grouped_search(query, embed_query(query), top_k, filters, engine or get_engine()),
+    )
+
+@timed("search.grouped")
+def _grouped_search(
+    query: str, embedding: List[float], top_k: int, filters: Optional[SearchFilters], engine: Engine
+) -> List[ConversationHits]:
+    with engine.begin() as conn:
+        for statement, params in _grouped_statements(embedding, top_k, filters):
+            result = conn.execute(statement, params)
+        rows = result.all()
+    return _group_rows(query, rows)
+
+async def agrouped_vector_search(
+    query: str, top_k: int = 5, filters: Optional[SearchFilters] = None
+) -> List[ConversationHits]:
+    """
+    Async `grouped_vector_search` on the asyncpg pool, sharing its cache.
+    """
+    async def run() -> List[ConversationHits]:
+        statements = _grouped_statements(await aembed_query(query), top_k, filters)
+        with span("search.grouped"):
+            async with get_async_engine().begin() as conn:
+                for statement, params in statements:
+                    result = await conn.execute(statement, params)
+                rows = result.all()
+        return _group_rows(query, rows)
+    return await search_result_cache.aget_or_compute(("grouped", query, top_k, filters), run)
+
+async def amulti_grouped_search(
+    queries: Sequence[str], top_k: int = 5, filters: Optional[SearchFilters] = None
+) -> List[ConversationHits]:
+    """
+    `agrouped_vector_search` for several queries at once. Each query is
+    embedded in a worker thread and grouped and filtered in SQL exactly like
+    a single search (sharing its cache); the searches run concurrently on the
+    asyncpg pool and are merged per conversation.
+    """
+    results = await asyncio.gather(*(agrouped_vector_search(q, top_k, filters) for q in queries))
+    return merge_conversations(results)
+
+def merge_conversations(results: Sequence[Sequence[ConversationHits]]) -> List[ConversationHits]:
+    """
+    Merge per-query conversation lists into one ordered by best chunk score.
+    Queries are listed in the order given; snippets found by several queries
+    appear once.
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for conversations in results:
+        for conv in conversations:
+            key = conv.doc_id or conv.hits[0].node_id
+            group = groups.setdefault(key, {"queries": [], "hits": {}})
+            group["queries"].extend(q for q in conv.queries if q not in group["queries"])
+            for hit in conv.hits:
+                best = group["hits"].get(hit.node_id)
+                if best is None or hit.score > best.score:
+                    group["hits"][hit.node_id] = hit
+    merged = []
+    for group in groups.values():
+        hits = sorted(group["hits"].values(), key=lambda h: h.score, reverse=True)
+        top = hits[0]
+        merged.append(ConversationHits(top.doc_id, top.title, top.create_time, top.score, group["queries"], hits))
+    merged.sort(key=lambda c: c.score, reverse=True)
+    return merged
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[SearchHit]], top_k: int) -> List[SearchHit]:
+    """
+    Fuse ranked lists by summing 1 / (RRF_K + rank) per chunk.
+    The fused score replaces each hit's original score.
+    """
+    scores: Dict[str, float] = {}
+    hits: Dict[str, SearchHit] = {}
+    for ranking in rankings:
+        for rank, hit in enumerate(ranking, 1):
+            scores[hit.node_id] = scores.get(hit.node_id, 0.0) + 1.0 / (RRF_K + rank)
+            hits.setdefault(hit.node_id, hit)
+    ordered = sorted(scores, key=scores.get, reverse=True)[:top_k]
+    return [hits[node_id]._replace(score=scores[node_id]) for node_id in ordered]
+
+def hybrid_search(query: str, top_k: int = 5, keyword_only: bool = False) -> List[SearchHit]:
+    """
+    Combine full-text and vector search with reciprocal rank fusion.
+    `keyword_only` skips the vector side entirely (and never loads the model).
+    """
+    candidates = top_k * 4
+    keyword_hits = keyword_search(query, candidates)
+    if keyword_only:
+        return keyword_hits[:top_k]
+    return search_result_cache.get_or_compute(
+        ("hybrid", query, top_k),
+        lambda: reciprocal_rank_fusion([keyword_hits, vector_search(query, candidates)], top_k),
+    )
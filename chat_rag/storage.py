@@ -1,22 +1,70 @@
+from functools import lru_cache
 from llama_index.core import StorageContext
 from llama_index.vector_stores.postgres import PGVectorStore
-from sqlalchemy import make_url
-from chat_rag.config import DATABASE_URL
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from chat_rag.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    HNSW_EF_SEARCH,
+    IVFFLAT_PROBES,
+)
 
-def get_vector_store() -> PGVectorStore:
+TABLE_NAME = "embeddings"
+# PGVectorStore prefixes its table name with "data_"
+EMBEDDINGS_TABLE = f"data_{TABLE_NAME}"
+
+# ANN query-time settings applied to every pooled connection at startup
+SEARCH_SETTINGS = {
+    "hnsw.ef_search": str(HNSW_EF_SEARCH),
+    "ivfflat.probes": str(IVFFLAT_PROBES),
+}
+
+def _url_with_driver(driver: str):
+    url = make_url(DATABASE_URL)
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """
+    Process-wide synchronous SQLAlchemy engine with a connection pool.
+    """
+    # Force sync driver; DATABASE_URL defaults to asyncpg
+    return create_engine(
+        _url_with_driver("psycopg2"),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        connect_args={"options": " ".join(f"-c {k}={v}" for k, v in SEARCH_SETTINGS.items())},
+    )
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """
+    Process-wide asyncpg engine. Connections are only opened on first use.
+    """
+    return create_async_engine(
+        _url_with_driver("asyncpg"),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        connect_args={"server_settings": SEARCH_SETTINGS},
+    )
+
+def get_vector_store(table_name: str = TABLE_NAME, embed_dim: int = 1024) -> PGVectorStore:
     """
     Initialize and return the PGVectorStore.
+    Every store shares the process-wide engines and their connection pools.
     """
-    url = make_url(DATABASE_URL)
-    
-    return PGVectorStore.from_params(
-        database=url.database,
-        host=url.host,
-        password=url.password,
-        port=url.port,
-        user=url.username,
-        table_name="embeddings",
-        embed_dim=1024,  # BGE-M3 dimension
+    return PGVectorStore(
+        connection_string=_url_with_driver("psycopg2").render_as_string(hide_password=False),
+        async_connection_string=_url_with_driver("asyncpg").render_as_string(hide_password=False),
+        table_name=table_name,
+        embed_dim=embed_dim,  # 1024 = BGE-M3 dimension
+        engine=get_engine(),
+        async_engine=get_async_engine(),
     )
 
 def get_storage_context() -> StorageContext:
@@ -0,0 +1,279 @@
+"""
+Incremental readers for ChatGPT exports.
+
+`conversations.json` is one huge top-level array and `chat.html` embeds the
+same array as `var jsonData = [...]`. Both are decoded here one element at a
+time from a bounded read window, so memory use tracks the largest single
+conversation instead of the whole export. Either file can also be read
+straight out of the export `.zip` without extracting it first.
+
+Only the standard library is used so `parse_export.py` can import this module
+without pulling in the RAG dependencies.
+"""
+import html as html_mod
+import io
+import json
+import posixpath
+import re
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+READ_SIZE = 1 << 20  # 1 MiB
+_WS = ' \t\r\n'
+# Characters that may follow a complete array element
+_VALUE_END = _WS + ',]'
+_HTML_MARKER = re.compile(r"var\s+jsonData\s*=\s*")
+# Longest HTML entity we expect to see split across a chunk boundary.
+_MAX_ENTITY_LEN = 32
+# Files in an export archive that anything here reads; the rest (images,
+# audio, DALL-E files) can be very large and is never needed.
+EXPORT_MEMBERS = ('conversations.json', 'chat.html', 'user.json', 'shared_conversations.json')
+
+
+class ReadProgress:
+    """How much of an export file has been consumed, for progress/ETA estimates."""
+
+    def __init__(self) -> None:
+        self.total_bytes = 0
+        self.read_bytes = 0
+
+    @property
+    def fraction(self) -> float:
+        if not self.total_bytes:
+            return 0.0
+        return min(1.0, self.read_bytes / self.total_bytes)
+
+
+class _TrackingReader:
+    """Text reader that reports the underlying byte position to a ReadProgress."""
+
+    def __init__(self, fp: TextIO, progress: ReadProgress):
+        self._fp = fp
+        self._progress = progress
+
+    def read(self, size: int = READ_SIZE) -> str:
+        chunk = self._fp.read(size)
+        self._progress.read_bytes = self._fp.buffer.tell()
+        return chunk
+
+
+class _UnescapingReader:
+    """File-like wrapper that HTML-unescapes text chunk by chunk.
+
+    A chunk ending in an unterminated `&...` is extended a few characters so
+    entities split across chunk boundaries are decoded correctly.
+    """
+
+    def __init__(self, fp: TextIO, prefix: str = ''):
+        self._fp = fp
+        self._pending = prefix
+
+    def read(self, size: int = READ_SIZE) -> str:
+        chunk = self._pending + self._fp.read(size)
+        self._pending = ''
+        while True:
+            amp = chunk.rfind('&')
+            if amp == -1 or ';' in chunk[amp:] or len(chunk) - amp >= _MAX_ENTITY_LEN:
+                break
+            more = self._fp.read(_MAX_ENTITY_LEN)
+            if not more:
+                break
+            chunk += more
+        return html_mod.unescape(chunk)
+
+
+def iter_json_array(fp, read_size: int = READ_SIZE) -> Iterator[Any]:
+    """Yield the elements of a JSON array read incrementally from `fp`.
+
+    `fp` only needs a `read(size)` method returning `str`. Leading text before
+    the opening `[` must already have been consumed.
+    """
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def fill(size: int = read_size) -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = fp.read(size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_ws() -> Optional[str]:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return None
+
+    if skip_ws() != '[':
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    if skip_ws() == ']':
+        return
+
+    while True:
+        if skip_ws() is None:
+            raise ValueError("Unexpected end of JSON array")
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Grow the window geometrically so a conversation larger than
+                # read_size is re-scanned a logarithmic number of times.
+                if not fill(max(read_size, len(buf) - pos)):
+                    raise
+                continue
+            # Only a delimiter proves the value is complete: a number cut at
+            # the buffer edge decodes short (`1.5` read as `1` from `1.`).
+            if (end == len(buf) or buf[end] not in _VALUE_END) and fill():
+                continue
+            break
+        pos = end
+        yield value
+        sep = skip_ws()
+        if sep == ',':
+            pos += 1
+        elif sep == ']':
+            return
+        else:
+            raise ValueError(f"Malformed JSON array: unexpected {sep!r}")
+
+
+def find_export_member(zf: zipfile.ZipFile, name: str) -> Optional[zipfile.ZipInfo]:
+    """Find `name` in an export archive, at the root or inside one top-level folder."""
+    matches = [
+        info for info in zf.infolist()
+        if not info.is_dir() and posixpath.basename(info.filename) == name
+    ]
+    if not matches:
+        return None
+    return min(matches, key=lambda info: info.filename.count('/'))
+
+
+def extract_export(
+    zip_path: Path, dest: Path, members: Sequence[str] = EXPORT_MEMBERS
+) -> List[str]:
+    """Extract only the named export files from `zip_path` into `dest`.
+
+    Members are copied in READ_SIZE chunks and written flat into `dest`.
+    Returns the names that were found.
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    extracted = []
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in members:
+            info = find_export_member(zf, name)
+            if info is None:
+                continue
+            with zf.open(info) as src, (dest / name).open('wb') as out:
+                shutil.copyfileobj(src, out, READ_SIZE)
+            extracted.append(name)
+    return extracted
+
+
+def _open_tracked(path: Path, progress: Optional[ReadProgress], member: Optional[str] = None, **kwargs):
+    if member is None:
+        f = path.open('r', encoding='utf-8', **kwargs)
+        total = path.stat().st_size
+    else:
+        with zipfile.ZipFile(path) as zf:
+            info = find_export_member(zf, member)
+            if info is None:
+                raise FileNotFoundError(f"{member} not found in {path}")
+            # The member stays readable after the archive handle is closed
+            f = io.TextIOWrapper(zf.open(info), encoding='utf-8', **kwargs)
+        total = info.file_size
+    if progress is None:
+        return f, f
+    progress.total_bytes = total
+    return f, _TrackingReader(f, progress)
+
+
+def iter_json_file(
+    path: Path, progress: Optional[ReadProgress] = None, member: Optional[str] = None
+) -> Iterator[Any]:
+    """Stream the elements of a top-level JSON array stored in `path`.
+
+    If `member` is given, `path` is a zip archive and the array is read from
+    that member without extracting it.
+    """
+    f, reader = _open_tracked(path, progress, member)
+    with f:
+        yield from iter_json_array(reader)
+
+
+def iter_json_from_html(
+    path: Path, progress: Optional[ReadProgress] = None, member: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream the `var jsonData = [...]` array embedded in `chat.html`."""
+    f, reader = _open_tracked(path, progress, member, errors='replace')
+    with f:
+        tail = ''
+        while True:
+            chunk = reader.read(READ_SIZE)
+            if not chunk:
+                raise ValueError("jsonData array not found in chat.html")
+            window = tail + chunk
+            m = _HTML_MARKER.search(window)
+            if m and m.end() < len(window):
+                yield from iter_json_array(_UnescapingReader(reader, window[m.end():]))
+                return
+            # Keep enough context to match a marker split across chunks.
+            tail = window[-64:]
+
+
+def _export_has(path: Path, name: str) -> bool:
+    if path.is_dir():
+        return (path / name).exists()
+    with zipfile.ZipFile(path) as zf:
+        return find_export_member(zf, name) is not None
+
+
+def open_export(
+    path: Path, prefer: str = 'json', progress: Optional[ReadProgress] = None
+) -> Tuple[Iterator[Dict[str, Any]], str]:
+    """Stream conversations from an export directory or `.zip`.
+
+    `conversations.json` or `chat.html` is read, `prefer` picking one when
+    both exist. Returns the iterator and the name of the file it reads.
+    """
+    if not path.is_dir() and not (path.is_file() and zipfile.is_zipfile(path)):
+        raise FileNotFoundError(f"{path} is neither an export directory nor a zip archive")
+    order = ('chat.html', 'conversations.json') if prefer == 'html' else ('conversations.json', 'chat.html')
+    for name in order:
+        if not _export_has(path, name):
+            continue
+        member = None if path.is_dir() else name
+        source = path / name if member is None else path
+        reader = iter_json_file if name == 'conversations.json' else iter_json_from_html
+        return reader(source, progress, member=member), name
+    raise FileNotFoundError('Neither conversations.json nor chat.html found')
+
+
+def read_export_json(path: Path, name: str) -> Any:
+    """Load a small JSON file (e.g. `user.json`) from an export directory or
+    `.zip`; None if it is missing or unreadable."""
+    try:
+        if path.is_dir():
+            with (path / name).open('r', encoding='utf-8') as f:
+                return json.load(f)
+        with zipfile.ZipFile(path) as zf:
+            info = find_export_member(zf, name)
+            if info is None:
+                return None
+            with zf.open(info) as f:
+                return json.load(io.TextIOWrapper(f, encoding='utf-8'))
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
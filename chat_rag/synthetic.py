@@ -0,0 +1,149 @@
+"""
+Synthetic ChatGPT exports for benchmarks and tests.
+
+Conversations use the same shape as a real `conversations.json`: a `mapping`
+tree of message nodes linked by `parent`/`children`, with regenerated
+assistant replies creating sibling branches and `current_node` pointing at
+the tip of the last branch. Text is drawn from per-topic vocabularies so
+retrieval benchmarks have queries with a well-defined set of relevant
+conversations.
+
+Output is fully determined by the seed. Only the standard library is used.
+"""
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+_SYLLABLES = (
+    "ka", "lo", "mi", "ne", "ru", "sa", "to", "vi", "ze", "bo",
+    "da", "fe", "gi", "ho", "ju", "pe", "qu", "ti", "wa", "xo",
+)
+_START_TIME = 1_672_531_200.0  # 2023-01-01T00:00:00Z
+
+
+class SyntheticSpec(NamedTuple):
+    conversations: int = 1000
+    # Messages on the canonical path (user and assistant turns alternate)
+    messages: int = 12
+    words_per_message: int = 60
+    # Chance that an assistant reply is regenerated, adding a sibling branch
+    branch_rate: float = 0.1
+    topics: int = 50
+    seed: int = 0
+
+
+def _vocabulary(rng: random.Random, size: int) -> List[str]:
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+class SyntheticExport:
+    """
+    Generator for one synthetic export. Topic `t` has its own vocabulary;
+    every conversation belongs to one topic (`topic_of`) and mixes its topic
+    words with a shared common vocabulary.
+    """
+
+    def __init__(self, spec: SyntheticSpec):
+        self.spec = spec
+        rng = random.Random(spec.seed)
+        vocab = _vocabulary(rng, 400 + spec.topics * 40)
+        self.common = vocab[:400]
+        self.topic_words = [
+            vocab[400 + t * 40 : 400 + (t + 1) * 40] for t in range(spec.topics)
+        ]
+
+    def topic_of(self, index: int) -> int:
+        return index % self.spec.topics
+
+    def _text(self, rng: random.Random, topic: int) -> str:
+        words = [
+            rng.choice(self.topic_words[topic]) if rng.random() < 0.4 else rng.choice(self.common)
+            for _ in range(self.spec.words_per_message)
+        ]
+        return ' '.join(words).capitalize() + '.'
+
+    def conversation(self, index: int) -> Dict[str, Any]:
+        spec = self.spec
+        rng = random.Random(spec.seed * 1_000_003 + index)
+        topic = self.topic_of(index)
+        created = _START_TIME + index * 3600.0
+        mapping: Dict[str, Dict[str, Any]] = {}
+
+        def add_node(parent: Optional[str], role: Optional[str], when: float) -> str:
+            node_id = f"{index:08d}-{len(mapping):04d}"
+            message = None
+            if role is not None:
+                message = {
+                    "id": node_id,
+                    "author": {"role": role, "name": None, "metadata": {}},
+                    "create_time": when,
+                    "content": {"content_type": "text", "parts": [self._text(rng, topic)]},
+                    "status": "finished_successfully",
+                    "metadata": {},
+                }
+            mapping[node_id] = {"id": node_id, "message": message, "parent": parent, "children": []}
+            if parent is not None:
+                mapping[parent]["children"].append(node_id)
+            return node_id
+
+        current = add_node(None, None, created)
+        when = created
+        for turn in range(spec.messages):
+            when += 30.0
+            role = "user" if turn % 2 == 0 else "assistant"
+            if role == "assistant" and rng.random() < spec.branch_rate:
+                # Abandoned reply; the regenerated sibling continues the thread
+                add_node(current, role, when)
+                when += 5.0
+            current = add_node(current, role, when)
+
+        conv_id = f"00000000-0000-4000-8000-{index:012d}"
+        return {
+            "title": f"{' '.join(self.topic_words[topic][:3]).title()} #{index}",
+            "create_time": created,
+            "update_time": when,
+            "mapping": mapping,
+            "current_node": current,
+            "conversation_id": conv_id,
+            "id": conv_id,
+        }
+
+    def conversations(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.spec.conversations):
+            yield self.conversation(i)
+
+    def query(self, rng: random.Random, words: int = 4) -> "SyntheticQuery":
+        """
+        A query made of words from one topic; relevant conversations are the
+        ones in that topic.
+        """
+        topic = rng.randrange(self.spec.topics)
+        return SyntheticQuery(' '.join(rng.sample(self.topic_words[topic], words)), topic)
+
+    def write(self, output_dir: Path) -> Path:
+        """
+        Write `conversations.json` and `user.json` to `output_dir`, streaming
+        one conversation at a time. Returns the conversations file path.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / 'conversations.json'
+        with path.open('w', encoding='utf-8') as f:
+            f.write('[')
+            for i, conv in enumerate(self.conversations()):
+                if i:
+                    f.write(',\n')
+                json.dump(conv, f, ensure_ascii=False)
+            f.write(']\n')
+        (output_dir / 'user.json').write_text(
+            json.dumps({"id": "user-synthetic", "email": "bench@example.com"}), encoding='utf-8'
+        )
+        return path
+
+
+class SyntheticQuery(NamedTuple):
+    text: str
+    topic: int
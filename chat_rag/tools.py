@@ -1,9 +1,30 @@
 from typing import List, Optional
-from llama_index.core import VectorStoreIndex
 from llama_index.core.tools import FunctionTool
-from llama_index.core.vector_stores import MetadataFilters, ExactMatchFilter
-from chat_rag.storage import get_vector_store
+from llama_index.core.utils import get_tokenizer
+from chat_rag.config import RERANK_ENABLED, RERANK_TOKEN_BUDGET, RERANK_TOP_K
+from chat_rag.documents import afetch_document_chunks, fetch_document_chunks
+from chat_rag.metrics import timed
+from chat_rag.rerank import arerank_search, rerank_search
+from chat_rag.search import (
+    ConversationHits,
+    SearchFilters,
+    SearchHit,
+    agrouped_vector_search,
+    amulti_grouped_search,
+    grouped_vector_search,
+    hybrid_search,
+    parse_date_bound,
+)
 
+# Upper bound on queries per multi-search call; each uses a pooled connection
+MAX_MULTI_QUERIES = 8
+
+def _format_document(doc_id: str, chunks: List[str]) -> str:
+    if not chunks:
+        return f"No content found for document ID: {doc_id}"
+    return "\n\n".join(chunks)
+
+@timed("tool.get_doc_content")
 def get_doc_content(doc_id: str) -> str:
     """
     Retrieves the full content of a document (conversation) by its ID.
@@ -14,80 +35,192 @@ def get_doc_content(doc_id: str) -> str:
         doc_id (str): The unique ID of the document to retrieve.
     """
     try:
-        vector_store = get_vector_store()
-        index = VectorStoreIndex.from_vector_store(vector_store=vector_store)
-        
-        # Create a retriever that filters by doc_id
-        filters = MetadataFilters(
-            filters=[ExactMatchFilter(key="id", value=doc_id)]
-        )
+        # Direct ordered lookup: no query embedding and no chunk limit
+        return _format_document(doc_id, fetch_document_chunks(doc_id))
         
-        # Retrieve all nodes for this doc_id
-        # We set similarity_top_k to a high number to ensure we get all chunks
-        retriever = index.as_retriever(
-            filters=filters, 
-            similarity_top_k=100
-        )
+    except Exception as e:
+        return f"Error retrieving document: {str(e)}"
+
+@timed("tool.get_doc_content")
+async def aget_doc_content(doc_id: str) -> str:
+    """
+    Async `get_doc_content` on the asyncpg pool; used when the agent runs in
+    an event loop.
+    """
+    try:
+        return _format_document(doc_id, await afetch_document_chunks(doc_id))
         
-        nodes = retriever.retrieve("get all content")
+    except Exception as e:
+        return f"Error retrieving document: {str(e)}"
+
+def _format_hits(hits: List[SearchHit]) -> str:
+    if not hits:
+        return "No matching conversations found."
         
-        if not nodes:
-            return f"No content found for document ID: {doc_id}"
-            
-        # Sort nodes by their position in the document to reconstruct order
-        # Note: LlamaIndex nodes usually have relationships/metadata for order
-        # For now, we'll assume the retriever returns them or we can sort if needed.
-        # A simple concatenation might work if chunks are returned in order or have index.
+    results = []
+    for i, hit in enumerate(hits, 1):
+        title = hit.title or 'Untitled'
+        doc_id = hit.doc_id or 'Unknown ID'
+        date = hit.create_time if hit.create_time is not None else 'Unknown Date'
+        preview = hit.text[:200].replace('\n', ' ')
         
-        # Let's try to sort by node ID or just concatenate. 
-        # Ideally, we should use the doc store, but we are using a vector store only setup.
-        # Reconstructing from vector store nodes is a bit hacky but works for simple cases.
+        results.append(f"{i}. TITLE: {title}\n   ID: {doc_id}\n   DATE: {date}\n   PREVIEW: {preview}...\n")
         
-        # Sort by node id (usually doc_id_node_index)
-        sorted_nodes = sorted(nodes, key=lambda x: x.node.node_id)
+    return "\n".join(results)
+
+def _format_conversations(
+    conversations: List[ConversationHits], limit: int = 10, show_queries: bool = False, token_budget: int = 0
+) -> str:
+    """
+    Numbered results, best first. With a `token_budget`, results that would
+    exceed it are left out (the first is always kept) and a note says how many.
+    """
+    if not conversations:
+        return "No matching conversations found."
         
-        full_text = "\n\n".join([node.text for node in sorted_nodes])
-        return full_text
+    conversations = conversations[:limit]
+    count_tokens = get_tokenizer() if token_budget > 0 else None
+    used = 0
+    results = []
+    for i, conv in enumerate(conversations, 1):
+        title = conv.title or 'Untitled'
+        doc_id = conv.doc_id or 'Unknown ID'
+        date = conv.create_time if conv.create_time is not None else 'Unknown Date'
+        lines = [f"{i}. TITLE: {title}", f"   ID: {doc_id}", f"   DATE: {date}"]
+        if show_queries:
+            lines.append(f"   MATCHED: {'; '.join(conv.queries)}")
+        for hit in conv.hits[:2]:
+            preview = hit.text[:200].replace('\n', ' ')
+            lines.append(f"   PREVIEW: {preview}...")
+        entry = "\n".join(lines) + "\n"
+        if count_tokens is not None:
+            used += len(count_tokens(entry))
+            if results and used > token_budget:
+                break
+        results.append(entry)
         
-    except Exception as e:
-        return f"Error retrieving document: {str(e)}"
+    omitted = len(conversations) - len(results)
+    if omitted:
+        results.append(f"({omitted} lower-ranked result(s) omitted to stay within the token budget)")
+    return "\n".join(results)
 
-def search_conversations(query: str) -> str:
+def _search_filters(
+    date_from: Optional[str], date_to: Optional[str], title_contains: Optional[str]
+) -> Optional[SearchFilters]:
+    filters = SearchFilters(
+        date_from=parse_date_bound(date_from) if date_from else None,
+        date_to=parse_date_bound(date_to, end=True) if date_to else None,
+        title_contains=title_contains or None,
+    )
+    return filters if any(filters) else None
+
+@timed("tool.search_conversations")
+def search_conversations(
+    query: str,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    title_contains: Optional[str] = None,
+) -> str:
     """
     Searches for conversations matching the query string.
     Use this to find relevant conversations, list items, or find specific topics.
+    Returns up to 5 distinct conversations, each with its best matching snippets.
+    When the user mentions a time period or a title, pass it as a filter
+    instead of checking dates or titles in the results.
     
     Args:
         query (str): The search query (e.g., "software engineer resume", "python error").
+        date_from (Optional[str]): Only conversations started on or after this date: YYYY, YYYY-MM or YYYY-MM-DD.
+        date_to (Optional[str]): Only conversations started on or before this date (inclusive): YYYY, YYYY-MM or YYYY-MM-DD.
+        title_contains (Optional[str]): Only conversations whose title contains this text (case-insensitive).
     """
     try:
-        vector_store = get_vector_store()
-        index = VectorStoreIndex.from_vector_store(vector_store=vector_store)
+        # Distinct conversations, filtered and grouped in SQL, each with its best snippets
+        filters = _search_filters(date_from, date_to, title_contains)
+        if RERANK_ENABLED:
+            return _format_conversations(rerank_search(query, RERANK_TOP_K, filters), token_budget=RERANK_TOKEN_BUDGET)
+        return _format_conversations(grouped_vector_search(query, top_k=5, filters=filters))
         
-        # Use the standard retriever
-        retriever = index.as_retriever(similarity_top_k=5)
-        nodes = retriever.retrieve(query)
+    except Exception as e:
+        return f"Error searching conversations: {str(e)}"
+
+@timed("tool.search_conversations")
+async def asearch_conversations(
+    query: str,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    title_contains: Optional[str] = None,
+) -> str:
+    """
+    Async `search_conversations` on the asyncpg pool.
+    """
+    try:
+        filters = _search_filters(date_from, date_to, title_contains)
+        if RERANK_ENABLED:
+            return _format_conversations(await arerank_search(query, RERANK_TOP_K, filters), token_budget=RERANK_TOKEN_BUDGET)
+        return _format_conversations(await agrouped_vector_search(query, top_k=5, filters=filters))
         
-        if not nodes:
-            return "No matching conversations found."
-            
-        results = []
-        for i, node in enumerate(nodes, 1):
-            title = node.metadata.get('title', 'Untitled')
-            doc_id = node.metadata.get('id', 'Unknown ID')
-            date = node.metadata.get('create_time', 'Unknown Date')
-            preview = node.text[:200].replace('\n', ' ')
-            
-            results.append(f"{i}. TITLE: {title}\n   ID: {doc_id}\n   DATE: {date}\n   PREVIEW: {preview}...\n")
-            
-        return "\n".join(results)
+    except Exception as e:
+        return f"Error searching conversations: {str(e)}"
+
+@timed("tool.multi_search_conversations")
+async def multi_search_conversations(
+    queries: List[str],
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    title_contains: Optional[str] = None,
+) -> str:
+    """
+    Searches for conversations matching any of several queries in one step.
+    Use this instead of calling search_conversations repeatedly with reworded
+    or related queries; results are merged per conversation and list which
+    queries matched. The filters apply to every query.
+    
+    Args:
+        queries (List[str]): Up to 8 search queries (e.g., ["kubernetes ingress", "nginx reverse proxy"]).
+        date_from (Optional[str]): Only conversations started on or after this date: YYYY, YYYY-MM or YYYY-MM-DD.
+        date_to (Optional[str]): Only conversations started on or before this date (inclusive): YYYY, YYYY-MM or YYYY-MM-DD.
+        title_contains (Optional[str]): Only conversations whose title contains this text (case-insensitive).
+    """
+    try:
+        queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))[:MAX_MULTI_QUERIES]
+        if not queries:
+            return "No queries given."
+        filters = _search_filters(date_from, date_to, title_contains)
+        conversations = await amulti_grouped_search(queries, top_k=5, filters=filters)
+        return _format_conversations(conversations, show_queries=True)
+        
+    except Exception as e:
+        return f"Error searching conversations: {str(e)}"
+
+@timed("tool.hybrid_search_conversations")
+def hybrid_search_conversations(query: str, keyword_only: bool = False) -> str:
+    """
+    Searches conversations by combining exact keyword matching with semantic search.
+    Use this for exact identifiers such as error codes, function names, file names
+    or product names. Set keyword_only=True to match the words literally without
+    semantic search.
+    
+    Args:
+        query (str): Words or identifiers to look for (e.g., "ECONNREFUSED", "useEffect cleanup").
+        keyword_only (bool): Only use full-text keyword matching.
+    """
+    try:
+        return _format_hits(hybrid_search(query, top_k=5, keyword_only=keyword_only))
         
     except Exception as e:
         return f"Error searching conversations: {str(e)}"
 
 def get_rag_tools() -> List[FunctionTool]:
-    """Returns a list of tools for the ReAct agent."""
+    """
+    Returns a list of tools for the ReAct agent.
+    Agents call tools with `acall`, so tools with an async variant query
+    Postgres on the asyncpg pool instead of in a worker thread; the sync
+    function still provides the name, description and schema.
+    """
     return [
-        FunctionTool.from_defaults(fn=get_doc_content),
-        FunctionTool.from_defaults(fn=search_conversations),
+        FunctionTool.from_defaults(fn=get_doc_content, async_fn=aget_doc_content),
+        FunctionTool.from_defaults(fn=search_conversations, async_fn=asearch_conversations),
+        FunctionTool.from_defaults(async_fn=multi_search_conversations),
+        FunctionTool.from_defaults(fn=hybrid_search_conversations),
     ]
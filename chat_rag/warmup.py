@@ -0,0 +1,107 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+class StartupTimings:
+    """
+    Wall-clock seconds per startup phase, in the order they ran, plus any
+    phase that failed.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.finished = False
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.errors[name] = str(e)
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    @property
+    def ready(self) -> bool:
+        return self.finished and not self.errors
+
+    def summary(self) -> str:
+        parts = [f"{name} {seconds:.2f}s" for name, seconds in self.phases.items()]
+        parts.append(f"total {sum(self.phases.values()):.2f}s")
+        line = "Startup: " + ", ".join(parts)
+        for name, error in self.errors.items():
+            line += f"\n  {name} failed: {error}"
+        return line
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "ready": self.ready,
+            "finished": self.finished,
+            "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+            "errors": self.errors,
+        }
+
+def warm_up(timings: Optional[StartupTimings] = None) -> StartupTimings:
+    """
+    Load everything the first chat turn would otherwise load on demand: the
+    LLM client and agent tools, the embedding model (plus one dummy
+    embedding so lazy kernels initialise), the reranker if enabled, the
+    database pool and the vector index. A failing phase is recorded and the rest still run.
+    """
+    timings = timings or StartupTimings()
+    _warm_up_phases(timings)
+    timings.finished = True
+    return timings
+
+async def awarm_up(timings: Optional[StartupTimings] = None) -> StartupTimings:
+    """
+    `warm_up` for a server: the blocking phases run in a worker thread, then
+    the asyncpg pool is opened on the calling loop, since its connections can
+    only be used by the loop that created them.
+    """
+    timings = timings or StartupTimings()
+    await asyncio.to_thread(_warm_up_phases, timings)
+    with timings.phase("async_db_pool"):
+        from sqlalchemy import text
+        from chat_rag.storage import get_async_engine
+        async with get_async_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    timings.finished = True
+    return timings
+
+def _warm_up_phases(timings: StartupTimings) -> None:
+    with timings.phase("llm_client"):
+        from chat_rag.query import get_llm, get_tools
+        get_llm()
+        get_tools()
+
+    with timings.phase("embedding_model"):
+        from chat_rag.context import get_embed_model
+        embed_model = get_embed_model()
+
+    if "embedding_model" not in timings.errors:
+        with timings.phase("dummy_embedding"):
+            embed_model.get_query_embedding("warm-up")
+
+    with timings.phase("db_pool"):
+        from sqlalchemy import text
+        from chat_rag.storage import get_engine
+        with get_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    from chat_rag.config import RERANK_ENABLED
+    if RERANK_ENABLED:
+        with timings.phase("reranker"):
+            from chat_rag.rerank import get_reranker
+            get_reranker().predict([("warm-up", "warm-up")], show_progress_bar=False)
+
+    if "embedding_model" not in timings.errors:
+        with timings.phase("vector_index"):
+            from chat_rag.context import get_retrieval_context
+            get_retrieval_context().retriever()
@@ -6,6 +6,8 @@ export default function Chat() {
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
   const messagesEndRef = useRef(null);
+  // Server-side conversation memory is keyed by this id
+  const sessionIdRef = useRef(null);
 
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
@@ -26,11 +28,14 @@ export default function Chat() {
       const response = await fetch('/api/chat', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ message: userMsg.content }),
+        body: JSON.stringify({ message: userMsg.content, session_id: sessionIdRef.current }),
       });
 
       if (!response.ok) throw new Error('Chat failed');
 
+      const sessionId = response.headers.get('X-Session-Id');
+      if (sessionId) sessionIdRef.current = sessionId;
+
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       let assistantMsg = { role: 'assistant', content: '' };
@@ -16,12 +16,21 @@ export default function Stats() {
     };
 
     fetchStats();
-    const interval = setInterval(fetchStats, 2000);
-    return () => clearInterval(interval);
+
+    // Ingestion progress is pushed by the server instead of polled
+    const events = new EventSource('/api/ingest/events');
+    events.onmessage = (e) => {
+      const update = JSON.parse(e.data);
+      setStats((prev) => ({ ...(prev || {}), ...update }));
+      if (update.ingestion_status !== 'running') fetchStats();
+    };
+    return () => events.close();
   }, []);
 
   if (!stats) return null;
 
+  const details = stats.ingestion_details;
+
   return (
     <div className="card" style={{ display: 'flex', gap: '2rem', alignItems: 'center' }}>
       <div style={{ display: 'flex', alignItems: 'center', gap: '0.5rem' }}>
@@ -32,7 +41,14 @@ export default function Stats() {
       {stats.ingestion_status === 'running' && (
         <div style={{ display: 'flex', alignItems: 'center', gap: '0.5rem' }}>
           <Loader2 className="spin" size={20} />
-          <span>Ingesting...</span>
+          <span>Ingesting... {Math.round((stats.ingestion_progress || 0) * 100)}%</span>
+          {details && details.conversations_parsed !== undefined && (
+            <span style={{ color: 'var(--text-secondary)' }}>
+              {details.conversations_parsed} conversations, {details.nodes_written} nodes
+              {' '}({details.throughput.toFixed(1)} nodes/s
+              {details.eta_seconds != null && `, ~${Math.ceil(details.eta_seconds)}s left`})
+            </span>
+          )}
         </div>
       )}
 
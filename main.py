@@ -1,8 +1,6 @@
 import argparse
 import sys
 from pathlib import Path
-from chat_rag.ingest import ingest_data
-from chat_rag.interface import start_repl
 
 def main():
     parser = argparse.ArgumentParser(description="ChatGPT Data Extractor & RAG")
@@ -10,9 +8,40 @@ def main():
     
     # Ingest Command
     ingest_parser = subparsers.add_parser('ingest', help='Ingest data into the RAG pipeline')
-    ingest_parser.add_argument('--input', default='source-data', help='Path to source data')
+    ingest_parser.add_argument('--input', default='source-data', help='Path to source data directory or export .zip')
     ingest_parser.add_argument('--limit', type=int, default=None, help='Limit number of conversations to process')
     ingest_parser.add_argument('--batch-size', type=int, default=10, help='Batch size for ingestion')
+    ingest_parser.add_argument('--embed-batch-size', type=int, default=64, help='Number of chunks embedded per model call')
+    ingest_parser.add_argument('--workers', type=int, default=1, help='Number of embedding worker processes')
+    ingest_parser.add_argument('--no-embed-cache', dest='embed_cache', action='store_false', help='Do not read or write the on-disk embedding cache')
+    ingest_parser.add_argument('--defer-index', action='store_true', help='Drop the ANN index during ingestion and rebuild it afterwards')
+    ingest_parser.add_argument('--index-branches', action='store_true', help='Also index abandoned branches (regenerated/edited turns) as separate documents')
+    ingest_parser.add_argument('--force', action='store_true', help='Re-embed every conversation, ignoring the ingestion manifest')
+    ingest_parser.add_argument('--also-export-markdown', metavar='DIR', nargs='?', const='conversations', default=None,
+                               help='Also write the Markdown export (as parse_export.py does) to DIR in the same pass (default: conversations)')
+    
+    # Index Command
+    index_parser = subparsers.add_parser('index', help='Manage the ANN index on the embeddings table')
+    index_parser.add_argument('action', choices=['build', 'rebuild', 'status'], help='Index action')
+    index_parser.add_argument('--type', choices=['hnsw', 'ivfflat'], default=None, help='Index type (defaults to VECTOR_INDEX_TYPE)')
+    
+    # Bench Command
+    bench_parser = subparsers.add_parser('bench', help='Benchmark the pipeline on a synthetic export')
+    bench_parser.add_argument('--conversations', type=int, default=1000, help='Number of synthetic conversations')
+    bench_parser.add_argument('--messages', type=int, default=12, help='Messages per conversation (canonical path)')
+    bench_parser.add_argument('--words', type=int, default=60, help='Words per message')
+    bench_parser.add_argument('--branch-rate', type=float, default=0.1, help='Chance an assistant reply is regenerated into a branch')
+    bench_parser.add_argument('--topics', type=int, default=50, help='Number of distinct topics')
+    bench_parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    bench_parser.add_argument('--queries', type=int, default=200, help='Number of retrieval queries')
+    bench_parser.add_argument('--top-k', type=int, default=10, help='Results per query')
+    bench_parser.add_argument('--batch-size', type=int, default=100, help='Conversations per chunk/embed/write batch')
+    bench_parser.add_argument('--store', choices=['auto', 'pg', 'memory'], default='auto', help='Vector store (auto falls back to memory without Postgres)')
+    bench_parser.add_argument('--index-type', choices=['hnsw', 'ivfflat', 'none'], default=None, help='ANN index on the scratch table (defaults to VECTOR_INDEX_TYPE)')
+    bench_parser.add_argument('--embed-dim', type=int, default=256, help='Dimension of the stand-in hash embedding')
+    bench_parser.add_argument('--real-embeddings', action='store_true', help='Use the configured EMBEDDING_MODEL instead of the stand-in')
+    bench_parser.add_argument('--output', default=None, help='Keep the synthetic export in this directory')
+    bench_parser.add_argument('--json', default=None, help='Also write the results as JSON to this file')
     
     # Chat Command
     chat_parser = subparsers.add_parser('chat', help='Start the chat REPL')
@@ -25,9 +54,68 @@ def main():
     if args.command == 'ingest':
         input_path = Path(args.input)
         if not input_path.exists():
-            print(f"Error: Input directory '{input_path}' does not exist.")
+            print(f"Error: Input path '{input_path}' does not exist.")
             sys.exit(1)
-        ingest_data(input_path, limit=args.limit, batch_size=args.batch_size)
+        # Subcommands import their dependencies lazily so `--help`, `serve`
+        # and `index` don't pay for loading the embedding stack
+        from chat_rag.ingest import ingest_data
+        exporter = None
+        if args.also_export_markdown:
+            from parse_export import MarkdownExporter, export_options, load_conversations
+            _, source_label = load_conversations(input_path, 'json')
+            exporter = MarkdownExporter(
+                Path(args.also_export_markdown),
+                export_options(input_path, source_label, include_tools=False),
+            )
+        ingest_data(input_path, limit=args.limit, batch_size=args.batch_size, force=args.force,
+                    embed_batch_size=args.embed_batch_size, workers=args.workers,
+                    use_embed_cache=args.embed_cache, defer_index=args.defer_index,
+                    include_branches=args.index_branches,
+                    conversation_hook=exporter.add_conversation if exporter else None)
+        if exporter:
+            exporter.finish()
+            print(
+                f"Markdown export: wrote {exporter.processed - exporter.unchanged}, "
+                f"skipped {exporter.unchanged} unchanged; output root: {exporter.output_root}"
+            )
+        
+    elif args.command == 'index':
+        from chat_rag.ann import ann_index_status, build_ann_index, embeddings_table_exists
+        from chat_rag.config import VECTOR_INDEX_TYPE
+        from chat_rag.storage import EMBEDDINGS_TABLE, get_engine
+        engine = get_engine()
+        if args.action == 'status':
+            for key, value in ann_index_status(engine).items():
+                print(f"{key}: {value}")
+        elif not embeddings_table_exists(engine):
+            print(f"Error: Table '{EMBEDDINGS_TABLE}' does not exist yet. Run `python main.py ingest` first.")
+            sys.exit(1)
+        else:
+            from chat_rag.documents import ensure_metadata_indexes
+            from chat_rag.search import ensure_text_search_index
+            ensure_text_search_index(engine)
+            ensure_metadata_indexes(engine)
+            index_type = args.type or VECTOR_INDEX_TYPE
+            elapsed = build_ann_index(engine, index_type=index_type, rebuild=args.action == 'rebuild')
+            print(f"{index_type} index {args.action} finished in {elapsed:.1f}s.")
+        
+    elif args.command == 'bench':
+        from chat_rag.bench import BenchConfig, format_results, run_benchmark, write_results
+        from chat_rag.config import VECTOR_INDEX_TYPE
+        from chat_rag.synthetic import SyntheticSpec
+        spec = SyntheticSpec(
+            conversations=args.conversations, messages=args.messages, words_per_message=args.words,
+            branch_rate=args.branch_rate, topics=args.topics, seed=args.seed,
+        )
+        config = BenchConfig(
+            spec=spec, queries=args.queries, top_k=args.top_k, batch_size=args.batch_size,
+            store=args.store, index_type=args.index_type or VECTOR_INDEX_TYPE, embed_dim=args.embed_dim,
+            real_embeddings=args.real_embeddings, output_dir=Path(args.output) if args.output else None,
+        )
+        results = run_benchmark(config)
+        print(format_results(results))
+        if args.json:
+            write_results(results, Path(args.json))
         
     elif args.command == 'chat':
         import asyncio
@@ -1,14 +1,24 @@
 import argparse
 import datetime as dt
 import hashlib
-import html as html_mod
 import json
 import os
 import re
+import shutil
 import sys
+import time
 import unicodedata
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from chat_rag.normalize import Conversation, Message, normalize
+from chat_rag.streaming import open_export, read_export_json
+
+
+# Reused encoder for YAML scalars; cheaper than json.dumps per value
+_json_scalar = json.JSONEncoder(ensure_ascii=False).encode
 
 
 def _read_json(path: Path) -> Any:
@@ -16,18 +26,6 @@ def _read_json(path: Path) -> Any:
         return json.load(f)
 
 
-def _extract_json_from_html(path: Path) -> List[Dict[str, Any]]:
-    text = path.read_text(encoding='utf-8', errors='replace')
-    # Greedy capture of the JSON array assigned to var jsonData = ...;
-    m = re.search(r"var\s+jsonData\s*=\s*(\[.*?\])\s*;", text, flags=re.DOTALL)
-    if not m:
-        raise ValueError("jsonData array not found in chat.html")
-    json_blob = m.group(1)
-    # Unescape HTML entities that may appear inside strings
-    json_blob = html_mod.unescape(json_blob)
-    return json.loads(json_blob)
-
-
 def _ts_to_iso(ts: Optional[float]) -> Optional[str]:
     if ts is None:
         return None
@@ -63,55 +61,17 @@ def _slugify(text: str, max_len: int = 80) -> str:
     return text[:max_len]
 
 
-def _compute_stable_id(conversation: Dict[str, Any]) -> str:
-    mapping = conversation.get('mapping', {}) or {}
-    node_ids = [nid for nid, node in mapping.items() if (node or {}).get('message')]
-    node_ids.sort()
+def _compute_stable_id(conversation: Conversation) -> str:
+    node_ids = sorted(m.node_id for m in conversation.messages)
     h = hashlib.sha1('\n'.join(node_ids).encode('utf-8')).hexdigest()
     return h[:10]
 
 
-def _collect_messages(conversation: Dict[str, Any]) -> List[Dict[str, Any]]:
-    mapping = conversation.get('mapping', {}) or {}
-    messages: List[Dict[str, Any]] = []
-    for node in mapping.values():
-        msg = (node or {}).get('message')
-        if msg:
-            messages.append(msg)
-    # Order: create_time asc, then update_time, then id
-    def key_fn(m: Dict[str, Any]):
-        ct = m.get('create_time')
-        ut = m.get('update_time')
-        mid = m.get('id') or ''
-        return (
-            float(ct) if isinstance(ct, (int, float, str)) and str(ct).replace('.', '', 1).isdigit() else float('inf'),
-            float(ut) if isinstance(ut, (int, float, str)) and str(ut).replace('.', '', 1).isdigit() else float('inf'),
-            mid,
-        )
-    messages.sort(key=key_fn)
-    return messages
-
-
-def _is_hidden(msg: Dict[str, Any]) -> bool:
-    meta = (msg.get('metadata') or {})
-    if meta.get('is_visually_hidden_from_conversation') is True:
-        return True
-    # Hide empty system placeholders
-    role = (msg.get('author') or {}).get('role')
-    content = msg.get('content') or {}
-    ctype = content.get('content_type')
-    parts = content.get('parts') or []
-    if role == 'system' and (ctype == 'text') and all((p or '').strip() == '' for p in parts):
-        return True
-    return False
-
-
-def _render_message_content(msg: Dict[str, Any]) -> Tuple[str, str]:
-    content = msg.get('content') or {}
-    ctype = content.get('content_type') or 'text'
+def _render_message_content(msg: Message) -> Tuple[str, str]:
+    content = msg.content
+    ctype = msg.content_type
     if ctype == 'text':
-        parts = content.get('parts') or []
-        text = '\n\n'.join(str(p) for p in parts if p is not None)
+        text = '\n\n'.join(str(p) for p in msg.parts if p is not None)
         return ctype, text
     elif ctype == 'tether_quote':
         text = content.get('text') or ''
@@ -126,11 +86,10 @@ def _render_message_content(msg: Dict[str, Any]) -> Tuple[str, str]:
         return ctype, f"```{ctype}\n{payload}\n```"
 
 
-def _gather_attachments(conversation: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _gather_attachments(messages: List[Message]) -> List[Dict[str, Any]]:
     attachments: List[Dict[str, Any]] = []
-    for msg in _collect_messages(conversation):
-        meta = (msg.get('metadata') or {})
-        att = meta.get('attachments') or []
+    for msg in messages:
+        att = msg.metadata.get('attachments') or []
         for a in att:
             attachments.append({
                 'id': a.get('id'),
@@ -142,77 +101,61 @@ def _gather_attachments(conversation: Dict[str, Any]) -> List[Dict[str, Any]]:
     return attachments
 
 
-def load_conversations(input_dir: Path, prefer: str) -> Tuple[List[Dict[str, Any]], str]:
-    json_path = input_dir / 'conversations.json'
-    html_path = input_dir / 'chat.html'
-    if prefer == 'json' and json_path.exists():
-        return _read_json(json_path), 'conversations.json'
-    if prefer == 'html' and html_path.exists():
-        return _extract_json_from_html(html_path), 'chat.html'
-    # Fallback to whichever exists
-    if json_path.exists():
-        return _read_json(json_path), 'conversations.json'
-    if html_path.exists():
-        return _extract_json_from_html(html_path), 'chat.html'
-    raise FileNotFoundError('Neither conversations.json nor chat.html found')
+def load_conversations(input_dir: Path, prefer: str) -> Tuple[Iterator[Dict[str, Any]], str]:
+    # Conversations are streamed one at a time; the export is never held in memory.
+    # `input_dir` may also be the export .zip, read without extracting it.
+    return open_export(input_dir, prefer)
 
 
 def load_owner_email(input_dir: Path) -> Optional[str]:
-    p = input_dir / 'user.json'
-    if not p.exists():
-        return None
-    try:
-        data = _read_json(p)
-        return data.get('email')
-    except Exception:
-        return None
+    data = read_export_json(input_dir, 'user.json')
+    return data.get('email') if isinstance(data, dict) else None
 
 
 def load_shared_index(input_dir: Path) -> Dict[str, Dict[str, Any]]:
-    p = input_dir / 'shared_conversations.json'
-    if not p.exists():
-        return {}
-    try:
-        items = _read_json(p)
-        return {item.get('conversation_id'): item for item in items if item.get('conversation_id')}
-    except Exception:
+    items = read_export_json(input_dir, 'shared_conversations.json')
+    if not isinstance(items, list):
         return {}
+    return {item.get('conversation_id'): item for item in items if item.get('conversation_id')}
 
 
-def write_conversation_folder(
-    conversation: Dict[str, Any],
+class RenderedConversation(NamedTuple):
+    project_slug: Optional[str]
+    base_name: str
+    stable_id: str
+    markdown: str
+    content_hash: str
+    has_attachments: bool
+
+
+def render_conversation(
+    conversation: Any,
     conv_index: int,
     source_label: str,
-    output_root: Path,
     owner_email: Optional[str],
     shared_index: Dict[str, Dict[str, Any]],
     include_tools: bool,
-    copy_attachments: bool,
-    dry_run: bool,
-) -> None:
-    title = conversation.get('title') or f'Conversation {conv_index + 1}'
-    messages = _collect_messages(conversation)
+) -> RenderedConversation:
+    """Render one conversation (raw or already normalized) to Markdown
+    without touching the filesystem."""
+    conversation = normalize(conversation)
+    title = conversation.title or f'Conversation {conv_index + 1}'
+    # Every message in time order, including any abandoned branches
+    messages = conversation.messages
     # Filter hidden and tool messages as configured
-    filtered: List[Dict[str, Any]] = []
-    for m in messages:
-        if _is_hidden(m):
-            continue
-        role = (m.get('author') or {}).get('role')
-        if role == 'tool' and not include_tools:
-            continue
-        filtered.append(m)
+    filtered = Conversation.visible(messages, include_tools)
 
     # Participants
-    participants = sorted({(m.get('author') or {}).get('role') or 'unknown' for m in filtered})
+    participants = sorted({m.role or 'unknown' for m in filtered})
 
     # Times
-    created_at_iso = _ts_to_iso(conversation.get('create_time'))
+    created_at_iso = _ts_to_iso(conversation.create_time)
     # If update_time missing on conversation, compute from messages
-    conv_update_ts = conversation.get('update_time')
+    conv_update_ts = conversation.update_time
     if conv_update_ts is None:
         max_ts = None
         for m in filtered:
-            ct = m.get('create_time')
+            ct = m.create_time
             if isinstance(ct, (int, float)):
                 max_ts = max(ct, max_ts or ct)
         conv_update_iso = _ts_to_iso(max_ts)
@@ -224,21 +167,12 @@ def write_conversation_folder(
     slug = _slugify(title)
     # Optional project/workspace grouping
     project_key = conversation.get('project') or conversation.get('project_id') or conversation.get('workspace_id') or conversation.get('team_id')
-    project_root = output_root
-    if project_key:
-        project_slug = _slugify(str(project_key))
-        project_root = output_root / project_slug
-
-    folder_name = f"{stamp}_{slug}"
-    folder_path = project_root / folder_name
-    if folder_path.exists():
-        folder_name = f"{folder_name}_{stable_id[:8]}"
-        folder_path = project_root / folder_name
+    project_slug = _slugify(str(project_key)) if project_key else None
 
     # YAML front matter
-    attachments = _gather_attachments(conversation)
+    attachments = _gather_attachments(messages)
     # Shared info: only if conversation has an id that matches index (rare in this export)
-    conv_id = conversation.get('id')
+    conv_id = conversation.id
     shared_entry = shared_index.get(conv_id) if conv_id else None
 
     yaml_lines: List[str] = ["---"]
@@ -257,11 +191,11 @@ def write_conversation_folder(
                     for dk, dv in item.items():
                         if dv is None:
                             continue
-                        yaml_lines.append(f"    {dk}: {json.dumps(dv, ensure_ascii=False)}")
+                        yaml_lines.append(f"    {dk}: {_json_scalar(dv)}")
                 else:
-                    yaml_lines.append(f"  - {json.dumps(item, ensure_ascii=False)}")
+                    yaml_lines.append(f"  - {_json_scalar(item)}")
         else:
-            yaml_lines.append(f"{k}: {json.dumps(v, ensure_ascii=False)}")
+            yaml_lines.append(f"{k}: {_json_scalar(v)}")
 
     add_yaml('title', title)
     add_yaml('created_at', created_at_iso)
@@ -283,8 +217,8 @@ def write_conversation_folder(
     # Build body
     body_lines: List[str] = []
     for m in filtered:
-        role = (m.get('author') or {}).get('role') or 'unknown'
-        ts_iso = _ts_to_iso(m.get('create_time'))
+        role = m.role or 'unknown'
+        ts_iso = _ts_to_iso(m.create_time)
         header = f"## [{role}] {ts_iso}" if ts_iso else f"## [{role}]"
         body_lines.append(header)
         ctype, text = _render_message_content(m)
@@ -293,29 +227,256 @@ def write_conversation_folder(
             body_lines.append(text)
             body_lines.append("")
 
+    markdown = '\n'.join(yaml_lines) + '\n'.join(body_lines).rstrip() + '\n'
+    return RenderedConversation(
+        project_slug=project_slug,
+        base_name=f"{stamp}_{slug}",
+        stable_id=stable_id,
+        markdown=markdown,
+        content_hash=hashlib.sha1(markdown.encode('utf-8')).hexdigest(),
+        has_attachments=any(a.get('present') for a in attachments),
+    )
+
+
+class FolderNamer:
+    """Deterministic folder names: the first conversation in export order keeps
+    `<stamp>_<slug>`, later collisions get the stable id appended (and a
+    counter if that is taken too, e.g. empty conversations share a stable id).
+    Tracking names in memory avoids a filesystem stat per conversation."""
+
+    def __init__(self) -> None:
+        self._used: set = set()
+
+    def assign(self, rendered: RenderedConversation) -> Path:
+        folder_name = rendered.base_name
+        rel = Path(rendered.project_slug, folder_name) if rendered.project_slug else Path(folder_name)
+        if rel in self._used:
+            base = f"{folder_name}_{rendered.stable_id[:8]}"
+            rel = rel.with_name(base)
+            n = 2
+            while rel in self._used:
+                rel = rel.with_name(f"{base}_{n}")
+                n += 1
+        self._used.add(rel)
+        return rel
+
+
+MANIFEST_NAME = '.export-manifest.json'
+
+
+class ExportManifest:
+    """Record of what each previous run wrote, stored in the output root:
+    folder (relative to the root) -> stable id and hash of the Markdown.
+    Folder names are unique within a run, unlike stable ids, which collide
+    for conversations with the same messages."""
+
+    def __init__(self, output_root: Path) -> None:
+        self.path = output_root / MANIFEST_NAME
+        self.entries: Dict[str, Dict[str, str]] = {}
+        # Folders left behind by earlier runs that were not pruned
+        self.stale: List[str] = []
+        if self.path.exists():
+            try:
+                data = _read_json(self.path)
+                self.entries = data.get('folders', {})
+                if data.get('version') == 1:
+                    # Version 1 was keyed by stable id
+                    self.entries = {
+                        e['folder']: {'stable_id': sid, 'hash': e.get('hash')}
+                        for sid, e in data.get('conversations', {}).items() if e.get('folder')
+                    }
+                self.stale = data.get('stale', [])
+            except Exception:
+                self.entries, self.stale = {}, []
+        self.seen: Dict[str, Dict[str, str]] = {}
+
+    def is_current(self, rendered: RenderedConversation, folder_rel: Path, output_root: Path) -> bool:
+        entry = self.entries.get(folder_rel.as_posix())
+        return (
+            entry is not None
+            and entry.get('hash') == rendered.content_hash
+            and (output_root / folder_rel / 'conversation.md').exists()
+        )
+
+    def mark(self, rendered: RenderedConversation, folder_rel: Path) -> None:
+        self.seen[folder_rel.as_posix()] = {'stable_id': rendered.stable_id, 'hash': rendered.content_hash}
+
+    def stale_folders(self) -> List[str]:
+        """Folders written by earlier runs that no conversation in this export
+        uses any more (removed conversations, or ones whose folder moved)."""
+        previous = set(self.entries) | set(self.stale)
+        return sorted(f for f in previous if f and f not in self.seen)
+
+    def save(self, keep_stale: bool) -> None:
+        data = {
+            'version': 2,
+            'folders': self.seen,
+            'stale': self.stale_folders() if keep_stale else [],
+        }
+        _atomic_write(self.path, json.dumps(data, indent=1, sort_keys=True))
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + '.tmp')
+    with tmp.open('w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _remove_empty_parents(path: Path, root: Path) -> None:
+    """Remove the now-empty directories above `path` (e.g. a project folder), up to `root`."""
+    parent = path.parent
+    while parent != root and root in parent.parents:
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+
+
+def write_conversation_folder(
+    rendered: RenderedConversation,
+    folder_rel: Path,
+    output_root: Path,
+    copy_attachments: bool,
+    dry_run: bool,
+) -> None:
     # Planned actions
-    md_rel = Path(folder_name) / 'conversation.md'
+    md_rel = Path(folder_rel.name) / 'conversation.md'
     if dry_run:
         print(f"[DRY-RUN] Would write: {md_rel}")
-    else:
-        folder_path.mkdir(parents=True, exist_ok=True)
-        # Attempt to copy attachments if we ever find actual files (none mapped in this export)
-        if copy_attachments and any(a.get('present') for a in attachments):
-            (folder_path / 'attachments').mkdir(exist_ok=True)
-        with (folder_path / 'conversation.md').open('w', encoding='utf-8', newline='\n') as f:
-            f.write('\n'.join(yaml_lines))
-            f.write('\n'.join(body_lines).rstrip() + '\n')
+        return
+    folder_path = output_root / folder_rel
+    folder_path.mkdir(parents=True, exist_ok=True)
+    # Attempt to copy attachments if we ever find actual files (none mapped in this export)
+    if copy_attachments and rendered.has_attachments:
+        (folder_path / 'attachments').mkdir(exist_ok=True)
+    # Temp file + rename so readers (and sync tools) never see a partial file
+    _atomic_write(folder_path / 'conversation.md', rendered.markdown)
+
+
+class MarkdownExporter:
+    """Writes rendered conversations into `output_root` as they arrive,
+    skipping ones the manifest says are unchanged. Used by `main()` and by
+    `main.py ingest --also-export-markdown`, which feeds it conversations
+    from the ingestion pass instead of reading the export a second time."""
+
+    def __init__(
+        self,
+        output_root: Path,
+        options: Dict[str, Any],
+        copy_attachments: bool = True,
+        dry_run: bool = False,
+        force: bool = False,
+    ) -> None:
+        self.output_root = output_root
+        self.options = options
+        self.copy_attachments = copy_attachments
+        self.dry_run = dry_run
+        self.force = force
+        self.namer = FolderNamer()
+        self.manifest = ExportManifest(output_root)
+        self.processed = 0
+        self.unchanged = 0
+        self._next_index = 0
+        if not dry_run:
+            output_root.mkdir(parents=True, exist_ok=True)
+
+    def add(self, rendered: RenderedConversation) -> None:
+        self.processed += 1
+        folder_rel = self.namer.assign(rendered)
+        if not self.force and self.manifest.is_current(rendered, folder_rel, self.output_root):
+            self.unchanged += 1
+        else:
+            write_conversation_folder(
+                rendered=rendered,
+                folder_rel=folder_rel,
+                output_root=self.output_root,
+                copy_attachments=self.copy_attachments,
+                dry_run=self.dry_run,
+            )
+        self.manifest.mark(rendered, folder_rel)
+
+    def add_conversation(self, conversation: Any) -> None:
+        """Render and write the next conversation in export order."""
+        self.add(render_conversation(conversation, self._next_index, **self.options))
+        self._next_index += 1
+
+    def finish(self, prune: bool = False) -> List[str]:
+        """Prune (or report) stale folders and save the manifest. Returns the
+        stale folders."""
+        stale = self.manifest.stale_folders()
+        if prune:
+            for folder in stale:
+                if self.dry_run:
+                    print(f"[DRY-RUN] Would remove: {folder}")
+                else:
+                    shutil.rmtree(self.output_root / folder, ignore_errors=True)
+                    _remove_empty_parents(self.output_root / folder, self.output_root)
+        elif stale:
+            print(f"{len(stale)} folder(s) belong to conversations no longer in the export (use --prune to remove).")
+        if not self.dry_run:
+            self.manifest.save(keep_stale=not prune)
+        return stale
+
+
+def export_options(input_dir: Path, source_label: str, include_tools: bool) -> Dict[str, Any]:
+    """Render options for the export at `input_dir` (directory or .zip)."""
+    return {
+        'source_label': source_label,
+        'owner_email': load_owner_email(input_dir),
+        'shared_index': load_shared_index(input_dir),
+        'include_tools': include_tools,
+    }
+
+
+# Render options shared by every task, set once per worker process
+_render_options: Dict[str, Any] = {}
+
+
+def _init_render_worker(options: Dict[str, Any]) -> None:
+    _render_options.update(options)
+
+
+def _render_task(item: Tuple[int, Dict[str, Any]]) -> RenderedConversation:
+    conv_index, conversation = item
+    return render_conversation(conversation, conv_index, **_render_options)
+
+
+def _iter_rendered(
+    conversations: Iterator[Dict[str, Any]],
+    options: Dict[str, Any],
+    jobs: int,
+) -> Iterator[RenderedConversation]:
+    """Render conversations in export order, across `jobs` processes if > 1."""
+    if jobs <= 1:
+        _init_render_worker(options)
+        for item in enumerate(conversations):
+            yield _render_task(item)
+        return
+    # Bounded in-flight window keeps memory flat while preserving order
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker, initargs=(options,)) as pool:
+        for item in enumerate(conversations):
+            pending.append(pool.submit(_render_task, item))
+            if len(pending) >= jobs * 8:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description='Extract ChatGPT export into Markdown conversations.')
-    parser.add_argument('--input', default='source-data', help='Path to source-data directory')
+    parser.add_argument('--input', default='source-data', help='Path to source-data directory or export .zip')
     parser.add_argument('--output', default='conversations', help='Destination root directory')
     parser.add_argument('--prefer', choices=['json', 'html'], default='json', help='Preferred input format')
     parser.add_argument('--include-tools', action='store_true', help='Include tool messages')
     parser.add_argument('--copy-attachments', dest='copy_attachments', action='store_true', default=True, help='Copy available attachments')
     parser.add_argument('--no-copy-attachments', dest='copy_attachments', action='store_false', help='Do not copy attachments')
     parser.add_argument('--dry-run', action='store_true', help='Do not write files; print planned actions')
+    parser.add_argument('--jobs', type=int, default=1, help='Number of processes used to render conversations')
+    parser.add_argument('--force', action='store_true', help='Rewrite every conversation even if unchanged')
+    parser.add_argument('--prune', action='store_true', help='Delete folders of conversations no longer in the export')
     args = parser.parse_args(argv)
 
     input_dir = Path(args.input)
@@ -326,26 +487,29 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"Error loading export: {e}")
         return 2
 
-    owner_email = load_owner_email(input_dir)
-    shared_index = load_shared_index(input_dir)
-
-    if not args.dry_run:
-        output_root.mkdir(parents=True, exist_ok=True)
-
-    for i, conv in enumerate(conversations):
-        write_conversation_folder(
-            conversation=conv,
-            conv_index=i,
-            source_label=source_label,
-            output_root=output_root,
-            owner_email=owner_email,
-            shared_index=shared_index,
-            include_tools=args.include_tools,
-            copy_attachments=args.copy_attachments,
-            dry_run=args.dry_run,
-        )
+    exporter = MarkdownExporter(
+        output_root,
+        export_options(input_dir, source_label, args.include_tools),
+        copy_attachments=args.copy_attachments,
+        dry_run=args.dry_run,
+        force=args.force,
+    )
+    start = time.perf_counter()
+    try:
+        for rendered in _iter_rendered(conversations, exporter.options, args.jobs):
+            exporter.add(rendered)
+    except ValueError as e:
+        # Malformed input is only discovered while streaming
+        print(f"Error loading export after {exporter.processed} conversation(s): {e}")
+        return 2
+    elapsed = time.perf_counter() - start
+
+    stale = exporter.finish(prune=args.prune)
+    processed, unchanged = exporter.processed, exporter.unchanged
 
-    print(f"Processed {len(conversations)} conversation(s) from {source_label}.")
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {processed} conversation(s) from {source_label} in {elapsed:.1f}s ({rate:.1f} conversations/sec).")
+    print(f"Wrote {processed - unchanged}, skipped {unchanged} unchanged" + (f", pruned {len(stale)}." if args.prune else "."))
     print(f"Output root: {output_root}")
     if args.dry_run:
         print("No files were written (dry run).")
@@ -1,6 +1,10 @@
+import asyncio
+import json
 from fastapi.testclient import TestClient
+from llama_index.core.agent.workflow import AgentStream
 from web.app import app
 from web.services import manager
+from web.sessions import AgentSessionPool
 from unittest.mock import MagicMock
 
 client = TestClient(app)
@@ -12,26 +16,112 @@ def test_stats():
     assert "ingestion_status" in data
     assert "ingestion_progress" in data
     assert "agent_initialized" in data
+    assert "hit_rate" in data["query_cache"]["search_results"]
 
 def test_chat_mock():
-    # Mock the agent
-    mock_agent = MagicMock()
-    async def mock_astream_chat(message):
-        mock_response = MagicMock()
-        async def async_gen():
-            yield "Hello"
-            yield " World"
-        mock_response.async_response_gen = async_gen
-        return mock_response
+    # Mock the agent workflow: run() returns a handler that streams events
+    class MockHandler:
+        def __init__(self, memory):
+            self.memory = memory
+        
+        async def stream_events(self):
+            yield AgentStream(delta="Hello", response="Hello", current_agent_name="agent")
+            yield AgentStream(delta=" World", response="Hello World", current_agent_name="agent")
         
-    mock_agent.astream_chat = mock_astream_chat
-    manager.agent = mock_agent
+        def __await__(self):
+            self.memory.append("Hi")
+            return asyncio.sleep(0).__await__()
+    
+    mock_agent = MagicMock()
+    mock_agent.run = lambda user_msg, memory: MockHandler(memory)
+    manager.sessions = AgentSessionPool(lambda: mock_agent, list, max_sessions=4)
     
     response = client.post("/api/chat", json={"message": "Hi"})
     assert response.status_code == 200
     assert response.text == "Hello World"
+    
+    # The returned session id routes follow-ups to the same memory
+    session_id = response.headers["X-Session-Id"]
+    client.post("/api/chat", json={"message": "Again", "session_id": session_id})
+    assert manager.sessions.get(session_id).memory == ["Hi", "Hi"]
+    assert len(manager.sessions) == 1
+    
+    metrics = client.get("/api/metrics").text
+    assert 'chat_rag_span_seconds_count{span="chat.turn"}' in metrics
+    assert "chat_rag_chat_sessions 1" in metrics
 
 def test_upload_invalid_file():
     response = client.post("/api/upload", files={"file": ("test.txt", b"content", "text/plain")})
     assert response.status_code == 400
     assert response.json()["detail"] == "Only .zip files are allowed"
+
+def test_health_and_readiness():
+    assert client.get("/api/health").json() == {"status": "ok"}
+    # The lifespan warm-up does not run without a `with TestClient(...)` block
+    response = client.get("/api/ready")
+    assert response.status_code == 503
+    assert "imports" in response.json()["phases"]
+
+def test_trigger_ingest_claims_status_before_preparing(tmp_path, monkeypatch):
+    import web.api.ingest as ingest_api
+    archive = tmp_path / "export.zip"
+    archive.write_bytes(b"not a zip")
+    monkeypatch.setattr(ingest_api, "UPLOAD_PATH", archive)
+    monkeypatch.setattr(ingest_api, "EXTRACT_DIR", tmp_path / "extract")
+    manager.set_ingestion_status("idle")
+    
+    # A bad archive fails in preparation and leaves the previous state
+    response = client.post("/api/ingest")
+    assert response.status_code == 400
+    assert manager.ingestion_status == "idle"
+    
+    seen = []
+    monkeypatch.setattr(ingest_api, "prepare_export", lambda *args: seen.append(manager.ingestion_status))
+    monkeypatch.setattr(manager, "start_ingestion", lambda path: manager.set_ingestion_status("running"))
+    assert client.post("/api/ingest").status_code == 200
+    assert seen == ["preparing"]
+    
+    # Requests arriving while another one is preparing are rejected
+    manager.set_ingestion_status("preparing")
+    assert client.post("/api/ingest").status_code == 400
+    manager.set_ingestion_status("idle")
+
+def test_ingest_events_sends_snapshot(monkeypatch):
+    from starlette.requests import Request
+    
+    async def disconnected(self):
+        return True
+    
+    # TestClient buffers the whole body, so end the stream after the first event
+    monkeypatch.setattr(Request, "is_disconnected", disconnected)
+    manager.set_ingestion_status("idle", 1.0, "Ingestion complete")
+    response = client.get("/api/ingest/events")
+    assert response.headers["content-type"].startswith("text/event-stream")
+    event = response.text.split("\n\n")[0]
+    assert event.startswith("data: ")
+    assert json.loads(event[len("data: "):])["ingestion_message"] == "Ingestion complete"
+
+def test_ingest_events_streams_progress():
+    from web.api.ingest import ingest_events
+    
+    class Connected:
+        async def is_disconnected(self):
+            return False
+    
+    async def read_events():
+        response = await ingest_events(Connected())
+        events = response.body_iterator
+        first = await events.__anext__()
+        # Published from the job's pump thread in the server
+        manager.handle_ingestion_event({"status": "running", "progress": 0.5, "message": "Parsed 5 conversations", "nodes_written": 3})
+        second = await events.__anext__()
+        await events.aclose()
+        return first, second
+    
+    first, second = asyncio.run(read_events())
+    assert first.startswith("data: ") and second.startswith("data: ")
+    snapshot = json.loads(second[len("data: "):])
+    assert snapshot["ingestion_status"] == "running"
+    assert snapshot["ingestion_details"]["nodes_written"] == 3
+    assert manager._subscribers == []
+    manager.set_ingestion_status("idle")
@@ -0,0 +1,28 @@
+from chat_rag.bench import BenchConfig, HashEmbedding, percentiles, run_benchmark
+from chat_rag.synthetic import SyntheticSpec
+
+
+def test_hash_embedding_is_deterministic_and_normalised():
+    model = HashEmbedding(dim=64)
+    a = model.get_text_embedding("alpha beta gamma")
+    assert a == HashEmbedding(dim=64).get_text_embedding("alpha beta gamma")
+    assert abs(sum(x * x for x in a) - 1.0) < 1e-5
+    assert a != model.get_text_embedding("delta epsilon")
+
+
+def test_percentiles():
+    p = percentiles([float(i) for i in range(1, 101)])
+    assert round(p["p50"], 2) == 50.5
+    assert p["p95"] < p["p99"] <= 100
+
+
+def test_run_benchmark_memory_store():
+    config = BenchConfig(
+        spec=SyntheticSpec(conversations=20, messages=4, words_per_message=20, topics=4),
+        queries=5, top_k=3, batch_size=8, store="memory", embed_dim=32,
+    )
+    results = run_benchmark(config)
+    assert results["parse"]["conversations"] == 20
+    assert results["chunk"]["nodes"] >= 20
+    # The in-memory store is exact, so it matches the brute-force baseline
+    assert results["retrieval"]["recall"] == 1.0
@@ -0,0 +1,23 @@
+import time
+
+from chat_rag.cache import LRUCache
+
+
+def test_lru_eviction_and_stats():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" becomes least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get_or_compute("c", lambda: 99) == 3
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry():
+    cache = LRUCache(maxsize=10, ttl=0.01)
+    cache.put("q", ["hit"])
+    assert cache.get("q") == ["hit"]
+    time.sleep(0.02)
+    assert cache.get("q") is None
@@ -0,0 +1,23 @@
+from chat_rag.embed_cache import EmbeddingCache
+
+
+def test_roundtrip_and_stats(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite", "model-a", max_entries=10)
+    assert cache.get_many(["a", "b"]) == [None, None]
+    cache.put_many(["a"], [[0.5, 0.25]])
+    assert cache.get_many(["a", "b"]) == [[0.5, 0.25], None]
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.close()
+
+    # Entries persist across instances but are scoped to the model name
+    assert EmbeddingCache(tmp_path / "cache.sqlite", "model-a", 10).get_many(["a"]) == [[0.5, 0.25]]
+    assert EmbeddingCache(tmp_path / "cache.sqlite", "model-b", 10).get_many(["a"]) == [None]
+
+
+def test_lru_eviction(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite", "m", max_entries=2)
+    cache.put_many(["a"], [[1.0]])
+    cache.put_many(["b"], [[2.0]])
+    cache.get_many(["a"])  # "b" is now least recently used
+    cache.put_many(["c"], [[3.0]])
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
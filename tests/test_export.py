@@ -0,0 +1,122 @@
+import json
+
+from parse_export import MANIFEST_NAME, _atomic_write, main
+
+
+def _conv(conv_id, title, text, t, project=None):
+    message = {
+        "id": f"{conv_id}-m",
+        "author": {"role": "user"},
+        "create_time": t,
+        "content": {"content_type": "text", "parts": [text]},
+    }
+    conv = {
+        "id": conv_id,
+        "title": title,
+        "create_time": t,
+        "update_time": t,
+        "current_node": message["id"],
+        "mapping": {message["id"]: {"message": message, "parent": None, "children": []}},
+    }
+    if project:
+        conv["project_id"] = project
+    return conv
+
+
+def _export(tmp_path, conversations):
+    src = tmp_path / "src"
+    src.mkdir(exist_ok=True)
+    (src / "conversations.json").write_text(json.dumps(conversations))
+    return src
+
+
+def _files(root):
+    return {p.relative_to(root).as_posix(): p.read_text() for p in root.rglob("conversation.md")}
+
+
+def test_rerun_skips_unchanged_and_rewrites_changed(tmp_path, capsys):
+    out = tmp_path / "out"
+    src = _export(tmp_path, [_conv("a", "Alpha", "one", 1), _conv("b", "Beta", "two", 2)])
+    assert main(["--input", str(src), "--output", str(out)]) == 0
+    first = _files(out)
+    mtimes = {p: (out / p).stat().st_mtime_ns for p in first}
+    capsys.readouterr()
+
+    _export(tmp_path, [_conv("a", "Alpha", "one", 1), _conv("b", "Beta", "two, edited", 2)])
+    assert main(["--input", str(src), "--output", str(out)]) == 0
+    assert "Wrote 1, skipped 1 unchanged" in capsys.readouterr().out
+    second = _files(out)
+    (alpha,) = [p for p in first if "alpha" in p]
+    (beta,) = [p for p in first if "beta" in p]
+    assert (out / alpha).stat().st_mtime_ns == mtimes[alpha]
+    assert second[alpha] == first[alpha]
+    assert "two, edited" in second[beta]
+
+
+def test_prune_removes_stale_folders_and_empty_projects(tmp_path):
+    out = tmp_path / "out"
+    src = _export(tmp_path, [_conv("a", "Alpha", "one", 1), _conv("b", "Beta", "two", 2, project="research")])
+    main(["--input", str(src), "--output", str(out)])
+    assert (out / "research").is_dir()
+
+    # Without --prune the stale folder is kept and remembered in the manifest
+    _export(tmp_path, [_conv("a", "Alpha", "one", 1)])
+    main(["--input", str(src), "--output", str(out)])
+    manifest = json.loads((out / MANIFEST_NAME).read_text())
+    assert len(manifest["stale"]) == 1 and manifest["stale"][0].startswith("research/")
+    assert len(_files(out)) == 2
+
+    main(["--input", str(src), "--output", str(out), "--prune"])
+    assert [p for p in _files(out)] == ["19700101-000001_alpha/conversation.md"]
+    assert not (out / "research").exists()
+    assert json.loads((out / MANIFEST_NAME).read_text())["stale"] == []
+
+
+def test_atomic_write_replaces_without_leftovers(tmp_path):
+    path = tmp_path / "conversation.md"
+    path.write_text("old")
+    _atomic_write(path, "new\n")
+    assert path.read_text() == "new\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["conversation.md"]
+
+
+def test_parallel_render_matches_serial_with_collisions(tmp_path):
+    # Same title and timestamp -> same base folder name; later ones get a suffix
+    conversations = [_conv(f"c{i}", "Same title", f"text {i}", 5) for i in range(6)]
+    conversations += [_conv(f"d{i}", f"Title {i % 2}", f"other {i}", 7) for i in range(6)]
+    src = _export(tmp_path, conversations)
+    outputs = []
+    for run, jobs in enumerate(["1", "2", "2"]):
+        out = tmp_path / f"out{run}"
+        assert main(["--input", str(src), "--output", str(out), "--jobs", jobs]) == 0
+        outputs.append(_files(out))
+    serial = outputs[0]
+    assert outputs[1] == serial and outputs[2] == serial
+
+    same = sorted(p.split("/")[0] for p in serial if "_same-title" in p)
+    assert len(same) == 6
+    # The first conversation in export order keeps the plain name
+    base = min(same, key=len)
+    assert serial[f"{base}/conversation.md"].count("text 0") == 1
+    assert all(name.startswith(base + "_") for name in same if name != base)
+
+
+def test_conversations_sharing_a_stable_id_are_tracked_separately(tmp_path, capsys):
+    # Conversations without messages all hash to the same stable id
+    empty = [
+        {"id": f"e{i}", "title": title, "create_time": 3, "update_time": 3, "mapping": {}}
+        for i, title in enumerate(["Draft", "Draft", "Draft", "Notes"])
+    ]
+    out = tmp_path / "out"
+    src = _export(tmp_path, empty)
+    main(["--input", str(src), "--output", str(out)])
+    folders = sorted(p.split("/")[0] for p in _files(out))
+    assert len(folders) == 4 and len(set(folders)) == 4
+    capsys.readouterr()
+
+    main(["--input", str(src), "--output", str(out)])
+    assert "Wrote 0, skipped 4 unchanged" in capsys.readouterr().out
+
+    _export(tmp_path, empty[:2] + empty[3:])
+    main(["--input", str(src), "--output", str(out), "--prune"])
+    assert len(_files(out)) == 3
@@ -0,0 +1,79 @@
+import queue
+
+import chat_rag.ingest
+from web import services
+from web.jobs import IngestionJob, _ingest_worker
+from web.services import ServiceManager
+
+
+class _StubProcess:
+    def __init__(self, alive=True, exitcode=None):
+        self.alive, self.exitcode = alive, exitcode
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+
+def test_worker_forwards_progress_then_completion(monkeypatch):
+    def fake_ingest(input_dir, progress_callback=None):
+        progress_callback({"status": "running", "stage": "parsing", "progress": 0.5, "nodes_written": 0})
+        progress_callback({"status": "running", "stage": "writing", "progress": 0.9, "nodes_written": 12})
+
+    monkeypatch.setattr(chat_rag.ingest, "ingest_data", fake_ingest)
+    events = queue.Queue()
+    _ingest_worker("export.zip", events)
+    stages = [events.get_nowait() for _ in range(3)]
+    assert [e.get("stage") for e in stages] == ["parsing", "writing", None]
+    assert stages[-1]["status"] == "idle"
+
+    monkeypatch.setattr(chat_rag.ingest, "ingest_data", lambda *a, **k: 1 / 0)
+    _ingest_worker("export.zip", events)
+    assert events.get_nowait()["status"] == "error"
+
+
+def test_job_pumps_events_until_finished():
+    received = []
+    job = IngestionJob("export.zip", received.append)
+    job._events = queue.Queue()
+    job._process = _StubProcess()
+    for event in (
+        {"status": "running", "progress": 0.5},
+        {"status": "idle", "progress": 1.0},
+        {"status": "running", "progress": 0.0},  # never read: idle ends the pump
+    ):
+        job._events.put(event)
+    job._pump_events()
+    assert [e["status"] for e in received] == ["running", "idle"]
+
+
+def test_job_reports_a_worker_that_died():
+    received = []
+    job = IngestionJob("export.zip", received.append)
+    job._events = queue.Queue()
+    job._process = _StubProcess(alive=False, exitcode=-9)
+    job._pump_events()
+    assert received == [{"status": "error", "progress": 0.0, "message": "Ingestion worker exited with code -9"}]
+
+
+def test_handle_ingestion_event_updates_snapshot(monkeypatch):
+    invalidations = []
+    monkeypatch.setattr(services, "invalidate_search_cache", lambda: invalidations.append(1))
+    manager = ServiceManager()
+    running = {"status": "running", "progress": 0.25, "message": "Parsed 10 conversations", "nodes_written": 0}
+    manager.handle_ingestion_event(running)
+    manager.handle_ingestion_event({**running, "progress": 0.5, "nodes_written": 40})
+    manager.handle_ingestion_event({**running, "progress": 0.6, "nodes_written": 40})
+    snapshot = manager.ingestion_snapshot()
+    assert snapshot["ingestion_status"] == "running"
+    assert snapshot["ingestion_progress"] == 0.6
+    assert snapshot["ingestion_details"]["nodes_written"] == 40
+    # Cached search results are dropped only when nodes_written changes
+    assert len(invalidations) == 2
+
+    manager.handle_ingestion_event({"status": "idle", "progress": 1.0, "message": "Ingestion complete"})
+    snapshot = manager.ingestion_snapshot()
+    assert (snapshot["ingestion_status"], snapshot["ingestion_message"]) == ("idle", "Ingestion complete")
+    assert snapshot["ingestion_details"]["nodes_written"] == 40
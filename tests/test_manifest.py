@@ -0,0 +1,14 @@
+from chat_rag.manifest import ManifestEntry, pipeline_fingerprint
+
+
+def test_pipeline_fingerprint_tracks_settings():
+    base = pipeline_fingerprint(chunk_size=1024, chunk_overlap=200, render_version=2, include_branches=False)
+    assert base == pipeline_fingerprint(include_branches=False, render_version=2, chunk_overlap=200, chunk_size=1024)
+    assert base != pipeline_fingerprint(chunk_size=512, chunk_overlap=200, render_version=2, include_branches=False)
+    assert base != pipeline_fingerprint(chunk_size=1024, chunk_overlap=200, render_version=3, include_branches=False)
+    assert base != pipeline_fingerprint(chunk_size=1024, chunk_overlap=200, render_version=2, include_branches=True)
+
+
+def test_legacy_entries_have_no_fingerprint():
+    # Rows recorded before fingerprints existed never match the current pipeline
+    assert ManifestEntry("c1", "abc", 1.0).fingerprint is None
@@ -0,0 +1,53 @@
+from chat_rag import metrics
+
+
+def test_span_records_histogram_and_request_timings():
+    metrics.registry.clear()
+    with metrics.collect_request_timings() as timings:
+        with metrics.span("tool.example"):
+            pass
+        metrics.observe("tool.example", 0.2)
+    assert set(timings) == {"tool.example"}
+    text = metrics.render_prometheus(
+        [("chat_rag_chat_sessions", "Open sessions.", {}, 3)],
+        [
+            ("chat_rag_cache_hits_total", "Hits.", {"cache": "q"}, 5),
+            ("chat_rag_cache_misses_total", "Misses.", {"cache": "q"}, 1),
+            ("chat_rag_cache_hits_total", "Hits.", {"cache": "r"}, 0),
+        ],
+    )
+    assert 'chat_rag_span_seconds_bucket{span="tool.example",le="0.25"} 2' in text
+    assert 'chat_rag_span_seconds_count{span="tool.example"} 2' in text
+    assert "chat_rag_chat_sessions 3" in text
+    assert "# TYPE chat_rag_chat_sessions gauge" in text
+    assert "# TYPE chat_rag_cache_hits_total counter" in text
+    # Each metric's samples are grouped under its HELP/TYPE lines
+    assert 'chat_rag_cache_hits_total{cache="q"} 5\nchat_rag_cache_hits_total{cache="r"} 0' in text
+    assert metrics.server_timing_header({"search.vector": 0.0125}) == "search-vector;dur=12.5"
+
+
+def test_disabled_is_a_no_op(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+    metrics.registry.clear()
+
+    def fn():
+        return 1
+
+    assert metrics.timed("x")(fn) is fn
+    with metrics.span("x"):
+        pass
+    assert metrics.registry.snapshot() == {}
+
+
+def test_timed_coroutine_waits_for_result():
+    import asyncio
+    metrics.registry.clear()
+
+    @metrics.timed("tool.async_example")
+    async def fn():
+        await asyncio.sleep(0.01)
+        return 2
+
+    assert asyncio.run(fn()) == 2
+    (counts, total, count), = metrics.registry.snapshot().values()
+    assert count == 1 and total >= 0.01
@@ -0,0 +1,70 @@
+import json
+
+from chat_rag.ingest import _render_conversation
+from chat_rag.normalize import Conversation, normalize
+from parse_export import MarkdownExporter, export_options, load_conversations, render_conversation
+
+
+def _node(parent, children, role, text, t, **meta):
+    message = {
+        "id": f"m{t}",
+        "author": {"role": role},
+        "create_time": t,
+        "content": {"content_type": "text", "parts": [text]},
+        "metadata": meta,
+    }
+    return {"message": message, "parent": parent, "children": children}
+
+
+CONV = {
+    "id": "c1",
+    "title": "Sample",
+    "create_time": 1,
+    "update_time": 9,
+    "current_node": "a",
+    "mapping": {
+        "root": {"message": None, "parent": None, "children": ["sys"]},
+        "sys": _node("root", ["q"], "system", "", 1),
+        "q": _node("sys", ["t"], "user", "question", "2"),  # string timestamp
+        "t": _node("q", ["a"], "tool", "lookup", 3),
+        "a": _node("t", [], "assistant", "answer", 4),
+        "x": _node("t", [], "assistant", "secret", 5, is_visually_hidden_from_conversation=True),
+    },
+}
+
+
+def test_ordering_and_hidden_flags():
+    conv = normalize(CONV)
+    assert normalize(conv) is conv
+    assert [m.node_id for m in conv.messages] == ["sys", "q", "t", "a", "x"]
+    assert [m.node_id for m in conv.canonical] == ["sys", "q", "t", "a"]
+    assert [leaf for leaf, _ in conv.branches] == ["x"]
+    assert [m.node_id for m in conv.messages if m.hidden] == ["sys", "x"]
+    assert [m.node_id for m in Conversation.visible(conv.messages, include_tools=False)] == ["q", "a"]
+
+
+def test_ingest_and_markdown_share_filtering():
+    assert _render_conversation(CONV) == "[user]: question\n\n[tool]: lookup\n\n[assistant]: answer"
+    markdown = render_conversation(CONV, 0, "conversations.json", None, {}, include_tools=False).markdown
+    assert "question" in markdown and "answer" in markdown
+    assert "lookup" not in markdown and "secret" not in markdown
+
+
+def test_exporter_matches_standalone_export(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "conversations.json").write_text(json.dumps([CONV, {**CONV, "id": "c2", "title": "Other"}]))
+    (src / "user.json").write_text(json.dumps({"email": "me@example.com"}))
+    conversations, label = load_conversations(src, "json")
+    options = export_options(src, label, include_tools=False)
+
+    exporter = MarkdownExporter(tmp_path / "out", options)
+    for conv in conversations:
+        exporter.add_conversation(normalize(conv))
+    assert exporter.finish() == []
+
+    files = sorted((tmp_path / "out").rglob("conversation.md"))
+    assert len(files) == 2
+    expected = render_conversation(CONV, 0, **options).markdown
+    assert [f.read_text() for f in files if f.parent.name.endswith("_sample")] == [expected]
+    assert "owner_email: \"me@example.com\"" in expected
@@ -0,0 +1,83 @@
+import json
+import re
+
+from llama_index.core.schema import TextNode
+
+from chat_rag.pipeline import _copy_field, write_nodes
+
+_UNESCAPE = {"\\\\": "\\", "\\t": "\t", "\\n": "\n", "\\r": "\r"}
+
+
+def _copy_decode(field):
+    # What Postgres reads back from a COPY text-format field
+    if field == "\\N":
+        return None
+    return re.sub(r"\\[\\tnr]", lambda m: _UNESCAPE[m.group()], field)
+
+
+def test_copy_field_escaping():
+    assert _copy_field("plain") == "plain"
+    assert _copy_field("a\\b") == "a\\\\b"
+    assert _copy_field("col\tnext\nline\r") == "col\\tnext\\nline\\r"
+    # Postgres text cannot store NUL, so it is dropped
+    assert _copy_field("nul\x00byte") == "nulbyte"
+    assert _copy_field(None) == "\\N"
+    assert _copy_field("") == ""
+    # A literal backslash-n stays distinguishable from a newline
+    assert _copy_decode(_copy_field("\\n")) == "\\n"
+    assert _copy_decode(_copy_field("\\\n\t\\t")) == "\\\n\t\\t"
+
+
+class _Cursor:
+    def __init__(self, copied):
+        self.copied = copied
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, buf):
+        self.copied.append((sql, buf.read()))
+
+
+class _RawConnection:
+    def __init__(self):
+        self.copied = []
+        self.committed = self.closed = False
+
+    def cursor(self):
+        return _Cursor(self.copied)
+
+    def commit(self):
+        self.committed = True
+
+    def close(self):
+        self.closed = True
+
+
+class _Engine:
+    def __init__(self):
+        self.raw = _RawConnection()
+
+    def raw_connection(self):
+        return self.raw
+
+
+def test_write_nodes_copy_rows_round_trip():
+    text = "line one\nline\ttwo \\ end\x00"
+    node = TextNode(id_="n1", text=text, metadata={"title": "Tab\there", "id": "c1"}, embedding=[0.5, -1.0])
+    engine = _Engine()
+    timing = write_nodes(engine, [node], table="data_test")
+    assert timing.count == 1
+    assert engine.raw.committed and engine.raw.closed
+
+    (sql, data), = engine.raw.copied
+    assert sql.startswith("COPY data_test (text, metadata_, node_id, embedding)")
+    rows = data.split("\n")
+    assert rows[-1] == "" and len(rows) == 2
+    fields = [_copy_decode(f) for f in rows[0].split("\t")]
+    assert fields[0] == text.replace("\x00", "")
+    assert json.loads(fields[1])["title"] == "Tab\there"
+    assert fields[2:] == ["n1", "[0.5,-1.0]"]
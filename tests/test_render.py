@@ -0,0 +1,79 @@
+from llama_index.core import Document, Settings
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import MetadataMode
+
+from chat_rag.ingest import _render_blocks, _render_conversation
+from chat_rag.normalize import normalize
+from chat_rag.pipeline import CHUNK_INDEX_KEY, ROLES_KEY, MessageBlock, chunk_documents
+
+
+def _msg(role, text, t):
+    return {"author": {"role": role}, "create_time": t, "content": {"parts": [text]}}
+
+
+# root -> q -> (old answer | new answer -> follow-up); the user kept the new answer
+BRANCHED = {
+    "current_node": "a2",
+    "mapping": {
+        "root": {"message": None, "parent": None, "children": ["q"]},
+        "q": {"message": _msg("user", "question", 1), "parent": "root", "children": ["old", "new"]},
+        "old": {"message": _msg("assistant", "old answer", 2), "parent": "q", "children": []},
+        "new": {"message": _msg("assistant", "new answer", 3), "parent": "q", "children": ["q2"]},
+        "q2": {"message": _msg("user", "follow-up", 4), "parent": "new", "children": ["a2"]},
+        "a2": {"message": _msg("assistant", "final", 5), "parent": "q2", "children": []},
+    },
+}
+
+
+def test_canonical_path_skips_abandoned_branches():
+    assert _render_conversation(BRANCHED) == (
+        "[user]: question\n\n[assistant]: new answer\n\n[user]: follow-up\n\n[assistant]: final"
+    )
+    assert [(leaf, [m.parts[0] for m in msgs]) for leaf, msgs in normalize(BRANCHED).branches] == [
+        ("old", ["old answer"])
+    ]
+
+
+def test_without_current_node_falls_back_to_time_order():
+    conv = {"mapping": BRANCHED["mapping"]}
+    assert [b.text for b in _render_blocks(conv)][:3] == [
+        "[user]: question", "[assistant]: old answer", "[assistant]: new answer"
+    ]
+
+
+def test_chunks_follow_message_boundaries(monkeypatch):
+    monkeypatch.setattr(Settings, "node_parser", SentenceSplitter(chunk_size=40, chunk_overlap=0))
+    blocks = [
+        MessageBlock("user", "[user]: " + "short question " * 12),
+        MessageBlock("assistant", "[assistant]: " + "medium answer text " * 10),
+        MessageBlock("user", "[user]: thanks"),
+    ]
+    doc = Document(text="\n\n".join(b.text for b in blocks), id_="c1")
+    nodes = chunk_documents([doc], [blocks])
+    texts = [n.get_content() for n in nodes]
+    # No chunk starts or ends in the middle of a message
+    assert "\n\n".join(texts) == doc.text
+    assert [n.metadata[ROLES_KEY] for n in nodes] == ["user", "assistant,user"]
+    assert [n.metadata[CHUNK_INDEX_KEY] for n in nodes] == [0, 1]
+    assert all(n.ref_doc_id == "c1" for n in nodes)
+
+
+def test_message_chunks_keep_document_metadata(monkeypatch):
+    monkeypatch.setattr(Settings, "node_parser", SentenceSplitter(chunk_size=60, chunk_overlap=0))
+    blocks = [
+        MessageBlock("user", "[user]: " + "long question " * 20),
+        MessageBlock("assistant", "[assistant]: short answer"),
+    ]
+    metadata = {"id": "c1", "title": "Kubernetes", "create_time": 1700000000.0, "source": "chatgpt", "branch": "leaf"}
+    doc = Document(
+        text="\n\n".join(b.text for b in blocks),
+        id_="c1#leaf",
+        metadata=metadata,
+        excluded_embed_metadata_keys=["branch", "source"],
+    )
+    nodes = chunk_documents([doc], [blocks])
+    assert len(nodes) > 1
+    for node in nodes:
+        assert {k: node.metadata[k] for k in metadata} == metadata
+        embedded = node.get_content(metadata_mode=MetadataMode.EMBED)
+        assert "title: Kubernetes" in embedded and "source" not in embedded
@@ -0,0 +1,59 @@
+import asyncio
+
+from chat_rag import rerank, tools
+from chat_rag.cache import search_result_cache
+from chat_rag.search import ConversationHits, SearchHit
+
+
+def _conv(doc_id, *texts):
+    hits = [SearchHit(f"{doc_id}-{i}", doc_id, doc_id.title(), 1.0, text, 0.5) for i, text in enumerate(texts)]
+    return ConversationHits(doc_id, doc_id.title(), 1.0, 0.5, ["q"], hits)
+
+
+class _FakeCrossEncoder:
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=None):
+        self.batches.append(list(pairs))
+        # Relevance = how often the query word appears in the snippet
+        return [text.count(query) for query, text in pairs]
+
+
+CANDIDATES = [
+    _conv("alpha", "nothing here", "kube kube"),
+    _conv("beta", "kube " * 200),
+    _conv("gamma", "unrelated"),
+]
+
+
+def test_rerank_scores_all_pairs_in_one_batch(monkeypatch):
+    model = _FakeCrossEncoder()
+    monkeypatch.setattr(rerank, "get_reranker", lambda: model)
+    ranked = rerank.rerank("kube", CANDIDATES, top_k=2)
+    assert len(model.batches) == 1 and len(model.batches[0]) == 4
+    assert [c.doc_id for c in ranked] == ["beta", "alpha"]
+    assert [h.text for h in ranked[1].hits] == ["kube kube", "nothing here"]
+    assert ranked[1].score == 2.0
+
+
+def test_reranked_tool_output_fits_token_budget(monkeypatch):
+    model = _FakeCrossEncoder()
+    fetched = []
+
+    async def fake_grouped(query, top_k, filters):
+        fetched.append(top_k)
+        return CANDIDATES
+
+    monkeypatch.setattr(rerank, "get_reranker", lambda: model)
+    monkeypatch.setattr(rerank, "agrouped_vector_search", fake_grouped)
+    monkeypatch.setattr(tools, "RERANK_ENABLED", True)
+    monkeypatch.setattr(tools, "RERANK_TOKEN_BUDGET", 60)
+    search_result_cache.clear()
+
+    output = asyncio.run(tools.asearch_conversations("kube"))
+    # Wide candidate set from pgvector, best reranked result first
+    assert fetched == [rerank.RERANK_CANDIDATES]
+    assert output.startswith("1. TITLE: Beta")
+    assert "TITLE: Alpha" not in output
+    assert "2 lower-ranked result(s) omitted" in output
@@ -0,0 +1,230 @@
+from chat_rag.search import SearchHit, reciprocal_rank_fusion
+
+
+def _hit(node_id, score=0.0):
+    return SearchHit(node_id, f"doc-{node_id}", "Title", 1700000000.0, f"text {node_id}", score)
+
+
+def test_reciprocal_rank_fusion_prefers_agreement():
+    keyword = [_hit("a"), _hit("b"), _hit("c")]
+    vector = [_hit("c"), _hit("a"), _hit("d")]
+    fused = reciprocal_rank_fusion([keyword, vector], top_k=3)
+    # "a" (ranks 1 and 2) beats "c" (ranks 3 and 1), both beat single-list hits
+    assert [h.node_id for h in fused] == ["a", "c", "b"]
+    assert fused[0].score == 1 / 61 + 1 / 62
+
+
+def test_reciprocal_rank_fusion_single_list():
+    assert [h.node_id for h in reciprocal_rank_fusion([[_hit("x"), _hit("y")]], top_k=5)] == ["x", "y"]
+
+
+class _FakeRetriever:
+    def __init__(self):
+        self.calls = []
+
+    def retrieve(self, bundle):
+        raise AssertionError("sync retrieve used on the async path")
+
+    async def aretrieve(self, bundle):
+        from llama_index.core.schema import NodeWithScore, TextNode
+        self.calls.append(bundle.embedding)
+        node = TextNode(id_="n1", text="hello", metadata={"id": "c1", "title": "T", "create_time": 1.0})
+        return [NodeWithScore(node=node, score=0.9)]
+
+
+def test_async_vector_search_shares_cache(monkeypatch):
+    import asyncio
+    from chat_rag import search
+    from chat_rag.cache import query_embedding_cache, search_result_cache
+
+    retriever = _FakeRetriever()
+
+    class _Context:
+        def retriever(self, similarity_top_k=5):
+            return retriever
+
+    monkeypatch.setattr(search, "get_retrieval_context", lambda: _Context())
+    monkeypatch.setattr(search, "_embed_query", lambda query: [0.5, 0.5])
+    query_embedding_cache.clear()
+    search_result_cache.clear()
+
+    assert asyncio.run(search.avector_search("greeting", top_k=5))[0].doc_id == "c1"
+    assert retriever.calls == [[0.5, 0.5]]
+    # Results are shared with the sync path through the search cache
+    assert search.vector_search("greeting", top_k=5)[0].doc_id == "c1"
+    assert len(retriever.calls) == 1
+
+
+class _FakeAsyncEngine:
+    """Async engine stand-in recording (sql, params) and returning fixed rows
+    (or rows computed from the params, if `rows` is callable)."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def begin(self):
+        engine = self
+
+        class _Result:
+            def __init__(self, params):
+                self.params = params
+
+            def all(self):
+                return engine.rows(self.params) if callable(engine.rows) else engine.rows
+
+        class _Conn:
+            async def execute(self, statement, params):
+                engine.executed.append((str(statement), params))
+                return _Result(params)
+
+        class _Begin:
+            async def __aenter__(self):
+                return _Conn()
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Begin()
+
+
+def test_grouped_search_tool_runs_one_query(monkeypatch):
+    import asyncio
+    from chat_rag import search
+    from chat_rag.cache import query_embedding_cache, search_result_cache
+    from chat_rag.tools import get_rag_tools
+
+    # Rows as returned by the grouping query: conversation key first, best conversation first
+    rows = [
+        ("c1", "n1", "c1", "First", 1.0, "best chunk", 0.9),
+        ("c1", "n2", "c1", "First", 1.0, "second chunk", 0.8),
+        ("legacy", "legacy", None, None, None, "orphan chunk", 0.5),
+    ]
+    engine = _FakeAsyncEngine(rows)
+    executed = engine.executed
+    monkeypatch.setattr(search, "get_async_engine", lambda: engine)
+    monkeypatch.setattr(search, "_embed_query", lambda query: [0.25, 0.5])
+    query_embedding_cache.clear()
+    search_result_cache.clear()
+
+    grouped = asyncio.run(search.agrouped_vector_search("topic", top_k=5))
+    assert [(c.doc_id, c.score, [h.node_id for h in c.hits]) for c in grouped] == [
+        ("c1", 0.9, ["n1", "n2"]),
+        (None, 0.5, ["legacy"]),
+    ]
+    # Over-fetching 50 chunks exceeds ef_search (40), so it is widened for the transaction first
+    (set_sql, set_params), (sql, params) = executed
+    assert "hnsw.ef_search" in set_sql and set_params == {"ef_search": "50"}
+    assert "row_number() OVER" in sql and params["embedding"] == "[0.25,0.5]"
+    assert params["top_k"] == 5 and params["candidates"] == 50
+
+    tool = next(t for t in get_rag_tools() if t.metadata.name == "search_conversations")
+    output = asyncio.run(tool.acall(query="topic")).content
+    assert len(executed) == 2  # second call was served from the search cache
+    assert output.count("ID: c1") == 1 and "PREVIEW: second chunk" in output
+
+
+def test_parse_date_bound_covers_whole_periods():
+    import datetime as dt
+    from chat_rag.search import parse_date_bound
+
+    def utc(*args):
+        return dt.datetime(*args, tzinfo=dt.timezone.utc).timestamp()
+
+    assert parse_date_bound("2024") == utc(2024, 1, 1)
+    assert parse_date_bound("2024-03", end=True) == utc(2024, 4, 1)
+    assert parse_date_bound("2024-12", end=True) == utc(2025, 1, 1)
+    assert parse_date_bound("2024-03-31", end=True) == utc(2024, 4, 1)
+    assert parse_date_bound("2024-03-01T10:00:00+02:00", end=True) == utc(2024, 3, 1, 8)
+
+
+def test_filtered_search_filters_in_sql(monkeypatch):
+    import asyncio
+    from chat_rag import search
+    from chat_rag.cache import query_embedding_cache, search_result_cache
+    from chat_rag.tools import get_rag_tools
+
+    engine = _FakeAsyncEngine([])
+    monkeypatch.setattr(search, "get_async_engine", lambda: engine)
+    monkeypatch.setattr(search, "_embed_query", lambda query: [1.0])
+    query_embedding_cache.clear()
+    search_result_cache.clear()
+
+    tool = next(t for t in get_rag_tools() if t.metadata.name == "search_conversations")
+    output = asyncio.run(tool.acall(query="kubernetes", date_from="2024-03", date_to="2024-03", title_contains="50%"))
+    assert output.content == "No matching conversations found."
+    statements = [sql for sql, _ in engine.executed]
+    assert "iterative_scan" in statements[1]
+    sql, params = engine.executed[-1]
+    assert "((metadata_->>'create_time')::double precision) >= :date_from" in sql
+    assert "(metadata_->>'title') ILIKE :title_pattern" in sql
+    assert params["title_pattern"] == "%50\\%%"
+    assert params["date_to"] - params["date_from"] == 31 * 86400
+
+    output = asyncio.run(tool.acall(query="kubernetes", date_from="March"))
+    assert output.content.startswith("Error searching conversations:")
+
+
+def test_multi_search_groups_in_sql_and_merges(monkeypatch):
+    import asyncio
+    from chat_rag import search
+    from chat_rag.cache import query_embedding_cache, search_result_cache
+    from chat_rag.tools import get_rag_tools
+
+    # Grouped rows per query embedding: c1 matches both queries, c2 only "beta"
+    rows = {
+        "[1.0]": [("c1", "n1", "c1", "First", 1.0, "alpha chunk", 0.9), ("c1", "n2", "c1", "First", 1.0, "shared", 0.7)],
+        "[2.0]": [("c1", "n2", "c1", "First", 1.0, "shared", 0.8), ("c2", "n3", "c2", "Second", 2.0, "beta chunk", 0.6)],
+    }
+    engine = _FakeAsyncEngine(lambda params: rows.get(params.get("embedding"), []))
+    embedded = []
+    monkeypatch.setattr(search, "get_async_engine", lambda: engine)
+    monkeypatch.setattr(search, "_embed_query", lambda q: embedded.append(q) or ([1.0] if q == "alpha" else [2.0]))
+    query_embedding_cache.clear()
+    search_result_cache.clear()
+
+    merged = asyncio.run(search.amulti_grouped_search(["alpha", "beta"]))
+    assert [(c.doc_id, c.queries, [h.node_id for h in c.hits]) for c in merged] == [
+        ("c1", ["alpha", "beta"], ["n1", "n2"]),
+        ("c2", ["beta"], ["n3"]),
+    ]
+    assert merged[0].hits[1].score == 0.8
+    assert sorted(embedded) == ["alpha", "beta"]
+
+    # Same grouped queries (and cache entries) as search_conversations; filters apply to each
+    tool = next(t for t in get_rag_tools() if t.metadata.name == "multi_search_conversations")
+    executed = len(engine.executed)
+    output = asyncio.run(tool.acall(queries=["alpha", " ", "beta", "alpha"])).content
+    assert len(engine.executed) == executed and sorted(embedded) == ["alpha", "beta"]
+    assert output.count("ID: c1") == 1 and "MATCHED: alpha; beta" in output
+
+    asyncio.run(tool.acall(queries=["alpha", "beta"], title_contains="first"))
+    filtered = [params for sql, params in engine.executed[executed:] if "row_number() OVER" in sql]
+    assert len(filtered) == 2 and all(p["title_pattern"] == "%first%" for p in filtered)
+
+
+def test_embed_model_loads_once_under_concurrent_first_use(monkeypatch):
+    import sys
+    import threading
+    import time
+    import types
+    from chat_rag import context
+
+    loads = []
+
+    class SlowModel:
+        def __init__(self, model_name):
+            loads.append(model_name)
+            time.sleep(0.05)
+
+    monkeypatch.setitem(sys.modules, "llama_index.embeddings.huggingface", types.SimpleNamespace(HuggingFaceEmbedding=SlowModel))
+    monkeypatch.setattr(context, "_embed_model", None)
+    # Warm-up thread and first query arriving together
+    models = []
+    threads = [threading.Thread(target=lambda: models.append(context.get_embed_model())) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loads) == 1
+    assert all(m is models[0] for m in models)
@@ -0,0 +1,34 @@
+from web.sessions import AgentSessionPool
+
+def make_pool(**kwargs):
+    return AgentSessionPool(object, list, **kwargs)
+
+def test_lru_eviction():
+    pool = make_pool(max_sessions=2)
+    a = pool.get("a")
+    pool.get("b")
+    assert pool.get("a") is a  # "a" is now most recently used
+    pool.get("c")  # evicts "b"
+    assert len(pool) == 2
+    assert pool.get("a") is a
+    assert pool.stats()["evicted"] == 1
+    assert pool.discard("b") is False
+
+def test_idle_timeout(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("web.sessions.time.monotonic", lambda: now[0])
+    pool = make_pool(max_sessions=10, idle_timeout=60)
+    a = pool.get("a")
+    now[0] += 30
+    pool.get("b")
+    now[0] += 45
+    # "a" has been idle for 75s, "b" for 45s
+    assert pool.get("b") is not None
+    assert len(pool) == 1
+    assert pool.get("a") is not a
+
+def test_sessions_have_separate_agents_and_memory():
+    pool = make_pool(max_sessions=10)
+    a, b = pool.get("a"), pool.get("b")
+    assert a.agent is not b.agent
+    assert a.memory is not b.memory
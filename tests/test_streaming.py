@@ -0,0 +1,87 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from chat_rag.streaming import (
+    ReadProgress,
+    extract_export,
+    iter_json_array,
+    iter_json_file,
+    iter_json_from_html,
+)
+
+SAMPLE = [
+    {"id": "a", "title": "First", "mapping": {"n1": {"message": {"content": {"parts": ["hi, [there]"]}}}}},
+    {"id": "b", "title": "Second é", "create_time": 1700000000.5},
+    {"id": "c", "title": "Third", "values": [1, 2.5, None, True]},
+]
+
+
+def test_iter_json_array_small_reads():
+    text = json.dumps(SAMPLE, indent=2)
+    # A tiny read size forces every value to straddle buffer boundaries
+    assert list(iter_json_array(io.StringIO(text), read_size=7)) == SAMPLE
+
+
+def test_iter_json_array_empty_and_scalars():
+    assert list(iter_json_array(io.StringIO("  [ ] "))) == []
+    assert list(iter_json_array(io.StringIO("[12345, 6]"), read_size=3)) == [12345, 6]
+
+
+def test_iter_json_array_numbers_split_mid_token():
+    # `[1.` decodes as 1 unless more input is read before accepting it
+    assert list(iter_json_array(io.StringIO("[1.5, 2]"), read_size=3)) == [1.5, 2]
+    values = [0.25, -3.5e-2, 12.0, 7, 1e10, -0.0]
+    text = json.dumps(values)
+    for read_size in range(1, 8):
+        assert list(iter_json_array(io.StringIO(text), read_size=read_size)) == values
+
+
+def test_iter_json_array_malformed():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('{"not": "an array"}')))
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO('[{"id": 1}, {"id": ')))
+
+
+def test_iter_json_file(tmp_path):
+    path = tmp_path / "conversations.json"
+    path.write_text(json.dumps(SAMPLE), encoding="utf-8")
+    assert list(iter_json_file(path)) == SAMPLE
+
+
+def test_iter_json_from_html(tmp_path):
+    blob = json.dumps(SAMPLE).replace("&", "&amp;")
+    html = f"<html><script>\nvar jsonData = {blob};\nrender(jsonData);</script></html>"
+    path = tmp_path / "chat.html"
+    path.write_text(html, encoding="utf-8")
+    assert list(iter_json_from_html(path)) == SAMPLE
+
+
+def test_iter_json_from_html_missing(tmp_path):
+    path = tmp_path / "chat.html"
+    path.write_text("<html></html>", encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_from_html(path))
+
+
+def test_iter_json_file_from_zip(tmp_path):
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("export/conversations.json", json.dumps(SAMPLE))
+        zf.writestr("export/dalle-generations/image.webp", b"\0" * 1024)
+    progress = ReadProgress()
+    assert list(iter_json_file(path, progress, member="conversations.json")) == SAMPLE
+    assert progress.fraction == 1.0
+
+
+def test_extract_export_only_needed_members(tmp_path):
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("user.json", '{"email": "a@example.com"}')
+        zf.writestr("file-abc.png", b"\0" * 1024)
+    dest = tmp_path / "out"
+    assert extract_export(path, dest) == ["user.json"]
+    assert sorted(p.name for p in dest.iterdir()) == ["user.json"]
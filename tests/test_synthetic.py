@@ -0,0 +1,28 @@
+import json
+
+from chat_rag.streaming import iter_json_file
+from chat_rag.synthetic import SyntheticExport, SyntheticSpec
+
+
+def test_conversation_tree_shape():
+    export = SyntheticExport(SyntheticSpec(conversations=5, messages=6, branch_rate=1.0, seed=3))
+    conv = export.conversation(2)
+    mapping = conv["mapping"]
+    # Walk back from the current node: the canonical path has every message
+    path = []
+    node = conv["current_node"]
+    while node is not None:
+        path.append(node)
+        node = mapping[node]["parent"]
+    assert len(path) == 6 + 1  # plus the empty root
+    assert mapping[conv["current_node"]]["children"] == []
+    # Every assistant reply was regenerated once, leaving an abandoned sibling
+    assert len(mapping) == 1 + 6 + 3
+    assert export.conversation(2) == conv
+
+
+def test_write_round_trips(tmp_path):
+    export = SyntheticExport(SyntheticSpec(conversations=7, messages=4))
+    path = export.write(tmp_path)
+    assert list(iter_json_file(path)) == list(export.conversations())
+    assert json.loads((tmp_path / "user.json").read_text())["email"]
@@ -1,33 +1,75 @@
+from typing import Optional
+from uuid import uuid4
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from fastapi.responses import StreamingResponse
+import time
+from chat_rag.metrics import observe
 from web.services import manager
-from llama_index.core.agent.workflow import AgentStream
+from llama_index.core.agent.workflow import AgentOutput, AgentStream, ToolCall, ToolCallResult
 import asyncio
 
 router = APIRouter()
 
 class ChatRequest(BaseModel):
     message: str
+    # Omit to start a new conversation; the id is returned in X-Session-Id
+    session_id: Optional[str] = None
 
 @router.post("/chat")
 async def chat(request: ChatRequest):
     try:
-        agent = manager.get_agent()
+        session_id = request.session_id or uuid4().hex
+        session = manager.get_session(session_id)
         
         # Create a generator for streaming response
         async def event_generator():
-            # Use workflow run method which returns a handler
-            handler = agent.run(user_msg=request.message)
-            
-            # Iterate over events
-            async for event in handler.stream_events():
-                if isinstance(event, AgentStream):
-                    yield event.delta
+            # Turns of one session run in order; other sessions are not blocked
+            async with session.lock:
+                started = time.perf_counter()
+                first_token = True
+                # An LLM step starts with the turn and after each batch of tool results
+                step_started = started
+                tool_started = {}
                 
-        return StreamingResponse(event_generator(), media_type="text/plain")
+                # Use workflow run method which returns a handler
+                handler = session.agent.run(user_msg=request.message, memory=session.memory)
+                
+                # Iterate over events, timing LLM steps and tool round-trips
+                async for event in handler.stream_events():
+                    now = time.perf_counter()
+                    if isinstance(event, AgentStream):
+                        if first_token and event.delta:
+                            observe("chat.first_token", now - started)
+                            first_token = False
+                        yield event.delta
+                    elif isinstance(event, AgentOutput):
+                        observe("agent.llm_step", now - step_started)
+                    elif isinstance(event, ToolCall):
+                        tool_started[event.tool_id] = now
+                    elif isinstance(event, ToolCallResult):
+                        if event.tool_id in tool_started:
+                            observe("agent.tool_call", now - tool_started.pop(event.tool_id))
+                        step_started = now
+                
+                # Let the run finish writing the reply to memory
+                await handler
+                observe("chat.turn", time.perf_counter() - started)
+                
+        return StreamingResponse(
+            event_generator(),
+            media_type="text/plain",
+            headers={"X-Session-Id": session_id},
+        )
         
     except Exception as e:
         # Log the error for debugging
         print(f"Error in chat endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.delete("/chat/{session_id}")
+async def end_chat(session_id: str):
+    """
+    Forget a session's agent and history.
+    """
+    return {"deleted": manager.sessions.discard(session_id)}
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter()
+
+@router.get("/health")
+async def health():
+    """
+    Liveness: the server is up and accepting requests.
+    """
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def ready(request: Request):
+    """
+    Readiness: 200 once startup warm-up has finished without errors, 503
+    (with the phases completed so far) until then.
+    """
+    startup = request.app.state.startup
+    return JSONResponse(startup.as_dict(), status_code=200 if startup.ready else 503)
@@ -1,53 +1,103 @@
+import asyncio
+import json
 import shutil
 import zipfile
 from pathlib import Path
-from fastapi import APIRouter, UploadFile, BackgroundTasks, HTTPException
+from fastapi import APIRouter, UploadFile, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from chat_rag.streaming import READ_SIZE, extract_export, find_export_member
 from web.services import manager
-from chat_rag.ingest import ingest_data
 
 router = APIRouter()
 
-def run_ingestion_task(input_dir: Path):
-    try:
-        manager.set_ingestion_status("running", 0.0, "Starting ingestion...")
-        # Note: ingest_data is currently synchronous and prints to stdout.
-        # In a real app, we'd want to capture progress callbacks.
-        # For now, we just mark it as running/done.
-        ingest_data(input_dir)
-        manager.set_ingestion_status("idle", 1.0, "Ingestion complete")
-    except Exception as e:
-        manager.set_ingestion_status("error", 0.0, str(e))
+# Seconds between SSE keep-alive comments while nothing changes
+KEEPALIVE_INTERVAL = 15.0
+
+UPLOAD_PATH = Path("source-data.zip")
+EXTRACT_DIR = Path("source-data")
+# Export files copied out of the archive; conversations are streamed from it
+METADATA_MEMBERS = ('user.json', 'shared_conversations.json')
 
 @router.post("/upload")
 async def upload_file(file: UploadFile):
     if not file.filename.endswith('.zip'):
         raise HTTPException(status_code=400, detail="Only .zip files are allowed")
     
-    upload_path = Path("source-data.zip")
-    with upload_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Write in chunks off the event loop, then swap the finished file into
+    # place so a running ingestion keeps reading the previous archive
+    partial_path = UPLOAD_PATH.with_name(UPLOAD_PATH.name + ".part")
+    buffer = await run_in_threadpool(partial_path.open, "wb")
+    try:
+        while chunk := await file.read(READ_SIZE):
+            await run_in_threadpool(buffer.write, chunk)
+    finally:
+        await run_in_threadpool(buffer.close)
+    await run_in_threadpool(partial_path.replace, UPLOAD_PATH)
         
     return {"message": "File uploaded successfully"}
 
+def prepare_export(zip_path: Path, extract_dir: Path) -> None:
+    """
+    Check the archive holds conversations and extract only its small metadata
+    files. Runs in a worker thread.
+    """
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            if not any(find_export_member(zf, name) for name in ('conversations.json', 'chat.html')):
+                raise HTTPException(status_code=400, detail="Archive contains no conversations.json or chat.html")
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="Uploaded file is not a valid zip archive")
+    
+    if extract_dir.exists():
+        shutil.rmtree(extract_dir)
+    extract_export(zip_path, extract_dir, METADATA_MEMBERS)
+
 @router.post("/ingest")
-async def trigger_ingest(background_tasks: BackgroundTasks):
-    if manager.ingestion_status == "running":
+async def trigger_ingest():
+    if manager.ingestion_status in ("preparing", "running"):
         raise HTTPException(status_code=400, detail="Ingestion already in progress")
-        
-    # Extract zip
-    zip_path = Path("source-data.zip")
-    extract_dir = Path("source-data")
     
-    if not zip_path.exists():
+    if not UPLOAD_PATH.exists():
          raise HTTPException(status_code=400, detail="No source data found. Please upload first.")
-
-    if extract_dir.exists():
-        shutil.rmtree(extract_dir)
-    extract_dir.mkdir()
     
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_dir)
-        
-    background_tasks.add_task(run_ingestion_task, extract_dir)
+    # Claim the ingestion before the first await so a concurrent request
+    # sees it as in progress; put the previous state back if preparing fails
+    previous = (manager.ingestion_status, manager.ingestion_progress, manager.ingestion_message)
+    manager.set_ingestion_status("preparing", 0.0, "Preparing export...")
+    try:
+        await run_in_threadpool(prepare_export, UPLOAD_PATH, EXTRACT_DIR)
+        # Runs in a separate worker process that streams conversations straight
+        # out of the archive; progress arrives via manager events
+        manager.start_ingestion(UPLOAD_PATH)
+    except BaseException:
+        manager.set_ingestion_status(*previous)
+        raise
     
     return {"message": "Ingestion started"}
+
+@router.get("/ingest/events")
+async def ingest_events(request: Request):
+    """
+    Server-Sent Events stream of ingestion progress snapshots.
+    """
+    queue = manager.subscribe()
+    
+    async def event_generator():
+        try:
+            yield f"data: {json.dumps(manager.ingestion_snapshot())}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    snapshot = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps(snapshot)}\n\n"
+        finally:
+            manager.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
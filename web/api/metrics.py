@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from chat_rag.cache import cache_stats
+from chat_rag.metrics import render_prometheus
+from web.services import manager
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Span timings plus cache, session and ingestion gauges and counters in the
+    Prometheus text exposition format.
+    """
+    gauges = []
+    counters = []
+    for cache, stats in cache_stats().items():
+        labels = {"cache": cache}
+        gauges.append(("chat_rag_cache_size", "Query cache entries.", labels, stats["size"]))
+        for key in ("hits", "misses"):
+            counters.append((f"chat_rag_cache_{key}_total", f"Query cache {key} since startup.", labels, stats[key]))
+    sessions = manager.sessions.stats()
+    gauges.append(("chat_rag_chat_sessions", "Open chat sessions.", {}, sessions["active"]))
+    counters.append(("chat_rag_chat_sessions_evicted_total", "Chat sessions evicted since startup.", {}, sessions["evicted"]))
+    gauges.append(("chat_rag_ingestion_progress", "Progress of the running ingestion (0-1).", {}, manager.ingestion_progress))
+    return PlainTextResponse(render_prometheus(gauges, counters), media_type="text/plain; version=0.0.4")
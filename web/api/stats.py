@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from web.services import manager
+from chat_rag.cache import cache_stats
 
 router = APIRouter()
 
@@ -9,5 +10,8 @@ async def get_stats():
         "ingestion_status": manager.ingestion_status,
         "ingestion_progress": manager.ingestion_progress,
         "ingestion_message": manager.ingestion_message,
-        "agent_initialized": manager.agent is not None
+        "ingestion_details": manager.ingestion_details,
+        "agent_initialized": len(manager.sessions) > 0,
+        "chat_sessions": manager.sessions.stats(),
+        "query_cache": cache_stats(),
     }
@@ -1,10 +1,41 @@
-from fastapi import FastAPI
+import time
+_import_start = time.perf_counter()
+
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
-from web.api import chat, stats, ingest
+from chat_rag.config import METRICS_ENABLED, TIMING_HEADERS, WARMUP_ON_STARTUP
+from chat_rag.metrics import collect_request_timings, server_timing_header
+from chat_rag.warmup import StartupTimings, awarm_up
+from web.api import chat, stats, ingest, health, metrics
+
+startup = StartupTimings()
+startup.add("imports", time.perf_counter() - _import_start)
+
+async def _warm_up_in_background():
+    # Blocking phases run in a thread so the server accepts requests (and
+    # answers readiness probes) while the model loads
+    await awarm_up(startup)
+    print(startup.summary())
 
-app = FastAPI(title="ChatGPT Data Extractor")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    task = None
+    if WARMUP_ON_STARTUP:
+        task = asyncio.create_task(_warm_up_in_background())
+    else:
+        startup.finished = True
+        print(startup.summary())
+    yield
+    if task is not None and not task.done():
+        task.cancel()
+
+app = FastAPI(title="ChatGPT Data Extractor", lifespan=lifespan)
+app.state.startup = startup
 
 # CORS
 app.add_middleware(
@@ -15,13 +46,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if METRICS_ENABLED and TIMING_HEADERS:
+    @app.middleware("http")
+    async def server_timing(request: Request, call_next):
+        # Streamed bodies (chat) finish after the headers are sent, so their
+        # header only covers work done before the first byte
+        with collect_request_timings() as timings:
+            response = await call_next(request)
+        if timings:
+            response.headers["Server-Timing"] = server_timing_header(timings)
+        return response
+
 # API Routers
 app.include_router(chat.router, prefix="/api")
 app.include_router(stats.router, prefix="/api")
 app.include_router(ingest.router, prefix="/api")
+app.include_router(health.router, prefix="/api")
+app.include_router(metrics.router, prefix="/api")
 
 # Mount static files (Frontend)
-# We will build the frontend to 'web/static' later
+# `npm run build` in frontend/ writes the bundle to 'web/static'; it is not
+# committed, so an out-of-date build is never served
 static_path = Path(__file__).parent / "static"
-if static_path.exists():
+if (static_path / "index.html").exists():
     app.mount("/", StaticFiles(directory=str(static_path), html=True), name="static")
+else:
+    @app.get("/", response_class=PlainTextResponse)
+    async def frontend_missing():
+        return PlainTextResponse(
+            "The web frontend has not been built. Run `npm install && npm run build` "
+            "in frontend/, then restart the server. The API is available under /api.",
+            status_code=503,
+        )
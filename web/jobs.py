@@ -0,0 +1,62 @@
+import multiprocessing
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+Event = Dict[str, Any]
+
+def _ingest_worker(input_dir: str, events) -> None:
+    """
+    Child process entry point: run ingestion and forward progress events.
+    """
+    # Imported here so the heavy ML stack only loads in the worker
+    from chat_rag.ingest import ingest_data
+    try:
+        ingest_data(Path(input_dir), progress_callback=events.put)
+        events.put({"status": "idle", "progress": 1.0, "message": "Ingestion complete"})
+    except Exception as e:
+        events.put({"status": "error", "progress": 0.0, "message": str(e)})
+
+class IngestionJob:
+    """
+    Runs `ingest_data` in a separate process so embedding never competes with
+    the server's event loop or threadpool. Progress events from the child are
+    pumped by a daemon thread into `on_event`.
+    """
+
+    def __init__(self, input_dir: Path, on_event: Callable[[Event], None]):
+        self.input_dir = input_dir
+        self.on_event = on_event
+        ctx = multiprocessing.get_context("spawn")
+        self._events = ctx.Queue()
+        self._process = ctx.Process(
+            target=_ingest_worker, args=(str(input_dir), self._events), daemon=True
+        )
+        self._pump: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._process.start()
+        self._pump = threading.Thread(target=self._pump_events, daemon=True)
+        self._pump.start()
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def _pump_events(self) -> None:
+        finished = False
+        while not finished:
+            try:
+                event = self._events.get(timeout=1.0)
+            except Exception:
+                # Nothing queued; stop if the worker died without reporting
+                if not self._process.is_alive():
+                    self.on_event({
+                        "status": "error",
+                        "progress": 0.0,
+                        "message": f"Ingestion worker exited with code {self._process.exitcode}",
+                    })
+                    break
+                continue
+            finished = event.get("status") in ("idle", "error")
+            self.on_event(event)
+        self._process.join(timeout=5)
@@ -1,16 +1,29 @@
 import asyncio
-from typing import Optional
-from llama_index.core.chat_engine.types import BaseChatEngine
-from chat_rag.query import setup_agent
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from chat_rag.cache import invalidate_search_cache
+from chat_rag.config import CHAT_MAX_SESSIONS, CHAT_SESSION_IDLE_TIMEOUT
+from chat_rag.query import create_memory, setup_agent
+from web.jobs import IngestionJob
+from web.sessions import AgentSessionPool, ChatSession
 
 class ServiceManager:
     _instance = None
     
     def __init__(self):
-        self.agent: Optional[BaseChatEngine] = None
+        # Per-session agents and memory; nothing is loaded until the first chat
+        self.sessions = AgentSessionPool(
+            setup_agent, create_memory, CHAT_MAX_SESSIONS, CHAT_SESSION_IDLE_TIMEOUT
+        )
         self.ingestion_status: str = "idle"
         self.ingestion_progress: float = 0.0
         self.ingestion_message: str = ""
+        # Latest structured progress event from the ingestion worker
+        self.ingestion_details: Dict[str, Any] = {}
+        self.ingestion_job: Optional[IngestionJob] = None
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._lock = threading.Lock()
         
     @classmethod
     def get_instance(cls):
@@ -18,15 +31,59 @@ class ServiceManager:
             cls._instance = cls()
         return cls._instance
         
-    def get_agent(self) -> BaseChatEngine:
-        if self.agent is None:
-            # Initialize agent lazily
-            self.agent = setup_agent()
-        return self.agent
+    def get_session(self, session_id: str) -> ChatSession:
+        return self.sessions.get(session_id)
         
     def set_ingestion_status(self, status: str, progress: float = 0.0, message: str = ""):
         self.ingestion_status = status
         self.ingestion_progress = progress
         self.ingestion_message = message
+        self._publish()
+    
+    def ingestion_snapshot(self) -> Dict[str, Any]:
+        return {
+            "ingestion_status": self.ingestion_status,
+            "ingestion_progress": self.ingestion_progress,
+            "ingestion_message": self.ingestion_message,
+            "ingestion_details": self.ingestion_details,
+        }
+    
+    def start_ingestion(self, input_dir: Path) -> None:
+        self.ingestion_details = {}
+        self.set_ingestion_status("running", 0.0, "Starting ingestion...")
+        self.ingestion_job = IngestionJob(input_dir, self.handle_ingestion_event)
+        self.ingestion_job.start()
+    
+    def handle_ingestion_event(self, event: Dict[str, Any]) -> None:
+        """
+        Called from the job's pump thread for every event the worker emits.
+        """
+        if "nodes_written" in event and event["nodes_written"] != self.ingestion_details.get("nodes_written"):
+            # The worker wrote new nodes; results cached in this process are stale
+            invalidate_search_cache()
+        if event.get("status") == "running":
+            self.ingestion_details = event
+        self.set_ingestion_status(event.get("status", "running"), event.get("progress", 0.0), event.get("message", ""))
+    
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Register an SSE listener on the running loop; it receives every snapshot.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers = [(l, q) for l, q in self._subscribers if q is not queue]
+    
+    def _publish(self) -> None:
+        snapshot = self.ingestion_snapshot()
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            # Events arrive on the pump thread; hand them to each listener's loop
+            loop.call_soon_threadsafe(queue.put_nowait, snapshot)
 
 manager = ServiceManager()
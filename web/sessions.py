@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+class ChatSession:
+    """
+    One browser chat: its own agent and memory. Turns within a session run
+    one at a time; different sessions stream concurrently.
+    """
+
+    def __init__(self, session_id: str, agent: Any, memory: Any):
+        self.session_id = session_id
+        self.agent = agent
+        self.memory = memory
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+class AgentSessionPool:
+    """
+    Sessions keyed by session id, evicted least-recently-used once more than
+    `max_sessions` are open and dropped after `idle_timeout` seconds unused.
+
+    `agent_factory` and `memory_factory` build the per-session parts; the LLM
+    client, tools, embedding model and vector store they use are process-wide
+    singletons, so opening a session is cheap.
+    """
+
+    def __init__(
+        self,
+        agent_factory: Callable[[], Any],
+        memory_factory: Callable[[], Any],
+        max_sessions: int,
+        idle_timeout: Optional[float] = None,
+    ):
+        self.agent_factory = agent_factory
+        self.memory_factory = memory_factory
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.created = 0
+        self.evicted = 0
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> ChatSession:
+        """
+        Return the session for `session_id`, creating it if needed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.last_used = now
+                return session
+        
+        # Built outside the lock; a concurrent first request may race, the
+        # first one stored wins
+        session = ChatSession(session_id, self.agent_factory(), self.memory_factory())
+        with self._lock:
+            existing = self._sessions.get(session_id)
+            if existing is not None:
+                return existing
+            self._sessions[session_id] = session
+            self.created += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+        return session
+
+    def _evict_idle(self, now: float) -> None:
+        if not self.idle_timeout:
+            return
+        # Ordered by last use, so the idle sessions are all at the front
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_used < self.idle_timeout:
+                break
+            self._sessions.popitem(last=False)
+            self.evicted += 1
+
+    def discard(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_timeout": self.idle_timeout,
+            "created": self.created,
+            "evicted": self.evicted,
+        }
@@ -1,9 +0,0 @@
-(function(){const j=document.createElement("link").relList;if(j&&j.supports&&j.supports("modulepreload"))return;for(const q of document.querySelectorAll('link[rel="modulepreload"]'))v(q);new MutationObserver(q=>{for(const x of q)if(x.type==="childList")for(const tl of x.addedNodes)tl.tagName==="LINK"&&tl.rel==="modulepreload"&&v(tl)}).observe(document,{childList:!0,subtree:!0});function B(q){const x={};return q.integrity&&(x.integrity=q.integrity),q.referrerPolicy&&(x.referrerPolicy=q.referrerPolicy),q.crossOrigin==="use-credentials"?x.credentials="include":q.crossOrigin==="anonymous"?x.credentials="omit":x.credentials="same-origin",x}function v(q){if(q.ep)return;q.ep=!0;const x=B(q);fetch(q.href,x)}})();var fi={exports:{}},ze={};var md;function $1(){if(md)return ze;md=1;var A=Symbol.for("react.transitional.element"),j=Symbol.for("react.fragment");function B(v,q,x){var tl=null;if(x!==void 0&&(tl=""+x),q.key!==void 0&&(tl=""+q.key),"key"in q){x={};for(var ml in q)ml!=="key"&&(x[ml]=q[ml])}else x=q;return q=x.ref,{$$typeof:A,type:v,key:tl,ref:q!==void 0?q:null,props:x}}return ze.Fragment=j,ze.jsx=B,ze.jsxs=B,ze}var hd;function k1(){return hd||(hd=1,fi.exports=$1()),fi.exports}var R=k1(),ci={exports:{}},G={};var gd;function F1(){if(gd)return G;gd=1;var A=Symbol.for("react.transitional.element"),j=Symbol.for("react.portal"),B=Symbol.for("react.fragment"),v=Symbol.for("react.strict_mode"),q=Symbol.for("react.profiler"),x=Symbol.for("react.consumer"),tl=Symbol.for("react.context"),ml=Symbol.for("react.forward_ref"),U=Symbol.for("react.suspense"),T=Symbol.for("react.memo"),V=Symbol.for("react.lazy"),H=Symbol.for("react.activity"),el=Symbol.iterator;function Bl(y){return y===null||typeof y!="object"?null:(y=el&&y[el]||y["@@iterator"],typeof y=="function"?y:null)}var Ol={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},pl=Object.assign,rt={};function Yl(y,E,p){this.props=y,this.context=E,this.refs=rt,this.updater=p||Ol}Yl.prototype.isReactComponent={},Yl.prototype.setState=function(y,E){if(typeof y!="object"&&typeof y!="function"&&y!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,y,E,"setState")},Yl.prototype.forceUpdate=function(y){this.updater.enqueueForceUpdate(this,y,"forceUpdate")};function At(){}At.prototype=Yl.prototype;function zl(y,E,p){this.props=y,this.context=E,this.refs=rt,this.updater=p||Ol}var ct=zl.prototype=new At;ct.constructor=zl,pl(ct,Yl.prototype),ct.isPureReactComponent=!0;var _t=Array.isArray;function Ql(){}var $={H:null,A:null,T:null,S:null},Zl=Object.prototype.hasOwnProperty;function pt(y,E,p){var O=p.ref;return{$$typeof:A,type:y,key:E,ref:O!==void 0?O:null,props:p}}function Za(y,E){return pt(y.type,E,y.props)}function Mt(y){return typeof y=="object"&&y!==null&&y.$$typeof===A}function Vl(y){var E={"=":"=0",":":"=2"};return"$"+y.replace(/[=:]/g,function(p){return E[p]})}var Ea=/\/+/g;function Rt(y,E){return typeof y=="object"&&y!==null&&y.key!=null?Vl(""+y.key):E.toString(36)}function bt(y){switch(y.status){case"fulfilled":return y.value;case"rejected":throw y.reason;default:switch(typeof y.status=="string"?y.then(Ql,Ql):(y.status="pending",y.then(function(E){y.status==="pending"&&(y.status="fulfilled",y.value=E)},function(E){y.status==="pending"&&(y.status="rejected",y.reason=E)})),y.status){case"fulfilled":return y.value;case"rejected":throw y.reason}}throw y}function r(y,E,p,O,X){var L=typeof y;(L==="undefined"||L==="boolean")&&(y=null);var ll=!1;if(y===null)ll=!0;else switch(L){case"bigint":case"string":case"number":ll=!0;break;case"object":switch(y.$$typeof){case A:case j:ll=!0;break;case V:return ll=y._init,r(ll(y._payload),E,p,O,X)}}if(ll)return X=X(y),ll=O===""?"."+Rt(y,0):O,_t(X)?(p="",ll!=null&&(p=ll.replace(Ea,"$&/")+"/"),r(X,E,p,"",function(Ou){return Ou})):X!=null&&(Mt(X)&&(X=Za(X,p+(X.key==null||y&&y.key===X.key?"":(""+X.key).replace(Ea,"$&/")+"/")+ll)),E.push(X)),1;ll=0;var xl=O===""?".":O+":";if(_t(y))for(var Sl=0;Sl<y.length;Sl++)O=y[Sl],L=xl+Rt(O,Sl),ll+=r(O,E,p,L,X);else if(Sl=Bl(y),typeof Sl=="function")for(y=Sl.call(y),Sl=0;!(O=y.next()).done;)O=O.value,L=xl+Rt(O,Sl++),ll+=r(O,E,p,L,X);else if(L==="object"){if(typeof y.then=="function")return r(bt(y),E,p,O,X);throw E=String(y),Error("Objects are not valid as a React child (found: "+(E==="[object Object]"?"object with keys {"+Object.keys(y).join(", ")+"}":E)+"). If you meant to render a collection of children, use an array instead.")}return ll}function _(y,E,p){if(y==null)return y;var O=[],X=0;return r(y,O,"","",function(L){return E.call(p,L,X++)}),O}function Y(y){if(y._status===-1){var E=y._result;E=E(),E.then(function(p){(y._status===0||y._status===-1)&&(y._status=1,y._result=p)},function(p){(y._status===0||y._status===-1)&&(y._status=2,y._result=p)}),y._status===-1&&(y._status=0,y._result=E)}if(y._status===1)return y._result.default;throw y._result}var nl=typeof reportError=="function"?reportError:function(y){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var E=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof y=="object"&&y!==null&&typeof y.message=="string"?String(y.message):String(y),error:y});if(!window.dispatchEvent(E))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",y);return}console.error(y)},sl={map:_,forEach:function(y,E,p){_(y,function(){E.apply(this,arguments)},p)},count:function(y){var E=0;return _(y,function(){E++}),E},toArray:function(y){return _(y,function(E){return E})||[]},only:function(y){if(!Mt(y))throw Error("React.Children.only expected to receive a single React element child.");return y}};return G.Activity=H,G.Children=sl,G.Component=Yl,G.Fragment=B,G.Profiler=q,G.PureComponent=zl,G.StrictMode=v,G.Suspense=U,G.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=$,G.__COMPILER_RUNTIME={__proto__:null,c:function(y){return $.H.useMemoCache(y)}},G.cache=function(y){return function(){return y.apply(null,arguments)}},G.cacheSignal=function(){return null},G.cloneElement=function(y,E,p){if(y==null)throw Error("The argument must be a React element, but you passed "+y+".");var O=pl({},y.props),X=y.key;if(E!=null)for(L in E.key!==void 0&&(X=""+E.key),E)!Zl.call(E,L)||L==="key"||L==="__self"||L==="__source"||L==="ref"&&E.ref===void 0||(O[L]=E[L]);var L=arguments.length-2;if(L===1)O.children=p;else if(1<L){for(var ll=Array(L),xl=0;xl<L;xl++)ll[xl]=arguments[xl+2];O.children=ll}return pt(y.type,X,O)},G.createContext=function(y){return y={$$typeof:tl,_currentValue:y,_currentValue2:y,_threadCount:0,Provider:null,Consumer:null},y.Provider=y,y.Consumer={$$typeof:x,_context:y},y},G.createElement=function(y,E,p){var O,X={},L=null;if(E!=null)for(O in E.key!==void 0&&(L=""+E.key),E)Zl.call(E,O)&&O!=="key"&&O!=="__self"&&O!=="__source"&&(X[O]=E[O]);var ll=arguments.length-2;if(ll===1)X.children=p;else if(1<ll){for(var xl=Array(ll),Sl=0;Sl<ll;Sl++)xl[Sl]=arguments[Sl+2];X.children=xl}if(y&&y.defaultProps)for(O in ll=y.defaultProps,ll)X[O]===void 0&&(X[O]=ll[O]);return pt(y,L,X)},G.createRef=function(){return{current:null}},G.forwardRef=function(y){return{$$typeof:ml,render:y}},G.isValidElement=Mt,G.lazy=function(y){return{$$typeof:V,_payload:{_status:-1,_result:y},_init:Y}},G.memo=function(y,E){return{$$typeof:T,type:y,compare:E===void 0?null:E}},G.startTransition=function(y){var E=$.T,p={};$.T=p;try{var O=y(),X=$.S;X!==null&&X(p,O),typeof O=="object"&&O!==null&&typeof O.then=="function"&&O.then(Ql,nl)}catch(L){nl(L)}finally{E!==null&&p.types!==null&&(E.types=p.types),$.T=E}},G.unstable_useCacheRefresh=function(){return $.H.useCacheRefresh()},G.use=function(y){return $.H.use(y)},G.useActionState=function(y,E,p){return $.H.useActionState(y,E,p)},G.useCallback=function(y,E){return $.H.useCallback(y,E)},G.useContext=function(y){return $.H.useContext(y)},G.useDebugValue=function(){},G.useDeferredValue=function(y,E){return $.H.useDeferredValue(y,E)},G.useEffect=function(y,E){return $.H.useEffect(y,E)},G.useEffectEvent=function(y){return $.H.useEffectEvent(y)},G.useId=function(){return $.H.useId()},G.useImperativeHandle=function(y,E,p){return $.H.useImperativeHandle(y,E,p)},G.useInsertionEffect=function(y,E){return $.H.useInsertionEffect(y,E)},G.useLayoutEffect=function(y,E){return $.H.useLayoutEffect(y,E)},G.useMemo=function(y,E){return $.H.useMemo(y,E)},G.useOptimistic=function(y,E){return $.H.useOptimistic(y,E)},G.useReducer=function(y,E,p){return $.H.useReducer(y,E,p)},G.useRef=function(y){return $.H.useRef(y)},G.useState=function(y){return $.H.useState(y)},G.useSyncExternalStore=function(y,E,p){return $.H.useSyncExternalStore(y,E,p)},G.useTransition=function(){return $.H.useTransition()},G.version="19.2.0",G}var Sd;function vi(){return Sd||(Sd=1,ci.exports=F1()),ci.exports}var Xl=vi(),ii={exports:{}},Te={},si={exports:{}},yi={};var rd;function I1(){return rd||(rd=1,(function(A){function j(r,_){var Y=r.length;r.push(_);l:for(;0<Y;){var nl=Y-1>>>1,sl=r[nl];if(0<q(sl,_))r[nl]=_,r[Y]=sl,Y=nl;else break l}}function B(r){return r.length===0?null:r[0]}function v(r){if(r.length===0)return null;var _=r[0],Y=r.pop();if(Y!==_){r[0]=Y;l:for(var nl=0,sl=r.length,y=sl>>>1;nl<y;){var E=2*(nl+1)-1,p=r[E],O=E+1,X=r[O];if(0>q(p,Y))O<sl&&0>q(X,p)?(r[nl]=X,r[O]=Y,nl=O):(r[nl]=p,r[E]=Y,nl=E);else if(O<sl&&0>q(X,Y))r[nl]=X,r[O]=Y,nl=O;else break l}}return _}function q(r,_){var Y=r.sortIndex-_.sortIndex;return Y!==0?Y:r.id-_.id}if(A.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var x=performance;A.unstable_now=function(){return x.now()}}else{var tl=Date,ml=tl.now();A.unstable_now=function(){return tl.now()-ml}}var U=[],T=[],V=1,H=null,el=3,Bl=!1,Ol=!1,pl=!1,rt=!1,Yl=typeof setTimeout=="function"?setTimeout:null,At=typeof clearTimeout=="function"?clearTimeout:null,zl=typeof setImmediate<"u"?setImmediate:null;function ct(r){for(var _=B(T);_!==null;){if(_.callback===null)v(T);else if(_.startTime<=r)v(T),_.sortIndex=_.expirationTime,j(U,_);else break;_=B(T)}}function _t(r){if(pl=!1,ct(r),!Ol)if(B(U)!==null)Ol=!0,Ql||(Ql=!0,Vl());else{var _=B(T);_!==null&&bt(_t,_.startTime-r)}}var Ql=!1,$=-1,Zl=5,pt=-1;function Za(){return rt?!0:!(A.unstable_now()-pt<Zl)}function Mt(){if(rt=!1,Ql){var r=A.unstable_now();pt=r;var _=!0;try{l:{Ol=!1,pl&&(pl=!1,At($),$=-1),Bl=!0;var Y=el;try{t:{for(ct(r),H=B(U);H!==null&&!(H.expirationTime>r&&Za());){var nl=H.callback;if(typeof nl=="function"){H.callback=null,el=H.priorityLevel;var sl=nl(H.expirationTime<=r);if(r=A.unstable_now(),typeof sl=="function"){H.callback=sl,ct(r),_=!0;break t}H===B(U)&&v(U),ct(r)}else v(U);H=B(U)}if(H!==null)_=!0;else{var y=B(T);y!==null&&bt(_t,y.startTime-r),_=!1}}break l}finally{H=null,el=Y,Bl=!1}_=void 0}}finally{_?Vl():Ql=!1}}}var Vl;if(typeof zl=="function")Vl=function(){zl(Mt)};else if(typeof MessageChannel<"u"){var Ea=new MessageChannel,Rt=Ea.port2;Ea.port1.onmessage=Mt,Vl=function(){Rt.postMessage(null)}}else Vl=function(){Yl(Mt,0)};function bt(r,_){$=Yl(function(){r(A.unstable_now())},_)}A.unstable_IdlePriority=5,A.unstable_ImmediatePriority=1,A.unstable_LowPriority=4,A.unstable_NormalPriority=3,A.unstable_Profiling=null,A.unstable_UserBlockingPriority=2,A.unstable_cancelCallback=function(r){r.callback=null},A.unstable_forceFrameRate=function(r){0>r||125<r?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Zl=0<r?Math.floor(1e3/r):5},A.unstable_getCurrentPriorityLevel=function(){return el},A.unstable_next=function(r){switch(el){case 1:case 2:case 3:var _=3;break;default:_=el}var Y=el;el=_;try{return r()}finally{el=Y}},A.unstable_requestPaint=function(){rt=!0},A.unstable_runWithPriority=function(r,_){switch(r){case 1:case 2:case 3:case 4:case 5:break;default:r=3}var Y=el;el=r;try{return _()}finally{el=Y}},A.unstable_scheduleCallback=function(r,_,Y){var nl=A.unstable_now();switch(typeof Y=="object"&&Y!==null?(Y=Y.delay,Y=typeof Y=="number"&&0<Y?nl+Y:nl):Y=nl,r){case 1:var sl=-1;break;case 2:sl=250;break;case 5:sl=1073741823;break;case 4:sl=1e4;break;default:sl=5e3}return sl=Y+sl,r={id:V++,callback:_,priorityLevel:r,startTime:Y,expirationTime:sl,sortIndex:-1},Y>nl?(r.sortIndex=Y,j(T,r),B(U)===null&&r===B(T)&&(pl?(At($),$=-1):pl=!0,bt(_t,Y-nl))):(r.sortIndex=sl,j(U,r),Ol||Bl||(Ol=!0,Ql||(Ql=!0,Vl()))),r},A.unstable_shouldYield=Za,A.unstable_wrapCallback=function(r){var _=el;return function(){var Y=el;el=_;try{return r.apply(this,arguments)}finally{el=Y}}}})(yi)),yi}var bd;function P1(){return bd||(bd=1,si.exports=I1()),si.exports}var di={exports:{}},jl={};var zd;function lo(){if(zd)return jl;zd=1;var A=vi();function j(U){var T="https://react.dev/errors/"+U;if(1<arguments.length){T+="?args[]="+encodeURIComponent(arguments[1]);for(var V=2;V<arguments.length;V++)T+="&args[]="+encodeURIComponent(arguments[V])}return"Minified React error #"+U+"; visit "+T+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function B(){}var v={d:{f:B,r:function(){throw Error(j(522))},D:B,C:B,L:B,m:B,X:B,S:B,M:B},p:0,findDOMNode:null},q=Symbol.for("react.portal");function x(U,T,V){var H=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:q,key:H==null?null:""+H,children:U,containerInfo:T,implementation:V}}var tl=A.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function ml(U,T){if(U==="font")return"";if(typeof T=="string")return T==="use-credentials"?T:""}return jl.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=v,jl.createPortal=function(U,T){var V=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!T||T.nodeType!==1&&T.nodeType!==9&&T.nodeType!==11)throw Error(j(299));return x(U,T,null,V)},jl.flushSync=function(U){var T=tl.T,V=v.p;try{if(tl.T=null,v.p=2,U)return U()}finally{tl.T=T,v.p=V,v.d.f()}},jl.preconnect=function(U,T){typeof U=="string"&&(T?(T=T.crossOrigin,T=typeof T=="string"?T==="use-credentials"?T:"":void 0):T=null,v.d.C(U,T))},jl.prefetchDNS=function(U){typeof U=="string"&&v.d.D(U)},jl.preinit=function(U,T){if(typeof U=="string"&&T&&typeof T.as=="string"){var V=T.as,H=ml(V,T.crossOrigin),el=typeof T.integrity=="string"?T.integrity:void 0,Bl=typeof T.fetchPriority=="string"?T.fetchPriority:void 0;V==="style"?v.d.S(U,typeof T.precedence=="string"?T.precedence:void 0,{crossOrigin:H,integrity:el,fetchPriority:Bl}):V==="script"&&v.d.X(U,{crossOrigin:H,integrity:el,fetchPriority:Bl,nonce:typeof T.nonce=="string"?T.nonce:void 0})}},jl.preinitModule=function(U,T){if(typeof U=="string")if(typeof T=="object"&&T!==null){if(T.as==null||T.as==="script"){var V=ml(T.as,T.crossOrigin);v.d.M(U,{crossOrigin:V,integrity:typeof T.integrity=="string"?T.integrity:void 0,nonce:typeof T.nonce=="string"?T.nonce:void 0})}}else T==null&&v.d.M(U)},jl.preload=function(U,T){if(typeof U=="string"&&typeof T=="object"&&T!==null&&typeof T.as=="string"){var V=T.as,H=ml(V,T.crossOrigin);v.d.L(U,V,{crossOrigin:H,integrity:typeof T.integrity=="string"?T.integrity:void 0,nonce:typeof T.nonce=="string"?T.nonce:void 0,type:typeof T.type=="string"?T.type:void 0,fetchPriority:typeof T.fetchPriority=="string"?T.fetchPriority:void 0,referrerPolicy:typeof T.referrerPolicy=="string"?T.referrerPolicy:void 0,imageSrcSet:typeof T.imageSrcSet=="string"?T.imageSrcSet:void 0,imageSizes:typeof T.imageSizes=="string"?T.imageSizes:void 0,media:typeof T.media=="string"?T.media:void 0})}},jl.preloadModule=function(U,T){if(typeof U=="string")if(T){var V=ml(T.as,T.crossOrigin);v.d.m(U,{as:typeof T.as=="string"&&T.as!=="script"?T.as:void 0,crossOrigin:V,integrity:typeof T.integrity=="string"?T.integrity:void 0})}else v.d.m(U)},jl.requestFormReset=function(U){v.d.r(U)},jl.unstable_batchedUpdates=function(U,T){return U(T)},jl.useFormState=function(U,T,V){return tl.H.useFormState(U,T,V)},jl.useFormStatus=function(){return tl.H.useHostTransitionStatus()},jl.version="19.2.0",jl}var Td;function to(){if(Td)return di.exports;Td=1;function A(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(A)}catch(j){console.error(j)}}return A(),di.exports=lo(),di.exports}var Ed;function ao(){if(Ed)return Te;Ed=1;var A=P1(),j=vi(),B=to();function v(l){var t="https://react.dev/errors/"+l;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+l+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function q(l){return!(!l||l.nodeType!==1&&l.nodeType!==9&&l.nodeType!==11)}function x(l){var t=l,a=l;if(l.alternate)for(;t.return;)t=t.return;else{l=t;do t=l,(t.flags&4098)!==0&&(a=t.return),l=t.return;while(l)}return t.tag===3?a:null}function tl(l){if(l.tag===13){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function ml(l){if(l.tag===31){var t=l.memoizedState;if(t===null&&(l=l.alternate,l!==null&&(t=l.memoizedState)),t!==null)return t.dehydrated}return null}function U(l){if(x(l)!==l)throw Error(v(188))}function T(l){var t=l.alternate;if(!t){if(t=x(l),t===null)throw Error(v(188));return t!==l?null:l}for(var a=l,u=t;;){var e=a.return;if(e===null)break;var n=e.alternate;if(n===null){if(u=e.return,u!==null){a=u;continue}break}if(e.child===n.child){for(n=e.child;n;){if(n===a)return U(e),l;if(n===u)return U(e),t;n=n.sibling}throw Error(v(188))}if(a.return!==u.return)a=e,u=n;else{for(var f=!1,c=e.child;c;){if(c===a){f=!0,a=e,u=n;break}if(c===u){f=!0,u=e,a=n;break}c=c.sibling}if(!f){for(c=n.child;c;){if(c===a){f=!0,a=n,u=e;break}if(c===u){f=!0,u=n,a=e;break}c=c.sibling}if(!f)throw Error(v(189))}}if(a.alternate!==u)throw Error(v(190))}if(a.tag!==3)throw Error(v(188));return a.stateNode.current===a?l:t}function V(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l;for(l=l.child;l!==null;){if(t=V(l),t!==null)return t;l=l.sibling}return null}var H=Object.assign,el=Symbol.for("react.element"),Bl=Symbol.for("react.transitional.element"),Ol=Symbol.for("react.portal"),pl=Symbol.for("react.fragment"),rt=Symbol.for("react.strict_mode"),Yl=Symbol.for("react.profiler"),At=Symbol.for("react.consumer"),zl=Symbol.for("react.context"),ct=Symbol.for("react.forward_ref"),_t=Symbol.for("react.suspense"),Ql=Symbol.for("react.suspense_list"),$=Symbol.for("react.memo"),Zl=Symbol.for("react.lazy"),pt=Symbol.for("react.activity"),Za=Symbol.for("react.memo_cache_sentinel"),Mt=Symbol.iterator;function Vl(l){return l===null||typeof l!="object"?null:(l=Mt&&l[Mt]||l["@@iterator"],typeof l=="function"?l:null)}var Ea=Symbol.for("react.client.reference");function Rt(l){if(l==null)return null;if(typeof l=="function")return l.$$typeof===Ea?null:l.displayName||l.name||null;if(typeof l=="string")return l;switch(l){case pl:return"Fragment";case Yl:return"Profiler";case rt:return"StrictMode";case _t:return"Suspense";case Ql:return"SuspenseList";case pt:return"Activity"}if(typeof l=="object")switch(l.$$typeof){case Ol:return"Portal";case zl:return l.displayName||"Context";case At:return(l._context.displayName||"Context")+".Consumer";case ct:var t=l.render;return l=l.displayName,l||(l=t.displayName||t.name||"",l=l!==""?"ForwardRef("+l+")":"ForwardRef"),l;case $:return t=l.displayName||null,t!==null?t:Rt(l.type)||"Memo";case Zl:t=l._payload,l=l._init;try{return Rt(l(t))}catch{}}return null}var bt=Array.isArray,r=j.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,_=B.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,Y={pending:!1,data:null,method:null,action:null},nl=[],sl=-1;function y(l){return{current:l}}function E(l){0>sl||(l.current=nl[sl],nl[sl]=null,sl--)}function p(l,t){sl++,nl[sl]=l.current,l.current=t}var O=y(null),X=y(null),L=y(null),ll=y(null);function xl(l,t){switch(p(L,t),p(X,l),p(O,null),t.nodeType){case 9:case 11:l=(l=t.documentElement)&&(l=l.namespaceURI)?Yy(l):0;break;default:if(l=t.tagName,t=t.namespaceURI)t=Yy(t),l=xy(t,l);else switch(l){case"svg":l=1;break;case"math":l=2;break;default:l=0}}E(O),p(O,l)}function Sl(){E(O),E(X),E(L)}function Ou(l){l.memoizedState!==null&&p(ll,l);var t=O.current,a=xy(t,l.type);t!==a&&(p(X,l),p(O,a))}function Ee(l){X.current===l&&(E(O),E(X)),ll.current===l&&(E(ll),ge._currentValue=Y)}var Qn,oi;function Aa(l){if(Qn===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);Qn=t&&t[1]||"",oi=-1<a.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Qn+l+oi}var Zn=!1;function Vn(l,t){if(!l||Zn)return"";Zn=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var u={DetermineComponentFrameRoot:function(){try{if(t){var z=function(){throw Error()};if(Object.defineProperty(z.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(z,[])}catch(g){var h=g}Reflect.construct(l,[],z)}else{try{z.call()}catch(g){h=g}l.call(z.prototype)}}else{try{throw Error()}catch(g){h=g}(z=l())&&typeof z.catch=="function"&&z.catch(function(){})}}catch(g){if(g&&h&&typeof g.stack=="string")return[g.stack,h.stack]}return[null,null]}};u.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var e=Object.getOwnPropertyDescriptor(u.DetermineComponentFrameRoot,"name");e&&e.configurable&&Object.defineProperty(u.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var n=u.DetermineComponentFrameRoot(),f=n[0],c=n[1];if(f&&c){var i=f.split(`
-`),m=c.split(`
-`);for(e=u=0;u<i.length&&!i[u].includes("DetermineComponentFrameRoot");)u++;for(;e<m.length&&!m[e].includes("DetermineComponentFrameRoot");)e++;if(u===i.length||e===m.length)for(u=i.length-1,e=m.length-1;1<=u&&0<=e&&i[u]!==m[e];)e--;for(;1<=u&&0<=e;u--,e--)if(i[u]!==m[e]){if(u!==1||e!==1)do if(u--,e--,0>e||i[u]!==m[e]){var S=`
-`+i[u].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=u&&0<=e);break}}}finally{Zn=!1,Error.prepareStackTrace=a}return(a=l?l.displayName||l.name:"")?Aa(a):""}function Md(l,t){switch(l.tag){case 26:case 27:case 5:return Aa(l.type);case 16:return Aa("Lazy");case 13:return l.child!==t&&t!==null?Aa("Suspense Fallback"):Aa("Suspense");case 19:return Aa("SuspenseList");case 0:case 15:return Vn(l.type,!1);case 11:return Vn(l.type.render,!1);case 1:return Vn(l.type,!0);case 31:return Aa("Activity");default:return""}}function mi(l){try{var t="",a=null;do t+=Md(l,a),a=l,l=l.return;while(l);return t}catch(u){return`
-Error generating stack: `+u.message+`
-`+u.stack}}var Ln=Object.prototype.hasOwnProperty,Kn=A.unstable_scheduleCallback,Jn=A.unstable_cancelCallback,Od=A.unstable_shouldYield,Dd=A.unstable_requestPaint,Fl=A.unstable_now,Ud=A.unstable_getCurrentPriorityLevel,hi=A.unstable_ImmediatePriority,gi=A.unstable_UserBlockingPriority,Ae=A.unstable_NormalPriority,Hd=A.unstable_LowPriority,Si=A.unstable_IdlePriority,Nd=A.log,Rd=A.unstable_setDisableYieldValue,Du=null,Il=null;function Ft(l){if(typeof Nd=="function"&&Rd(l),Il&&typeof Il.setStrictMode=="function")try{Il.setStrictMode(Du,l)}catch{}}var Pl=Math.clz32?Math.clz32:jd,Cd=Math.log,qd=Math.LN2;function jd(l){return l>>>=0,l===0?32:31-(Cd(l)/qd|0)|0}var _e=256,pe=262144,Me=4194304;function _a(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function Oe(l,t,a){var u=l.pendingLanes;if(u===0)return 0;var e=0,n=l.suspendedLanes,f=l.pingedLanes;l=l.warmLanes;var c=u&134217727;return c!==0?(u=c&~n,u!==0?e=_a(u):(f&=c,f!==0?e=_a(f):a||(a=c&~l,a!==0&&(e=_a(a))))):(c=u&~n,c!==0?e=_a(c):f!==0?e=_a(f):a||(a=u&~l,a!==0&&(e=_a(a)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,a=t&-t,n>=a||n===32&&(a&4194048)!==0)?t:e}function Uu(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Bd(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function ri(){var l=Me;return Me<<=1,(Me&62914560)===0&&(Me=4194304),l}function wn(l){for(var t=[],a=0;31>a;a++)t.push(l);return t}function Hu(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Yd(l,t,a,u,e,n){var f=l.pendingLanes;l.pendingLanes=a,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=a,l.entangledLanes&=a,l.errorRecoveryDisabledLanes&=a,l.shellSuspendCounter=0;var c=l.entanglements,i=l.expirationTimes,m=l.hiddenUpdates;for(a=f&~a;0<a;){var S=31-Pl(a),z=1<<S;c[S]=0,i[S]=-1;var h=m[S];if(h!==null)for(m[S]=null,S=0;S<h.length;S++){var g=h[S];g!==null&&(g.lane&=-536870913)}a&=~z}u!==0&&bi(l,u,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(f&~t))}function bi(l,t,a){l.pendingLanes|=t,l.suspendedLanes&=~t;var u=31-Pl(t);l.entangledLanes|=t,l.entanglements[u]=l.entanglements[u]|1073741824|a&261930}function zi(l,t){var a=l.entangledLanes|=t;for(l=l.entanglements;a;){var u=31-Pl(a),e=1<<u;e&t|l[u]&t&&(l[u]|=t),a&=~e}}function Ti(l,t){var a=t&-t;return a=(a&42)!==0?1:Wn(a),(a&(l.suspendedLanes|t))!==0?0:a}function Wn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function $n(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Ei(){var l=_.p;return l!==0?l:(l=window.event,l===void 0?32:cd(l.type))}function Ai(l,t){var a=_.p;try{return _.p=l,t()}finally{_.p=a}}var It=Math.random().toString(36).slice(2),Hl="__reactFiber$"+It,Ll="__reactProps$"+It,Va="__reactContainer$"+It,kn="__reactEvents$"+It,xd="__reactListeners$"+It,Gd="__reactHandles$"+It,_i="__reactResources$"+It,Nu="__reactMarker$"+It;function Fn(l){delete l[Hl],delete l[Ll],delete l[kn],delete l[xd],delete l[Gd]}function La(l){var t=l[Hl];if(t)return t;for(var a=l.parentNode;a;){if(t=a[Va]||a[Hl]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(l=Ky(l);l!==null;){if(a=l[Hl])return a;l=Ky(l)}return t}l=a,a=l.parentNode}return null}function Ka(l){if(l=l[Hl]||l[Va]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Ru(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(v(33))}function Ja(l){var t=l[_i];return t||(t=l[_i]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Dl(l){l[Nu]=!0}var pi=new Set,Mi={};function pa(l,t){wa(l,t),wa(l+"Capture",t)}function wa(l,t){for(Mi[l]=t,l=0;l<t.length;l++)pi.add(t[l])}var Xd=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Oi={},Di={};function Qd(l){return Ln.call(Di,l)?!0:Ln.call(Oi,l)?!1:Xd.test(l)?Di[l]=!0:(Oi[l]=!0,!1)}function De(l,t,a){if(Qd(t))if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var u=t.toLowerCase().slice(0,5);if(u!=="data-"&&u!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+a)}}function Ue(l,t,a){if(a===null)l.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+a)}}function Ct(l,t,a,u){if(u===null)l.removeAttribute(a);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(a);return}l.setAttributeNS(t,a,""+u)}}function it(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Ui(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Zd(l,t,a){var u=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof u<"u"&&typeof u.get=="function"&&typeof u.set=="function"){var e=u.get,n=u.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(f){a=""+f,n.call(this,f)}}),Object.defineProperty(l,t,{enumerable:u.enumerable}),{getValue:function(){return a},setValue:function(f){a=""+f},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function In(l){if(!l._valueTracker){var t=Ui(l)?"checked":"value";l._valueTracker=Zd(l,t,""+l[t])}}function Hi(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var a=t.getValue(),u="";return l&&(u=Ui(l)?l.checked?"true":"false":l.value),l=u,l!==a?(t.setValue(l),!0):!1}function He(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var Vd=/[\n"\\]/g;function st(l){return l.replace(Vd,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function Pn(l,t,a,u,e,n,f,c){l.name="",f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.type=f:l.removeAttribute("type"),t!=null?f==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+it(t)):l.value!==""+it(t)&&(l.value=""+it(t)):f!=="submit"&&f!=="reset"||l.removeAttribute("value"),t!=null?lf(l,f,it(t)):a!=null?lf(l,f,it(a)):u!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+it(c):l.removeAttribute("name")}function Ni(l,t,a,u,e,n,f,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||a!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){In(l);return}a=a!=null?""+it(a):"",t=t!=null?""+it(t):a,c||t===l.value||(l.value=t),l.defaultValue=t}u=u??e,u=typeof u!="function"&&typeof u!="symbol"&&!!u,l.checked=c?l.checked:!!u,l.defaultChecked=!!u,f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"&&(l.name=f),In(l)}function lf(l,t,a){t==="number"&&He(l.ownerDocument)===l||l.defaultValue===""+a||(l.defaultValue=""+a)}function Wa(l,t,a,u){if(l=l.options,t){t={};for(var e=0;e<a.length;e++)t["$"+a[e]]=!0;for(a=0;a<l.length;a++)e=t.hasOwnProperty("$"+l[a].value),l[a].selected!==e&&(l[a].selected=e),e&&u&&(l[a].defaultSelected=!0)}else{for(a=""+it(a),t=null,e=0;e<l.length;e++){if(l[e].value===a){l[e].selected=!0,u&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Ri(l,t,a){if(t!=null&&(t=""+it(t),t!==l.value&&(l.value=t),a==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=a!=null?""+it(a):""}function Ci(l,t,a,u){if(t==null){if(u!=null){if(a!=null)throw Error(v(92));if(bt(u)){if(1<u.length)throw Error(v(93));u=u[0]}a=u}a==null&&(a=""),t=a}a=it(t),l.defaultValue=a,u=l.textContent,u===a&&u!==""&&u!==null&&(l.value=u),In(l)}function $a(l,t){if(t){var a=l.firstChild;if(a&&a===l.lastChild&&a.nodeType===3){a.nodeValue=t;return}}l.textContent=t}var Ld=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function qi(l,t,a){var u=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?u?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":u?l.setProperty(t,a):typeof a!="number"||a===0||Ld.has(t)?t==="float"?l.cssFloat=a:l[t]=(""+a).trim():l[t]=a+"px"}function ji(l,t,a){if(t!=null&&typeof t!="object")throw Error(v(62));if(l=l.style,a!=null){for(var u in a)!a.hasOwnProperty(u)||t!=null&&t.hasOwnProperty(u)||(u.indexOf("--")===0?l.setProperty(u,""):u==="float"?l.cssFloat="":l[u]="");for(var e in t)u=t[e],t.hasOwnProperty(e)&&a[e]!==u&&qi(l,e,u)}else for(var n in t)t.hasOwnProperty(n)&&qi(l,n,t[n])}function tf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Kd=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Jd=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Ne(l){return Jd.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function qt(){}var af=null;function uf(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var ka=null,Fa=null;function Bi(l){var t=Ka(l);if(t&&(l=t.stateNode)){var a=l[Ll]||null;l:switch(l=t.stateNode,t.type){case"input":if(Pn(l,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=l;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+st(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var u=a[t];if(u!==l&&u.form===l.form){var e=u[Ll]||null;if(!e)throw Error(v(90));Pn(u,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<a.length;t++)u=a[t],u.form===l.form&&Hi(u)}break l;case"textarea":Ri(l,a.value,a.defaultValue);break l;case"select":t=a.value,t!=null&&Wa(l,!!a.multiple,t,!1)}}}var ef=!1;function Yi(l,t,a){if(ef)return l(t,a);ef=!0;try{var u=l(t);return u}finally{if(ef=!1,(ka!==null||Fa!==null)&&(bn(),ka&&(t=ka,l=Fa,Fa=ka=null,Bi(t),l)))for(t=0;t<l.length;t++)Bi(l[t])}}function Cu(l,t){var a=l.stateNode;if(a===null)return null;var u=a[Ll]||null;if(u===null)return null;a=u[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(u=!u.disabled)||(l=l.type,u=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!u;break l;default:l=!1}if(l)return null;if(a&&typeof a!="function")throw Error(v(231,t,typeof a));return a}var jt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),nf=!1;if(jt)try{var qu={};Object.defineProperty(qu,"passive",{get:function(){nf=!0}}),window.addEventListener("test",qu,qu),window.removeEventListener("test",qu,qu)}catch{nf=!1}var Pt=null,ff=null,Re=null;function xi(){if(Re)return Re;var l,t=ff,a=t.length,u,e="value"in Pt?Pt.value:Pt.textContent,n=e.length;for(l=0;l<a&&t[l]===e[l];l++);var f=a-l;for(u=1;u<=f&&t[a-u]===e[n-u];u++);return Re=e.slice(l,1<u?1-u:void 0)}function Ce(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function qe(){return!0}function Gi(){return!1}function Kl(l){function t(a,u,e,n,f){this._reactName=a,this._targetInst=e,this.type=u,this.nativeEvent=n,this.target=f,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(a=l[c],this[c]=a?a(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?qe:Gi,this.isPropagationStopped=Gi,this}return H(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=qe)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=qe)},persist:function(){},isPersistent:qe}),t}var Ma={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},je=Kl(Ma),ju=H({},Ma,{view:0,detail:0}),wd=Kl(ju),cf,sf,Bu,Be=H({},ju,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:df,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==Bu&&(Bu&&l.type==="mousemove"?(cf=l.screenX-Bu.screenX,sf=l.screenY-Bu.screenY):sf=cf=0,Bu=l),cf)},movementY:function(l){return"movementY"in l?l.movementY:sf}}),Xi=Kl(Be),Wd=H({},Be,{dataTransfer:0}),$d=Kl(Wd),kd=H({},ju,{relatedTarget:0}),yf=Kl(kd),Fd=H({},Ma,{animationName:0,elapsedTime:0,pseudoElement:0}),Id=Kl(Fd),Pd=H({},Ma,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),lv=Kl(Pd),tv=H({},Ma,{data:0}),Qi=Kl(tv),av={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},uv={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},ev={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function nv(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=ev[l])?!!t[l]:!1}function df(){return nv}var fv=H({},ju,{key:function(l){if(l.key){var t=av[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=Ce(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?uv[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:df,charCode:function(l){return l.type==="keypress"?Ce(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?Ce(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),cv=Kl(fv),iv=H({},Be,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Zi=Kl(iv),sv=H({},ju,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:df}),yv=Kl(sv),dv=H({},Ma,{propertyName:0,elapsedTime:0,pseudoElement:0}),vv=Kl(dv),ov=H({},Be,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),mv=Kl(ov),hv=H({},Ma,{newState:0,oldState:0}),gv=Kl(hv),Sv=[9,13,27,32],vf=jt&&"CompositionEvent"in window,Yu=null;jt&&"documentMode"in document&&(Yu=document.documentMode);var rv=jt&&"TextEvent"in window&&!Yu,Vi=jt&&(!vf||Yu&&8<Yu&&11>=Yu),Li=" ",Ki=!1;function Ji(l,t){switch(l){case"keyup":return Sv.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function wi(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var Ia=!1;function bv(l,t){switch(l){case"compositionend":return wi(t);case"keypress":return t.which!==32?null:(Ki=!0,Li);case"textInput":return l=t.data,l===Li&&Ki?null:l;default:return null}}function zv(l,t){if(Ia)return l==="compositionend"||!vf&&Ji(l,t)?(l=xi(),Re=ff=Pt=null,Ia=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Vi&&t.locale!=="ko"?null:t.data;default:return null}}var Tv={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!Tv[l.type]:t==="textarea"}function $i(l,t,a,u){ka?Fa?Fa.push(u):Fa=[u]:ka=u,t=Mn(t,"onChange"),0<t.length&&(a=new je("onChange","change",null,a,u),l.push({event:a,listeners:t}))}var xu=null,Gu=null;function Ev(l){Ny(l,0)}function Ye(l){var t=Ru(l);if(Hi(t))return l}function ki(l,t){if(l==="change")return t}var Fi=!1;if(jt){var of;if(jt){var mf="oninput"in document;if(!mf){var Ii=document.createElement("div");Ii.setAttribute("oninput","return;"),mf=typeof Ii.oninput=="function"}of=mf}else of=!1;Fi=of&&(!document.documentMode||9<document.documentMode)}function Pi(){xu&&(xu.detachEvent("onpropertychange",ls),Gu=xu=null)}function ls(l){if(l.propertyName==="value"&&Ye(Gu)){var t=[];$i(t,Gu,l,uf(l)),Yi(Ev,t)}}function Av(l,t,a){l==="focusin"?(Pi(),xu=t,Gu=a,xu.attachEvent("onpropertychange",ls)):l==="focusout"&&Pi()}function _v(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Ye(Gu)}function pv(l,t){if(l==="click")return Ye(t)}function Mv(l,t){if(l==="input"||l==="change")return Ye(t)}function Ov(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var lt=typeof Object.is=="function"?Object.is:Ov;function Xu(l,t){if(lt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var a=Object.keys(l),u=Object.keys(t);if(a.length!==u.length)return!1;for(u=0;u<a.length;u++){var e=a[u];if(!Ln.call(t,e)||!lt(l[e],t[e]))return!1}return!0}function ts(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function as(l,t){var a=ts(l);l=0;for(var u;a;){if(a.nodeType===3){if(u=l+a.textContent.length,l<=t&&u>=t)return{node:a,offset:t-l};l=u}l:{for(;a;){if(a.nextSibling){a=a.nextSibling;break l}a=a.parentNode}a=void 0}a=ts(a)}}function us(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?us(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function es(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=He(l.document);t instanceof l.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)l=t.contentWindow;else break;t=He(l.document)}return t}function hf(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Dv=jt&&"documentMode"in document&&11>=document.documentMode,Pa=null,gf=null,Qu=null,Sf=!1;function ns(l,t,a){var u=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;Sf||Pa==null||Pa!==He(u)||(u=Pa,"selectionStart"in u&&hf(u)?u={start:u.selectionStart,end:u.selectionEnd}:(u=(u.ownerDocument&&u.ownerDocument.defaultView||window).getSelection(),u={anchorNode:u.anchorNode,anchorOffset:u.anchorOffset,focusNode:u.focusNode,focusOffset:u.focusOffset}),Qu&&Xu(Qu,u)||(Qu=u,u=Mn(gf,"onSelect"),0<u.length&&(t=new je("onSelect","select",null,t,a),l.push({event:t,listeners:u}),t.target=Pa)))}function Oa(l,t){var a={};return a[l.toLowerCase()]=t.toLowerCase(),a["Webkit"+l]="webkit"+t,a["Moz"+l]="moz"+t,a}var lu={animationend:Oa("Animation","AnimationEnd"),animationiteration:Oa("Animation","AnimationIteration"),animationstart:Oa("Animation","AnimationStart"),transitionrun:Oa("Transition","TransitionRun"),transitionstart:Oa("Transition","TransitionStart"),transitioncancel:Oa("Transition","TransitionCancel"),transitionend:Oa("Transition","TransitionEnd")},rf={},fs={};jt&&(fs=document.createElement("div").style,"AnimationEvent"in window||(delete lu.animationend.animation,delete lu.animationiteration.animation,delete lu.animationstart.animation),"TransitionEvent"in window||delete lu.transitionend.transition);function Da(l){if(rf[l])return rf[l];if(!lu[l])return l;var t=lu[l],a;for(a in t)if(t.hasOwnProperty(a)&&a in fs)return rf[l]=t[a];return l}var cs=Da("animationend"),is=Da("animationiteration"),ss=Da("animationstart"),Uv=Da("transitionrun"),Hv=Da("transitionstart"),Nv=Da("transitioncancel"),ys=Da("transitionend"),ds=new Map,bf="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");bf.push("scrollEnd");function zt(l,t){ds.set(l,t),pa(t,[l])}var xe=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},yt=[],tu=0,zf=0;function Ge(){for(var l=tu,t=zf=tu=0;t<l;){var a=yt[t];yt[t++]=null;var u=yt[t];yt[t++]=null;var e=yt[t];yt[t++]=null;var n=yt[t];if(yt[t++]=null,u!==null&&e!==null){var f=u.pending;f===null?e.next=e:(e.next=f.next,f.next=e),u.pending=e}n!==0&&vs(a,e,n)}}function Xe(l,t,a,u){yt[tu++]=l,yt[tu++]=t,yt[tu++]=a,yt[tu++]=u,zf|=u,l.lanes|=u,l=l.alternate,l!==null&&(l.lanes|=u)}function Tf(l,t,a,u){return Xe(l,t,a,u),Qe(l)}function Ua(l,t){return Xe(l,null,null,t),Qe(l)}function vs(l,t,a){l.lanes|=a;var u=l.alternate;u!==null&&(u.lanes|=a);for(var e=!1,n=l.return;n!==null;)n.childLanes|=a,u=n.alternate,u!==null&&(u.childLanes|=a),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-Pl(a),l=n.hiddenUpdates,u=l[e],u===null?l[e]=[t]:u.push(t),t.lane=a|536870912),n):null}function Qe(l){if(50<se)throw se=0,Hc=null,Error(v(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var au={};function Rv(l,t,a,u){this.tag=l,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=u,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function tt(l,t,a,u){return new Rv(l,t,a,u)}function Ef(l){return l=l.prototype,!(!l||!l.isReactComponent)}function Bt(l,t){var a=l.alternate;return a===null?(a=tt(l.tag,t,l.key,l.mode),a.elementType=l.elementType,a.type=l.type,a.stateNode=l.stateNode,a.alternate=l,l.alternate=a):(a.pendingProps=t,a.type=l.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=l.flags&65011712,a.childLanes=l.childLanes,a.lanes=l.lanes,a.child=l.child,a.memoizedProps=l.memoizedProps,a.memoizedState=l.memoizedState,a.updateQueue=l.updateQueue,t=l.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=l.sibling,a.index=l.index,a.ref=l.ref,a.refCleanup=l.refCleanup,a}function os(l,t){l.flags&=65011714;var a=l.alternate;return a===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=a.childLanes,l.lanes=a.lanes,l.child=a.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=a.memoizedProps,l.memoizedState=a.memoizedState,l.updateQueue=a.updateQueue,l.type=a.type,t=a.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Ze(l,t,a,u,e,n){var f=0;if(u=l,typeof l=="function")Ef(l)&&(f=1);else if(typeof l=="string")f=Y1(l,a,O.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case pt:return l=tt(31,a,t,e),l.elementType=pt,l.lanes=n,l;case pl:return Ha(a.children,e,n,t);case rt:f=8,e|=24;break;case Yl:return l=tt(12,a,t,e|2),l.elementType=Yl,l.lanes=n,l;case _t:return l=tt(13,a,t,e),l.elementType=_t,l.lanes=n,l;case Ql:return l=tt(19,a,t,e),l.elementType=Ql,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case zl:f=10;break l;case At:f=9;break l;case ct:f=11;break l;case $:f=14;break l;case Zl:f=16,u=null;break l}f=29,a=Error(v(130,l===null?"null":typeof l,"")),u=null}return t=tt(f,a,t,e),t.elementType=l,t.type=u,t.lanes=n,t}function Ha(l,t,a,u){return l=tt(7,l,u,t),l.lanes=a,l}function Af(l,t,a){return l=tt(6,l,null,t),l.lanes=a,l}function ms(l){var t=tt(18,null,null,0);return t.stateNode=l,t}function _f(l,t,a){return t=tt(4,l.children!==null?l.children:[],l.key,t),t.lanes=a,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var hs=new WeakMap;function dt(l,t){if(typeof l=="object"&&l!==null){var a=hs.get(l);return a!==void 0?a:(t={value:l,source:t,stack:mi(t)},hs.set(l,t),t)}return{value:l,source:t,stack:mi(t)}}var uu=[],eu=0,Ve=null,Zu=0,vt=[],ot=0,la=null,Ot=1,Dt="";function Yt(l,t){uu[eu++]=Zu,uu[eu++]=Ve,Ve=l,Zu=t}function gs(l,t,a){vt[ot++]=Ot,vt[ot++]=Dt,vt[ot++]=la,la=l;var u=Ot;l=Dt;var e=32-Pl(u)-1;u&=~(1<<e),a+=1;var n=32-Pl(t)+e;if(30<n){var f=e-e%5;n=(u&(1<<f)-1).toString(32),u>>=f,e-=f,Ot=1<<32-Pl(t)+e|a<<e|u,Dt=n+l}else Ot=1<<n|a<<e|u,Dt=l}function pf(l){l.return!==null&&(Yt(l,1),gs(l,1,0))}function Mf(l){for(;l===Ve;)Ve=uu[--eu],uu[eu]=null,Zu=uu[--eu],uu[eu]=null;for(;l===la;)la=vt[--ot],vt[ot]=null,Dt=vt[--ot],vt[ot]=null,Ot=vt[--ot],vt[ot]=null}function Ss(l,t){vt[ot++]=Ot,vt[ot++]=Dt,vt[ot++]=la,Ot=t.id,Dt=t.overflow,la=l}var Nl=null,dl=null,k=!1,ta=null,mt=!1,Of=Error(v(519));function aa(l){var t=Error(v(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw Vu(dt(t,l)),Of}function rs(l){var t=l.stateNode,a=l.type,u=l.memoizedProps;switch(t[Hl]=l,t[Ll]=u,a){case"dialog":J("cancel",t),J("close",t);break;case"iframe":case"object":case"embed":J("load",t);break;case"video":case"audio":for(a=0;a<de.length;a++)J(de[a],t);break;case"source":J("error",t);break;case"img":case"image":case"link":J("error",t),J("load",t);break;case"details":J("toggle",t);break;case"input":J("invalid",t),Ni(t,u.value,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name,!0);break;case"select":J("invalid",t);break;case"textarea":J("invalid",t),Ci(t,u.value,u.defaultValue,u.children)}a=u.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||u.suppressHydrationWarning===!0||jy(t.textContent,a)?(u.popover!=null&&(J("beforetoggle",t),J("toggle",t)),u.onScroll!=null&&J("scroll",t),u.onScrollEnd!=null&&J("scrollend",t),u.onClick!=null&&(t.onclick=qt),t=!0):t=!1,t||aa(l,!0)}function bs(l){for(Nl=l.return;Nl;)switch(Nl.tag){case 5:case 31:case 13:mt=!1;return;case 27:case 3:mt=!0;return;default:Nl=Nl.return}}function nu(l){if(l!==Nl)return!1;if(!k)return bs(l),k=!0,!1;var t=l.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=l.type,a=!(a!=="form"&&a!=="button")||Kc(l.type,l.memoizedProps)),a=!a),a&&dl&&aa(l),bs(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(v(317));dl=Ly(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(v(317));dl=Ly(l)}else t===27?(t=dl,ga(l.type)?(l=kc,kc=null,dl=l):dl=t):dl=Nl?gt(l.stateNode.nextSibling):null;return!0}function Na(){dl=Nl=null,k=!1}function Df(){var l=ta;return l!==null&&($l===null?$l=l:$l.push.apply($l,l),ta=null),l}function Vu(l){ta===null?ta=[l]:ta.push(l)}var Uf=y(null),Ra=null,xt=null;function ua(l,t,a){p(Uf,t._currentValue),t._currentValue=a}function Gt(l){l._currentValue=Uf.current,E(Uf)}function Hf(l,t,a){for(;l!==null;){var u=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,u!==null&&(u.childLanes|=t)):u!==null&&(u.childLanes&t)!==t&&(u.childLanes|=t),l===a)break;l=l.return}}function Nf(l,t,a,u){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var f=e.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=e;for(var i=0;i<t.length;i++)if(c.context===t[i]){n.lanes|=a,c=n.alternate,c!==null&&(c.lanes|=a),Hf(n.return,a,l),u||(f=null);break l}n=c.next}}else if(e.tag===18){if(f=e.return,f===null)throw Error(v(341));f.lanes|=a,n=f.alternate,n!==null&&(n.lanes|=a),Hf(f,a,l),f=null}else f=e.child;if(f!==null)f.return=e;else for(f=e;f!==null;){if(f===l){f=null;break}if(e=f.sibling,e!==null){e.return=f.return,f=e;break}f=f.return}e=f}}function fu(l,t,a,u){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var f=e.alternate;if(f===null)throw Error(v(387));if(f=f.memoizedProps,f!==null){var c=e.type;lt(e.pendingProps.value,f.value)||(l!==null?l.push(c):l=[c])}}else if(e===ll.current){if(f=e.alternate,f===null)throw Error(v(387));f.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(ge):l=[ge])}e=e.return}l!==null&&Nf(t,l,a,u),t.flags|=262144}function Le(l){for(l=l.firstContext;l!==null;){if(!lt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Ca(l){Ra=l,xt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Rl(l){return zs(Ra,l)}function Ke(l,t){return Ra===null&&Ca(l),zs(l,t)}function zs(l,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},xt===null){if(l===null)throw Error(v(308));xt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else xt=xt.next=t;return a}var Cv=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(a,u){l.push(u)}};this.abort=function(){t.aborted=!0,l.forEach(function(a){return a()})}},qv=A.unstable_scheduleCallback,jv=A.unstable_NormalPriority,Tl={$$typeof:zl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Rf(){return{controller:new Cv,data:new Map,refCount:0}}function Lu(l){l.refCount--,l.refCount===0&&qv(jv,function(){l.controller.abort()})}var Ku=null,Cf=0,cu=0,iu=null;function Bv(l,t){if(Ku===null){var a=Ku=[];Cf=0,cu=Bc(),iu={status:"pending",value:void 0,then:function(u){a.push(u)}}}return Cf++,t.then(Ts,Ts),t}function Ts(){if(--Cf===0&&Ku!==null){iu!==null&&(iu.status="fulfilled");var l=Ku;Ku=null,cu=0,iu=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Yv(l,t){var a=[],u={status:"pending",value:null,reason:null,then:function(e){a.push(e)}};return l.then(function(){u.status="fulfilled",u.value=t;for(var e=0;e<a.length;e++)(0,a[e])(t)},function(e){for(u.status="rejected",u.reason=e,e=0;e<a.length;e++)(0,a[e])(void 0)}),u}var Es=r.S;r.S=function(l,t){ny=Fl(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Bv(l,t),Es!==null&&Es(l,t)};var qa=y(null);function qf(){var l=qa.current;return l!==null?l:yl.pooledCache}function Je(l,t){t===null?p(qa,qa.current):p(qa,t.pool)}function As(){var l=qf();return l===null?null:{parent:Tl._currentValue,pool:l}}var su=Error(v(460)),jf=Error(v(474)),we=Error(v(542)),We={then:function(){}};function _s(l){return l=l.status,l==="fulfilled"||l==="rejected"}function ps(l,t,a){switch(a=l[a],a===void 0?l.push(t):a!==t&&(t.then(qt,qt),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Os(l),l;default:if(typeof t.status=="string")t.then(qt,qt);else{if(l=yl,l!==null&&100<l.shellSuspendCounter)throw Error(v(482));l=t,l.status="pending",l.then(function(u){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=u}},function(u){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=u}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,Os(l),l}throw Ba=t,su}}function ja(l){try{var t=l._init;return t(l._payload)}catch(a){throw a!==null&&typeof a=="object"&&typeof a.then=="function"?(Ba=a,su):a}}var Ba=null;function Ms(){if(Ba===null)throw Error(v(459));var l=Ba;return Ba=null,l}function Os(l){if(l===su||l===we)throw Error(v(483))}var yu=null,Ju=0;function $e(l){var t=Ju;return Ju+=1,yu===null&&(yu=[]),ps(yu,l,t)}function wu(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function ke(l,t){throw t.$$typeof===el?Error(v(525)):(l=Object.prototype.toString.call(t),Error(v(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function Ds(l){function t(d,s){if(l){var o=d.deletions;o===null?(d.deletions=[s],d.flags|=16):o.push(s)}}function a(d,s){if(!l)return null;for(;s!==null;)t(d,s),s=s.sibling;return null}function u(d){for(var s=new Map;d!==null;)d.key!==null?s.set(d.key,d):s.set(d.index,d),d=d.sibling;return s}function e(d,s){return d=Bt(d,s),d.index=0,d.sibling=null,d}function n(d,s,o){return d.index=o,l?(o=d.alternate,o!==null?(o=o.index,o<s?(d.flags|=67108866,s):o):(d.flags|=67108866,s)):(d.flags|=1048576,s)}function f(d){return l&&d.alternate===null&&(d.flags|=67108866),d}function c(d,s,o,b){return s===null||s.tag!==6?(s=Af(o,d.mode,b),s.return=d,s):(s=e(s,o),s.return=d,s)}function i(d,s,o,b){var N=o.type;return N===pl?S(d,s,o.props.children,b,o.key):s!==null&&(s.elementType===N||typeof N=="object"&&N!==null&&N.$$typeof===Zl&&ja(N)===s.type)?(s=e(s,o.props),wu(s,o),s.return=d,s):(s=Ze(o.type,o.key,o.props,null,d.mode,b),wu(s,o),s.return=d,s)}function m(d,s,o,b){return s===null||s.tag!==4||s.stateNode.containerInfo!==o.containerInfo||s.stateNode.implementation!==o.implementation?(s=_f(o,d.mode,b),s.return=d,s):(s=e(s,o.children||[]),s.return=d,s)}function S(d,s,o,b,N){return s===null||s.tag!==7?(s=Ha(o,d.mode,b,N),s.return=d,s):(s=e(s,o),s.return=d,s)}function z(d,s,o){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Af(""+s,d.mode,o),s.return=d,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Bl:return o=Ze(s.type,s.key,s.props,null,d.mode,o),wu(o,s),o.return=d,o;case Ol:return s=_f(s,d.mode,o),s.return=d,s;case Zl:return s=ja(s),z(d,s,o)}if(bt(s)||Vl(s))return s=Ha(s,d.mode,o,null),s.return=d,s;if(typeof s.then=="function")return z(d,$e(s),o);if(s.$$typeof===zl)return z(d,Ke(d,s),o);ke(d,s)}return null}function h(d,s,o,b){var N=s!==null?s.key:null;if(typeof o=="string"&&o!==""||typeof o=="number"||typeof o=="bigint")return N!==null?null:c(d,s,""+o,b);if(typeof o=="object"&&o!==null){switch(o.$$typeof){case Bl:return o.key===N?i(d,s,o,b):null;case Ol:return o.key===N?m(d,s,o,b):null;case Zl:return o=ja(o),h(d,s,o,b)}if(bt(o)||Vl(o))return N!==null?null:S(d,s,o,b,null);if(typeof o.then=="function")return h(d,s,$e(o),b);if(o.$$typeof===zl)return h(d,s,Ke(d,o),b);ke(d,o)}return null}function g(d,s,o,b,N){if(typeof b=="string"&&b!==""||typeof b=="number"||typeof b=="bigint")return d=d.get(o)||null,c(s,d,""+b,N);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case Bl:return d=d.get(b.key===null?o:b.key)||null,i(s,d,b,N);case Ol:return d=d.get(b.key===null?o:b.key)||null,m(s,d,b,N);case Zl:return b=ja(b),g(d,s,o,b,N)}if(bt(b)||Vl(b))return d=d.get(o)||null,S(s,d,b,N,null);if(typeof b.then=="function")return g(d,s,o,$e(b),N);if(b.$$typeof===zl)return g(d,s,o,Ke(s,b),N);ke(s,b)}return null}function M(d,s,o,b){for(var N=null,F=null,D=s,Z=s=0,W=null;D!==null&&Z<o.length;Z++){D.index>Z?(W=D,D=null):W=D.sibling;var I=h(d,D,o[Z],b);if(I===null){D===null&&(D=W);break}l&&D&&I.alternate===null&&t(d,D),s=n(I,s,Z),F===null?N=I:F.sibling=I,F=I,D=W}if(Z===o.length)return a(d,D),k&&Yt(d,Z),N;if(D===null){for(;Z<o.length;Z++)D=z(d,o[Z],b),D!==null&&(s=n(D,s,Z),F===null?N=D:F.sibling=D,F=D);return k&&Yt(d,Z),N}for(D=u(D);Z<o.length;Z++)W=g(D,d,Z,o[Z],b),W!==null&&(l&&W.alternate!==null&&D.delete(W.key===null?Z:W.key),s=n(W,s,Z),F===null?N=W:F.sibling=W,F=W);return l&&D.forEach(function(Ta){return t(d,Ta)}),k&&Yt(d,Z),N}function C(d,s,o,b){if(o==null)throw Error(v(151));for(var N=null,F=null,D=s,Z=s=0,W=null,I=o.next();D!==null&&!I.done;Z++,I=o.next()){D.index>Z?(W=D,D=null):W=D.sibling;var Ta=h(d,D,I.value,b);if(Ta===null){D===null&&(D=W);break}l&&D&&Ta.alternate===null&&t(d,D),s=n(Ta,s,Z),F===null?N=Ta:F.sibling=Ta,F=Ta,D=W}if(I.done)return a(d,D),k&&Yt(d,Z),N;if(D===null){for(;!I.done;Z++,I=o.next())I=z(d,I.value,b),I!==null&&(s=n(I,s,Z),F===null?N=I:F.sibling=I,F=I);return k&&Yt(d,Z),N}for(D=u(D);!I.done;Z++,I=o.next())I=g(D,d,Z,I.value,b),I!==null&&(l&&I.alternate!==null&&D.delete(I.key===null?Z:I.key),s=n(I,s,Z),F===null?N=I:F.sibling=I,F=I);return l&&D.forEach(function(W1){return t(d,W1)}),k&&Yt(d,Z),N}function il(d,s,o,b){if(typeof o=="object"&&o!==null&&o.type===pl&&o.key===null&&(o=o.props.children),typeof o=="object"&&o!==null){switch(o.$$typeof){case Bl:l:{for(var N=o.key;s!==null;){if(s.key===N){if(N=o.type,N===pl){if(s.tag===7){a(d,s.sibling),b=e(s,o.props.children),b.return=d,d=b;break l}}else if(s.elementType===N||typeof N=="object"&&N!==null&&N.$$typeof===Zl&&ja(N)===s.type){a(d,s.sibling),b=e(s,o.props),wu(b,o),b.return=d,d=b;break l}a(d,s);break}else t(d,s);s=s.sibling}o.type===pl?(b=Ha(o.props.children,d.mode,b,o.key),b.return=d,d=b):(b=Ze(o.type,o.key,o.props,null,d.mode,b),wu(b,o),b.return=d,d=b)}return f(d);case Ol:l:{for(N=o.key;s!==null;){if(s.key===N)if(s.tag===4&&s.stateNode.containerInfo===o.containerInfo&&s.stateNode.implementation===o.implementation){a(d,s.sibling),b=e(s,o.children||[]),b.return=d,d=b;break l}else{a(d,s);break}else t(d,s);s=s.sibling}b=_f(o,d.mode,b),b.return=d,d=b}return f(d);case Zl:return o=ja(o),il(d,s,o,b)}if(bt(o))return M(d,s,o,b);if(Vl(o)){if(N=Vl(o),typeof N!="function")throw Error(v(150));return o=N.call(o),C(d,s,o,b)}if(typeof o.then=="function")return il(d,s,$e(o),b);if(o.$$typeof===zl)return il(d,s,Ke(d,o),b);ke(d,o)}return typeof o=="string"&&o!==""||typeof o=="number"||typeof o=="bigint"?(o=""+o,s!==null&&s.tag===6?(a(d,s.sibling),b=e(s,o),b.return=d,d=b):(a(d,s),b=Af(o,d.mode,b),b.return=d,d=b),f(d)):a(d,s)}return function(d,s,o,b){try{Ju=0;var N=il(d,s,o,b);return yu=null,N}catch(D){if(D===su||D===we)throw D;var F=tt(29,D,null,d.mode);return F.lanes=b,F.return=d,F}finally{}}}var Ya=Ds(!0),Us=Ds(!1),ea=!1;function Bf(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Yf(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function na(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function fa(l,t,a){var u=l.updateQueue;if(u===null)return null;if(u=u.shared,(P&2)!==0){var e=u.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),u.pending=t,t=Qe(l),vs(l,null,a),t}return Xe(l,u,t,a),Qe(l)}function Wu(l,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var u=t.lanes;u&=l.pendingLanes,a|=u,t.lanes=a,zi(l,a)}}function xf(l,t){var a=l.updateQueue,u=l.alternate;if(u!==null&&(u=u.updateQueue,a===u)){var e=null,n=null;if(a=a.firstBaseUpdate,a!==null){do{var f={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};n===null?e=n=f:n=n.next=f,a=a.next}while(a!==null);n===null?e=n=t:n=n.next=t}else e=n=t;a={baseState:u.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:u.shared,callbacks:u.callbacks},l.updateQueue=a;return}l=a.lastBaseUpdate,l===null?a.firstBaseUpdate=t:l.next=t,a.lastBaseUpdate=t}var Gf=!1;function $u(){if(Gf){var l=iu;if(l!==null)throw l}}function ku(l,t,a,u){Gf=!1;var e=l.updateQueue;ea=!1;var n=e.firstBaseUpdate,f=e.lastBaseUpdate,c=e.shared.pending;if(c!==null){e.shared.pending=null;var i=c,m=i.next;i.next=null,f===null?n=m:f.next=m,f=i;var S=l.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==f&&(c===null?S.firstBaseUpdate=m:c.next=m,S.lastBaseUpdate=i))}if(n!==null){var z=e.baseState;f=0,S=m=i=null,c=n;do{var h=c.lane&-536870913,g=h!==c.lane;if(g?(w&h)===h:(u&h)===h){h!==0&&h===cu&&(Gf=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var M=l,C=c;h=t;var il=a;switch(C.tag){case 1:if(M=C.payload,typeof M=="function"){z=M.call(il,z,h);break l}z=M;break l;case 3:M.flags=M.flags&-65537|128;case 0:if(M=C.payload,h=typeof M=="function"?M.call(il,z,h):M,h==null)break l;z=H({},z,h);break l;case 2:ea=!0}}h=c.callback,h!==null&&(l.flags|=64,g&&(l.flags|=8192),g=e.callbacks,g===null?e.callbacks=[h]:g.push(h))}else g={lane:h,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(m=S=g,i=z):S=S.next=g,f|=h;if(c=c.next,c===null){if(c=e.shared.pending,c===null)break;g=c,c=g.next,g.next=null,e.lastBaseUpdate=g,e.shared.pending=null}}while(!0);S===null&&(i=z),e.baseState=i,e.firstBaseUpdate=m,e.lastBaseUpdate=S,n===null&&(e.shared.lanes=0),da|=f,l.lanes=f,l.memoizedState=z}}function Hs(l,t){if(typeof l!="function")throw Error(v(191,l));l.call(t)}function Ns(l,t){var a=l.callbacks;if(a!==null)for(l.callbacks=null,l=0;l<a.length;l++)Hs(a[l],t)}var du=y(null),Fe=y(0);function Rs(l,t){l=Wt,p(Fe,l),p(du,t),Wt=l|t.baseLanes}function Xf(){p(Fe,Wt),p(du,du.current)}function Qf(){Wt=Fe.current,E(du),E(Fe)}var at=y(null),ht=null;function ca(l){var t=l.alternate;p(rl,rl.current&1),p(at,l),ht===null&&(t===null||du.current!==null||t.memoizedState!==null)&&(ht=l)}function Zf(l){p(rl,rl.current),p(at,l),ht===null&&(ht=l)}function Cs(l){l.tag===22?(p(rl,rl.current),p(at,l),ht===null&&(ht=l)):ia()}function ia(){p(rl,rl.current),p(at,at.current)}function ut(l){E(at),ht===l&&(ht=null),E(rl)}var rl=y(0);function Ie(l){for(var t=l;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||Wc(a)||$c(a)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Xt=0,Q=null,fl=null,El=null,Pe=!1,vu=!1,xa=!1,ln=0,Fu=0,ou=null,xv=0;function hl(){throw Error(v(321))}function Vf(l,t){if(t===null)return!1;for(var a=0;a<t.length&&a<l.length;a++)if(!lt(l[a],t[a]))return!1;return!0}function Lf(l,t,a,u,e,n){return Xt=n,Q=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,r.H=l===null||l.memoizedState===null?g0:nc,xa=!1,n=a(u,e),xa=!1,vu&&(n=js(t,a,u,e)),qs(l),n}function qs(l){r.H=le;var t=fl!==null&&fl.next!==null;if(Xt=0,El=fl=Q=null,Pe=!1,Fu=0,ou=null,t)throw Error(v(300));l===null||Al||(l=l.dependencies,l!==null&&Le(l)&&(Al=!0))}function js(l,t,a,u){Q=l;var e=0;do{if(vu&&(ou=null),Fu=0,vu=!1,25<=e)throw Error(v(301));if(e+=1,El=fl=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}r.H=S0,n=t(a,u)}while(vu);return n}function Gv(){var l=r.H,t=l.useState()[0];return t=typeof t.then=="function"?Iu(t):t,l=l.useState()[0],(fl!==null?fl.memoizedState:null)!==l&&(Q.flags|=1024),t}function Kf(){var l=ln!==0;return ln=0,l}function Jf(l,t,a){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~a}function wf(l){if(Pe){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}Pe=!1}Xt=0,El=fl=Q=null,vu=!1,Fu=ln=0,ou=null}function Gl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return El===null?Q.memoizedState=El=l:El=El.next=l,El}function bl(){if(fl===null){var l=Q.alternate;l=l!==null?l.memoizedState:null}else l=fl.next;var t=El===null?Q.memoizedState:El.next;if(t!==null)El=t,fl=l;else{if(l===null)throw Q.alternate===null?Error(v(467)):Error(v(310));fl=l,l={memoizedState:fl.memoizedState,baseState:fl.baseState,baseQueue:fl.baseQueue,queue:fl.queue,next:null},El===null?Q.memoizedState=El=l:El=El.next=l}return El}function tn(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Iu(l){var t=Fu;return Fu+=1,ou===null&&(ou=[]),l=ps(ou,l,t),t=Q,(El===null?t.memoizedState:El.next)===null&&(t=t.alternate,r.H=t===null||t.memoizedState===null?g0:nc),l}function an(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return Iu(l);if(l.$$typeof===zl)return Rl(l)}throw Error(v(438,String(l)))}function Wf(l){var t=null,a=Q.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var u=Q.alternate;u!==null&&(u=u.updateQueue,u!==null&&(u=u.memoCache,u!=null&&(t={data:u.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=tn(),Q.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(l),u=0;u<l;u++)a[u]=Za;return t.index++,a}function Qt(l,t){return typeof t=="function"?t(l):t}function un(l){var t=bl();return $f(t,fl,l)}function $f(l,t,a){var u=l.queue;if(u===null)throw Error(v(311));u.lastRenderedReducer=a;var e=l.baseQueue,n=u.pending;if(n!==null){if(e!==null){var f=e.next;e.next=n.next,n.next=f}t.baseQueue=e=n,u.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var c=f=null,i=null,m=t,S=!1;do{var z=m.lane&-536870913;if(z!==m.lane?(w&z)===z:(Xt&z)===z){var h=m.revertLane;if(h===0)i!==null&&(i=i.next={lane:0,revertLane:0,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null}),z===cu&&(S=!0);else if((Xt&h)===h){m=m.next,h===cu&&(S=!0);continue}else z={lane:0,revertLane:m.revertLane,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=z,f=n):i=i.next=z,Q.lanes|=h,da|=h;z=m.action,xa&&a(n,z),n=m.hasEagerState?m.eagerState:a(n,z)}else h={lane:z,revertLane:m.revertLane,gesture:m.gesture,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=h,f=n):i=i.next=h,Q.lanes|=z,da|=z;m=m.next}while(m!==null&&m!==t);if(i===null?f=n:i.next=c,!lt(n,l.memoizedState)&&(Al=!0,S&&(a=iu,a!==null)))throw a;l.memoizedState=n,l.baseState=f,l.baseQueue=i,u.lastRenderedState=n}return e===null&&(u.lanes=0),[l.memoizedState,u.dispatch]}function kf(l){var t=bl(),a=t.queue;if(a===null)throw Error(v(311));a.lastRenderedReducer=l;var u=a.dispatch,e=a.pending,n=t.memoizedState;if(e!==null){a.pending=null;var f=e=e.next;do n=l(n,f.action),f=f.next;while(f!==e);lt(n,t.memoizedState)||(Al=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),a.lastRenderedState=n}return[n,u]}function Bs(l,t,a){var u=Q,e=bl(),n=k;if(n){if(a===void 0)throw Error(v(407));a=a()}else a=t();var f=!lt((fl||e).memoizedState,a);if(f&&(e.memoizedState=a,Al=!0),e=e.queue,Pf(Gs.bind(null,u,e,l),[l]),e.getSnapshot!==t||f||El!==null&&El.memoizedState.tag&1){if(u.flags|=2048,mu(9,{destroy:void 0},xs.bind(null,u,e,a,t),null),yl===null)throw Error(v(349));n||(Xt&127)!==0||Ys(u,t,a)}return a}function Ys(l,t,a){l.flags|=16384,l={getSnapshot:t,value:a},t=Q.updateQueue,t===null?(t=tn(),Q.updateQueue=t,t.stores=[l]):(a=t.stores,a===null?t.stores=[l]:a.push(l))}function xs(l,t,a,u){t.value=a,t.getSnapshot=u,Xs(t)&&Qs(l)}function Gs(l,t,a){return a(function(){Xs(t)&&Qs(l)})}function Xs(l){var t=l.getSnapshot;l=l.value;try{var a=t();return!lt(l,a)}catch{return!0}}function Qs(l){var t=Ua(l,2);t!==null&&kl(t,l,2)}function Ff(l){var t=Gl();if(typeof l=="function"){var a=l;if(l=a(),xa){Ft(!0);try{a()}finally{Ft(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Qt,lastRenderedState:l},t}function Zs(l,t,a,u){return l.baseState=a,$f(l,fl,typeof u=="function"?u:Qt)}function Xv(l,t,a,u,e){if(fn(l))throw Error(v(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(f){n.listeners.push(f)}};r.T!==null?a(!0):n.isTransition=!1,u(n),a=t.pending,a===null?(n.next=t.pending=n,Vs(t,n)):(n.next=a.next,t.pending=a.next=n)}}function Vs(l,t){var a=t.action,u=t.payload,e=l.state;if(t.isTransition){var n=r.T,f={};r.T=f;try{var c=a(e,u),i=r.S;i!==null&&i(f,c),Ls(l,t,c)}catch(m){If(l,t,m)}finally{n!==null&&f.types!==null&&(n.types=f.types),r.T=n}}else try{n=a(e,u),Ls(l,t,n)}catch(m){If(l,t,m)}}function Ls(l,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(u){Ks(l,t,u)},function(u){return If(l,t,u)}):Ks(l,t,a)}function Ks(l,t,a){t.status="fulfilled",t.value=a,Js(t),l.state=a,t=l.pending,t!==null&&(a=t.next,a===t?l.pending=null:(a=a.next,t.next=a,Vs(l,a)))}function If(l,t,a){var u=l.pending;if(l.pending=null,u!==null){u=u.next;do t.status="rejected",t.reason=a,Js(t),t=t.next;while(t!==u)}l.action=null}function Js(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function ws(l,t){return t}function Ws(l,t){if(k){var a=yl.formState;if(a!==null){l:{var u=Q;if(k){if(dl){t:{for(var e=dl,n=mt;e.nodeType!==8;){if(!n){e=null;break t}if(e=gt(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){dl=gt(e.nextSibling),u=e.data==="F!";break l}}aa(u)}u=!1}u&&(t=a[0])}}return a=Gl(),a.memoizedState=a.baseState=t,u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ws,lastRenderedState:t},a.queue=u,a=o0.bind(null,Q,u),u.dispatch=a,u=Ff(!1),n=ec.bind(null,Q,!1,u.queue),u=Gl(),e={state:t,dispatch:null,action:l,pending:null},u.queue=e,a=Xv.bind(null,Q,e,n,a),e.dispatch=a,u.memoizedState=l,[t,a,!1]}function $s(l){var t=bl();return ks(t,fl,l)}function ks(l,t,a){if(t=$f(l,t,ws)[0],l=un(Qt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var u=Iu(t)}catch(f){throw f===su?we:f}else u=t;t=bl();var e=t.queue,n=e.dispatch;return a!==t.memoizedState&&(Q.flags|=2048,mu(9,{destroy:void 0},Qv.bind(null,e,a),null)),[u,n,l]}function Qv(l,t){l.action=t}function Fs(l){var t=bl(),a=fl;if(a!==null)return ks(t,a,l);bl(),t=t.memoizedState,a=bl();var u=a.queue.dispatch;return a.memoizedState=l,[t,u,!1]}function mu(l,t,a,u){return l={tag:l,create:a,deps:u,inst:t,next:null},t=Q.updateQueue,t===null&&(t=tn(),Q.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=l.next=l:(u=a.next,a.next=l,l.next=u,t.lastEffect=l),l}function Is(){return bl().memoizedState}function en(l,t,a,u){var e=Gl();Q.flags|=l,e.memoizedState=mu(1|t,{destroy:void 0},a,u===void 0?null:u)}function nn(l,t,a,u){var e=bl();u=u===void 0?null:u;var n=e.memoizedState.inst;fl!==null&&u!==null&&Vf(u,fl.memoizedState.deps)?e.memoizedState=mu(t,n,a,u):(Q.flags|=l,e.memoizedState=mu(1|t,n,a,u))}function Ps(l,t){en(8390656,8,l,t)}function Pf(l,t){nn(2048,8,l,t)}function Zv(l){Q.flags|=4;var t=Q.updateQueue;if(t===null)t=tn(),Q.updateQueue=t,t.events=[l];else{var a=t.events;a===null?t.events=[l]:a.push(l)}}function l0(l){var t=bl().memoizedState;return Zv({ref:t,nextImpl:l}),function(){if((P&2)!==0)throw Error(v(440));return t.impl.apply(void 0,arguments)}}function t0(l,t){return nn(4,2,l,t)}function a0(l,t){return nn(4,4,l,t)}function u0(l,t){if(typeof t=="function"){l=l();var a=t(l);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function e0(l,t,a){a=a!=null?a.concat([l]):null,nn(4,4,u0.bind(null,t,l),a)}function lc(){}function n0(l,t){var a=bl();t=t===void 0?null:t;var u=a.memoizedState;return t!==null&&Vf(t,u[1])?u[0]:(a.memoizedState=[l,t],l)}function f0(l,t){var a=bl();t=t===void 0?null:t;var u=a.memoizedState;if(t!==null&&Vf(t,u[1]))return u[0];if(u=l(),xa){Ft(!0);try{l()}finally{Ft(!1)}}return a.memoizedState=[u,t],u}function tc(l,t,a){return a===void 0||(Xt&1073741824)!==0&&(w&261930)===0?l.memoizedState=t:(l.memoizedState=a,l=cy(),Q.lanes|=l,da|=l,a)}function c0(l,t,a,u){return lt(a,t)?a:du.current!==null?(l=tc(l,a,u),lt(l,t)||(Al=!0),l):(Xt&42)===0||(Xt&1073741824)!==0&&(w&261930)===0?(Al=!0,l.memoizedState=a):(l=cy(),Q.lanes|=l,da|=l,t)}function i0(l,t,a,u,e){var n=_.p;_.p=n!==0&&8>n?n:8;var f=r.T,c={};r.T=c,ec(l,!1,t,a);try{var i=e(),m=r.S;if(m!==null&&m(c,i),i!==null&&typeof i=="object"&&typeof i.then=="function"){var S=Yv(i,u);Pu(l,t,S,ft(l))}else Pu(l,t,u,ft(l))}catch(z){Pu(l,t,{then:function(){},status:"rejected",reason:z},ft())}finally{_.p=n,f!==null&&c.types!==null&&(f.types=c.types),r.T=f}}function Vv(){}function ac(l,t,a,u){if(l.tag!==5)throw Error(v(476));var e=s0(l).queue;i0(l,e,t,Y,a===null?Vv:function(){return y0(l),a(u)})}function s0(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:Y,baseState:Y,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Qt,lastRenderedState:Y},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Qt,lastRenderedState:a},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function y0(l){var t=s0(l);t.next===null&&(t=l.alternate.memoizedState),Pu(l,t.next.queue,{},ft())}function uc(){return Rl(ge)}function d0(){return bl().memoizedState}function v0(){return bl().memoizedState}function Lv(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var a=ft();l=na(a);var u=fa(t,l,a);u!==null&&(kl(u,t,a),Wu(u,t,a)),t={cache:Rf()},l.payload=t;return}t=t.return}}function Kv(l,t,a){var u=ft();a={lane:u,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},fn(l)?m0(t,a):(a=Tf(l,t,a,u),a!==null&&(kl(a,l,u),h0(a,t,u)))}function o0(l,t,a){var u=ft();Pu(l,t,a,u)}function Pu(l,t,a,u){var e={lane:u,revertLane:0,gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null};if(fn(l))m0(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var f=t.lastRenderedState,c=n(f,a);if(e.hasEagerState=!0,e.eagerState=c,lt(c,f))return Xe(l,t,e,0),yl===null&&Ge(),!1}catch{}finally{}if(a=Tf(l,t,e,u),a!==null)return kl(a,l,u),h0(a,t,u),!0}return!1}function ec(l,t,a,u){if(u={lane:2,revertLane:Bc(),gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},fn(l)){if(t)throw Error(v(479))}else t=Tf(l,a,u,2),t!==null&&kl(t,l,2)}function fn(l){var t=l.alternate;return l===Q||t!==null&&t===Q}function m0(l,t){vu=Pe=!0;var a=l.pending;a===null?t.next=t:(t.next=a.next,a.next=t),l.pending=t}function h0(l,t,a){if((a&4194048)!==0){var u=t.lanes;u&=l.pendingLanes,a|=u,t.lanes=a,zi(l,a)}}var le={readContext:Rl,use:an,useCallback:hl,useContext:hl,useEffect:hl,useImperativeHandle:hl,useLayoutEffect:hl,useInsertionEffect:hl,useMemo:hl,useReducer:hl,useRef:hl,useState:hl,useDebugValue:hl,useDeferredValue:hl,useTransition:hl,useSyncExternalStore:hl,useId:hl,useHostTransitionStatus:hl,useFormState:hl,useActionState:hl,useOptimistic:hl,useMemoCache:hl,useCacheRefresh:hl};le.useEffectEvent=hl;var g0={readContext:Rl,use:an,useCallback:function(l,t){return Gl().memoizedState=[l,t===void 0?null:t],l},useContext:Rl,useEffect:Ps,useImperativeHandle:function(l,t,a){a=a!=null?a.concat([l]):null,en(4194308,4,u0.bind(null,t,l),a)},useLayoutEffect:function(l,t){return en(4194308,4,l,t)},useInsertionEffect:function(l,t){en(4,2,l,t)},useMemo:function(l,t){var a=Gl();t=t===void 0?null:t;var u=l();if(xa){Ft(!0);try{l()}finally{Ft(!1)}}return a.memoizedState=[u,t],u},useReducer:function(l,t,a){var u=Gl();if(a!==void 0){var e=a(t);if(xa){Ft(!0);try{a(t)}finally{Ft(!1)}}}else e=t;return u.memoizedState=u.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},u.queue=l,l=l.dispatch=Kv.bind(null,Q,l),[u.memoizedState,l]},useRef:function(l){var t=Gl();return l={current:l},t.memoizedState=l},useState:function(l){l=Ff(l);var t=l.queue,a=o0.bind(null,Q,t);return t.dispatch=a,[l.memoizedState,a]},useDebugValue:lc,useDeferredValue:function(l,t){var a=Gl();return tc(a,l,t)},useTransition:function(){var l=Ff(!1);return l=i0.bind(null,Q,l.queue,!0,!1),Gl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,a){var u=Q,e=Gl();if(k){if(a===void 0)throw Error(v(407));a=a()}else{if(a=t(),yl===null)throw Error(v(349));(w&127)!==0||Ys(u,t,a)}e.memoizedState=a;var n={value:a,getSnapshot:t};return e.queue=n,Ps(Gs.bind(null,u,n,l),[l]),u.flags|=2048,mu(9,{destroy:void 0},xs.bind(null,u,n,a,t),null),a},useId:function(){var l=Gl(),t=yl.identifierPrefix;if(k){var a=Dt,u=Ot;a=(u&~(1<<32-Pl(u)-1)).toString(32)+a,t="_"+t+"R_"+a,a=ln++,0<a&&(t+="H"+a.toString(32)),t+="_"}else a=xv++,t="_"+t+"r_"+a.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:uc,useFormState:Ws,useActionState:Ws,useOptimistic:function(l){var t=Gl();t.memoizedState=t.baseState=l;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=ec.bind(null,Q,!0,a),a.dispatch=t,[l,t]},useMemoCache:Wf,useCacheRefresh:function(){return Gl().memoizedState=Lv.bind(null,Q)},useEffectEvent:function(l){var t=Gl(),a={impl:l};return t.memoizedState=a,function(){if((P&2)!==0)throw Error(v(440));return a.impl.apply(void 0,arguments)}}},nc={readContext:Rl,use:an,useCallback:n0,useContext:Rl,useEffect:Pf,useImperativeHandle:e0,useInsertionEffect:t0,useLayoutEffect:a0,useMemo:f0,useReducer:un,useRef:Is,useState:function(){return un(Qt)},useDebugValue:lc,useDeferredValue:function(l,t){var a=bl();return c0(a,fl.memoizedState,l,t)},useTransition:function(){var l=un(Qt)[0],t=bl().memoizedState;return[typeof l=="boolean"?l:Iu(l),t]},useSyncExternalStore:Bs,useId:d0,useHostTransitionStatus:uc,useFormState:$s,useActionState:$s,useOptimistic:function(l,t){var a=bl();return Zs(a,fl,l,t)},useMemoCache:Wf,useCacheRefresh:v0};nc.useEffectEvent=l0;var S0={readContext:Rl,use:an,useCallback:n0,useContext:Rl,useEffect:Pf,useImperativeHandle:e0,useInsertionEffect:t0,useLayoutEffect:a0,useMemo:f0,useReducer:kf,useRef:Is,useState:function(){return kf(Qt)},useDebugValue:lc,useDeferredValue:function(l,t){var a=bl();return fl===null?tc(a,l,t):c0(a,fl.memoizedState,l,t)},useTransition:function(){var l=kf(Qt)[0],t=bl().memoizedState;return[typeof l=="boolean"?l:Iu(l),t]},useSyncExternalStore:Bs,useId:d0,useHostTransitionStatus:uc,useFormState:Fs,useActionState:Fs,useOptimistic:function(l,t){var a=bl();return fl!==null?Zs(a,fl,l,t):(a.baseState=l,[l,a.queue.dispatch])},useMemoCache:Wf,useCacheRefresh:v0};S0.useEffectEvent=l0;function fc(l,t,a,u){t=l.memoizedState,a=a(u,t),a=a==null?t:H({},t,a),l.memoizedState=a,l.lanes===0&&(l.updateQueue.baseState=a)}var cc={enqueueSetState:function(l,t,a){l=l._reactInternals;var u=ft(),e=na(u);e.payload=t,a!=null&&(e.callback=a),t=fa(l,e,u),t!==null&&(kl(t,l,u),Wu(t,l,u))},enqueueReplaceState:function(l,t,a){l=l._reactInternals;var u=ft(),e=na(u);e.tag=1,e.payload=t,a!=null&&(e.callback=a),t=fa(l,e,u),t!==null&&(kl(t,l,u),Wu(t,l,u))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var a=ft(),u=na(a);u.tag=2,t!=null&&(u.callback=t),t=fa(l,u,a),t!==null&&(kl(t,l,a),Wu(t,l,a))}};function r0(l,t,a,u,e,n,f){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(u,n,f):t.prototype&&t.prototype.isPureReactComponent?!Xu(a,u)||!Xu(e,n):!0}function b0(l,t,a,u){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,u),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,u),t.state!==l&&cc.enqueueReplaceState(t,t.state,null)}function Ga(l,t){var a=t;if("ref"in t){a={};for(var u in t)u!=="ref"&&(a[u]=t[u])}if(l=l.defaultProps){a===t&&(a=H({},a));for(var e in l)a[e]===void 0&&(a[e]=l[e])}return a}function z0(l){xe(l)}function T0(l){console.error(l)}function E0(l){xe(l)}function cn(l,t){try{var a=l.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(u){setTimeout(function(){throw u})}}function A0(l,t,a){try{var u=l.onCaughtError;u(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function ic(l,t,a){return a=na(a),a.tag=3,a.payload={element:null},a.callback=function(){cn(l,t)},a}function _0(l){return l=na(l),l.tag=3,l}function p0(l,t,a,u){var e=a.type.getDerivedStateFromError;if(typeof e=="function"){var n=u.value;l.payload=function(){return e(n)},l.callback=function(){A0(t,a,u)}}var f=a.stateNode;f!==null&&typeof f.componentDidCatch=="function"&&(l.callback=function(){A0(t,a,u),typeof e!="function"&&(va===null?va=new Set([this]):va.add(this));var c=u.stack;this.componentDidCatch(u.value,{componentStack:c!==null?c:""})})}function Jv(l,t,a,u,e){if(a.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){if(t=a.alternate,t!==null&&fu(t,a,e,!0),a=at.current,a!==null){switch(a.tag){case 31:case 13:return ht===null?zn():a.alternate===null&&gl===0&&(gl=3),a.flags&=-257,a.flags|=65536,a.lanes=e,u===We?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([u]):t.add(u),Cc(l,u,e)),!1;case 22:return a.flags|=65536,u===We?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([u])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([u]):a.add(u)),Cc(l,u,e)),!1}throw Error(v(435,a.tag))}return Cc(l,u,e),zn(),!1}if(k)return t=at.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,u!==Of&&(l=Error(v(422),{cause:u}),Vu(dt(l,a)))):(u!==Of&&(t=Error(v(423),{cause:u}),Vu(dt(t,a))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,u=dt(u,a),e=ic(l.stateNode,u,e),xf(l,e),gl!==4&&(gl=2)),!1;var n=Error(v(520),{cause:u});if(n=dt(n,a),ie===null?ie=[n]:ie.push(n),gl!==4&&(gl=2),t===null)return!0;u=dt(u,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,l=e&-e,a.lanes|=l,l=ic(a.stateNode,u,l),xf(a,l),!1;case 1:if(t=a.type,n=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(va===null||!va.has(n))))return a.flags|=65536,e&=-e,a.lanes|=e,e=_0(e),p0(e,l,a,u),xf(a,e),!1}a=a.return}while(a!==null);return!1}var sc=Error(v(461)),Al=!1;function Cl(l,t,a,u){t.child=l===null?Us(t,null,a,u):Ya(t,l.child,a,u)}function M0(l,t,a,u,e){a=a.render;var n=t.ref;if("ref"in u){var f={};for(var c in u)c!=="ref"&&(f[c]=u[c])}else f=u;return Ca(t),u=Lf(l,t,a,f,n,e),c=Kf(),l!==null&&!Al?(Jf(l,t,e),Zt(l,t,e)):(k&&c&&pf(t),t.flags|=1,Cl(l,t,u,e),t.child)}function O0(l,t,a,u,e){if(l===null){var n=a.type;return typeof n=="function"&&!Ef(n)&&n.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=n,D0(l,t,n,u,e)):(l=Ze(a.type,null,u,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!Sc(l,e)){var f=n.memoizedProps;if(a=a.compare,a=a!==null?a:Xu,a(f,u)&&l.ref===t.ref)return Zt(l,t,e)}return t.flags|=1,l=Bt(n,u),l.ref=t.ref,l.return=t,t.child=l}function D0(l,t,a,u,e){if(l!==null){var n=l.memoizedProps;if(Xu(n,u)&&l.ref===t.ref)if(Al=!1,t.pendingProps=u=n,Sc(l,e))(l.flags&131072)!==0&&(Al=!0);else return t.lanes=l.lanes,Zt(l,t,e)}return yc(l,t,a,u,e)}function U0(l,t,a,u){var e=u.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),u.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|a:a,l!==null){for(u=t.child=l.child,e=0;u!==null;)e=e|u.lanes|u.childLanes,u=u.sibling;u=e&~n}else u=0,t.child=null;return H0(l,t,n,a,u)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Je(t,n!==null?n.cachePool:null),n!==null?Rs(t,n):Xf(),Cs(t);else return u=t.lanes=536870912,H0(l,t,n!==null?n.baseLanes|a:a,a,u)}else n!==null?(Je(t,n.cachePool),Rs(t,n),ia(),t.memoizedState=null):(l!==null&&Je(t,null),Xf(),ia());return Cl(l,t,e,a),t.child}function te(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function H0(l,t,a,u,e){var n=qf();return n=n===null?null:{parent:Tl._currentValue,pool:n},t.memoizedState={baseLanes:a,cachePool:n},l!==null&&Je(t,null),Xf(),Cs(t),l!==null&&fu(l,t,u,!0),t.childLanes=e,null}function sn(l,t){return t=dn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function N0(l,t,a){return Ya(t,l.child,null,a),l=sn(t,t.pendingProps),l.flags|=2,ut(t),t.memoizedState=null,l}function wv(l,t,a){var u=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(k){if(u.mode==="hidden")return l=sn(t,u),t.lanes=536870912,te(null,l);if(Zf(t),(l=dl)?(l=Vy(l,mt),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:la!==null?{id:Ot,overflow:Dt}:null,retryLane:536870912,hydrationErrors:null},a=ms(l),a.return=t,t.child=a,Nl=t,dl=null)):l=null,l===null)throw aa(t);return t.lanes=536870912,null}return sn(t,u)}var n=l.memoizedState;if(n!==null){var f=n.dehydrated;if(Zf(t),e)if(t.flags&256)t.flags&=-257,t=N0(l,t,a);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(v(558));else if(Al||fu(l,t,a,!1),e=(a&l.childLanes)!==0,Al||e){if(u=yl,u!==null&&(f=Ti(u,a),f!==0&&f!==n.retryLane))throw n.retryLane=f,Ua(l,f),kl(u,l,f),sc;zn(),t=N0(l,t,a)}else l=n.treeContext,dl=gt(f.nextSibling),Nl=t,k=!0,ta=null,mt=!1,l!==null&&Ss(t,l),t=sn(t,u),t.flags|=4096;return t}return l=Bt(l.child,{mode:u.mode,children:u.children}),l.ref=t.ref,t.child=l,l.return=t,l}function yn(l,t){var a=t.ref;if(a===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(v(284));(l===null||l.ref!==a)&&(t.flags|=4194816)}}function yc(l,t,a,u,e){return Ca(t),a=Lf(l,t,a,u,void 0,e),u=Kf(),l!==null&&!Al?(Jf(l,t,e),Zt(l,t,e)):(k&&u&&pf(t),t.flags|=1,Cl(l,t,a,e),t.child)}function R0(l,t,a,u,e,n){return Ca(t),t.updateQueue=null,a=js(t,u,a,e),qs(l),u=Kf(),l!==null&&!Al?(Jf(l,t,n),Zt(l,t,n)):(k&&u&&pf(t),t.flags|=1,Cl(l,t,a,n),t.child)}function C0(l,t,a,u,e){if(Ca(t),t.stateNode===null){var n=au,f=a.contextType;typeof f=="object"&&f!==null&&(n=Rl(f)),n=new a(u,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=cc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=u,n.state=t.memoizedState,n.refs={},Bf(t),f=a.contextType,n.context=typeof f=="object"&&f!==null?Rl(f):au,n.state=t.memoizedState,f=a.getDerivedStateFromProps,typeof f=="function"&&(fc(t,a,f,u),n.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(f=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),f!==n.state&&cc.enqueueReplaceState(n,n.state,null),ku(t,u,n,e),$u(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),u=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,i=Ga(a,c);n.props=i;var m=n.context,S=a.contextType;f=au,typeof S=="object"&&S!==null&&(f=Rl(S));var z=a.getDerivedStateFromProps;S=typeof z=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||m!==f)&&b0(t,n,u,f),ea=!1;var h=t.memoizedState;n.state=h,ku(t,u,n,e),$u(),m=t.memoizedState,c||h!==m||ea?(typeof z=="function"&&(fc(t,a,z,u),m=t.memoizedState),(i=ea||r0(t,a,i,u,h,m,f))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=u,t.memoizedState=m),n.props=u,n.state=m,n.context=f,u=i):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),u=!1)}else{n=t.stateNode,Yf(l,t),f=t.memoizedProps,S=Ga(a,f),n.props=S,z=t.pendingProps,h=n.context,m=a.contextType,i=au,typeof m=="object"&&m!==null&&(i=Rl(m)),c=a.getDerivedStateFromProps,(m=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f!==z||h!==i)&&b0(t,n,u,i),ea=!1,h=t.memoizedState,n.state=h,ku(t,u,n,e),$u();var g=t.memoizedState;f!==z||h!==g||ea||l!==null&&l.dependencies!==null&&Le(l.dependencies)?(typeof c=="function"&&(fc(t,a,c,u),g=t.memoizedState),(S=ea||r0(t,a,S,u,h,g,i)||l!==null&&l.dependencies!==null&&Le(l.dependencies))?(m||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(u,g,i),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(u,g,i)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=u,t.memoizedState=g),n.props=u,n.state=g,n.context=i,u=S):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),u=!1)}return n=u,yn(l,t),u=(t.flags&128)!==0,n||u?(n=t.stateNode,a=u&&typeof a.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&u?(t.child=Ya(t,l.child,null,e),t.child=Ya(t,null,a,e)):Cl(l,t,a,e),t.memoizedState=n.state,l=t.child):l=Zt(l,t,e),l}function q0(l,t,a,u){return Na(),t.flags|=256,Cl(l,t,a,u),t.child}var dc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function vc(l){return{baseLanes:l,cachePool:As()}}function oc(l,t,a){return l=l!==null?l.childLanes&~a:0,t&&(l|=nt),l}function j0(l,t,a){var u=t.pendingProps,e=!1,n=(t.flags&128)!==0,f;if((f=n)||(f=l!==null&&l.memoizedState===null?!1:(rl.current&2)!==0),f&&(e=!0,t.flags&=-129),f=(t.flags&32)!==0,t.flags&=-33,l===null){if(k){if(e?ca(t):ia(),(l=dl)?(l=Vy(l,mt),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:la!==null?{id:Ot,overflow:Dt}:null,retryLane:536870912,hydrationErrors:null},a=ms(l),a.return=t,t.child=a,Nl=t,dl=null)):l=null,l===null)throw aa(t);return $c(l)?t.lanes=32:t.lanes=536870912,null}var c=u.children;return u=u.fallback,e?(ia(),e=t.mode,c=dn({mode:"hidden",children:c},e),u=Ha(u,e,a,null),c.return=t,u.return=t,c.sibling=u,t.child=c,u=t.child,u.memoizedState=vc(a),u.childLanes=oc(l,f,a),t.memoizedState=dc,te(null,u)):(ca(t),mc(t,c))}var i=l.memoizedState;if(i!==null&&(c=i.dehydrated,c!==null)){if(n)t.flags&256?(ca(t),t.flags&=-257,t=hc(l,t,a)):t.memoizedState!==null?(ia(),t.child=l.child,t.flags|=128,t=null):(ia(),c=u.fallback,e=t.mode,u=dn({mode:"visible",children:u.children},e),c=Ha(c,e,a,null),c.flags|=2,u.return=t,c.return=t,u.sibling=c,t.child=u,Ya(t,l.child,null,a),u=t.child,u.memoizedState=vc(a),u.childLanes=oc(l,f,a),t.memoizedState=dc,t=te(null,u));else if(ca(t),$c(c)){if(f=c.nextSibling&&c.nextSibling.dataset,f)var m=f.dgst;f=m,u=Error(v(419)),u.stack="",u.digest=f,Vu({value:u,source:null,stack:null}),t=hc(l,t,a)}else if(Al||fu(l,t,a,!1),f=(a&l.childLanes)!==0,Al||f){if(f=yl,f!==null&&(u=Ti(f,a),u!==0&&u!==i.retryLane))throw i.retryLane=u,Ua(l,u),kl(f,l,u),sc;Wc(c)||zn(),t=hc(l,t,a)}else Wc(c)?(t.flags|=192,t.child=l.child,t=null):(l=i.treeContext,dl=gt(c.nextSibling),Nl=t,k=!0,ta=null,mt=!1,l!==null&&Ss(t,l),t=mc(t,u.children),t.flags|=4096);return t}return e?(ia(),c=u.fallback,e=t.mode,i=l.child,m=i.sibling,u=Bt(i,{mode:"hidden",children:u.children}),u.subtreeFlags=i.subtreeFlags&65011712,m!==null?c=Bt(m,c):(c=Ha(c,e,a,null),c.flags|=2),c.return=t,u.return=t,u.sibling=c,t.child=u,te(null,u),u=t.child,c=l.child.memoizedState,c===null?c=vc(a):(e=c.cachePool,e!==null?(i=Tl._currentValue,e=e.parent!==i?{parent:i,pool:i}:e):e=As(),c={baseLanes:c.baseLanes|a,cachePool:e}),u.memoizedState=c,u.childLanes=oc(l,f,a),t.memoizedState=dc,te(l.child,u)):(ca(t),a=l.child,l=a.sibling,a=Bt(a,{mode:"visible",children:u.children}),a.return=t,a.sibling=null,l!==null&&(f=t.deletions,f===null?(t.deletions=[l],t.flags|=16):f.push(l)),t.child=a,t.memoizedState=null,a)}function mc(l,t){return t=dn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function dn(l,t){return l=tt(22,l,null,t),l.lanes=0,l}function hc(l,t,a){return Ya(t,l.child,null,a),l=mc(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function B0(l,t,a){l.lanes|=t;var u=l.alternate;u!==null&&(u.lanes|=t),Hf(l.return,t,a)}function gc(l,t,a,u,e,n){var f=l.memoizedState;f===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:u,tail:a,tailMode:e,treeForkCount:n}:(f.isBackwards=t,f.rendering=null,f.renderingStartTime=0,f.last=u,f.tail=a,f.tailMode=e,f.treeForkCount=n)}function Y0(l,t,a){var u=t.pendingProps,e=u.revealOrder,n=u.tail;u=u.children;var f=rl.current,c=(f&2)!==0;if(c?(f=f&1|2,t.flags|=128):f&=1,p(rl,f),Cl(l,t,u,a),u=k?Zu:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&B0(l,a,t);else if(l.tag===19)B0(l,a,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(a=t.child,e=null;a!==null;)l=a.alternate,l!==null&&Ie(l)===null&&(e=a),a=a.sibling;a=e,a===null?(e=t.child,t.child=null):(e=a.sibling,a.sibling=null),gc(t,!1,e,a,n,u);break;case"backwards":case"unstable_legacy-backwards":for(a=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&Ie(l)===null){t.child=e;break}l=e.sibling,e.sibling=a,a=e,e=l}gc(t,!0,a,null,n,u);break;case"together":gc(t,!1,null,null,void 0,u);break;default:t.memoizedState=null}return t.child}function Zt(l,t,a){if(l!==null&&(t.dependencies=l.dependencies),da|=t.lanes,(a&t.childLanes)===0)if(l!==null){if(fu(l,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(v(153));if(t.child!==null){for(l=t.child,a=Bt(l,l.pendingProps),t.child=a,a.return=t;l.sibling!==null;)l=l.sibling,a=a.sibling=Bt(l,l.pendingProps),a.return=t;a.sibling=null}return t.child}function Sc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&Le(l)))}function Wv(l,t,a){switch(t.tag){case 3:xl(t,t.stateNode.containerInfo),ua(t,Tl,l.memoizedState.cache),Na();break;case 27:case 5:Ou(t);break;case 4:xl(t,t.stateNode.containerInfo);break;case 10:ua(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Zf(t),null;break;case 13:var u=t.memoizedState;if(u!==null)return u.dehydrated!==null?(ca(t),t.flags|=128,null):(a&t.child.childLanes)!==0?j0(l,t,a):(ca(t),l=Zt(l,t,a),l!==null?l.sibling:null);ca(t);break;case 19:var e=(l.flags&128)!==0;if(u=(a&t.childLanes)!==0,u||(fu(l,t,a,!1),u=(a&t.childLanes)!==0),e){if(u)return Y0(l,t,a);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),p(rl,rl.current),u)break;return null;case 22:return t.lanes=0,U0(l,t,a,t.pendingProps);case 24:ua(t,Tl,l.memoizedState.cache)}return Zt(l,t,a)}function x0(l,t,a){if(l!==null)if(l.memoizedProps!==t.pendingProps)Al=!0;else{if(!Sc(l,a)&&(t.flags&128)===0)return Al=!1,Wv(l,t,a);Al=(l.flags&131072)!==0}else Al=!1,k&&(t.flags&1048576)!==0&&gs(t,Zu,t.index);switch(t.lanes=0,t.tag){case 16:l:{var u=t.pendingProps;if(l=ja(t.elementType),t.type=l,typeof l=="function")Ef(l)?(u=Ga(l,u),t.tag=1,t=C0(null,t,l,u,a)):(t.tag=0,t=yc(null,t,l,u,a));else{if(l!=null){var e=l.$$typeof;if(e===ct){t.tag=11,t=M0(null,t,l,u,a);break l}else if(e===$){t.tag=14,t=O0(null,t,l,u,a);break l}}throw t=Rt(l)||l,Error(v(306,t,""))}}return t;case 0:return yc(l,t,t.type,t.pendingProps,a);case 1:return u=t.type,e=Ga(u,t.pendingProps),C0(l,t,u,e,a);case 3:l:{if(xl(t,t.stateNode.containerInfo),l===null)throw Error(v(387));u=t.pendingProps;var n=t.memoizedState;e=n.element,Yf(l,t),ku(t,u,null,a);var f=t.memoizedState;if(u=f.cache,ua(t,Tl,u),u!==n.cache&&Nf(t,[Tl],a,!0),$u(),u=f.element,n.isDehydrated)if(n={element:u,isDehydrated:!1,cache:f.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=q0(l,t,u,a);break l}else if(u!==e){e=dt(Error(v(424)),t),Vu(e),t=q0(l,t,u,a);break l}else{switch(l=t.stateNode.containerInfo,l.nodeType){case 9:l=l.body;break;default:l=l.nodeName==="HTML"?l.ownerDocument.body:l}for(dl=gt(l.firstChild),Nl=t,k=!0,ta=null,mt=!0,a=Us(t,null,u,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling}else{if(Na(),u===e){t=Zt(l,t,a);break l}Cl(l,t,u,a)}t=t.child}return t;case 26:return yn(l,t),l===null?(a=$y(t.type,null,t.pendingProps,null))?t.memoizedState=a:k||(a=t.type,l=t.pendingProps,u=On(L.current).createElement(a),u[Hl]=t,u[Ll]=l,ql(u,a,l),Dl(u),t.stateNode=u):t.memoizedState=$y(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return Ou(t),l===null&&k&&(u=t.stateNode=Jy(t.type,t.pendingProps,L.current),Nl=t,mt=!0,e=dl,ga(t.type)?(kc=e,dl=gt(u.firstChild)):dl=e),Cl(l,t,t.pendingProps.children,a),yn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&k&&((e=u=dl)&&(u=_1(u,t.type,t.pendingProps,mt),u!==null?(t.stateNode=u,Nl=t,dl=gt(u.firstChild),mt=!1,e=!0):e=!1),e||aa(t)),Ou(t),e=t.type,n=t.pendingProps,f=l!==null?l.memoizedProps:null,u=n.children,Kc(e,n)?u=null:f!==null&&Kc(e,f)&&(t.flags|=32),t.memoizedState!==null&&(e=Lf(l,t,Gv,null,null,a),ge._currentValue=e),yn(l,t),Cl(l,t,u,a),t.child;case 6:return l===null&&k&&((l=a=dl)&&(a=p1(a,t.pendingProps,mt),a!==null?(t.stateNode=a,Nl=t,dl=null,l=!0):l=!1),l||aa(t)),null;case 13:return j0(l,t,a);case 4:return xl(t,t.stateNode.containerInfo),u=t.pendingProps,l===null?t.child=Ya(t,null,u,a):Cl(l,t,u,a),t.child;case 11:return M0(l,t,t.type,t.pendingProps,a);case 7:return Cl(l,t,t.pendingProps,a),t.child;case 8:return Cl(l,t,t.pendingProps.children,a),t.child;case 12:return Cl(l,t,t.pendingProps.children,a),t.child;case 10:return u=t.pendingProps,ua(t,t.type,u.value),Cl(l,t,u.children,a),t.child;case 9:return e=t.type._context,u=t.pendingProps.children,Ca(t),e=Rl(e),u=u(e),t.flags|=1,Cl(l,t,u,a),t.child;case 14:return O0(l,t,t.type,t.pendingProps,a);case 15:return D0(l,t,t.type,t.pendingProps,a);case 19:return Y0(l,t,a);case 31:return wv(l,t,a);case 22:return U0(l,t,a,t.pendingProps);case 24:return Ca(t),u=Rl(Tl),l===null?(e=qf(),e===null&&(e=yl,n=Rf(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=a),e=n),t.memoizedState={parent:u,cache:e},Bf(t),ua(t,Tl,e)):((l.lanes&a)!==0&&(Yf(l,t),ku(t,null,null,a),$u()),e=l.memoizedState,n=t.memoizedState,e.parent!==u?(e={parent:u,cache:u},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),ua(t,Tl,u)):(u=n.cache,ua(t,Tl,u),u!==e.cache&&Nf(t,[Tl],a,!0))),Cl(l,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(v(156,t.tag))}function Vt(l){l.flags|=4}function rc(l,t,a,u,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(dy())l.flags|=8192;else throw Ba=We,jf}else l.flags&=-16777217}function G0(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!ld(t))if(dy())l.flags|=8192;else throw Ba=We,jf}function vn(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?ri():536870912,l.lanes|=t,ru|=t)}function ae(l,t){if(!k)switch(l.tailMode){case"hidden":t=l.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?l.tail=null:a.sibling=null;break;case"collapsed":a=l.tail;for(var u=null;a!==null;)a.alternate!==null&&(u=a),a=a.sibling;u===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:u.sibling=null}}function vl(l){var t=l.alternate!==null&&l.alternate.child===l.child,a=0,u=0;if(t)for(var e=l.child;e!==null;)a|=e.lanes|e.childLanes,u|=e.subtreeFlags&65011712,u|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)a|=e.lanes|e.childLanes,u|=e.subtreeFlags,u|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=u,l.childLanes=a,t}function $v(l,t,a){var u=t.pendingProps;switch(Mf(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return vl(t),null;case 1:return vl(t),null;case 3:return a=t.stateNode,u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Gt(Tl),Sl(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(l===null||l.child===null)&&(nu(t)?Vt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Df())),vl(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(Vt(t),n!==null?(vl(t),G0(t,n)):(vl(t),rc(t,e,null,u,a))):n?n!==l.memoizedState?(Vt(t),vl(t),G0(t,n)):(vl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==u&&Vt(t),vl(t),rc(t,e,l,u,a)),null;case 27:if(Ee(t),a=L.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==u&&Vt(t);else{if(!u){if(t.stateNode===null)throw Error(v(166));return vl(t),null}l=O.current,nu(t)?rs(t):(l=Jy(e,u,a),t.stateNode=l,Vt(t))}return vl(t),null;case 5:if(Ee(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==u&&Vt(t);else{if(!u){if(t.stateNode===null)throw Error(v(166));return vl(t),null}if(n=O.current,nu(t))rs(t);else{var f=On(L.current);switch(n){case 1:n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=f.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof u.is=="string"?f.createElement("select",{is:u.is}):f.createElement("select"),u.multiple?n.multiple=!0:u.size&&(n.size=u.size);break;default:n=typeof u.is=="string"?f.createElement(e,{is:u.is}):f.createElement(e)}}n[Hl]=t,n[Ll]=u;l:for(f=t.child;f!==null;){if(f.tag===5||f.tag===6)n.appendChild(f.stateNode);else if(f.tag!==4&&f.tag!==27&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===t)break l;for(;f.sibling===null;){if(f.return===null||f.return===t)break l;f=f.return}f.sibling.return=f.return,f=f.sibling}t.stateNode=n;l:switch(ql(n,e,u),e){case"button":case"input":case"select":case"textarea":u=!!u.autoFocus;break l;case"img":u=!0;break l;default:u=!1}u&&Vt(t)}}return vl(t),rc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,a),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==u&&Vt(t);else{if(typeof u!="string"&&t.stateNode===null)throw Error(v(166));if(l=L.current,nu(t)){if(l=t.stateNode,a=t.memoizedProps,u=null,e=Nl,e!==null)switch(e.tag){case 27:case 5:u=e.memoizedProps}l[Hl]=t,l=!!(l.nodeValue===a||u!==null&&u.suppressHydrationWarning===!0||jy(l.nodeValue,a)),l||aa(t,!0)}else l=On(l).createTextNode(u),l[Hl]=t,t.stateNode=l}return vl(t),null;case 31:if(a=t.memoizedState,l===null||l.memoizedState!==null){if(u=nu(t),a!==null){if(l===null){if(!u)throw Error(v(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(v(557));l[Hl]=t}else Na(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;vl(t),l=!1}else a=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=a),l=!0;if(!l)return t.flags&256?(ut(t),t):(ut(t),null);if((t.flags&128)!==0)throw Error(v(558))}return vl(t),null;case 13:if(u=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=nu(t),u!==null&&u.dehydrated!==null){if(l===null){if(!e)throw Error(v(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(v(317));e[Hl]=t}else Na(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;vl(t),e=!1}else e=Df(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(ut(t),t):(ut(t),null)}return ut(t),(t.flags&128)!==0?(t.lanes=a,t):(a=u!==null,l=l!==null&&l.memoizedState!==null,a&&(u=t.child,e=null,u.alternate!==null&&u.alternate.memoizedState!==null&&u.alternate.memoizedState.cachePool!==null&&(e=u.alternate.memoizedState.cachePool.pool),n=null,u.memoizedState!==null&&u.memoizedState.cachePool!==null&&(n=u.memoizedState.cachePool.pool),n!==e&&(u.flags|=2048)),a!==l&&a&&(t.child.flags|=8192),vn(t,t.updateQueue),vl(t),null);case 4:return Sl(),l===null&&Xc(t.stateNode.containerInfo),vl(t),null;case 10:return Gt(t.type),vl(t),null;case 19:if(E(rl),u=t.memoizedState,u===null)return vl(t),null;if(e=(t.flags&128)!==0,n=u.rendering,n===null)if(e)ae(u,!1);else{if(gl!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=Ie(l),n!==null){for(t.flags|=128,ae(u,!1),l=n.updateQueue,t.updateQueue=l,vn(t,l),t.subtreeFlags=0,l=a,a=t.child;a!==null;)os(a,l),a=a.sibling;return p(rl,rl.current&1|2),k&&Yt(t,u.treeForkCount),t.child}l=l.sibling}u.tail!==null&&Fl()>Sn&&(t.flags|=128,e=!0,ae(u,!1),t.lanes=4194304)}else{if(!e)if(l=Ie(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,vn(t,l),ae(u,!0),u.tail===null&&u.tailMode==="hidden"&&!n.alternate&&!k)return vl(t),null}else 2*Fl()-u.renderingStartTime>Sn&&a!==536870912&&(t.flags|=128,e=!0,ae(u,!1),t.lanes=4194304);u.isBackwards?(n.sibling=t.child,t.child=n):(l=u.last,l!==null?l.sibling=n:t.child=n,u.last=n)}return u.tail!==null?(l=u.tail,u.rendering=l,u.tail=l.sibling,u.renderingStartTime=Fl(),l.sibling=null,a=rl.current,p(rl,e?a&1|2:a&1),k&&Yt(t,u.treeForkCount),l):(vl(t),null);case 22:case 23:return ut(t),Qf(),u=t.memoizedState!==null,l!==null?l.memoizedState!==null!==u&&(t.flags|=8192):u&&(t.flags|=8192),u?(a&536870912)!==0&&(t.flags&128)===0&&(vl(t),t.subtreeFlags&6&&(t.flags|=8192)):vl(t),a=t.updateQueue,a!==null&&vn(t,a.retryQueue),a=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),u=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(u=t.memoizedState.cachePool.pool),u!==a&&(t.flags|=2048),l!==null&&E(qa),null;case 24:return a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Gt(Tl),vl(t),null;case 25:return null;case 30:return null}throw Error(v(156,t.tag))}function kv(l,t){switch(Mf(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Gt(Tl),Sl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return Ee(t),null;case 31:if(t.memoizedState!==null){if(ut(t),t.alternate===null)throw Error(v(340));Na()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(ut(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(v(340));Na()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return E(rl),null;case 4:return Sl(),null;case 10:return Gt(t.type),null;case 22:case 23:return ut(t),Qf(),l!==null&&E(qa),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Gt(Tl),null;case 25:return null;default:return null}}function X0(l,t){switch(Mf(t),t.tag){case 3:Gt(Tl),Sl();break;case 26:case 27:case 5:Ee(t);break;case 4:Sl();break;case 31:t.memoizedState!==null&&ut(t);break;case 13:ut(t);break;case 19:E(rl);break;case 10:Gt(t.type);break;case 22:case 23:ut(t),Qf(),l!==null&&E(qa);break;case 24:Gt(Tl)}}function ue(l,t){try{var a=t.updateQueue,u=a!==null?a.lastEffect:null;if(u!==null){var e=u.next;a=e;do{if((a.tag&l)===l){u=void 0;var n=a.create,f=a.inst;u=n(),f.destroy=u}a=a.next}while(a!==e)}}catch(c){ul(t,t.return,c)}}function sa(l,t,a){try{var u=t.updateQueue,e=u!==null?u.lastEffect:null;if(e!==null){var n=e.next;u=n;do{if((u.tag&l)===l){var f=u.inst,c=f.destroy;if(c!==void 0){f.destroy=void 0,e=t;var i=a,m=c;try{m()}catch(S){ul(e,i,S)}}}u=u.next}while(u!==n)}}catch(S){ul(t,t.return,S)}}function Q0(l){var t=l.updateQueue;if(t!==null){var a=l.stateNode;try{Ns(t,a)}catch(u){ul(l,l.return,u)}}}function Z0(l,t,a){a.props=Ga(l.type,l.memoizedProps),a.state=l.memoizedState;try{a.componentWillUnmount()}catch(u){ul(l,t,u)}}function ee(l,t){try{var a=l.ref;if(a!==null){switch(l.tag){case 26:case 27:case 5:var u=l.stateNode;break;case 30:u=l.stateNode;break;default:u=l.stateNode}typeof a=="function"?l.refCleanup=a(u):a.current=u}}catch(e){ul(l,t,e)}}function Ut(l,t){var a=l.ref,u=l.refCleanup;if(a!==null)if(typeof u=="function")try{u()}catch(e){ul(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(e){ul(l,t,e)}else a.current=null}function V0(l){var t=l.type,a=l.memoizedProps,u=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&u.focus();break l;case"img":a.src?u.src=a.src:a.srcSet&&(u.srcset=a.srcSet)}}catch(e){ul(l,l.return,e)}}function bc(l,t,a){try{var u=l.stateNode;r1(u,l.type,a,t),u[Ll]=t}catch(e){ul(l,l.return,e)}}function L0(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&ga(l.type)||l.tag===4}function zc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||L0(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&ga(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function Tc(l,t,a){var u=l.tag;if(u===5||u===6)l=l.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(l,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(l),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=qt));else if(u!==4&&(u===27&&ga(l.type)&&(a=l.stateNode,t=null),l=l.child,l!==null))for(Tc(l,t,a),l=l.sibling;l!==null;)Tc(l,t,a),l=l.sibling}function on(l,t,a){var u=l.tag;if(u===5||u===6)l=l.stateNode,t?a.insertBefore(l,t):a.appendChild(l);else if(u!==4&&(u===27&&ga(l.type)&&(a=l.stateNode),l=l.child,l!==null))for(on(l,t,a),l=l.sibling;l!==null;)on(l,t,a),l=l.sibling}function K0(l){var t=l.stateNode,a=l.memoizedProps;try{for(var u=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);ql(t,u,a),t[Hl]=l,t[Ll]=a}catch(n){ul(l,l.return,n)}}var Lt=!1,_l=!1,Ec=!1,J0=typeof WeakSet=="function"?WeakSet:Set,Ul=null;function Fv(l,t){if(l=l.containerInfo,Vc=qn,l=es(l),hf(l)){if("selectionStart"in l)var a={start:l.selectionStart,end:l.selectionEnd};else l:{a=(a=l.ownerDocument)&&a.defaultView||window;var u=a.getSelection&&a.getSelection();if(u&&u.rangeCount!==0){a=u.anchorNode;var e=u.anchorOffset,n=u.focusNode;u=u.focusOffset;try{a.nodeType,n.nodeType}catch{a=null;break l}var f=0,c=-1,i=-1,m=0,S=0,z=l,h=null;t:for(;;){for(var g;z!==a||e!==0&&z.nodeType!==3||(c=f+e),z!==n||u!==0&&z.nodeType!==3||(i=f+u),z.nodeType===3&&(f+=z.nodeValue.length),(g=z.firstChild)!==null;)h=z,z=g;for(;;){if(z===l)break t;if(h===a&&++m===e&&(c=f),h===n&&++S===u&&(i=f),(g=z.nextSibling)!==null)break;z=h,h=z.parentNode}z=g}a=c===-1||i===-1?null:{start:c,end:i}}else a=null}a=a||{start:0,end:0}}else a=null;for(Lc={focusedElem:l,selectionRange:a},qn=!1,Ul=t;Ul!==null;)if(t=Ul,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Ul=l;else for(;Ul!==null;){switch(t=Ul,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(a=0;a<l.length;a++)e=l[a],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,a=t,e=n.memoizedProps,n=n.memoizedState,u=a.stateNode;try{var M=Ga(a.type,e);l=u.getSnapshotBeforeUpdate(M,n),u.__reactInternalSnapshotBeforeUpdate=l}catch(C){ul(a,a.return,C)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,a=l.nodeType,a===9)wc(l);else if(a===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":wc(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(v(163))}if(l=t.sibling,l!==null){l.return=t.return,Ul=l;break}Ul=t.return}}function w0(l,t,a){var u=a.flags;switch(a.tag){case 0:case 11:case 15:Jt(l,a),u&4&&ue(5,a);break;case 1:if(Jt(l,a),u&4)if(l=a.stateNode,t===null)try{l.componentDidMount()}catch(f){ul(a,a.return,f)}else{var e=Ga(a.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(f){ul(a,a.return,f)}}u&64&&Q0(a),u&512&&ee(a,a.return);break;case 3:if(Jt(l,a),u&64&&(l=a.updateQueue,l!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{Ns(l,t)}catch(f){ul(a,a.return,f)}}break;case 27:t===null&&u&4&&K0(a);case 26:case 5:Jt(l,a),t===null&&u&4&&V0(a),u&512&&ee(a,a.return);break;case 12:Jt(l,a);break;case 31:Jt(l,a),u&4&&k0(l,a);break;case 13:Jt(l,a),u&4&&F0(l,a),u&64&&(l=a.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(a=f1.bind(null,a),M1(l,a))));break;case 22:if(u=a.memoizedState!==null||Lt,!u){t=t!==null&&t.memoizedState!==null||_l,e=Lt;var n=_l;Lt=u,(_l=t)&&!n?wt(l,a,(a.subtreeFlags&8772)!==0):Jt(l,a),Lt=e,_l=n}break;case 30:break;default:Jt(l,a)}}function W0(l){var t=l.alternate;t!==null&&(l.alternate=null,W0(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&Fn(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var ol=null,Jl=!1;function Kt(l,t,a){for(a=a.child;a!==null;)$0(l,t,a),a=a.sibling}function $0(l,t,a){if(Il&&typeof Il.onCommitFiberUnmount=="function")try{Il.onCommitFiberUnmount(Du,a)}catch{}switch(a.tag){case 26:_l||Ut(a,t),Kt(l,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:_l||Ut(a,t);var u=ol,e=Jl;ga(a.type)&&(ol=a.stateNode,Jl=!1),Kt(l,t,a),oe(a.stateNode),ol=u,Jl=e;break;case 5:_l||Ut(a,t);case 6:if(u=ol,e=Jl,ol=null,Kt(l,t,a),ol=u,Jl=e,ol!==null)if(Jl)try{(ol.nodeType===9?ol.body:ol.nodeName==="HTML"?ol.ownerDocument.body:ol).removeChild(a.stateNode)}catch(n){ul(a,t,n)}else try{ol.removeChild(a.stateNode)}catch(n){ul(a,t,n)}break;case 18:ol!==null&&(Jl?(l=ol,Qy(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,a.stateNode),Mu(l)):Qy(ol,a.stateNode));break;case 4:u=ol,e=Jl,ol=a.stateNode.containerInfo,Jl=!0,Kt(l,t,a),ol=u,Jl=e;break;case 0:case 11:case 14:case 15:sa(2,a,t),_l||sa(4,a,t),Kt(l,t,a);break;case 1:_l||(Ut(a,t),u=a.stateNode,typeof u.componentWillUnmount=="function"&&Z0(a,t,u)),Kt(l,t,a);break;case 21:Kt(l,t,a);break;case 22:_l=(u=_l)||a.memoizedState!==null,Kt(l,t,a),_l=u;break;default:Kt(l,t,a)}}function k0(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{Mu(l)}catch(a){ul(t,t.return,a)}}}function F0(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{Mu(l)}catch(a){ul(t,t.return,a)}}function Iv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new J0),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new J0),t;default:throw Error(v(435,l.tag))}}function mn(l,t){var a=Iv(l);t.forEach(function(u){if(!a.has(u)){a.add(u);var e=c1.bind(null,l,u);u.then(e,e)}})}function wl(l,t){var a=t.deletions;if(a!==null)for(var u=0;u<a.length;u++){var e=a[u],n=l,f=t,c=f;l:for(;c!==null;){switch(c.tag){case 27:if(ga(c.type)){ol=c.stateNode,Jl=!1;break l}break;case 5:ol=c.stateNode,Jl=!1;break l;case 3:case 4:ol=c.stateNode.containerInfo,Jl=!0;break l}c=c.return}if(ol===null)throw Error(v(160));$0(n,f,e),ol=null,Jl=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)I0(t,l),t=t.sibling}var Tt=null;function I0(l,t){var a=l.alternate,u=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:wl(t,l),Wl(l),u&4&&(sa(3,l,l.return),ue(3,l),sa(5,l,l.return));break;case 1:wl(t,l),Wl(l),u&512&&(_l||a===null||Ut(a,a.return)),u&64&&Lt&&(l=l.updateQueue,l!==null&&(u=l.callbacks,u!==null&&(a=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=a===null?u:a.concat(u))));break;case 26:var e=Tt;if(wl(t,l),Wl(l),u&512&&(_l||a===null||Ut(a,a.return)),u&4){var n=a!==null?a.memoizedState:null;if(u=l.memoizedState,a===null)if(u===null)if(l.stateNode===null){l:{u=l.type,a=l.memoizedProps,e=e.ownerDocument||e;t:switch(u){case"title":n=e.getElementsByTagName("title")[0],(!n||n[Nu]||n[Hl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(u),e.head.insertBefore(n,e.querySelector("head > title"))),ql(n,u,a),n[Hl]=l,Dl(n),u=n;break l;case"link":var f=Iy("link","href",e).get(u+(a.href||""));if(f){for(var c=0;c<f.length;c++)if(n=f[c],n.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&n.getAttribute("rel")===(a.rel==null?null:a.rel)&&n.getAttribute("title")===(a.title==null?null:a.title)&&n.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){f.splice(c,1);break t}}n=e.createElement(u),ql(n,u,a),e.head.appendChild(n);break;case"meta":if(f=Iy("meta","content",e).get(u+(a.content||""))){for(c=0;c<f.length;c++)if(n=f[c],n.getAttribute("content")===(a.content==null?null:""+a.content)&&n.getAttribute("name")===(a.name==null?null:a.name)&&n.getAttribute("property")===(a.property==null?null:a.property)&&n.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&n.getAttribute("charset")===(a.charSet==null?null:a.charSet)){f.splice(c,1);break t}}n=e.createElement(u),ql(n,u,a),e.head.appendChild(n);break;default:throw Error(v(468,u))}n[Hl]=l,Dl(n),u=n}l.stateNode=u}else Py(e,l.type,l.stateNode);else l.stateNode=Fy(e,u,l.memoizedProps);else n!==u?(n===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):n.count--,u===null?Py(e,l.type,l.stateNode):Fy(e,u,l.memoizedProps)):u===null&&l.stateNode!==null&&bc(l,l.memoizedProps,a.memoizedProps)}break;case 27:wl(t,l),Wl(l),u&512&&(_l||a===null||Ut(a,a.return)),a!==null&&u&4&&bc(l,l.memoizedProps,a.memoizedProps);break;case 5:if(wl(t,l),Wl(l),u&512&&(_l||a===null||Ut(a,a.return)),l.flags&32){e=l.stateNode;try{$a(e,"")}catch(M){ul(l,l.return,M)}}u&4&&l.stateNode!=null&&(e=l.memoizedProps,bc(l,e,a!==null?a.memoizedProps:e)),u&1024&&(Ec=!0);break;case 6:if(wl(t,l),Wl(l),u&4){if(l.stateNode===null)throw Error(v(162));u=l.memoizedProps,a=l.stateNode;try{a.nodeValue=u}catch(M){ul(l,l.return,M)}}break;case 3:if(Hn=null,e=Tt,Tt=Dn(t.containerInfo),wl(t,l),Tt=e,Wl(l),u&4&&a!==null&&a.memoizedState.isDehydrated)try{Mu(t.containerInfo)}catch(M){ul(l,l.return,M)}Ec&&(Ec=!1,P0(l));break;case 4:u=Tt,Tt=Dn(l.stateNode.containerInfo),wl(t,l),Wl(l),Tt=u;break;case 12:wl(t,l),Wl(l);break;case 31:wl(t,l),Wl(l),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,mn(l,u)));break;case 13:wl(t,l),Wl(l),l.child.flags&8192&&l.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(gn=Fl()),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,mn(l,u)));break;case 22:e=l.memoizedState!==null;var i=a!==null&&a.memoizedState!==null,m=Lt,S=_l;if(Lt=m||e,_l=S||i,wl(t,l),_l=S,Lt=m,Wl(l),u&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(a===null||i||Lt||_l||Xa(l)),a=null,t=l;;){if(t.tag===5||t.tag===26){if(a===null){i=a=t;try{if(n=i.stateNode,e)f=n.style,typeof f.setProperty=="function"?f.setProperty("display","none","important"):f.display="none";else{c=i.stateNode;var z=i.memoizedProps.style,h=z!=null&&z.hasOwnProperty("display")?z.display:null;c.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(M){ul(i,i.return,M)}}}else if(t.tag===6){if(a===null){i=t;try{i.stateNode.nodeValue=e?"":i.memoizedProps}catch(M){ul(i,i.return,M)}}}else if(t.tag===18){if(a===null){i=t;try{var g=i.stateNode;e?Zy(g,!0):Zy(i.stateNode,!1)}catch(M){ul(i,i.return,M)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}u&4&&(u=l.updateQueue,u!==null&&(a=u.retryQueue,a!==null&&(u.retryQueue=null,mn(l,a))));break;case 19:wl(t,l),Wl(l),u&4&&(u=l.updateQueue,u!==null&&(l.updateQueue=null,mn(l,u)));break;case 30:break;case 21:break;default:wl(t,l),Wl(l)}}function Wl(l){var t=l.flags;if(t&2){try{for(var a,u=l.return;u!==null;){if(L0(u)){a=u;break}u=u.return}if(a==null)throw Error(v(160));switch(a.tag){case 27:var e=a.stateNode,n=zc(l);on(l,n,e);break;case 5:var f=a.stateNode;a.flags&32&&($a(f,""),a.flags&=-33);var c=zc(l);on(l,c,f);break;case 3:case 4:var i=a.stateNode.containerInfo,m=zc(l);Tc(l,m,i);break;default:throw Error(v(161))}}catch(S){ul(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function P0(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;P0(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function Jt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)w0(l,t.alternate,t),t=t.sibling}function Xa(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:sa(4,t,t.return),Xa(t);break;case 1:Ut(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&Z0(t,t.return,a),Xa(t);break;case 27:oe(t.stateNode);case 26:case 5:Ut(t,t.return),Xa(t);break;case 22:t.memoizedState===null&&Xa(t);break;case 30:Xa(t);break;default:Xa(t)}l=l.sibling}}function wt(l,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var u=t.alternate,e=l,n=t,f=n.flags;switch(n.tag){case 0:case 11:case 15:wt(e,n,a),ue(4,n);break;case 1:if(wt(e,n,a),u=n,e=u.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(m){ul(u,u.return,m)}if(u=n,e=u.updateQueue,e!==null){var c=u.stateNode;try{var i=e.shared.hiddenCallbacks;if(i!==null)for(e.shared.hiddenCallbacks=null,e=0;e<i.length;e++)Hs(i[e],c)}catch(m){ul(u,u.return,m)}}a&&f&64&&Q0(n),ee(n,n.return);break;case 27:K0(n);case 26:case 5:wt(e,n,a),a&&u===null&&f&4&&V0(n),ee(n,n.return);break;case 12:wt(e,n,a);break;case 31:wt(e,n,a),a&&f&4&&k0(e,n);break;case 13:wt(e,n,a),a&&f&4&&F0(e,n);break;case 22:n.memoizedState===null&&wt(e,n,a),ee(n,n.return);break;case 30:break;default:wt(e,n,a)}t=t.sibling}}function Ac(l,t){var a=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(l!=null&&l.refCount++,a!=null&&Lu(a))}function _c(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Lu(l))}function Et(l,t,a,u){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)ly(l,t,a,u),t=t.sibling}function ly(l,t,a,u){var e=t.flags;switch(t.tag){case 0:case 11:case 15:Et(l,t,a,u),e&2048&&ue(9,t);break;case 1:Et(l,t,a,u);break;case 3:Et(l,t,a,u),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Lu(l)));break;case 12:if(e&2048){Et(l,t,a,u),l=t.stateNode;try{var n=t.memoizedProps,f=n.id,c=n.onPostCommit;typeof c=="function"&&c(f,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(i){ul(t,t.return,i)}}else Et(l,t,a,u);break;case 31:Et(l,t,a,u);break;case 13:Et(l,t,a,u);break;case 23:break;case 22:n=t.stateNode,f=t.alternate,t.memoizedState!==null?n._visibility&2?Et(l,t,a,u):ne(l,t):n._visibility&2?Et(l,t,a,u):(n._visibility|=2,hu(l,t,a,u,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Ac(f,t);break;case 24:Et(l,t,a,u),e&2048&&_c(t.alternate,t);break;default:Et(l,t,a,u)}}function hu(l,t,a,u,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,f=t,c=a,i=u,m=f.flags;switch(f.tag){case 0:case 11:case 15:hu(n,f,c,i,e),ue(8,f);break;case 23:break;case 22:var S=f.stateNode;f.memoizedState!==null?S._visibility&2?hu(n,f,c,i,e):ne(n,f):(S._visibility|=2,hu(n,f,c,i,e)),e&&m&2048&&Ac(f.alternate,f);break;case 24:hu(n,f,c,i,e),e&&m&2048&&_c(f.alternate,f);break;default:hu(n,f,c,i,e)}t=t.sibling}}function ne(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=l,u=t,e=u.flags;switch(u.tag){case 22:ne(a,u),e&2048&&Ac(u.alternate,u);break;case 24:ne(a,u),e&2048&&_c(u.alternate,u);break;default:ne(a,u)}t=t.sibling}}var fe=8192;function gu(l,t,a){if(l.subtreeFlags&fe)for(l=l.child;l!==null;)ty(l,t,a),l=l.sibling}function ty(l,t,a){switch(l.tag){case 26:gu(l,t,a),l.flags&fe&&l.memoizedState!==null&&x1(a,Tt,l.memoizedState,l.memoizedProps);break;case 5:gu(l,t,a);break;case 3:case 4:var u=Tt;Tt=Dn(l.stateNode.containerInfo),gu(l,t,a),Tt=u;break;case 22:l.memoizedState===null&&(u=l.alternate,u!==null&&u.memoizedState!==null?(u=fe,fe=16777216,gu(l,t,a),fe=u):gu(l,t,a));break;default:gu(l,t,a)}}function ay(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function ce(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var u=t[a];Ul=u,ey(u,l)}ay(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)uy(l),l=l.sibling}function uy(l){switch(l.tag){case 0:case 11:case 15:ce(l),l.flags&2048&&sa(9,l,l.return);break;case 3:ce(l);break;case 12:ce(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,hn(l)):ce(l);break;default:ce(l)}}function hn(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var u=t[a];Ul=u,ey(u,l)}ay(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:sa(8,t,t.return),hn(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,hn(t));break;default:hn(t)}l=l.sibling}}function ey(l,t){for(;Ul!==null;){var a=Ul;switch(a.tag){case 0:case 11:case 15:sa(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var u=a.memoizedState.cachePool.pool;u!=null&&u.refCount++}break;case 24:Lu(a.memoizedState.cache)}if(u=a.child,u!==null)u.return=a,Ul=u;else l:for(a=l;Ul!==null;){u=Ul;var e=u.sibling,n=u.return;if(W0(u),u===a){Ul=null;break l}if(e!==null){e.return=n,Ul=e;break l}Ul=n}}}var Pv={getCacheForType:function(l){var t=Rl(Tl),a=t.data.get(l);return a===void 0&&(a=l(),t.data.set(l,a)),a},cacheSignal:function(){return Rl(Tl).controller.signal}},l1=typeof WeakMap=="function"?WeakMap:Map,P=0,yl=null,K=null,w=0,al=0,et=null,ya=!1,Su=!1,pc=!1,Wt=0,gl=0,da=0,Qa=0,Mc=0,nt=0,ru=0,ie=null,$l=null,Oc=!1,gn=0,ny=0,Sn=1/0,rn=null,va=null,Ml=0,oa=null,bu=null,$t=0,Dc=0,Uc=null,fy=null,se=0,Hc=null;function ft(){return(P&2)!==0&&w!==0?w&-w:r.T!==null?Bc():Ei()}function cy(){if(nt===0)if((w&536870912)===0||k){var l=pe;pe<<=1,(pe&3932160)===0&&(pe=262144),nt=l}else nt=536870912;return l=at.current,l!==null&&(l.flags|=32),nt}function kl(l,t,a){(l===yl&&(al===2||al===9)||l.cancelPendingCommit!==null)&&(zu(l,0),ma(l,w,nt,!1)),Hu(l,a),((P&2)===0||l!==yl)&&(l===yl&&((P&2)===0&&(Qa|=a),gl===4&&ma(l,w,nt,!1)),Ht(l))}function iy(l,t,a){if((P&6)!==0)throw Error(v(327));var u=!a&&(t&127)===0&&(t&l.expiredLanes)===0||Uu(l,t),e=u?u1(l,t):Rc(l,t,!0),n=u;do{if(e===0){Su&&!u&&ma(l,t,0,!1);break}else{if(a=l.current.alternate,n&&!t1(a)){e=Rc(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var f=0;else f=l.pendingLanes&-536870913,f=f!==0?f:f&536870912?536870912:0;if(f!==0){t=f;l:{var c=l;e=ie;var i=c.current.memoizedState.isDehydrated;if(i&&(zu(c,f).flags|=256),f=Rc(c,f,!1),f!==2){if(pc&&!i){c.errorRecoveryDisabledLanes|=n,Qa|=n,e=4;break l}n=$l,$l=e,n!==null&&($l===null?$l=n:$l.push.apply($l,n))}e=f}if(n=!1,e!==2)continue}}if(e===1){zu(l,0),ma(l,t,0,!0);break}l:{switch(u=l,n=e,n){case 0:case 1:throw Error(v(345));case 4:if((t&4194048)!==t)break;case 6:ma(u,t,nt,!ya);break l;case 2:$l=null;break;case 3:case 5:break;default:throw Error(v(329))}if((t&62914560)===t&&(e=gn+300-Fl(),10<e)){if(ma(u,t,nt,!ya),Oe(u,0,!0)!==0)break l;$t=t,u.timeoutHandle=Gy(sy.bind(null,u,a,$l,rn,Oc,t,nt,Qa,ru,ya,n,"Throttled",-0,0),e);break l}sy(u,a,$l,rn,Oc,t,nt,Qa,ru,ya,n,null,-0,0)}}break}while(!0);Ht(l)}function sy(l,t,a,u,e,n,f,c,i,m,S,z,h,g){if(l.timeoutHandle=-1,z=t.subtreeFlags,z&8192||(z&16785408)===16785408){z={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:qt},ty(t,n,z);var M=(n&62914560)===n?gn-Fl():(n&4194048)===n?ny-Fl():0;if(M=G1(z,M),M!==null){$t=n,l.cancelPendingCommit=M(Sy.bind(null,l,t,n,a,u,e,f,c,i,S,z,null,h,g)),ma(l,n,f,!m);return}}Sy(l,t,n,a,u,e,f,c,i)}function t1(l){for(var t=l;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var u=0;u<a.length;u++){var e=a[u],n=e.getSnapshot;e=e.value;try{if(!lt(n(),e))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function ma(l,t,a,u){t&=~Mc,t&=~Qa,l.suspendedLanes|=t,l.pingedLanes&=~t,u&&(l.warmLanes|=t),u=l.expirationTimes;for(var e=t;0<e;){var n=31-Pl(e),f=1<<n;u[n]=-1,e&=~f}a!==0&&bi(l,a,t)}function bn(){return(P&6)===0?(ye(0),!1):!0}function Nc(){if(K!==null){if(al===0)var l=K.return;else l=K,xt=Ra=null,wf(l),yu=null,Ju=0,l=K;for(;l!==null;)X0(l.alternate,l),l=l.return;K=null}}function zu(l,t){var a=l.timeoutHandle;a!==-1&&(l.timeoutHandle=-1,T1(a)),a=l.cancelPendingCommit,a!==null&&(l.cancelPendingCommit=null,a()),$t=0,Nc(),yl=l,K=a=Bt(l.current,null),w=t,al=0,et=null,ya=!1,Su=Uu(l,t),pc=!1,ru=nt=Mc=Qa=da=gl=0,$l=ie=null,Oc=!1,(t&8)!==0&&(t|=t&32);var u=l.entangledLanes;if(u!==0)for(l=l.entanglements,u&=t;0<u;){var e=31-Pl(u),n=1<<e;t|=l[e],u&=~n}return Wt=t,Ge(),a}function yy(l,t){Q=null,r.H=le,t===su||t===we?(t=Ms(),al=3):t===jf?(t=Ms(),al=4):al=t===sc?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,et=t,K===null&&(gl=1,cn(l,dt(t,l.current)))}function dy(){var l=at.current;return l===null?!0:(w&4194048)===w?ht===null:(w&62914560)===w||(w&536870912)!==0?l===ht:!1}function vy(){var l=r.H;return r.H=le,l===null?le:l}function oy(){var l=r.A;return r.A=Pv,l}function zn(){gl=4,ya||(w&4194048)!==w&&at.current!==null||(Su=!0),(da&134217727)===0&&(Qa&134217727)===0||yl===null||ma(yl,w,nt,!1)}function Rc(l,t,a){var u=P;P|=2;var e=vy(),n=oy();(yl!==l||w!==t)&&(rn=null,zu(l,t)),t=!1;var f=gl;l:do try{if(al!==0&&K!==null){var c=K,i=et;switch(al){case 8:Nc(),f=6;break l;case 3:case 2:case 9:case 6:at.current===null&&(t=!0);var m=al;if(al=0,et=null,Tu(l,c,i,m),a&&Su){f=0;break l}break;default:m=al,al=0,et=null,Tu(l,c,i,m)}}a1(),f=gl;break}catch(S){yy(l,S)}while(!0);return t&&l.shellSuspendCounter++,xt=Ra=null,P=u,r.H=e,r.A=n,K===null&&(yl=null,w=0,Ge()),f}function a1(){for(;K!==null;)my(K)}function u1(l,t){var a=P;P|=2;var u=vy(),e=oy();yl!==l||w!==t?(rn=null,Sn=Fl()+500,zu(l,t)):Su=Uu(l,t);l:do try{if(al!==0&&K!==null){t=K;var n=et;t:switch(al){case 1:al=0,et=null,Tu(l,t,n,1);break;case 2:case 9:if(_s(n)){al=0,et=null,hy(t);break}t=function(){al!==2&&al!==9||yl!==l||(al=7),Ht(l)},n.then(t,t);break l;case 3:al=7;break l;case 4:al=5;break l;case 7:_s(n)?(al=0,et=null,hy(t)):(al=0,et=null,Tu(l,t,n,7));break;case 5:var f=null;switch(K.tag){case 26:f=K.memoizedState;case 5:case 27:var c=K;if(f?ld(f):c.stateNode.complete){al=0,et=null;var i=c.sibling;if(i!==null)K=i;else{var m=c.return;m!==null?(K=m,Tn(m)):K=null}break t}}al=0,et=null,Tu(l,t,n,5);break;case 6:al=0,et=null,Tu(l,t,n,6);break;case 8:Nc(),gl=6;break l;default:throw Error(v(462))}}e1();break}catch(S){yy(l,S)}while(!0);return xt=Ra=null,r.H=u,r.A=e,P=a,K!==null?0:(yl=null,w=0,Ge(),gl)}function e1(){for(;K!==null&&!Od();)my(K)}function my(l){var t=x0(l.alternate,l,Wt);l.memoizedProps=l.pendingProps,t===null?Tn(l):K=t}function hy(l){var t=l,a=t.alternate;switch(t.tag){case 15:case 0:t=R0(a,t,t.pendingProps,t.type,void 0,w);break;case 11:t=R0(a,t,t.pendingProps,t.type.render,t.ref,w);break;case 5:wf(t);default:X0(a,t),t=K=os(t,Wt),t=x0(a,t,Wt)}l.memoizedProps=l.pendingProps,t===null?Tn(l):K=t}function Tu(l,t,a,u){xt=Ra=null,wf(t),yu=null,Ju=0;var e=t.return;try{if(Jv(l,e,t,a,w)){gl=1,cn(l,dt(a,l.current)),K=null;return}}catch(n){if(e!==null)throw K=e,n;gl=1,cn(l,dt(a,l.current)),K=null;return}t.flags&32768?(k||u===1?l=!0:Su||(w&536870912)!==0?l=!1:(ya=l=!0,(u===2||u===9||u===3||u===6)&&(u=at.current,u!==null&&u.tag===13&&(u.flags|=16384))),gy(t,l)):Tn(t)}function Tn(l){var t=l;do{if((t.flags&32768)!==0){gy(t,ya);return}l=t.return;var a=$v(t.alternate,t,Wt);if(a!==null){K=a;return}if(t=t.sibling,t!==null){K=t;return}K=t=l}while(t!==null);gl===0&&(gl=5)}function gy(l,t){do{var a=kv(l.alternate,l);if(a!==null){a.flags&=32767,K=a;return}if(a=l.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(l=l.sibling,l!==null)){K=l;return}K=l=a}while(l!==null);gl=6,K=null}function Sy(l,t,a,u,e,n,f,c,i){l.cancelPendingCommit=null;do En();while(Ml!==0);if((P&6)!==0)throw Error(v(327));if(t!==null){if(t===l.current)throw Error(v(177));if(n=t.lanes|t.childLanes,n|=zf,Yd(l,a,n,f,c,i),l===yl&&(K=yl=null,w=0),bu=t,oa=l,$t=a,Dc=n,Uc=e,fy=u,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,i1(Ae,function(){return Ey(),null})):(l.callbackNode=null,l.callbackPriority=0),u=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||u){u=r.T,r.T=null,e=_.p,_.p=2,f=P,P|=4;try{Fv(l,t,a)}finally{P=f,_.p=e,r.T=u}}Ml=1,ry(),by(),zy()}}function ry(){if(Ml===1){Ml=0;var l=oa,t=bu,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=r.T,r.T=null;var u=_.p;_.p=2;var e=P;P|=4;try{I0(t,l);var n=Lc,f=es(l.containerInfo),c=n.focusedElem,i=n.selectionRange;if(f!==c&&c&&c.ownerDocument&&us(c.ownerDocument.documentElement,c)){if(i!==null&&hf(c)){var m=i.start,S=i.end;if(S===void 0&&(S=m),"selectionStart"in c)c.selectionStart=m,c.selectionEnd=Math.min(S,c.value.length);else{var z=c.ownerDocument||document,h=z&&z.defaultView||window;if(h.getSelection){var g=h.getSelection(),M=c.textContent.length,C=Math.min(i.start,M),il=i.end===void 0?C:Math.min(i.end,M);!g.extend&&C>il&&(f=il,il=C,C=f);var d=as(c,C),s=as(c,il);if(d&&s&&(g.rangeCount!==1||g.anchorNode!==d.node||g.anchorOffset!==d.offset||g.focusNode!==s.node||g.focusOffset!==s.offset)){var o=z.createRange();o.setStart(d.node,d.offset),g.removeAllRanges(),C>il?(g.addRange(o),g.extend(s.node,s.offset)):(o.setEnd(s.node,s.offset),g.addRange(o))}}}}for(z=[],g=c;g=g.parentNode;)g.nodeType===1&&z.push({element:g,left:g.scrollLeft,top:g.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<z.length;c++){var b=z[c];b.element.scrollLeft=b.left,b.element.scrollTop=b.top}}qn=!!Vc,Lc=Vc=null}finally{P=e,_.p=u,r.T=a}}l.current=t,Ml=2}}function by(){if(Ml===2){Ml=0;var l=oa,t=bu,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=r.T,r.T=null;var u=_.p;_.p=2;var e=P;P|=4;try{w0(l,t.alternate,t)}finally{P=e,_.p=u,r.T=a}}Ml=3}}function zy(){if(Ml===4||Ml===3){Ml=0,Dd();var l=oa,t=bu,a=$t,u=fy;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Ml=5:(Ml=0,bu=oa=null,Ty(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(va=null),$n(a),t=t.stateNode,Il&&typeof Il.onCommitFiberRoot=="function")try{Il.onCommitFiberRoot(Du,t,void 0,(t.current.flags&128)===128)}catch{}if(u!==null){t=r.T,e=_.p,_.p=2,r.T=null;try{for(var n=l.onRecoverableError,f=0;f<u.length;f++){var c=u[f];n(c.value,{componentStack:c.stack})}}finally{r.T=t,_.p=e}}($t&3)!==0&&En(),Ht(l),e=l.pendingLanes,(a&261930)!==0&&(e&42)!==0?l===Hc?se++:(se=0,Hc=l):se=0,ye(0)}}function Ty(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Lu(t)))}function En(){return ry(),by(),zy(),Ey()}function Ey(){if(Ml!==5)return!1;var l=oa,t=Dc;Dc=0;var a=$n($t),u=r.T,e=_.p;try{_.p=32>a?32:a,r.T=null,a=Uc,Uc=null;var n=oa,f=$t;if(Ml=0,bu=oa=null,$t=0,(P&6)!==0)throw Error(v(331));var c=P;if(P|=4,uy(n.current),ly(n,n.current,f,a),P=c,ye(0,!1),Il&&typeof Il.onPostCommitFiberRoot=="function")try{Il.onPostCommitFiberRoot(Du,n)}catch{}return!0}finally{_.p=e,r.T=u,Ty(l,t)}}function Ay(l,t,a){t=dt(a,t),t=ic(l.stateNode,t,2),l=fa(l,t,2),l!==null&&(Hu(l,2),Ht(l))}function ul(l,t,a){if(l.tag===3)Ay(l,l,a);else for(;t!==null;){if(t.tag===3){Ay(t,l,a);break}else if(t.tag===1){var u=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof u.componentDidCatch=="function"&&(va===null||!va.has(u))){l=dt(a,l),a=_0(2),u=fa(t,a,2),u!==null&&(p0(a,u,t,l),Hu(u,2),Ht(u));break}}t=t.return}}function Cc(l,t,a){var u=l.pingCache;if(u===null){u=l.pingCache=new l1;var e=new Set;u.set(t,e)}else e=u.get(t),e===void 0&&(e=new Set,u.set(t,e));e.has(a)||(pc=!0,e.add(a),l=n1.bind(null,l,t,a),t.then(l,l))}function n1(l,t,a){var u=l.pingCache;u!==null&&u.delete(t),l.pingedLanes|=l.suspendedLanes&a,l.warmLanes&=~a,yl===l&&(w&a)===a&&(gl===4||gl===3&&(w&62914560)===w&&300>Fl()-gn?(P&2)===0&&zu(l,0):Mc|=a,ru===w&&(ru=0)),Ht(l)}function _y(l,t){t===0&&(t=ri()),l=Ua(l,t),l!==null&&(Hu(l,t),Ht(l))}function f1(l){var t=l.memoizedState,a=0;t!==null&&(a=t.retryLane),_y(l,a)}function c1(l,t){var a=0;switch(l.tag){case 31:case 13:var u=l.stateNode,e=l.memoizedState;e!==null&&(a=e.retryLane);break;case 19:u=l.stateNode;break;case 22:u=l.stateNode._retryCache;break;default:throw Error(v(314))}u!==null&&u.delete(t),_y(l,a)}function i1(l,t){return Kn(l,t)}var An=null,Eu=null,qc=!1,_n=!1,jc=!1,ha=0;function Ht(l){l!==Eu&&l.next===null&&(Eu===null?An=Eu=l:Eu=Eu.next=l),_n=!0,qc||(qc=!0,y1())}function ye(l,t){if(!jc&&_n){jc=!0;do for(var a=!1,u=An;u!==null;){if(l!==0){var e=u.pendingLanes;if(e===0)var n=0;else{var f=u.suspendedLanes,c=u.pingedLanes;n=(1<<31-Pl(42|l)+1)-1,n&=e&~(f&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(a=!0,Dy(u,n))}else n=w,n=Oe(u,u===yl?n:0,u.cancelPendingCommit!==null||u.timeoutHandle!==-1),(n&3)===0||Uu(u,n)||(a=!0,Dy(u,n));u=u.next}while(a);jc=!1}}function s1(){py()}function py(){_n=qc=!1;var l=0;ha!==0&&z1()&&(l=ha);for(var t=Fl(),a=null,u=An;u!==null;){var e=u.next,n=My(u,t);n===0?(u.next=null,a===null?An=e:a.next=e,e===null&&(Eu=a)):(a=u,(l!==0||(n&3)!==0)&&(_n=!0)),u=e}Ml!==0&&Ml!==5||ye(l),ha!==0&&(ha=0)}function My(l,t){for(var a=l.suspendedLanes,u=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var f=31-Pl(n),c=1<<f,i=e[f];i===-1?((c&a)===0||(c&u)!==0)&&(e[f]=Bd(c,t)):i<=t&&(l.expiredLanes|=c),n&=~c}if(t=yl,a=w,a=Oe(l,l===t?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),u=l.callbackNode,a===0||l===t&&(al===2||al===9)||l.cancelPendingCommit!==null)return u!==null&&u!==null&&Jn(u),l.callbackNode=null,l.callbackPriority=0;if((a&3)===0||Uu(l,a)){if(t=a&-a,t===l.callbackPriority)return t;switch(u!==null&&Jn(u),$n(a)){case 2:case 8:a=gi;break;case 32:a=Ae;break;case 268435456:a=Si;break;default:a=Ae}return u=Oy.bind(null,l),a=Kn(a,u),l.callbackPriority=t,l.callbackNode=a,t}return u!==null&&u!==null&&Jn(u),l.callbackPriority=2,l.callbackNode=null,2}function Oy(l,t){if(Ml!==0&&Ml!==5)return l.callbackNode=null,l.callbackPriority=0,null;var a=l.callbackNode;if(En()&&l.callbackNode!==a)return null;var u=w;return u=Oe(l,l===yl?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),u===0?null:(iy(l,u,t),My(l,Fl()),l.callbackNode!=null&&l.callbackNode===a?Oy.bind(null,l):null)}function Dy(l,t){if(En())return null;iy(l,t,!0)}function y1(){E1(function(){(P&6)!==0?Kn(hi,s1):py()})}function Bc(){if(ha===0){var l=cu;l===0&&(l=_e,_e<<=1,(_e&261888)===0&&(_e=256)),ha=l}return ha}function Uy(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:Ne(""+l)}function Hy(l,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,l.id&&a.setAttribute("form",l.id),t.parentNode.insertBefore(a,t),l=new FormData(l),a.parentNode.removeChild(a),l}function d1(l,t,a,u,e){if(t==="submit"&&a&&a.stateNode===e){var n=Uy((e[Ll]||null).action),f=u.submitter;f&&(t=(t=f[Ll]||null)?Uy(t.formAction):f.getAttribute("formAction"),t!==null&&(n=t,f=null));var c=new je("action","action",null,u,e);l.push({event:c,listeners:[{instance:null,listener:function(){if(u.defaultPrevented){if(ha!==0){var i=f?Hy(e,f):new FormData(e);ac(a,{pending:!0,data:i,method:e.method,action:n},null,i)}}else typeof n=="function"&&(c.preventDefault(),i=f?Hy(e,f):new FormData(e),ac(a,{pending:!0,data:i,method:e.method,action:n},n,i))},currentTarget:e}]})}}for(var Yc=0;Yc<bf.length;Yc++){var xc=bf[Yc],v1=xc.toLowerCase(),o1=xc[0].toUpperCase()+xc.slice(1);zt(v1,"on"+o1)}zt(cs,"onAnimationEnd"),zt(is,"onAnimationIteration"),zt(ss,"onAnimationStart"),zt("dblclick","onDoubleClick"),zt("focusin","onFocus"),zt("focusout","onBlur"),zt(Uv,"onTransitionRun"),zt(Hv,"onTransitionStart"),zt(Nv,"onTransitionCancel"),zt(ys,"onTransitionEnd"),wa("onMouseEnter",["mouseout","mouseover"]),wa("onMouseLeave",["mouseout","mouseover"]),wa("onPointerEnter",["pointerout","pointerover"]),wa("onPointerLeave",["pointerout","pointerover"]),pa("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),pa("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),pa("onBeforeInput",["compositionend","keypress","textInput","paste"]),pa("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),pa("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),pa("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var de="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),m1=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(de));function Ny(l,t){t=(t&4)!==0;for(var a=0;a<l.length;a++){var u=l[a],e=u.event;u=u.listeners;l:{var n=void 0;if(t)for(var f=u.length-1;0<=f;f--){var c=u[f],i=c.instance,m=c.currentTarget;if(c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(S){xe(S)}e.currentTarget=null,n=i}else for(f=0;f<u.length;f++){if(c=u[f],i=c.instance,m=c.currentTarget,c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(S){xe(S)}e.currentTarget=null,n=i}}}}function J(l,t){var a=t[kn];a===void 0&&(a=t[kn]=new Set);var u=l+"__bubble";a.has(u)||(Ry(t,l,2,!1),a.add(u))}function Gc(l,t,a){var u=0;t&&(u|=4),Ry(a,l,u,t)}var pn="_reactListening"+Math.random().toString(36).slice(2);function Xc(l){if(!l[pn]){l[pn]=!0,pi.forEach(function(a){a!=="selectionchange"&&(m1.has(a)||Gc(a,!1,l),Gc(a,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[pn]||(t[pn]=!0,Gc("selectionchange",!1,t))}}function Ry(l,t,a,u){switch(cd(t)){case 2:var e=Z1;break;case 8:e=V1;break;default:e=ti}a=e.bind(null,t,a,l),e=void 0,!nf||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),u?e!==void 0?l.addEventListener(t,a,{capture:!0,passive:e}):l.addEventListener(t,a,!0):e!==void 0?l.addEventListener(t,a,{passive:e}):l.addEventListener(t,a,!1)}function Qc(l,t,a,u,e){var n=u;if((t&1)===0&&(t&2)===0&&u!==null)l:for(;;){if(u===null)return;var f=u.tag;if(f===3||f===4){var c=u.stateNode.containerInfo;if(c===e)break;if(f===4)for(f=u.return;f!==null;){var i=f.tag;if((i===3||i===4)&&f.stateNode.containerInfo===e)return;f=f.return}for(;c!==null;){if(f=La(c),f===null)return;if(i=f.tag,i===5||i===6||i===26||i===27){u=n=f;continue l}c=c.parentNode}}u=u.return}Yi(function(){var m=n,S=uf(a),z=[];l:{var h=ds.get(l);if(h!==void 0){var g=je,M=l;switch(l){case"keypress":if(Ce(a)===0)break l;case"keydown":case"keyup":g=cv;break;case"focusin":M="focus",g=yf;break;case"focusout":M="blur",g=yf;break;case"beforeblur":case"afterblur":g=yf;break;case"click":if(a.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Xi;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=$d;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=yv;break;case cs:case is:case ss:g=Id;break;case ys:g=vv;break;case"scroll":case"scrollend":g=wd;break;case"wheel":g=mv;break;case"copy":case"cut":case"paste":g=lv;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=Zi;break;case"toggle":case"beforetoggle":g=gv}var C=(t&4)!==0,il=!C&&(l==="scroll"||l==="scrollend"),d=C?h!==null?h+"Capture":null:h;C=[];for(var s=m,o;s!==null;){var b=s;if(o=b.stateNode,b=b.tag,b!==5&&b!==26&&b!==27||o===null||d===null||(b=Cu(s,d),b!=null&&C.push(ve(s,b,o))),il)break;s=s.return}0<C.length&&(h=new g(h,M,null,a,S),z.push({event:h,listeners:C}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",g=l==="mouseout"||l==="pointerout",h&&a!==af&&(M=a.relatedTarget||a.fromElement)&&(La(M)||M[Va]))break l;if((g||h)&&(h=S.window===S?S:(h=S.ownerDocument)?h.defaultView||h.parentWindow:window,g?(M=a.relatedTarget||a.toElement,g=m,M=M?La(M):null,M!==null&&(il=x(M),C=M.tag,M!==il||C!==5&&C!==27&&C!==6)&&(M=null)):(g=null,M=m),g!==M)){if(C=Xi,b="onMouseLeave",d="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(C=Zi,b="onPointerLeave",d="onPointerEnter",s="pointer"),il=g==null?h:Ru(g),o=M==null?h:Ru(M),h=new C(b,s+"leave",g,a,S),h.target=il,h.relatedTarget=o,b=null,La(S)===m&&(C=new C(d,s+"enter",M,a,S),C.target=o,C.relatedTarget=il,b=C),il=b,g&&M)t:{for(C=h1,d=g,s=M,o=0,b=d;b;b=C(b))o++;b=0;for(var N=s;N;N=C(N))b++;for(;0<o-b;)d=C(d),o--;for(;0<b-o;)s=C(s),b--;for(;o--;){if(d===s||s!==null&&d===s.alternate){C=d;break t}d=C(d),s=C(s)}C=null}else C=null;g!==null&&Cy(z,h,g,C,!1),M!==null&&il!==null&&Cy(z,il,M,C,!0)}}l:{if(h=m?Ru(m):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var F=ki;else if(Wi(h))if(Fi)F=Mv;else{F=_v;var D=Av}else g=h.nodeName,!g||g.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?m&&tf(m.elementType)&&(F=ki):F=pv;if(F&&(F=F(l,m))){$i(z,F,a,S);break l}D&&D(l,h,m),l==="focusout"&&m&&h.type==="number"&&m.memoizedProps.value!=null&&lf(h,"number",h.value)}switch(D=m?Ru(m):window,l){case"focusin":(Wi(D)||D.contentEditable==="true")&&(Pa=D,gf=m,Qu=null);break;case"focusout":Qu=gf=Pa=null;break;case"mousedown":Sf=!0;break;case"contextmenu":case"mouseup":case"dragend":Sf=!1,ns(z,a,S);break;case"selectionchange":if(Dv)break;case"keydown":case"keyup":ns(z,a,S)}var Z;if(vf)l:{switch(l){case"compositionstart":var W="onCompositionStart";break l;case"compositionend":W="onCompositionEnd";break l;case"compositionupdate":W="onCompositionUpdate";break l}W=void 0}else Ia?Ji(l,a)&&(W="onCompositionEnd"):l==="keydown"&&a.keyCode===229&&(W="onCompositionStart");W&&(Vi&&a.locale!=="ko"&&(Ia||W!=="onCompositionStart"?W==="onCompositionEnd"&&Ia&&(Z=xi()):(Pt=S,ff="value"in Pt?Pt.value:Pt.textContent,Ia=!0)),D=Mn(m,W),0<D.length&&(W=new Qi(W,l,null,a,S),z.push({event:W,listeners:D}),Z?W.data=Z:(Z=wi(a),Z!==null&&(W.data=Z)))),(Z=rv?bv(l,a):zv(l,a))&&(W=Mn(m,"onBeforeInput"),0<W.length&&(D=new Qi("onBeforeInput","beforeinput",null,a,S),z.push({event:D,listeners:W}),D.data=Z)),d1(z,l,m,a,S)}Ny(z,t)})}function ve(l,t,a){return{instance:l,listener:t,currentTarget:a}}function Mn(l,t){for(var a=t+"Capture",u=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=Cu(l,a),e!=null&&u.unshift(ve(l,e,n)),e=Cu(l,t),e!=null&&u.push(ve(l,e,n))),l.tag===3)return u;l=l.return}return[]}function h1(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Cy(l,t,a,u,e){for(var n=t._reactName,f=[];a!==null&&a!==u;){var c=a,i=c.alternate,m=c.stateNode;if(c=c.tag,i!==null&&i===u)break;c!==5&&c!==26&&c!==27||m===null||(i=m,e?(m=Cu(a,n),m!=null&&f.unshift(ve(a,m,i))):e||(m=Cu(a,n),m!=null&&f.push(ve(a,m,i)))),a=a.return}f.length!==0&&l.push({event:t,listeners:f})}var g1=/\r\n?/g,S1=/\u0000|\uFFFD/g;function qy(l){return(typeof l=="string"?l:""+l).replace(g1,`
-`).replace(S1,"")}function jy(l,t){return t=qy(t),qy(l)===t}function cl(l,t,a,u,e,n){switch(a){case"children":typeof u=="string"?t==="body"||t==="textarea"&&u===""||$a(l,u):(typeof u=="number"||typeof u=="bigint")&&t!=="body"&&$a(l,""+u);break;case"className":Ue(l,"class",u);break;case"tabIndex":Ue(l,"tabindex",u);break;case"dir":case"role":case"viewBox":case"width":case"height":Ue(l,a,u);break;case"style":ji(l,u,n);break;case"data":if(t!=="object"){Ue(l,"data",u);break}case"src":case"href":if(u===""&&(t!=="a"||a!=="href")){l.removeAttribute(a);break}if(u==null||typeof u=="function"||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=Ne(""+u),l.setAttribute(a,u);break;case"action":case"formAction":if(typeof u=="function"){l.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(a==="formAction"?(t!=="input"&&cl(l,t,"name",e.name,e,null),cl(l,t,"formEncType",e.formEncType,e,null),cl(l,t,"formMethod",e.formMethod,e,null),cl(l,t,"formTarget",e.formTarget,e,null)):(cl(l,t,"encType",e.encType,e,null),cl(l,t,"method",e.method,e,null),cl(l,t,"target",e.target,e,null)));if(u==null||typeof u=="symbol"||typeof u=="boolean"){l.removeAttribute(a);break}u=Ne(""+u),l.setAttribute(a,u);break;case"onClick":u!=null&&(l.onclick=qt);break;case"onScroll":u!=null&&J("scroll",l);break;case"onScrollEnd":u!=null&&J("scrollend",l);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(v(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(v(60));l.innerHTML=a}}break;case"multiple":l.multiple=u&&typeof u!="function"&&typeof u!="symbol";break;case"muted":l.muted=u&&typeof u!="function"&&typeof u!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(u==null||typeof u=="function"||typeof u=="boolean"||typeof u=="symbol"){l.removeAttribute("xlink:href");break}a=Ne(""+u),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""+u):l.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":u&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,""):l.removeAttribute(a);break;case"capture":case"download":u===!0?l.setAttribute(a,""):u!==!1&&u!=null&&typeof u!="function"&&typeof u!="symbol"?l.setAttribute(a,u):l.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":u!=null&&typeof u!="function"&&typeof u!="symbol"&&!isNaN(u)&&1<=u?l.setAttribute(a,u):l.removeAttribute(a);break;case"rowSpan":case"start":u==null||typeof u=="function"||typeof u=="symbol"||isNaN(u)?l.removeAttribute(a):l.setAttribute(a,u);break;case"popover":J("beforetoggle",l),J("toggle",l),De(l,"popover",u);break;case"xlinkActuate":Ct(l,"http://www.w3.org/1999/xlink","xlink:actuate",u);break;case"xlinkArcrole":Ct(l,"http://www.w3.org/1999/xlink","xlink:arcrole",u);break;case"xlinkRole":Ct(l,"http://www.w3.org/1999/xlink","xlink:role",u);break;case"xlinkShow":Ct(l,"http://www.w3.org/1999/xlink","xlink:show",u);break;case"xlinkTitle":Ct(l,"http://www.w3.org/1999/xlink","xlink:title",u);break;case"xlinkType":Ct(l,"http://www.w3.org/1999/xlink","xlink:type",u);break;case"xmlBase":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:base",u);break;case"xmlLang":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:lang",u);break;case"xmlSpace":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:space",u);break;case"is":De(l,"is",u);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=Kd.get(a)||a,De(l,a,u))}}function Zc(l,t,a,u,e,n){switch(a){case"style":ji(l,u,n);break;case"dangerouslySetInnerHTML":if(u!=null){if(typeof u!="object"||!("__html"in u))throw Error(v(61));if(a=u.__html,a!=null){if(e.children!=null)throw Error(v(60));l.innerHTML=a}}break;case"children":typeof u=="string"?$a(l,u):(typeof u=="number"||typeof u=="bigint")&&$a(l,""+u);break;case"onScroll":u!=null&&J("scroll",l);break;case"onScrollEnd":u!=null&&J("scrollend",l);break;case"onClick":u!=null&&(l.onclick=qt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Mi.hasOwnProperty(a))l:{if(a[0]==="o"&&a[1]==="n"&&(e=a.endsWith("Capture"),t=a.slice(2,e?a.length-7:void 0),n=l[Ll]||null,n=n!=null?n[a]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof u=="function")){typeof n!="function"&&n!==null&&(a in l?l[a]=null:l.hasAttribute(a)&&l.removeAttribute(a)),l.addEventListener(t,u,e);break l}a in l?l[a]=u:u===!0?l.setAttribute(a,""):De(l,a,u)}}}function ql(l,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":J("error",l),J("load",l);var u=!1,e=!1,n;for(n in a)if(a.hasOwnProperty(n)){var f=a[n];if(f!=null)switch(n){case"src":u=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(v(137,t));default:cl(l,t,n,f,a,null)}}e&&cl(l,t,"srcSet",a.srcSet,a,null),u&&cl(l,t,"src",a.src,a,null);return;case"input":J("invalid",l);var c=n=f=e=null,i=null,m=null;for(u in a)if(a.hasOwnProperty(u)){var S=a[u];if(S!=null)switch(u){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":m=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(v(137,t));break;default:cl(l,t,u,S,a,null)}}Ni(l,n,c,i,m,f,e,!1);return;case"select":J("invalid",l),u=f=n=null;for(e in a)if(a.hasOwnProperty(e)&&(c=a[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":u=c;default:cl(l,t,e,c,a,null)}t=n,a=f,l.multiple=!!u,t!=null?Wa(l,!!u,t,!1):a!=null&&Wa(l,!!u,a,!0);return;case"textarea":J("invalid",l),n=e=u=null;for(f in a)if(a.hasOwnProperty(f)&&(c=a[f],c!=null))switch(f){case"value":u=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(v(91));break;default:cl(l,t,f,c,a,null)}Ci(l,u,e,n);return;case"option":for(i in a)if(a.hasOwnProperty(i)&&(u=a[i],u!=null))switch(i){case"selected":l.selected=u&&typeof u!="function"&&typeof u!="symbol";break;default:cl(l,t,i,u,a,null)}return;case"dialog":J("beforetoggle",l),J("toggle",l),J("cancel",l),J("close",l);break;case"iframe":case"object":J("load",l);break;case"video":case"audio":for(u=0;u<de.length;u++)J(de[u],l);break;case"image":J("error",l),J("load",l);break;case"details":J("toggle",l);break;case"embed":case"source":case"link":J("error",l),J("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in a)if(a.hasOwnProperty(m)&&(u=a[m],u!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(v(137,t));default:cl(l,t,m,u,a,null)}return;default:if(tf(t)){for(S in a)a.hasOwnProperty(S)&&(u=a[S],u!==void 0&&Zc(l,t,S,u,a,void 0));return}}for(c in a)a.hasOwnProperty(c)&&(u=a[c],u!=null&&cl(l,t,c,u,a,null))}function r1(l,t,a,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,S=null;for(g in a){var z=a[g];if(a.hasOwnProperty(g)&&z!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=z;default:u.hasOwnProperty(g)||cl(l,t,g,null,u,z)}}for(var h in u){var g=u[h];if(z=a[h],u.hasOwnProperty(h)&&(g!=null||z!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(v(137,t));break;default:g!==z&&cl(l,t,h,g,u,z)}}Pn(l,f,c,i,m,S,n,e);return;case"select":g=f=c=h=null;for(n in a)if(i=a[n],a.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:u.hasOwnProperty(n)||cl(l,t,n,null,u,i)}for(e in u)if(n=u[e],i=a[e],u.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&cl(l,t,e,n,u,i)}t=c,a=f,u=g,h!=null?Wa(l,!!a,h,!1):!!u!=!!a&&(t!=null?Wa(l,!!a,t,!0):Wa(l,!!a,a?[]:"",!1));return;case"textarea":g=h=null;for(c in a)if(e=a[c],a.hasOwnProperty(c)&&e!=null&&!u.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:cl(l,t,c,null,u,e)}for(f in u)if(e=u[f],n=a[f],u.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(v(91));break;default:e!==n&&cl(l,t,f,e,u,n)}Ri(l,h,g);return;case"option":for(var M in a)if(h=a[M],a.hasOwnProperty(M)&&h!=null&&!u.hasOwnProperty(M))switch(M){case"selected":l.selected=!1;break;default:cl(l,t,M,null,u,h)}for(i in u)if(h=u[i],g=a[i],u.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null))switch(i){case"selected":l.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:cl(l,t,i,h,u,g)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var C in a)h=a[C],a.hasOwnProperty(C)&&h!=null&&!u.hasOwnProperty(C)&&cl(l,t,C,null,u,h);for(m in u)if(h=u[m],g=a[m],u.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(v(137,t));break;default:cl(l,t,m,h,u,g)}return;default:if(tf(t)){for(var il in a)h=a[il],a.hasOwnProperty(il)&&h!==void 0&&!u.hasOwnProperty(il)&&Zc(l,t,il,void 0,u,h);for(S in u)h=u[S],g=a[S],!u.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||Zc(l,t,S,h,u,g);return}}for(var d in a)h=a[d],a.hasOwnProperty(d)&&h!=null&&!u.hasOwnProperty(d)&&cl(l,t,d,null,u,h);for(z in u)h=u[z],g=a[z],!u.hasOwnProperty(z)||h===g||h==null&&g==null||cl(l,t,z,h,u,g)}function By(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function b1(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,a=performance.getEntriesByType("resource"),u=0;u<a.length;u++){var e=a[u],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&By(f)){for(f=0,c=e.responseEnd,u+=1;u<a.length;u++){var i=a[u],m=i.startTime;if(m>c)break;var S=i.transferSize,z=i.initiatorType;S&&By(z)&&(i=i.responseEnd,f+=S*(i<c?1:(c-m)/(i-m)))}if(--u,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Vc=null,Lc=null;function On(l){return l.nodeType===9?l:l.ownerDocument}function Yy(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function xy(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Kc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Jc=null;function z1(){var l=window.event;return l&&l.type==="popstate"?l===Jc?!1:(Jc=l,!0):(Jc=null,!1)}var Gy=typeof setTimeout=="function"?setTimeout:void 0,T1=typeof clearTimeout=="function"?clearTimeout:void 0,Xy=typeof Promise=="function"?Promise:void 0,E1=typeof queueMicrotask=="function"?queueMicrotask:typeof Xy<"u"?function(l){return Xy.resolve(null).then(l).catch(A1)}:Gy;function A1(l){setTimeout(function(){throw l})}function ga(l){return l==="head"}function Qy(l,t){var a=t,u=0;do{var e=a.nextSibling;if(l.removeChild(a),e&&e.nodeType===8)if(a=e.data,a==="/$"||a==="/&"){if(u===0){l.removeChild(e),Mu(t);return}u--}else if(a==="$"||a==="$?"||a==="$~"||a==="$!"||a==="&")u++;else if(a==="html")oe(l.ownerDocument.documentElement);else if(a==="head"){a=l.ownerDocument.head,oe(a);for(var n=a.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Nu]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||a.removeChild(n),n=f}}else a==="body"&&oe(l.ownerDocument.body);a=e}while(a);Mu(t)}function Zy(l,t){var a=l;l=0;do{var u=a.nextSibling;if(a.nodeType===1?t?(a._stashedDisplay=a.style.display,a.style.display="none"):(a.style.display=a._stashedDisplay||"",a.getAttribute("style")===""&&a.removeAttribute("style")):a.nodeType===3&&(t?(a._stashedText=a.nodeValue,a.nodeValue=""):a.nodeValue=a._stashedText||""),u&&u.nodeType===8)if(a=u.data,a==="/$"){if(l===0)break;l--}else a!=="$"&&a!=="$?"&&a!=="$~"&&a!=="$!"||l++;a=u}while(a)}function wc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":wc(a),Fn(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}l.removeChild(a)}}function _1(l,t,a,u){for(;l.nodeType===1;){var e=a;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!u&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(u){if(!l[Nu])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=gt(l.nextSibling),l===null)break}return null}function p1(l,t,a){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!a||(l=gt(l.nextSibling),l===null))return null;return l}function Vy(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=gt(l.nextSibling),l===null))return null;return l}function Wc(l){return l.data==="$?"||l.data==="$~"}function $c(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function M1(l,t){var a=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||a.readyState!=="loading")t();else{var u=function(){t(),a.removeEventListener("DOMContentLoaded",u)};a.addEventListener("DOMContentLoaded",u),l._reactRetry=u}}function gt(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var kc=null;function Ly(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="/$"||a==="/&"){if(t===0)return gt(l.nextSibling);t--}else a!=="$"&&a!=="$!"&&a!=="$?"&&a!=="$~"&&a!=="&"||t++}l=l.nextSibling}return null}function Ky(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var a=l.data;if(a==="$"||a==="$!"||a==="$?"||a==="$~"||a==="&"){if(t===0)return l;t--}else a!=="/$"&&a!=="/&"||t++}l=l.previousSibling}return null}function Jy(l,t,a){switch(t=On(a),l){case"html":if(l=t.documentElement,!l)throw Error(v(452));return l;case"head":if(l=t.head,!l)throw Error(v(453));return l;case"body":if(l=t.body,!l)throw Error(v(454));return l;default:throw Error(v(451))}}function oe(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);Fn(l)}var St=new Map,wy=new Set;function Dn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var kt=_.d;_.d={f:O1,r:D1,D:U1,C:H1,L:N1,m:R1,X:q1,S:C1,M:j1};function O1(){var l=kt.f(),t=bn();return l||t}function D1(l){var t=Ka(l);t!==null&&t.tag===5&&t.type==="form"?y0(t):kt.r(l)}var Au=typeof document>"u"?null:document;function Wy(l,t,a){var u=Au;if(u&&typeof t=="string"&&t){var e=st(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof a=="string"&&(e+='[crossorigin="'+a+'"]'),wy.has(e)||(wy.add(e),l={rel:l,crossOrigin:a,href:t},u.querySelector(e)===null&&(t=u.createElement("link"),ql(t,"link",l),Dl(t),u.head.appendChild(t)))}}function U1(l){kt.D(l),Wy("dns-prefetch",l,null)}function H1(l,t){kt.C(l,t),Wy("preconnect",l,t)}function N1(l,t,a){kt.L(l,t,a);var u=Au;if(u&&l&&t){var e='link[rel="preload"][as="'+st(t)+'"]';t==="image"&&a&&a.imageSrcSet?(e+='[imagesrcset="'+st(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(e+='[imagesizes="'+st(a.imageSizes)+'"]')):e+='[href="'+st(l)+'"]';var n=e;switch(t){case"style":n=_u(l);break;case"script":n=pu(l)}St.has(n)||(l=H({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:l,as:t},a),St.set(n,l),u.querySelector(e)!==null||t==="style"&&u.querySelector(me(n))||t==="script"&&u.querySelector(he(n))||(t=u.createElement("link"),ql(t,"link",l),Dl(t),u.head.appendChild(t)))}}function R1(l,t){kt.m(l,t);var a=Au;if(a&&l){var u=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+st(u)+'"][href="'+st(l)+'"]',n=e;switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=pu(l)}if(!St.has(n)&&(l=H({rel:"modulepreload",href:l},t),St.set(n,l),a.querySelector(e)===null)){switch(u){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(he(n)))return}u=a.createElement("link"),ql(u,"link",l),Dl(u),a.head.appendChild(u)}}}function C1(l,t,a){kt.S(l,t,a);var u=Au;if(u&&l){var e=Ja(u).hoistableStyles,n=_u(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=u.querySelector(me(n)))c.loading=5;else{l=H({rel:"stylesheet",href:l,"data-precedence":t},a),(a=St.get(n))&&Fc(l,a);var i=f=u.createElement("link");Dl(i),ql(i,"link",l),i._p=new Promise(function(m,S){i.onload=m,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Un(f,t,u)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function q1(l,t){kt.X(l,t);var a=Au;if(a&&l){var u=Ja(a).hoistableScripts,e=pu(l),n=u.get(e);n||(n=a.querySelector(he(e)),n||(l=H({src:l,async:!0},t),(t=St.get(e))&&Ic(l,t),n=a.createElement("script"),Dl(n),ql(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function j1(l,t){kt.M(l,t);var a=Au;if(a&&l){var u=Ja(a).hoistableScripts,e=pu(l),n=u.get(e);n||(n=a.querySelector(he(e)),n||(l=H({src:l,async:!0,type:"module"},t),(t=St.get(e))&&Ic(l,t),n=a.createElement("script"),Dl(n),ql(n,"link",l),a.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},u.set(e,n))}}function $y(l,t,a,u){var e=(e=L.current)?Dn(e):null;if(!e)throw Error(v(446));switch(l){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=_u(a.href),a=Ja(e).hoistableStyles,u=a.get(t),u||(u={type:"style",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){l=_u(a.href);var n=Ja(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(me(l)))&&!n._p&&(f.instance=n,f.state.loading=5),St.has(l)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},St.set(l,a),n||B1(e,l,a,f.state))),t&&u===null)throw Error(v(528,""));return f}if(t&&u!==null)throw Error(v(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=pu(a),a=Ja(e).hoistableScripts,u=a.get(t),u||(u={type:"script",instance:null,count:0,state:null},a.set(t,u)),u):{type:"void",instance:null,count:0,state:null};default:throw Error(v(444,l))}}function _u(l){return'href="'+st(l)+'"'}function me(l){return'link[rel="stylesheet"]['+l+"]"}function ky(l){return H({},l,{"data-precedence":l.precedence,precedence:null})}function B1(l,t,a,u){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?u.loading=1:(t=l.createElement("link"),u.preload=t,t.addEventListener("load",function(){return u.loading|=1}),t.addEventListener("error",function(){return u.loading|=2}),ql(t,"link",a),Dl(t),l.head.appendChild(t))}function pu(l){return'[src="'+st(l)+'"]'}function he(l){return"script[async]"+l}function Fy(l,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var u=l.querySelector('style[data-href~="'+st(a.href)+'"]');if(u)return t.instance=u,Dl(u),u;var e=H({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return u=(l.ownerDocument||l).createElement("style"),Dl(u),ql(u,"style",e),Un(u,a.precedence,l),t.instance=u;case"stylesheet":e=_u(a.href);var n=l.querySelector(me(e));if(n)return t.state.loading|=4,t.instance=n,Dl(n),n;u=ky(a),(e=St.get(e))&&Fc(u,e),n=(l.ownerDocument||l).createElement("link"),Dl(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),ql(n,"link",u),t.state.loading|=4,Un(n,a.precedence,l),t.instance=n;case"script":return n=pu(a.src),(e=l.querySelector(he(n)))?(t.instance=e,Dl(e),e):(u=a,(e=St.get(n))&&(u=H({},a),Ic(u,e)),l=l.ownerDocument||l,e=l.createElement("script"),Dl(e),ql(e,"link",u),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(v(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(u=t.instance,t.state.loading|=4,Un(u,a.precedence,l));return t.instance}function Un(l,t,a){for(var u=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=u.length?u[u.length-1]:null,n=e,f=0;f<u.length;f++){var c=u[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(l,t.firstChild))}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function Ic(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Hn=null;function Iy(l,t,a){if(Hn===null){var u=new Map,e=Hn=new Map;e.set(a,u)}else e=Hn,u=e.get(a),u||(u=new Map,e.set(a,u));if(u.has(l))return u;for(u.set(l,null),a=a.getElementsByTagName(l),e=0;e<a.length;e++){var n=a[e];if(!(n[Nu]||n[Hl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=u.get(f);c?c.push(n):u.set(f,[n])}}return u}function Py(l,t,a){l=l.ownerDocument||l,l.head.insertBefore(a,t==="title"?l.querySelector("head > title"):null)}function Y1(l,t,a){if(a===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return l=t.disabled,typeof t.precedence=="string"&&l==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function ld(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function x1(l,t,a,u){if(a.type==="stylesheet"&&(typeof u.media!="string"||matchMedia(u.media).matches!==!1)&&(a.state.loading&4)===0){if(a.instance===null){var e=_u(u.href),n=t.querySelector(me(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Nn.bind(l),t.then(l,l)),a.state.loading|=4,a.instance=n,Dl(n);return}n=t.ownerDocument||t,u=ky(u),(e=St.get(e))&&Fc(u,e),n=n.createElement("link"),Dl(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),ql(n,"link",u),a.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(a,t),(t=a.state.preload)&&(a.state.loading&3)===0&&(l.count++,a=Nn.bind(l),t.addEventListener("load",a),t.addEventListener("error",a))}}var Pc=0;function G1(l,t){return l.stylesheets&&l.count===0&&Cn(l,l.stylesheets),0<l.count||0<l.imgCount?function(a){var u=setTimeout(function(){if(l.stylesheets&&Cn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Pc===0&&(Pc=62500*b1());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Cn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Pc?50:800)+t);return l.unsuspend=a,function(){l.unsuspend=null,clearTimeout(u),clearTimeout(e)}}:null}function Nn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Cn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Rn=null;function Cn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Rn=new Map,t.forEach(X1,l),Rn=null,Nn.call(l))}function X1(l,t){if(!(t.state.loading&4)){var a=Rn.get(l);if(a)var u=a.get(null);else{a=new Map,Rn.set(l,a);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(a.set(f.dataset.precedence,f),u=f)}u&&a.set(null,u)}e=t.instance,f=e.getAttribute("data-precedence"),n=a.get(f)||u,n===u&&a.set(null,e),a.set(f,e),this.count++,u=Nn.bind(this),e.addEventListener("load",u),e.addEventListener("error",u),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var ge={$$typeof:zl,Provider:null,Consumer:null,_currentValue:Y,_currentValue2:Y,_threadCount:0};function Q1(l,t,a,u,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=wn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=wn(0),this.hiddenUpdates=wn(null),this.identifierPrefix=u,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function td(l,t,a,u,e,n,f,c,i,m,S,z){return l=new Q1(l,t,a,f,i,m,S,z,c),t=1,n===!0&&(t|=24),n=tt(3,null,null,t),l.current=n,n.stateNode=l,t=Rf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:u,isDehydrated:a,cache:t},Bf(n),l}function ad(l){return l?(l=au,l):au}function ud(l,t,a,u,e,n){e=ad(e),u.context===null?u.context=e:u.pendingContext=e,u=na(t),u.payload={element:a},n=n===void 0?null:n,n!==null&&(u.callback=n),a=fa(l,u,t),a!==null&&(kl(a,l,t),Wu(a,l,t))}function ed(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var a=l.retryLane;l.retryLane=a!==0&&a<t?a:t}}function li(l,t){ed(l,t),(l=l.alternate)&&ed(l,t)}function nd(l){if(l.tag===13||l.tag===31){var t=Ua(l,67108864);t!==null&&kl(t,l,67108864),li(l,67108864)}}function fd(l){if(l.tag===13||l.tag===31){var t=ft();t=Wn(t);var a=Ua(l,t);a!==null&&kl(a,l,t),li(l,t)}}var qn=!0;function Z1(l,t,a,u){var e=r.T;r.T=null;var n=_.p;try{_.p=2,ti(l,t,a,u)}finally{_.p=n,r.T=e}}function V1(l,t,a,u){var e=r.T;r.T=null;var n=_.p;try{_.p=8,ti(l,t,a,u)}finally{_.p=n,r.T=e}}function ti(l,t,a,u){if(qn){var e=ai(u);if(e===null)Qc(l,t,u,jn,a),id(l,u);else if(K1(e,l,t,a,u))u.stopPropagation();else if(id(l,u),t&4&&-1<L1.indexOf(l)){for(;e!==null;){var n=Ka(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=_a(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-Pl(f);c.entanglements[1]|=i,f&=~i}Ht(n),(P&6)===0&&(Sn=Fl()+500,ye(0))}}break;case 31:case 13:c=Ua(n,2),c!==null&&kl(c,n,2),bn(),li(n,2)}if(n=ai(u),n===null&&Qc(l,t,u,jn,a),n===e)break;e=n}e!==null&&u.stopPropagation()}else Qc(l,t,u,null,a)}}function ai(l){return l=uf(l),ui(l)}var jn=null;function ui(l){if(jn=null,l=La(l),l!==null){var t=x(l);if(t===null)l=null;else{var a=t.tag;if(a===13){if(l=tl(t),l!==null)return l;l=null}else if(a===31){if(l=ml(t),l!==null)return l;l=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return jn=l,null}function cd(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Ud()){case hi:return 2;case gi:return 8;case Ae:case Hd:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ei=!1,Sa=null,ra=null,ba=null,Se=new Map,re=new Map,za=[],L1="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function id(l,t){switch(l){case"focusin":case"focusout":Sa=null;break;case"dragenter":case"dragleave":ra=null;break;case"mouseover":case"mouseout":ba=null;break;case"pointerover":case"pointerout":Se.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":re.delete(t.pointerId)}}function be(l,t,a,u,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:a,eventSystemFlags:u,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Ka(t),t!==null&&nd(t)),l):(l.eventSystemFlags|=u,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function K1(l,t,a,u,e){switch(t){case"focusin":return Sa=be(Sa,l,t,a,u,e),!0;case"dragenter":return ra=be(ra,l,t,a,u,e),!0;case"mouseover":return ba=be(ba,l,t,a,u,e),!0;case"pointerover":var n=e.pointerId;return Se.set(n,be(Se.get(n)||null,l,t,a,u,e)),!0;case"gotpointercapture":return n=e.pointerId,re.set(n,be(re.get(n)||null,l,t,a,u,e)),!0}return!1}function sd(l){var t=La(l.target);if(t!==null){var a=x(t);if(a!==null){if(t=a.tag,t===13){if(t=tl(a),t!==null){l.blockedOn=t,Ai(l.priority,function(){fd(a)});return}}else if(t===31){if(t=ml(a),t!==null){l.blockedOn=t,Ai(l.priority,function(){fd(a)});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){l.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}l.blockedOn=null}function Bn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var a=ai(l.nativeEvent);if(a===null){a=l.nativeEvent;var u=new a.constructor(a.type,a);af=u,a.target.dispatchEvent(u),af=null}else return t=Ka(a),t!==null&&nd(t),l.blockedOn=a,!1;t.shift()}return!0}function yd(l,t,a){Bn(l)&&a.delete(t)}function J1(){ei=!1,Sa!==null&&Bn(Sa)&&(Sa=null),ra!==null&&Bn(ra)&&(ra=null),ba!==null&&Bn(ba)&&(ba=null),Se.forEach(yd),re.forEach(yd)}function Yn(l,t){l.blockedOn===t&&(l.blockedOn=null,ei||(ei=!0,A.unstable_scheduleCallback(A.unstable_NormalPriority,J1)))}var xn=null;function dd(l){xn!==l&&(xn=l,A.unstable_scheduleCallback(A.unstable_NormalPriority,function(){xn===l&&(xn=null);for(var t=0;t<l.length;t+=3){var a=l[t],u=l[t+1],e=l[t+2];if(typeof u!="function"){if(ui(u||a)===null)continue;break}var n=Ka(a);n!==null&&(l.splice(t,3),t-=3,ac(n,{pending:!0,data:e,method:a.method,action:u},u,e))}}))}function Mu(l){function t(i){return Yn(i,l)}Sa!==null&&Yn(Sa,l),ra!==null&&Yn(ra,l),ba!==null&&Yn(ba,l),Se.forEach(t),re.forEach(t);for(var a=0;a<za.length;a++){var u=za[a];u.blockedOn===l&&(u.blockedOn=null)}for(;0<za.length&&(a=za[0],a.blockedOn===null);)sd(a),a.blockedOn===null&&za.shift();if(a=(l.ownerDocument||l).$$reactFormReplay,a!=null)for(u=0;u<a.length;u+=3){var e=a[u],n=a[u+1],f=e[Ll]||null;if(typeof n=="function")f||dd(a);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Ll]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?a[u+1]=c:(a.splice(u,3),u-=3),dd(a)}}}function vd(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),u||setTimeout(a,20)}function a(){if(!u&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var u=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(a,100),function(){u=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ni(l){this._internalRoot=l}Gn.prototype.render=ni.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(v(409));var a=t.current,u=ft();ud(a,u,l,t,null,null)},Gn.prototype.unmount=ni.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;ud(l.current,2,null,l,null,null),bn(),t[Va]=null}};function Gn(l){this._internalRoot=l}Gn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var a=0;a<za.length&&t!==0&&t<za[a].priority;a++);za.splice(a,0,l),a===0&&sd(l)}};var od=j.version;if(od!=="19.2.0")throw Error(v(527,od,"19.2.0"));_.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(v(188)):(l=Object.keys(l).join(","),Error(v(268,l)));return l=T(t),l=l!==null?V(l):null,l=l===null?null:l.stateNode,l};var w1={bundleType:0,version:"19.2.0",rendererPackageName:"react-dom",currentDispatcherRef:r,reconcilerVersion:"19.2.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xn.isDisabled&&Xn.supportsFiber)try{Du=Xn.inject(w1),Il=Xn}catch{}}return Te.createRoot=function(l,t){if(!q(l))throw Error(v(299));var a=!1,u="",e=z0,n=T0,f=E0;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(u=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=td(l,1,!1,null,null,a,u,null,e,n,f,vd),l[Va]=t.current,Xc(l),new ni(t)},Te.hydrateRoot=function(l,t,a){if(!q(l))throw Error(v(299));var u=!1,e="",n=z0,f=T0,c=E0,i=null;return a!=null&&(a.unstable_strictMode===!0&&(u=!0),a.identifierPrefix!==void 0&&(e=a.identifierPrefix),a.onUncaughtError!==void 0&&(n=a.onUncaughtError),a.onCaughtError!==void 0&&(f=a.onCaughtError),a.onRecoverableError!==void 0&&(c=a.onRecoverableError),a.formState!==void 0&&(i=a.formState)),t=td(l,1,!0,t,a??null,u,e,i,n,f,c,vd),t.context=ad(null),a=t.current,u=ft(),u=Wn(u),e=na(u),e.callback=null,fa(a,e,u),a=u,t.current.lanes=a,Hu(t,a),Ht(t),l[Va]=t.current,Xc(l),new Gn(t)},Te.version="19.2.0",Te}var Ad;function uo(){if(Ad)return ii.exports;Ad=1;function A(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(A)}catch(j){console.error(j)}}return A(),ii.exports=ao(),ii.exports}var eo=uo();const no=A=>A.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),fo=A=>A.replace(/^([A-Z])|[\s-_]+(\w)/g,(j,B,v)=>v?v.toUpperCase():B.toLowerCase()),_d=A=>{const j=fo(A);return j.charAt(0).toUpperCase()+j.slice(1)},pd=(...A)=>A.filter((j,B,v)=>!!j&&j.trim()!==""&&v.indexOf(j)===B).join(" ").trim(),co=A=>{for(const j in A)if(j.startsWith("aria-")||j==="role"||j==="title")return!0};var io={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const so=Xl.forwardRef(({color:A="currentColor",size:j=24,strokeWidth:B=2,absoluteStrokeWidth:v,className:q="",children:x,iconNode:tl,...ml},U)=>Xl.createElement("svg",{ref:U,...io,width:j,height:j,stroke:A,strokeWidth:v?Number(B)*24/Number(j):B,className:pd("lucide",q),...!x&&!co(ml)&&{"aria-hidden":"true"},...ml},[...tl.map(([T,V])=>Xl.createElement(T,V)),...Array.isArray(x)?x:[x]]));const Nt=(A,j)=>{const B=Xl.forwardRef(({className:v,...q},x)=>Xl.createElement(so,{ref:x,iconNode:j,className:pd(`lucide-${no(_d(A))}`,`lucide-${A}`,v),...q}));return B.displayName=_d(A),B};const yo=[["path",{d:"M22 12h-2.48a2 2 0 0 0-1.93 1.46l-2.35 8.36a.25.25 0 0 1-.48 0L9.24 2.18a.25.25 0 0 0-.48 0l-2.35 8.36A2 2 0 0 1 4.49 12H2",key:"169zse"}]],vo=Nt("activity",yo);const oo=[["path",{d:"M12 8V4H8",key:"hb8ula"}],["rect",{width:"16",height:"12",x:"4",y:"8",rx:"2",key:"enze0r"}],["path",{d:"M2 14h2",key:"vft8re"}],["path",{d:"M20 14h2",key:"4cs60a"}],["path",{d:"M15 13v2",key:"1xurst"}],["path",{d:"M9 13v2",key:"rq6x2g"}]],mo=Nt("bot",oo);const ho=[["path",{d:"M21.801 10A10 10 0 1 1 17 3.335",key:"yps3ct"}],["path",{d:"m9 11 3 3L22 4",key:"1pflzl"}]],go=Nt("circle-check-big",ho);const So=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["path",{d:"m15 9-6 6",key:"1uzhvr"}],["path",{d:"m9 9 6 6",key:"z0biqf"}]],ro=Nt("circle-x",So);const bo=[["path",{d:"M13.659 22H18a2 2 0 0 0 2-2V8a2.4 2.4 0 0 0-.706-1.706l-3.588-3.588A2.4 2.4 0 0 0 14 2H6a2 2 0 0 0-2 2v11.5",key:"4pqfef"}],["path",{d:"M14 2v5a1 1 0 0 0 1 1h5",key:"wfsgrz"}],["path",{d:"M8 12v-1",key:"1ej8lb"}],["path",{d:"M8 18v-2",key:"qcmpov"}],["path",{d:"M8 7V6",key:"1nbb54"}],["circle",{cx:"8",cy:"20",r:"2",key:"ckkr5m"}]],zo=Nt("file-archive",bo);const To=[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]],Eo=Nt("loader-circle",To);const Ao=[["path",{d:"M22 17a2 2 0 0 1-2 2H6.828a2 2 0 0 0-1.414.586l-2.202 2.202A.71.71 0 0 1 2 21.286V5a2 2 0 0 1 2-2h16a2 2 0 0 1 2 2z",key:"18887p"}]],_o=Nt("message-square",Ao);const po=[["path",{d:"M14.536 21.686a.5.5 0 0 0 .937-.024l6.5-19a.496.496 0 0 0-.635-.635l-19 6.5a.5.5 0 0 0-.024.937l7.93 3.18a2 2 0 0 1 1.112 1.11z",key:"1ffxy3"}],["path",{d:"m21.854 2.147-10.94 10.939",key:"12cjpa"}]],Mo=Nt("send",po);const Oo=[["path",{d:"M12 3v12",key:"1x0j5s"}],["path",{d:"m17 8-5-5-5 5",key:"7q97r8"}],["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}]],Do=Nt("upload",Oo);const Uo=[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2",key:"975kel"}],["circle",{cx:"12",cy:"7",r:"4",key:"17ys0d"}]],Ho=Nt("user",Uo);function No(){const[A,j]=Xl.useState(null);return Xl.useEffect(()=>{const B=async()=>{try{const x=await(await fetch("/api/stats")).json();j(x)}catch(q){console.error(q)}};B();const v=setInterval(B,2e3);return()=>clearInterval(v)},[]),A?R.jsxs("div",{className:"card",style:{display:"flex",gap:"2rem",alignItems:"center"},children:[R.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"0.5rem"},children:[R.jsx(vo,{size:20,color:"var(--accent)"}),R.jsxs("span",{children:["Status: ",R.jsx("span",{style:{color:A.ingestion_status==="running"?"var(--accent)":"var(--text-secondary)"},children:A.ingestion_status.toUpperCase()})]})]}),A.ingestion_status==="running"&&R.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"0.5rem"},children:[R.jsx(Eo,{className:"spin",size:20}),R.jsx("span",{children:"Ingesting..."})]}),R.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"0.5rem"},children:[A.agent_initialized?R.jsx(go,{size:20,color:"var(--success)"}):R.jsx(ro,{size:20,color:"var(--text-secondary)"}),R.jsx("span",{children:"Agent Ready"})]}),A.ingestion_message&&R.jsx("div",{style:{marginLeft:"auto",color:"var(--text-secondary)"},children:A.ingestion_message})]}):null}function Ro(){const[A,j]=Xl.useState(!1),[B,v]=Xl.useState(""),q=async x=>{const tl=x.target.files[0];if(!tl)return;const ml=new FormData;ml.append("file",tl),j(!0),v("");try{if(!(await fetch("/api/upload",{method:"POST",body:ml})).ok)throw new Error("Upload failed");v("Upload successful!"),await fetch("/api/ingest",{method:"POST"}),v("Upload successful! Ingestion started.")}catch(U){v("Error uploading file."),console.error(U)}finally{j(!1)}};return R.jsxs("div",{className:"card",children:[R.jsxs("h3",{style:{marginTop:0,display:"flex",alignItems:"center",gap:"0.5rem"},children:[R.jsx(zo,{size:20}),"Data Upload"]}),R.jsxs("p",{style:{color:"var(--text-secondary)",marginBottom:"1rem"},children:["Upload your ",R.jsx("code",{children:"source-data.zip"})," to start ingestion."]}),R.jsxs("div",{style:{display:"flex",gap:"1rem",alignItems:"center"},children:[R.jsxs("label",{className:"btn",style:{display:"flex",alignItems:"center",gap:"0.5rem",cursor:A?"wait":"pointer"},children:[R.jsx(Do,{size:18}),A?"Uploading...":"Select Zip File",R.jsx("input",{type:"file",accept:".zip",onChange:q,style:{display:"none"},disabled:A})]}),B&&R.jsx("span",{children:B})]})]})}function Co(){const[A,j]=Xl.useState([]),[B,v]=Xl.useState(""),[q,x]=Xl.useState(!1),tl=Xl.useRef(null),ml=()=>{tl.current?.scrollIntoView({behavior:"smooth"})};Xl.useEffect(ml,[A]);const U=async T=>{if(T.preventDefault(),!B.trim()||q)return;const V={role:"user",content:B};j(H=>[...H,V]),v(""),x(!0);try{const H=await fetch("/api/chat",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:V.content})});if(!H.ok)throw new Error("Chat failed");const el=H.body.getReader(),Bl=new TextDecoder;let Ol={role:"assistant",content:""};for(j(pl=>[...pl,Ol]);;){const{done:pl,value:rt}=await el.read();if(pl)break;const Yl=Bl.decode(rt);Ol.content+=Yl,j(At=>{const zl=[...At];return zl[zl.length-1]={...Ol},zl})}}catch(H){console.error(H),j(el=>[...el,{role:"assistant",content:"Error: Could not get response."}])}finally{x(!1)}};return R.jsxs("div",{className:"card",style:{flex:1,display:"flex",flexDirection:"column",minHeight:0},children:[R.jsxs("div",{style:{flex:1,overflowY:"auto",paddingRight:"0.5rem",display:"flex",flexDirection:"column",gap:"1rem"},children:[A.map((T,V)=>R.jsxs("div",{style:{display:"flex",gap:"1rem",alignSelf:T.role==="user"?"flex-end":"flex-start",maxWidth:"80%",backgroundColor:T.role==="user"?"var(--accent)":"var(--bg-primary)",padding:"1rem",borderRadius:"0.75rem",borderBottomRightRadius:T.role==="user"?0:"0.75rem",borderBottomLeftRadius:T.role==="assistant"?0:"0.75rem"},children:[R.jsx("div",{style:{marginTop:"0.25rem"},children:T.role==="user"?R.jsx(Ho,{size:18}):R.jsx(mo,{size:18})}),R.jsx("div",{style:{whiteSpace:"pre-wrap",lineHeight:1.5},children:T.content})]},V)),R.jsx("div",{ref:tl})]}),R.jsxs("form",{onSubmit:U,style:{marginTop:"1rem",display:"flex",gap:"1rem"},children:[R.jsx("input",{type:"text",value:B,onChange:T=>v(T.target.value),placeholder:"Ask something about your data...",disabled:q}),R.jsx("button",{type:"submit",className:"btn",disabled:q||!B.trim(),children:R.jsx(Mo,{size:20})})]})]})}function qo(){return R.jsxs("div",{className:"container",children:[R.jsx("header",{className:"header",children:R.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"1rem"},children:[R.jsx(_o,{size:32,color:"var(--accent)"}),R.jsx("h1",{style:{margin:0,fontSize:"1.5rem"},children:"ChatGPT Data Extractor"})]})}),R.jsxs("div",{style:{display:"grid",gridTemplateColumns:"1fr 2fr",gap:"2rem",flex:1,minHeight:0},children:[R.jsxs("div",{style:{display:"flex",flexDirection:"column",gap:"2rem"},children:[R.jsx(No,{}),R.jsx(Ro,{}),R.jsxs("div",{className:"card",style:{flex:1},children:[R.jsx("h3",{children:"Instructions"}),R.jsxs("ul",{style:{paddingLeft:"1.2rem",color:"var(--text-secondary)",lineHeight:1.6},children:[R.jsxs("li",{children:["Upload your ",R.jsx("code",{children:"source-data.zip"})," if you haven't already."]}),R.jsx("li",{children:"Wait for ingestion to complete (check status above)."}),R.jsx("li",{children:"Start chatting with your data!"})]})]})]}),R.jsx(Co,{})]})]})}eo.createRoot(document.getElementById("root")).render(R.jsx(Xl.StrictMode,{children:R.jsx(qo,{})}));